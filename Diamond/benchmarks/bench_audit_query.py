@@ -0,0 +1,83 @@
+"""Benchmark: audit-trail reads, whole-file JSON vs the indexed query module.
+
+Builds one JSON-lines audit file of N records (one every second) and times:
+- last record: read_text().split() + json.loads (old compliance check) vs
+  AuditLog.last() (backwards seek)
+- a 10-minute time range plus an actor filter: json.loads of every line vs
+  AuditLog.query() over the sparse index
+- a count over the same range
+
+Usage:
+    python -m benchmarks.bench_audit_query --records 500000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.utils.audit_query import AuditLog, to_epoch
+
+
+def _timed(label: str, fn, repeat: int = 5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {elapsed * 1000:10.2f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit query benchmark")
+    parser.add_argument("--records", type=int, default=500_000)
+    args = parser.parse_args()
+
+    start = datetime(2026, 10, 17)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "2026-10-17_actions.jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(args.records):
+                f.write(json.dumps({
+                    "timestamp": (start + timedelta(seconds=i)).isoformat(),
+                    "action_type": "task_complete", "actor": f"agent-{i % 8}",
+                    "result": "failed" if i % 50 == 0 else "success", "duration_ms": i % 997,
+                }) + "\n")
+        size = path.stat().st_size
+        print(f"\nAudit query benchmark: {args.records} records, {size / 1e6:.1f} MB")
+
+        since = start + timedelta(seconds=args.records // 2)
+        until = since + timedelta(minutes=10)
+        lo, hi = since.timestamp(), until.timestamp()
+
+        def full_scan():
+            out = []
+            for line in path.read_text(encoding="utf-8").splitlines():
+                record = json.loads(line)
+                if record["actor"] == "agent-3" and lo <= to_epoch(record["timestamp"]) <= hi:
+                    out.append(record)
+            return out
+
+        log = AuditLog(path)
+        _timed("build index (first query)", log.reindex, repeat=1)
+
+        print("\nlast record")
+        old = _timed("  read whole file", lambda: json.loads(
+            path.read_text(encoding="utf-8").strip().split("\n")[-1]), repeat=3)
+        new = _timed("  AuditLog.last()", log.last, repeat=100)
+        assert old == new
+
+        print("\n10-minute range, actor filter")
+        old = _timed("  json.loads every line", full_scan, repeat=1)
+        new = _timed("  AuditLog.query()", lambda: log.query(since, until, actor="agent-3"),
+                     repeat=100)
+        assert old == new
+
+        print("\n10-minute range count")
+        _timed("  AuditLog.count()", lambda: log.count(since, until), repeat=100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark: SQLiteMessageBus publish and consume/ack throughput.
+
+Each scenario publishes --messages messages into a fresh database, then
+drains them with consume(max_messages=--batch) followed by one ack per
+batch. Timed:
+- 1 publisher: every publish() is its own transaction.
+- N publishers: --threads threads publish at once, so group commit puts
+  concurrent publishes into shared transactions (see "avg batch").
+- consume+ack: leases and deletes, --batch messages per round trip.
+
+Run with --synchronous FULL to include an fsync per commit. That is where
+group commit pays off most.
+
+Usage:
+    python -m benchmarks.bench_durable_bus --messages 20000 --threads 8 --synchronous FULL
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.a2a.message import A2AMessage, MessageType
+from src.a2a.sqlite_bus import SQLiteMessageBus
+
+
+def _messages(count: int, agents: int) -> list[A2AMessage]:
+    return [A2AMessage("bench", f"agent-{i % agents}", MessageType.TASK_DELEGATION,
+                       {"n": i, "task": "x" * 200}) for i in range(count)]
+
+
+def _report(label: str, count: int, elapsed: float, extra: str = "") -> None:
+    print(f"{label:<26} {count:>8,} msgs {elapsed:7.2f} s {count / elapsed:10,.0f} msgs/sec {extra}")
+
+
+def _publish(bus: SQLiteMessageBus, messages: list[A2AMessage], threads: int) -> float:
+    chunks = [messages[i::threads] for i in range(threads)]
+    workers = [threading.Thread(target=lambda chunk=chunk: [bus.publish(m) for m in chunk])
+               for chunk in chunks]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def _drain(bus: SQLiteMessageBus, agents: int, batch: int) -> tuple[int, float]:
+    drained = 0
+    start = time.perf_counter()
+    for i in range(agents):
+        agent = f"agent-{i}"
+        while True:
+            messages = bus.consume(agent, max_messages=batch)
+            if not messages:
+                break
+            bus.ack(agent, [m.message_id for m in messages])
+            drained += len(messages)
+    return drained, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Durable message bus benchmark")
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=50, help="Messages per consume/ack")
+    parser.add_argument("--synchronous", default="NORMAL", choices=["OFF", "NORMAL", "FULL"])
+    args = parser.parse_args()
+
+    print(f"\nDurable bus benchmark: {args.messages:,} messages, "
+          f"synchronous={args.synchronous}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, threads in (("1 publisher", 1), (f"{args.threads} publishers", args.threads)):
+            bus = SQLiteMessageBus(Path(tmp) / f"{threads}.db", max_queue_size=args.messages,
+                                   synchronous=args.synchronous)
+            elapsed = _publish(bus, _messages(args.messages, args.agents), threads)
+            stats = bus.get_stats()
+            _report(f"publish, {label}", args.messages, elapsed,
+                    f"{stats['commits']:>7,} commits  avg batch {stats['avg_batch']}")
+            if threads > 1:
+                drained, elapsed = _drain(bus, args.agents, args.batch)
+                _report(f"consume+ack x{args.batch}", drained, elapsed)
+            bus.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark: list/count a large Done/ folder, glob + stat vs folder index.
+
+Creates N task files in a temporary Done/ and times:
+- legacy list_md_files (glob, sort by stat().st_mtime) and count_by_prefix
+- the folder index: cold build, warm query with no changes, query after a
+  handful of new files, count_by_prefix and oldest(10)
+
+Usage:
+    python -m benchmarks.bench_folder_index --files 100000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.utils import folder_index
+from src.utils.folder_index import FolderIndex
+
+PREFIXES = ["EMAIL", "LINKEDIN", "ODOO", "FACEBOOK", "WHATSAPP", "PAYMENT", "AUDIT"]
+
+
+def _legacy_list(path: Path) -> list[Path]:
+    return sorted(path.glob("*.md"), key=lambda f: f.stat().st_mtime)
+
+
+def _legacy_count_by_prefix(path: Path) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for f in _legacy_list(path):
+        parts = f.stem.split("_", 1)
+        prefix = parts[0] if len(parts) > 1 else "OTHER"
+        counts[prefix] = counts.get(prefix, 0) + 1
+    return counts
+
+
+def _timed(label: str, fn, repeat: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<42} {best * 1000:10.2f} ms")
+    return result
+
+
+def _populate(done: Path, files: int) -> None:
+    base = time.time() - files
+    body = "---\ntype: email\npriority: medium\nstatus: done\n---\n\n# Task\n"
+    for i in range(files):
+        p = done / f"{random.choice(PREFIXES)}_task_{i:06d}.md"
+        p.write_text(body)
+        os.utime(p, (base + i, base + i))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Folder index benchmark")
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--new", type=int, default=10, help="files added between queries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        done = Path(tmp) / "Done"
+        done.mkdir()
+        print(f"Creating {args.files} files in {done} ...")
+        _populate(done, args.files)
+        t = time.time() - 60
+        os.utime(done, (t, t))
+
+        print(f"\nFolder index benchmark: {args.files} files")
+        legacy = _timed("legacy list_md_files (glob + stat sort)", lambda: _legacy_list(done))
+        _timed("legacy count_by_prefix", lambda: _legacy_count_by_prefix(done))
+
+        index = FolderIndex(done)
+        indexed = _timed("index cold build + list", index.list)
+        assert indexed == legacy, "index order differs from glob + sort"
+        _timed("index list (unchanged folder)", index.list, repeat=5)
+        _timed("index count_by_prefix (unchanged)", index.count_by_prefix, repeat=5)
+        _timed("index oldest(10) (unchanged)", lambda: index.oldest(10), repeat=5)
+
+        for i in range(args.new):
+            (done / f"EMAIL_new_{i}.md").write_text("x")
+        stats_before = index.stats_taken
+        _timed(f"index count_by_prefix after +{args.new} files", index.count_by_prefix)
+        print(f"{'files stat()ed for the refresh':<42} {index.stats_taken - stats_before:10d}")
+
+        # With the racy window elapsed the folder mtime is trusted again
+        folder_index.RACY_WINDOW_NS = 0
+        index.refresh()
+        _timed("index count (trusted mtime, no readdir)", index.count, repeat=5)
+
+
+if __name__ == "__main__":
+    main()
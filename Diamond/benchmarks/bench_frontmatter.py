@@ -0,0 +1,117 @@
+"""Benchmark: frontmatter parse/dump, full YAML vs the flat fast path.
+
+Creates N representative task files in a temporary Done/ (mostly flat
+scalar frontmatter as written by the watchers, some with lists or nested
+maps that need full YAML) and reports files/sec for:
+- parse: yaml.SafeLoader, yaml.CSafeLoader (if libyaml is present), and
+  frontmatter.parse (fast path with CSafeLoader fallback)
+- dump: yaml.dump and frontmatter.dump
+
+It also checks that frontmatter.dump is byte-identical to yaml.dump for
+every file, and counts how many documents CSafeDumper would render
+differently (the reason dump does not use it).
+
+Usage:
+    python -m benchmarks.bench_frontmatter --files 10000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from src.utils import frontmatter
+
+PREFIXES = ["EMAIL", "LINKEDIN", "ODOO", "FACEBOOK", "WHATSAPP", "PAYMENT", "AUDIT"]
+SUBJECTS = [
+    "Invoice 1234 from Acme Corp",
+    "Re: Invoice #42",
+    "Meeting tomorrow?",
+    "Quarterly report",
+    "yes",
+    "Payment received: $1,200.00",
+    "Can you review the proposal",
+]
+
+
+def _metadata(i: int) -> dict:
+    prefix = random.choice(PREFIXES)
+    meta = {
+        "type": prefix.lower(),
+        "source": "gmail" if prefix == "EMAIL" else prefix.lower(),
+        "from": f"user{i}@example.com",
+        "subject": random.choice(SUBJECTS),
+        "priority": random.choice(["low", "medium", "high", "critical"]),
+        "status": "done",
+        "claimed_by": random.choice(["local-01", "cloud-01", None]),
+        "retry_count": random.randint(0, 3),
+        "requires_approval": random.random() < 0.2,
+        "created": f"2026-10-{random.randint(1, 28):02d} 10:{i % 60:02d}:00",
+    }
+    if random.random() < 0.1:
+        meta["tags"] = ["finance", "q4"]  # needs full YAML
+    if random.random() < 0.05:
+        meta["odoo"] = {"invoice_id": i, "state": "posted"}
+    return meta
+
+
+def _rate(label: str, fn, items: list) -> None:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<42} {len(items) / elapsed:12,.0f} files/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frontmatter parse/dump benchmark")
+    parser.add_argument("--files", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        done = Path(tmp) / "Done"
+        done.mkdir()
+        print(f"Creating {args.files} files in {done} ...")
+        metas = [_metadata(i) for i in range(args.files)]
+        for i, meta in enumerate(metas):
+            (done / f"TASK_{i:06d}.md").write_text(
+                yaml.dump(meta, default_flow_style=False, sort_keys=False)
+                .strip().join(["---\n", "\n---\n\n# Task\n"])
+            )
+        texts = [p.read_text() for p in sorted(done.glob("*.md"))]
+        blocks = [t[3:t.find("---", 3)].strip() for t in texts]
+
+        fast = sum(frontmatter._fast_parse(b) is not None for b in blocks)
+        print(f"\nFrontmatter benchmark: {args.files} files "
+              f"({fast / len(blocks):.0%} take the parse fast path)")
+
+        _rate("parse yaml.SafeLoader", lambda b: yaml.load(b, Loader=yaml.SafeLoader), blocks)
+        if hasattr(yaml, "CSafeLoader"):
+            _rate("parse yaml.CSafeLoader", lambda b: yaml.load(b, Loader=yaml.CSafeLoader), blocks)
+        _rate("parse frontmatter.parse", frontmatter.parse, texts)
+
+        _rate("dump yaml.dump",
+              lambda m: yaml.dump(m, default_flow_style=False, sort_keys=False), metas)
+        _rate("dump frontmatter.dump", lambda m: frontmatter.dump(m, "# Task"), metas)
+
+        mismatches = sum(
+            frontmatter.dump(m, "# Task")
+            != "---\n" + yaml.dump(m, default_flow_style=False, sort_keys=False).strip()
+            + "\n---\n\n# Task"
+            for m in metas
+        )
+        print(f"{'frontmatter.dump != yaml.dump':<42} {mismatches:12d}")
+        if hasattr(yaml, "CSafeDumper"):
+            c_diff = sum(
+                yaml.dump(m, Dumper=yaml.CSafeDumper, default_flow_style=False, sort_keys=False)
+                != yaml.dump(m, default_flow_style=False, sort_keys=False)
+                for m in metas
+            )
+            print(f"{'CSafeDumper != yaml.dump':<42} {c_diff:12d}")
+
+
+if __name__ == "__main__":
+    main()
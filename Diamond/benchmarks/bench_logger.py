@@ -0,0 +1,120 @@
+"""Benchmark: log_action / audit_log records/sec, before and after buffering.
+
+Times N records from T threads (the concurrent orchestrator's workers) for:
+- legacy: get_folder("Logs") (resolve() + mkdir) + exists() + open("a") +
+  write + close per record (the old logger)
+- direct: one O_APPEND write per record (logger without the writer thread)
+- buffered: queued to the background writer, batched per file
+
+and then the same with fsync enabled, where batching matters most.
+
+Usage:
+    python -m benchmarks.bench_logger --records 50000 --threads 4 --fsync-records 2000
+"""
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils import file_ops, logger
+
+
+def _legacy_get_folder(root: Path) -> Path:
+    Path(file_ops.__file__).resolve()  # what the old get_project_root() did per call
+    folder = root / "Logs"
+    folder.mkdir(parents=True, exist_ok=True)
+    return folder
+
+
+def _legacy_log_action(root: Path, action: str, details: str, task_name: str) -> None:
+    log_file = _legacy_get_folder(root) / f"{datetime.now().strftime('%Y-%m-%d')}_{task_name}.md"
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    entry = f"- **[{timestamp}]** {action}: {details}\n"
+    if not log_file.exists():
+        header = f"# Log: {task_name}\n\n**Date:** {timestamp[:10]}\n\n## Actions\n\n"
+        log_file.write_text(header + entry, encoding="utf-8")
+    else:
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(entry)
+
+
+def _legacy_audit_log(root: Path, action_type: str, actor: str) -> None:
+    record = {"timestamp": datetime.now().isoformat(), "action_type": action_type, "actor": actor}
+    with open(_legacy_get_folder(root) / f"{datetime.now().strftime('%Y-%m-%d')}_actions.jsonl", "a",
+              encoding="utf-8") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+
+
+def _run(label: str, fn, records: int, threads: int, done=None) -> None:
+    per_thread = records // threads
+
+    def worker(t):
+        for i in range(per_thread):
+            fn(t, i)
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    start = time.perf_counter()
+    for th in pool:
+        th.start()
+    for th in pool:
+        th.join()
+    if done:
+        done()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {per_thread * threads / elapsed:12,.0f} records/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logger benchmark")
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--fsync-records", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=".") as tmp:  # on the project's disk, not tmpfs
+        root = Path(tmp).resolve()
+        (root / "Logs").mkdir()
+        logger._console.disabled = True  # measure file writes, not terminal output
+        n, threads = args.records, args.threads
+
+        print(f"\nLogger benchmark: {n} records, {threads} threads")
+        _run("legacy log_action", lambda t, i: _legacy_log_action(root, "Step", str(i), f"w{t}"),
+             n, threads)
+        _run("legacy audit_log", lambda t, i: _legacy_audit_log(root, "step", f"w{t}"), n, threads)
+
+        with patch.object(file_ops, "_PROJECT_ROOT", root):
+            _run("direct O_APPEND log_action",
+                 lambda t, i: logger.log_action("Step", str(i), f"d{t}"), n, threads)
+            _run("direct O_APPEND audit_log",
+                 lambda t, i: logger.audit_log("step", actor=f"d{t}"), n, threads)
+
+            writer = logger.start_background_writer(force=True)
+            _run("buffered log_action (incl. flush)",
+                 lambda t, i: logger.log_action("Step", str(i), f"b{t}"), n, threads,
+                 done=logger.flush_logs)
+            _run("buffered audit_log (incl. flush)",
+                 lambda t, i: logger.audit_log("step", actor=f"b{t}"), n, threads,
+                 done=logger.flush_logs)
+            logger.stop_background_writer()
+            stats = writer.get_stats()
+            print(f"{'writer: records / write() calls':<36} {stats['records']:>8} / {stats['writes']}")
+
+            n = args.fsync_records
+            print(f"\nWith fsync: {n} records, {threads} threads")
+            with patch.object(logger, "_fsync_direct", True):
+                _run("direct audit_log, fsync per line",
+                     lambda t, i: logger.audit_log("step", actor=f"f{t}"), n, threads)
+            logger.start_background_writer(fsync="flush", force=True)
+            _run("buffered audit_log, fsync per flush",
+                 lambda t, i: logger.audit_log("step", actor=f"g{t}"), n, threads,
+                 done=logger.flush_logs)
+            logger.stop_background_writer()
+
+
+if __name__ == "__main__":
+    main()
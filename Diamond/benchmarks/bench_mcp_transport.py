@@ -0,0 +1,65 @@
+"""Benchmark: per-call MCP latency, spawn-per-call vs pooled session vs in-process.
+
+Usage:
+    python -m benchmarks.bench_mcp_transport --server payment --tool list_accounts --calls 20
+"""
+
+import argparse
+import statistics
+import time
+
+from src.utils.mcp_registry import MCP_SERVERS, _in_process_request, _raw_call
+from src.utils.mcp_session import MCPSessionManager, parse_tool_result
+
+
+def _timed(fn, calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+    print(f"{label:<11} calls={len(samples):<5} mean={statistics.mean(samples):8.2f}ms "
+          f"p50={statistics.median(samples):8.2f}ms p95={p95:8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP transport latency benchmark")
+    parser.add_argument("--server", default="payment", choices=sorted(MCP_SERVERS))
+    parser.add_argument("--tool", default="list_accounts")
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    module = MCP_SERVERS[args.server]
+    spawn = _timed(lambda: _raw_call(module, args.tool, {}), args.calls)
+
+    manager = MCPSessionManager()
+    start = time.perf_counter()
+    manager.get(args.server)
+    startup_ms = (time.perf_counter() - start) * 1000
+    pooled = _timed(lambda: manager.call_tool(args.server, args.tool, {}), args.calls)
+    manager.close_all()
+
+    params = {"name": args.tool, "arguments": {}}
+    _in_process_request(args.server, "tools/list")  # import + connect outside the timing
+    direct = _timed(
+        lambda: parse_tool_result(_in_process_request(args.server, "tools/call", params)),
+        args.calls,
+    )
+
+    print(f"MCP transport benchmark: {args.server}.{args.tool}")
+    _report("spawn", spawn)
+    _report("session", pooled)
+    _report("in_process", direct)
+    print(f"session startup (spawn + initialize): {startup_ms:.2f}ms, "
+          f"speedup: {statistics.mean(spawn) / statistics.mean(pooled):.1f}x")
+    print(f"in_process vs session: {statistics.mean(pooled) / statistics.mean(direct):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark: MockMessageBus publish/consume, sorted list vs per-priority deques.
+
+Four agent queues are pre-filled to --depth messages of mixed priority.
+Then publishes and single-message consumes alternate round-robin across
+the agents, so every queue stays near that depth. Timed:
+- legacy: the old bus. It finds the insertion point with a linear scan
+  plus list.insert, and every consume rebuilds the list to drop expired
+  messages and then slices it. Both are O(depth).
+- deques: the current MockMessageBus, O(1) per message.
+
+The legacy bus runs --legacy-ops operations (it is quadratic); the current
+one runs --ops (1M by default).
+
+Usage:
+    python -m benchmarks.bench_message_bus --ops 1000000 --depth 900
+"""
+
+import argparse
+import itertools
+import threading
+import time
+from collections import defaultdict
+
+from src.a2a.message import A2AMessage, MessagePriority, MessageType
+from src.a2a.message_bus import MockMessageBus
+from src.utils.metrics import BUS_MESSAGES, BUS_QUEUE_DEPTH
+
+PRIORITIES = [MessagePriority.NORMAL, MessagePriority.HIGH, MessagePriority.NORMAL,
+              MessagePriority.LOW, MessagePriority.URGENT, MessagePriority.NORMAL]
+
+
+class LegacyBus:
+    """publish/consume of the list-based bus, as it was before the deques."""
+
+    ORDER = {MessagePriority.URGENT: 0, MessagePriority.HIGH: 1,
+             MessagePriority.NORMAL: 2, MessagePriority.LOW: 3}
+
+    def __init__(self, max_queue_size: int = 1000):
+        self._queues = defaultdict(list)
+        self._max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+
+    def publish(self, message: A2AMessage) -> bool:
+        with self._lock:
+            queue = self._queues[message.recipient_id]
+            if len(queue) >= self._max_queue_size:
+                BUS_MESSAGES.inc(event="dropped")
+                return False
+            msg_priority = self.ORDER.get(message.priority, 2)
+            insert_idx = len(queue)
+            for i, existing in enumerate(queue):
+                if msg_priority < self.ORDER.get(existing.priority, 2):
+                    insert_idx = i
+                    break
+            queue.insert(insert_idx, message)
+            BUS_MESSAGES.inc(event="published")
+            BUS_QUEUE_DEPTH.set(len(queue), agent=message.recipient_id)
+            return True
+
+    def consume(self, agent_id: str, max_messages: int = 10) -> list:
+        with self._lock:
+            queue = self._queues.get(agent_id, [])
+            queue[:] = [m for m in queue if not m.is_expired]
+            consumed = queue[:max_messages]
+            self._queues[agent_id] = queue[max_messages:]
+            if consumed:
+                BUS_MESSAGES.inc(len(consumed), event="consumed")
+            BUS_QUEUE_DEPTH.set(len(self._queues[agent_id]), agent=agent_id)
+            return consumed
+
+
+def _messages(agents: list[str], per_agent: int) -> dict[str, list[A2AMessage]]:
+    """A reusable pool of messages per agent (construction is not what we time)."""
+    priorities = itertools.cycle(PRIORITIES)
+    return {
+        agent: [A2AMessage("bench", agent, MessageType.TASK_DELEGATION, {"n": i},
+                           priority=next(priorities)) for i in range(per_agent)]
+        for agent in agents
+    }
+
+
+def _run(label: str, bus, agents: list[str], ops: int, depth: int) -> None:
+    pool = _messages(agents, depth + 64)
+    for agent in agents:
+        for message in pool[agent][:depth]:
+            bus.publish(message)
+
+    cursors = {agent: itertools.cycle(pool[agent]) for agent in agents}
+    turn = itertools.cycle(agents)
+    start = time.perf_counter()
+    for i in range(ops // 2):
+        agent = next(turn)
+        bus.publish(next(cursors[agent]))
+        bus.consume(agent, max_messages=1)
+    elapsed = time.perf_counter() - start
+    done = (ops // 2) * 2
+    print(f"{label:<28} {done:>10,} ops {elapsed:8.2f} s {done / elapsed:12,.0f} ops/sec "
+          f"{elapsed / done * 1e6:8.2f} µs/op")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Message bus benchmark")
+    parser.add_argument("--ops", type=int, default=1_000_000)
+    parser.add_argument("--legacy-ops", type=int, default=50_000)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=900, help="Messages kept in each queue")
+    args = parser.parse_args()
+
+    agents = [f"agent-{i}" for i in range(args.agents)]
+    print(f"\nMessage bus benchmark: {args.agents} agents, queue depth ~{args.depth}")
+    _run("legacy (sorted list)", LegacyBus(), agents, args.legacy_ops, args.depth)
+    _run("deques", MockMessageBus(), agents, args.ops, args.depth)
+
+
+if __name__ == "__main__":
+    main()
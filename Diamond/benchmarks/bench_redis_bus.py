@@ -0,0 +1,133 @@
+"""Benchmark: RedisStreamsBus vs MockMessageBus throughput and latency.
+
+Timed for each backend:
+- publish: one publish() per message.
+- publish_many: batches of --batch messages, one pipeline each (Redis only;
+  the memory bus has no batch call and is timed with a publish() loop).
+- consume+ack: consume(max_messages=--batch), then one ack per batch.
+- latency: a consumer thread blocks in consume(timeout=...) while the main
+  thread publishes one message every --interval seconds. Latency is measured
+  from publish to receipt; p50/p99 are reported.
+
+Runs against a real server when --url is given (e.g. a local redis-server),
+otherwise against fakeredis in-process. fakeredis numbers show the bus's
+own overhead but not network round trips.
+
+Usage:
+    python -m benchmarks.bench_redis_bus --messages 20000 --url redis://localhost:6379/15
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+from src.a2a.message import A2AMessage, MessageType
+from src.a2a.message_bus import MockMessageBus
+from src.a2a.redis_bus import RedisStreamsBus
+
+
+def _messages(count: int, agents: int) -> list[A2AMessage]:
+    return [A2AMessage("bench", f"agent-{i % agents}", MessageType.TASK_DELEGATION,
+                       {"n": i, "task": "x" * 200}) for i in range(count)]
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    print(f"  {label:<16} {count:>8,} msgs {elapsed:7.2f} s {count / elapsed:10,.0f} msgs/sec "
+          f"{elapsed / count * 1e6:8.1f} µs/msg")
+
+
+def _drain(bus, agents: int, batch: int) -> int:
+    drained = 0
+    for i in range(agents):
+        agent = f"agent-{i}"
+        while True:
+            messages = bus.consume(agent, max_messages=batch)
+            if not messages:
+                break
+            bus.ack(agent, [m.message_id for m in messages])
+            drained += len(messages)
+    return drained
+
+
+def _latency(bus, samples: int, interval: float) -> list[float]:
+    latencies: list[float] = []
+    done = threading.Event()
+
+    def consumer():
+        while len(latencies) < samples and not done.is_set():
+            for message in bus.consume("latency-agent", max_messages=10, timeout=1.0):
+                latencies.append(time.perf_counter() - message.payload["sent"])
+                bus.ack("latency-agent", [message.message_id])
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    time.sleep(0.05)
+    for _ in range(samples):
+        bus.publish(A2AMessage("bench", "latency-agent", MessageType.INFO_REQUEST,
+                               {"sent": time.perf_counter()}))
+        time.sleep(interval)
+    thread.join(timeout=5)
+    done.set()
+    return latencies
+
+
+def _run(label: str, make_bus, args) -> None:
+    print(f"\n{label}")
+    bus = make_bus()
+    messages = _messages(args.messages, args.agents)
+    start = time.perf_counter()
+    for message in messages:
+        bus.publish(message)
+    _report("publish", args.messages, time.perf_counter() - start)
+    _drain(bus, args.agents, args.batch)
+
+    start = time.perf_counter()
+    if isinstance(bus, RedisStreamsBus):
+        for i in range(0, len(messages), args.batch):
+            bus.publish_many(messages[i:i + args.batch])
+    else:
+        for message in messages:
+            bus.publish(message)
+    _report("publish_many", args.messages, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    drained = _drain(bus, args.agents, args.batch)
+    _report("consume+ack", drained, time.perf_counter() - start)
+
+    latencies = sorted(_latency(bus, args.samples, args.interval))
+    if latencies:
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"  {'latency':<16} {len(latencies):>8,} msgs  p50 "
+              f"{statistics.median(latencies) * 1e3:6.2f} ms  p99 {p99 * 1e3:6.2f} ms")
+    bus.clear()
+    bus.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis Streams bus benchmark")
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=100, help="Messages per pipeline / consume")
+    parser.add_argument("--samples", type=int, default=200, help="Latency samples")
+    parser.add_argument("--interval", type=float, default=0.005, help="Seconds between samples")
+    parser.add_argument("--url", help="Redis URL; default: fakeredis in-process")
+    args = parser.parse_args()
+
+    if args.url:
+        import redis
+        client, where = redis.Redis.from_url(args.url), args.url
+    else:
+        import fakeredis
+        client, where = fakeredis.FakeRedis(), "fakeredis"
+
+    queue_size = args.messages + args.samples
+    print(f"\nMessage bus benchmark: {args.messages:,} messages, {args.agents} agents")
+    _run("memory (MockMessageBus)", lambda: MockMessageBus(max_queue_size=queue_size), args)
+    _run(f"redis streams ({where})",
+         lambda: RedisStreamsBus(client=client, max_queue_size=queue_size, prefix="a2a-bench"),
+         args)
+
+
+if __name__ == "__main__":
+    main()
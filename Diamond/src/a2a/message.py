@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from src.utils.tracing import current_trace_id
+
 
 class MessagePriority(str, Enum):
     LOW = "low"
@@ -43,6 +45,11 @@ class A2AMessage:
     correlation_id: str | None = None       # Links request/response pairs
     ttl: int = 3600                         # Seconds before message expires
 
+    def __post_init__(self):
+        # Messages sent while handling a task carry its trace id
+        if self.correlation_id is None:
+            self.correlation_id = current_trace_id()
+
     @property
     def is_expired(self) -> bool:
         return time.time() - self.timestamp > self.ttl
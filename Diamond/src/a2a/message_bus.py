@@ -2,15 +2,195 @@
 
 Provides pub/sub and point-to-point messaging between agents.
 All messages are stored in memory (no external dependencies).
+
+- Each agent's queue is one deque per priority (urgent, high, normal, low):
+  publish appends to its priority's deque and consume pops from the
+  highest non-empty one, so both are O(1) per message and FIFO order
+  within a priority is kept.
+- Per-queue and bus-wide depth counters are updated as messages come and
+  go, so peek() and get_stats() are O(1).
+- TTL expiry uses a timing wheel: one slot per second of expiry time,
+  holding the entries that expire in it. Every bus call sweeps the slots
+  that have passed since the last call, so expired messages leave every
+  queue — including those of agents that never consume — without a
+  clock read per message. Expired entries are only marked dead and
+  skipped by consume; a queue's deques are compacted once dead entries
+  outnumber live ones.
+- A broadcast is one shared entry referenced by every recipient queue; it
+  leaves the wheel when the last queue has consumed it.
+- consume(..., timeout=) blocks on the queue's condition variable (sharing
+  the bus lock) until a message arrives; aconsume() is the asyncio
+  counterpart, woken through call_soon_threadsafe. publish notifies only
+  the recipient queue's waiters.
+- subscribe() callbacks run on a single "bus-subscriber" thread after the
+  lock is released, in publish order, so a slow subscriber cannot stall
+  publish. flush_subscribers() waits for the ones already queued.
+
+Usage:
+    bus = MockMessageBus(max_queue_size=1000)
+    bus.publish(A2AMessage("swarm", "sales-agent", MessageType.TASK_DELEGATION, {...}))
+    messages = bus.consume("sales-agent", max_messages=10)
+    messages = bus.consume("sales-agent", timeout=5.0)       # wait up to 5s
+    messages = await bus.aconsume("sales-agent", timeout=5.0)
+
+create_message_bus() picks the backend configured in config.yaml
+`a2a.backend`: "memory", the durable "sqlite" (src/a2a/sqlite_bus.py) or
+"redis" (Redis Streams, src/a2a/redis_bus.py).
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import threading
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Callable
 
 from src.a2a.message import A2AMessage, MessagePriority
+from src.utils.metrics import BUS_MESSAGES, BUS_QUEUE_DEPTH
+
+logger = logging.getLogger("ai_employee")
+
+# Lane index per priority: consume drains lane 0 first
+PRIORITY_LANES = {
+    MessagePriority.URGENT: 0,
+    MessagePriority.HIGH: 1,
+    MessagePriority.NORMAL: 2,
+    MessagePriority.LOW: 3,
+}
+
+# Dead entries tolerated in a queue's deques before they are compacted
+_COMPACT_MIN = 64
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Entry:
+    """A queued message, shared by every queue it was delivered to."""
+
+    __slots__ = ("message", "slot", "holders", "dead")
+
+    def __init__(self, message: A2AMessage, slot: int):
+        self.message = message
+        self.slot = slot
+        self.holders: list[_AgentQueue] = []
+        self.dead = False
+
+
+class _AgentQueue:
+    """One agent's entries: a FIFO deque per priority, depth counters and waiters."""
+
+    __slots__ = ("lanes", "size", "stored", "expired", "cond", "async_waiters")
+
+    def __init__(self, lock: threading.Lock):
+        self.lanes = tuple(deque() for _ in range(len(PRIORITY_LANES)))
+        self.size = 0       # live messages
+        self.stored = 0     # entries in the deques, live or dead
+        self.expired = 0
+        self.cond = threading.Condition(lock)
+        self.async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def wake(self, all_waiters: bool = False) -> None:
+        """Wake threads blocked in consume and coroutines in aconsume (lock held)."""
+        if all_waiters:
+            self.cond.notify_all()
+        else:
+            self.cond.notify()
+        for loop, future in self.async_waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                pass  # loop already closed
+        self.async_waiters.clear()
+
+    def push(self, entry: _Entry) -> None:
+        self.lanes[PRIORITY_LANES.get(entry.message.priority, 2)].append(entry)
+        entry.holders.append(self)
+        self.size += 1
+        self.stored += 1
+
+    def compact(self) -> None:
+        """Drop dead entries once they outnumber the live ones."""
+        if self.stored - self.size > max(_COMPACT_MIN, self.size):
+            for lane in self.lanes:
+                live = [e for e in lane if not e.dead]
+                lane.clear()
+                lane.extend(live)
+            self.stored = self.size
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class SubscriberDispatcher:
+    """subscribe() callbacks of a bus, run on one thread outside the bus lock.
+
+    A single worker keeps callbacks in publish order; it is started by the
+    first notify().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_agent: dict[str, list[Callable]] = defaultdict(list)
+        self._broadcast: list[Callable] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def subscribe(self, agent_id: str, callback: Callable[[A2AMessage], None]) -> None:
+        with self._lock:
+            self._by_agent[agent_id].append(callback)
+
+    def subscribe_broadcast(self, callback: Callable[[A2AMessage], None]) -> None:
+        with self._lock:
+            self._broadcast.append(callback)
+
+    def notify(self, message: A2AMessage) -> None:
+        """Queue the callbacks interested in a published message."""
+        with self._lock:
+            if message.is_broadcast:
+                callbacks = list(self._broadcast)
+            else:
+                callbacks = list(self._by_agent.get(message.recipient_id, ()))
+            if not callbacks or self._closed:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1,
+                                                    thread_name_prefix="bus-subscriber")
+            self._executor.submit(self._run, callbacks, message)
+
+    @staticmethod
+    def _run(callbacks: list[Callable], message: A2AMessage) -> None:
+        for callback in callbacks:
+            try:
+                callback(message)
+            except Exception as e:
+                logger.debug(f"[MessageBus] subscriber failed on {message.message_id}: {e}")
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until the callbacks queued so far have run."""
+        with self._lock:
+            executor = self._executor
+            if executor is None or self._closed:
+                return True
+            marker = executor.submit(lambda: None)
+        try:
+            marker.result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
 
 
 class MockMessageBus:
@@ -21,13 +201,71 @@ class MockMessageBus:
     """
 
     def __init__(self, max_queue_size: int = 1000):
-        self._queues: dict[str, list[A2AMessage]] = defaultdict(list)
-        self._subscribers: dict[str, list[Callable]] = defaultdict(list)
-        self._broadcast_subscribers: list[Callable] = []
+        self._lock = threading.Lock()
+        self._queues: dict[str, _AgentQueue] = defaultdict(lambda: _AgentQueue(self._lock))
+        self._subscribers = SubscriberDispatcher()
         self._max_queue_size = max_queue_size
         self._total_published = 0
         self._total_consumed = 0
-        self._lock = threading.Lock()
+        self._total_queued = 0
+        self._total_expired = 0
+        # Timing wheel: expiry second → entries; every slot before the cursor is swept
+        self._wheel: dict[int, set[_Entry]] = {}
+        self._wheel_cursor = int(time.time())
+        self._closed = False
+
+    # -- expiry ------------------------------------------------------------------
+
+    def _expire(self, now: float) -> None:
+        """Evict entries whose slot has passed (lock held)."""
+        limit = int(now)
+        if limit <= self._wheel_cursor:
+            return
+        if limit - self._wheel_cursor > len(self._wheel):
+            slots = sorted(s for s in self._wheel if s < limit)
+        else:
+            slots = range(self._wheel_cursor, limit)
+        self._wheel_cursor = limit
+        for slot in slots:
+            for entry in self._wheel.pop(slot, ()):
+                entry.dead = True
+                for queue in entry.holders:
+                    queue.size -= 1
+                    queue.expired += 1
+                    self._total_queued -= 1
+                    self._total_expired += 1
+                    BUS_MESSAGES.inc(event="expired")
+                entry.holders.clear()
+        for agent_id, queue in self._queues.items():
+            if queue.stored != queue.size:
+                queue.compact()
+                BUS_QUEUE_DEPTH.set(queue.size, agent=agent_id)
+
+    def _new_entry(self, message: A2AMessage, now: float) -> _Entry | None:
+        """Wheel entry for a message, or None if it has already expired."""
+        expires_at = message.timestamp + message.ttl
+        if now > expires_at:
+            return None
+        entry = _Entry(message, max(int(expires_at), self._wheel_cursor))
+        self._wheel.setdefault(entry.slot, set()).add(entry)
+        return entry
+
+    def _release(self, entry: _Entry, queue: _AgentQueue) -> None:
+        """A queue is done with an entry; forget it once no queue holds it."""
+        entry.holders.remove(queue)
+        if not entry.holders:
+            slot = self._wheel.get(entry.slot)
+            if slot is not None:
+                slot.discard(entry)
+                if not slot:
+                    del self._wheel[entry.slot]
+
+    def _count_expired_on_publish(self, queue: _AgentQueue) -> None:
+        queue.expired += 1
+        self._total_expired += 1
+        BUS_MESSAGES.inc(event="expired")
+
+    # -- public API --------------------------------------------------------------
 
     def publish(self, message: A2AMessage) -> bool:
         """Publish a message to a recipient's queue.
@@ -35,114 +273,247 @@ class MockMessageBus:
         Returns True if published, False if queue full.
         """
         with self._lock:
+            now = time.time()
+            self._expire(now)
             recipient = message.recipient_id
 
             if message.is_broadcast:
-                self._handle_broadcast(message)
+                self._handle_broadcast(message, now)
                 self._total_published += 1
-                return True
+                BUS_MESSAGES.inc(event="published")
+            else:
+                queue = self._queues[recipient]
+                if queue.size >= self._max_queue_size:
+                    BUS_MESSAGES.inc(event="dropped")
+                    return False
+
+                self._total_published += 1
+                BUS_MESSAGES.inc(event="published")
+                entry = self._new_entry(message, now)
+                if entry is None:
+                    self._count_expired_on_publish(queue)
+                else:
+                    queue.push(entry)
+                    self._total_queued += 1
+                    BUS_QUEUE_DEPTH.set(queue.size, agent=recipient)
+                    queue.wake()
 
-            queue = self._queues[recipient]
-            if len(queue) >= self._max_queue_size:
-                return False
+        # Notify subscribers outside the lock
+        self._subscribers.notify(message)
+        return True
 
-            # Insert by priority (urgent first)
-            priority_order = {
-                MessagePriority.URGENT: 0,
-                MessagePriority.HIGH: 1,
-                MessagePriority.NORMAL: 2,
-                MessagePriority.LOW: 3,
-            }
-            msg_priority = priority_order.get(message.priority, 2)
-
-            # Find insertion point
-            insert_idx = len(queue)
-            for i, existing in enumerate(queue):
-                existing_priority = priority_order.get(existing.priority, 2)
-                if msg_priority < existing_priority:
-                    insert_idx = i
-                    break
-
-            queue.insert(insert_idx, message)
-            self._total_published += 1
-
-            # Notify subscribers
-            for callback in self._subscribers.get(recipient, []):
-                try:
-                    callback(message)
-                except Exception:
-                    pass
+    def flush_subscribers(self, timeout: float | None = None) -> bool:
+        """Wait until subscriber callbacks queued so far have run."""
+        return self._subscribers.flush(timeout)
 
-            return True
+    def _take(self, agent_id: str, max_messages: int) -> list[A2AMessage]:
+        """Pop up to max_messages live messages in priority order (lock held)."""
+        self._expire(time.time())
+        queue = self._queues[agent_id]
+        consumed: list[A2AMessage] = []
+        if not queue.size:
+            return consumed
+        for lane in queue.lanes:
+            while lane and len(consumed) < max_messages:
+                entry = lane.popleft()
+                queue.stored -= 1
+                if entry.dead:
+                    continue
+                self._release(entry, queue)
+                consumed.append(entry.message)
+            if len(consumed) >= max_messages:
+                break
+
+        queue.size -= len(consumed)
+        self._total_queued -= len(consumed)
+        self._total_consumed += len(consumed)
+        BUS_MESSAGES.inc(len(consumed), event="consumed")
+        BUS_QUEUE_DEPTH.set(queue.size, agent=agent_id)
+        return consumed
 
-    def consume(self, agent_id: str, max_messages: int = 10) -> list[A2AMessage]:
+    def consume(self, agent_id: str, max_messages: int = 10,
+                timeout: float | None = 0) -> list[A2AMessage]:
         """Consume messages from an agent's queue.
 
-        Returns up to max_messages, removing expired ones.
+        Returns up to max_messages in priority order; expired ones are skipped.
+        With timeout > 0, waits up to that many seconds for a message to
+        arrive when the queue is empty (None waits until one does or the bus
+        is closed); the default 0 returns at once.
         """
         with self._lock:
-            queue = self._queues.get(agent_id, [])
+            consumed = self._take(agent_id, max_messages)
+            if consumed or timeout == 0:
+                return consumed
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                if consumed or self._closed:
+                    return consumed
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return consumed
+                # Bounded waits so TTL sweeps and clear() are noticed
+                self._queues[agent_id].cond.wait(
+                    1.0 if remaining is None else min(remaining, 1.0))
+                consumed = self._take(agent_id, max_messages)
 
-            # Remove expired messages
-            queue[:] = [m for m in queue if not m.is_expired]
+    async def aconsume(self, agent_id: str, max_messages: int = 10,
+                       timeout: float | None = None) -> list[A2AMessage]:
+        """asyncio counterpart of consume(): awaits a message without blocking the loop.
 
-            # Take up to max_messages
-            consumed = queue[:max_messages]
-            self._queues[agent_id] = queue[max_messages:]
-            self._total_consumed += len(consumed)
+        timeout=None waits until a message arrives or the bus is closed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                consumed = self._take(agent_id, max_messages)
+                if consumed or self._closed:
+                    return consumed
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return consumed
+                future = loop.create_future()
+                queue = self._queues[agent_id]
+                queue.async_waiters.append((loop, future))
+            try:
+                await asyncio.wait_for(future, None if remaining is None else min(remaining, 1.0))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    try:
+                        queue.async_waiters.remove((loop, future))
+                    except ValueError:
+                        pass
 
-            return consumed
+    def ack(self, agent_id: str, message_ids: list[str]) -> int:
+        """No-op: the in-memory bus removes messages when they are consumed."""
+        return 0
+
+    def nack(self, agent_id: str, message_ids: list[str], delay: float = 0) -> int:
+        """No-op: consumed messages cannot be returned to an in-memory queue."""
+        return 0
 
     def peek(self, agent_id: str) -> int:
-        """Check how many messages are waiting for an agent."""
+        """Check how many unexpired messages are waiting for an agent."""
         with self._lock:
-            queue = self._queues.get(agent_id, [])
-            return len([m for m in queue if not m.is_expired])
+            self._expire(time.time())
+            queue = self._queues.get(agent_id)
+            return queue.size if queue is not None else 0
 
     def subscribe(self, agent_id: str, callback: Callable[[A2AMessage], None]) -> None:
         """Subscribe to messages for a specific agent."""
-        with self._lock:
-            self._subscribers[agent_id].append(callback)
+        self._subscribers.subscribe(agent_id, callback)
 
     def subscribe_broadcast(self, callback: Callable[[A2AMessage], None]) -> None:
         """Subscribe to all broadcast messages."""
-        with self._lock:
-            self._broadcast_subscribers.append(callback)
-
-    def _handle_broadcast(self, message: A2AMessage) -> None:
-        """Deliver a broadcast message to all queues and subscribers."""
-        for agent_id in list(self._queues.keys()):
-            if agent_id != message.sender_id:
-                queue = self._queues[agent_id]
-                if len(queue) < self._max_queue_size:
-                    queue.append(message)
+        self._subscribers.subscribe_broadcast(callback)
 
-        for callback in self._broadcast_subscribers:
-            try:
-                callback(message)
-            except Exception:
-                pass
+    def _handle_broadcast(self, message: A2AMessage, now: float) -> None:
+        """Deliver one shared broadcast entry to every other agent's queue (lock held)."""
+        recipients = [(agent_id, queue) for agent_id, queue in self._queues.items()
+                      if agent_id != message.sender_id and queue.size < self._max_queue_size]
+        entry = self._new_entry(message, now) if recipients else None
+        for agent_id, queue in recipients:
+            if entry is None:
+                self._count_expired_on_publish(queue)
+                continue
+            queue.push(entry)
+            self._total_queued += 1
+            BUS_QUEUE_DEPTH.set(queue.size, agent=agent_id)
+            queue.wake()
 
     def clear(self, agent_id: str | None = None) -> None:
         """Clear messages for a specific agent, or all if None."""
         with self._lock:
             if agent_id:
-                self._queues.pop(agent_id, None)
+                queue = self._queues.pop(agent_id, None)
+                if queue is not None:
+                    for lane in queue.lanes:
+                        for entry in lane:
+                            if not entry.dead:
+                                self._release(entry, queue)
+                    self._total_queued -= queue.size
+                    queue.wake(all_waiters=True)  # waiters move to the new queue
+                BUS_QUEUE_DEPTH.set(0, agent=agent_id)
             else:
+                for name, queue in self._queues.items():
+                    BUS_QUEUE_DEPTH.set(0, agent=name)
+                    queue.wake(all_waiters=True)
                 self._queues.clear()
+                self._wheel.clear()
+                self._total_queued = 0
+
+    def close(self) -> None:
+        """Wake every waiting consumer (they return []) and stop the subscriber thread."""
+        with self._lock:
+            self._closed = True
+            for queue in self._queues.values():
+                queue.wake(all_waiters=True)
+        self._subscribers.close()
 
     def get_stats(self) -> dict:
-        """Get message bus statistics."""
+        """Get message bus statistics, with depth and expired count per queue."""
         with self._lock:
-            total_queued = sum(len(q) for q in self._queues.values())
+            self._expire(time.time())
             return {
                 "backend": "memory",
-                "total_queued": total_queued,
+                "total_queued": self._total_queued,
                 "total_published": self._total_published,
                 "total_consumed": self._total_consumed,
+                "total_expired": self._total_expired,
                 "active_queues": len(self._queues),
                 "max_queue_size": self._max_queue_size,
+                "queues": {
+                    agent_id: {"depth": queue.size, "expired": queue.expired}
+                    for agent_id, queue in self._queues.items()
+                },
             }
 
     def __repr__(self) -> str:
         return f"MockMessageBus(queues={len(self._queues)}, published={self._total_published})"
+
+
+def create_message_bus(root: str | Path | None = None):
+    """Build the bus selected by config.yaml `a2a.backend`.
+
+    "memory" (default) is MockMessageBus; "sqlite" is the durable
+    SQLiteMessageBus at <project root>/<a2a.sqlite.path>; "redis" is
+    RedisStreamsBus at a2a.redis.url. Unknown backends, or redis without the
+    redis package, fall back to memory with a warning.
+    """
+    try:
+        from src.config.agent_config import AgentConfig
+        config = AgentConfig._load_config().get("a2a", {}) or {}
+    except Exception:
+        config = {}
+    backend = config.get("backend", "memory")
+    max_queue_size = config.get("max_queue_size", 1000)
+
+    if backend == "sqlite":
+        from src.a2a.sqlite_bus import SQLiteMessageBus
+        if root is None:
+            from src.utils.file_ops import get_project_root
+            root = get_project_root()
+        settings = config.get("sqlite", {}) or {}
+        return SQLiteMessageBus(
+            Path(root) / settings.get("path", ".a2a_bus.db"),
+            max_queue_size=max_queue_size,
+            ack_timeout=settings.get("ack_timeout", 300),
+            synchronous=settings.get("synchronous", "NORMAL"),
+        )
+    if backend == "redis":
+        from src.a2a.redis_bus import HAS_REDIS, RedisStreamsBus
+        if HAS_REDIS:
+            settings = config.get("redis", {}) or {}
+            return RedisStreamsBus(
+                url=settings.get("url", "redis://localhost:6379/0"),
+                max_queue_size=max_queue_size,
+                group=settings.get("group", "agents"),
+                consumer=settings.get("consumer"),
+                claim_idle=settings.get("claim_idle", 300),
+                prefix=settings.get("prefix", "a2a"),
+            )
+    if backend != "memory":
+        logger.warning(f"[MessageBus] backend {backend!r} is not available; using memory")
+    return MockMessageBus(max_queue_size=max_queue_size)
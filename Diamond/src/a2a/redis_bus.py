@@ -0,0 +1,449 @@
+"""Redis Streams A2A message bus for swarms spread over several hosts.
+
+Same publish/consume/peek/subscribe API as MockMessageBus and
+SQLiteMessageBus, on top of Redis Streams:
+
+- One stream per agent and priority lane: <prefix>:q:<agent>:<lane>.
+  consume() reads lane 0 (urgent) first and reads lower lanes only while
+  max_messages leaves room, so the memory bus's priority-then-FIFO order
+  holds. Agents are tracked in the <prefix>:agents set; broadcasts go to
+  one entry per known agent.
+- Every stream has one consumer group (`group`). Several instances of the
+  same agent each get their own consumer name and compete for its messages.
+- Delivery is at-least-once. consume() leaves entries pending until ack()
+  (XACK + XDEL). Entries left pending for claim_idle seconds by a crashed or
+  slow consumer are taken over by the next consume() (XAUTOCLAIM).
+  nack() resets an entry's idle time so that it is reclaimed after `delay`.
+- Backpressure: publish returns False once an agent's streams hold
+  max_queue_size entries (queued plus pending). XADD also trims each stream
+  with an approximate MAXLEN of the same size. This only matters if
+  concurrent publishers overshoot the check.
+- Entries hold one field "m" with compact JSON: short keys, no whitespace.
+- publish_many() sends a batch in a pipeline: one round trip for the depth
+  checks and one for all the XADDs.
+- Expired messages are not written. A message that expires while queued is
+  dropped (acked and deleted) when a consumer reads it.
+
+Needs the `redis` package; tests use fakeredis. Counters in get_stats()
+are for this process; depths come from Redis.
+
+Usage:
+    bus = RedisStreamsBus(url="redis://localhost:6379/0")
+    bus.publish(message)
+    for message in bus.consume("sales-agent", timeout=5.0):
+        handle(message)
+        bus.ack("sales-agent", [message.message_id])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+from src.a2a.message import A2AMessage, MessagePriority, MessageType
+from src.a2a.message_bus import PRIORITY_LANES, SubscriberDispatcher
+from src.utils.metrics import BUS_MESSAGES, BUS_QUEUE_DEPTH
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+logger = logging.getLogger("ai_employee")
+
+LANES = range(len(PRIORITY_LANES))
+
+# Seconds between XAUTOCLAIM sweeps of one agent's streams by this process
+_CLAIM_INTERVAL = 1.0
+
+# Longest single XREAD BLOCK while waiting (also bounds shutdown latency)
+_POLL_INTERVAL = 1.0
+
+
+def _encode(message: A2AMessage) -> str:
+    """Compact JSON for a stream entry."""
+    data = {
+        "i": message.message_id, "s": message.sender_id, "r": message.recipient_id,
+        "t": message.message_type.value, "d": message.payload, "ts": message.timestamp,
+    }
+    if message.priority != MessagePriority.NORMAL:
+        data["p"] = message.priority.value
+    if message.correlation_id is not None:
+        data["c"] = message.correlation_id
+    if message.ttl != 3600:
+        data["ttl"] = message.ttl
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _decode(raw: bytes | str) -> A2AMessage:
+    data = json.loads(raw)
+    return A2AMessage(
+        sender_id=data["s"], recipient_id=data["r"],
+        message_type=MessageType(data["t"]), payload=data["d"],
+        priority=MessagePriority(data.get("p", "normal")),
+        message_id=data["i"], timestamp=data["ts"],
+        correlation_id=data.get("c"), ttl=data.get("ttl", 3600),
+    )
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisStreamsBus:
+    """At-least-once message bus on Redis Streams with consumer groups."""
+
+    def __init__(self, client: Any = None, url: str = "redis://localhost:6379/0",
+                 max_queue_size: int = 1000, group: str = "agents",
+                 consumer: str | None = None, claim_idle: float = 300.0,
+                 prefix: str = "a2a"):
+        if client is None:
+            if not HAS_REDIS:
+                raise RuntimeError("RedisStreamsBus needs the 'redis' package (pip install redis)")
+            client = redis.Redis.from_url(url)
+        self._redis = client
+        self._max_queue_size = max_queue_size
+        self._group = group
+        self._consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._claim_idle_ms = int(claim_idle * 1000)
+        self._prefix = prefix
+        self._agents_key = f"{prefix}:agents"
+
+        self._lock = threading.Lock()
+        self._groups: set[str] = set()                       # streams with our group
+        self._pending: dict[tuple[str, str], tuple[str, bytes]] = {}  # (agent, msg id) → entry
+        self._next_claim: dict[str, float] = {}
+        self._expired: dict[str, int] = defaultdict(int)
+        self._subscribers = SubscriberDispatcher()
+        self._closed = False
+
+        self._total_published = 0
+        self._total_consumed = 0
+        self._total_reclaimed = 0
+        self._total_acked = 0
+        self._total_expired = 0
+
+    def _stream(self, agent_id: str, lane: int) -> str:
+        return f"{self._prefix}:q:{agent_id}:{lane}"
+
+    # -- publish -----------------------------------------------------------------
+
+    def publish(self, message: A2AMessage) -> bool:
+        """Publish a message to a recipient's stream.
+
+        Returns True if published, False if queue full.
+        """
+        return self.publish_many([message]) == 1
+
+    def publish_many(self, messages: list[A2AMessage]) -> int:
+        """Publish a batch with pipelined round trips; returns how many were accepted."""
+        now = time.time()
+        agents: set[str] = set()
+        if any(m.is_broadcast for m in messages):
+            agents = {_text(a) for a in self._redis.smembers(self._agents_key)}
+
+        deliveries: list[tuple[A2AMessage, list[str]]] = []
+        for message in messages:
+            if message.is_broadcast:
+                recipients = sorted(agents - {message.sender_id})
+            else:
+                recipients = [message.recipient_id]
+            deliveries.append((message, recipients))
+
+        # Round trip 1: current depth (queued + pending) of every recipient
+        targets = sorted({agent for _, recipients in deliveries for agent in recipients})
+        pipe = self._redis.pipeline(transaction=False)
+        for agent_id in targets:
+            for lane in LANES:
+                pipe.xlen(self._stream(agent_id, lane))
+        lengths = pipe.execute()
+        depth = {agent_id: sum(lengths[i * len(LANES):(i + 1) * len(LANES)])
+                 for i, agent_id in enumerate(targets)}
+
+        # Round trip 2: every XADD
+        pipe = self._redis.pipeline(transaction=False)
+        accepted: list[A2AMessage] = []
+        expired: list[str] = []
+        for message, recipients in deliveries:
+            if not message.is_broadcast and depth[message.recipient_id] >= self._max_queue_size:
+                BUS_MESSAGES.inc(event="dropped")
+                continue
+            accepted.append(message)
+            if now > message.timestamp + message.ttl:
+                expired.extend(recipients)
+                continue
+            lane = PRIORITY_LANES.get(message.priority, 2)
+            body = _encode(message)
+            for agent_id in recipients:
+                if depth[agent_id] >= self._max_queue_size:
+                    continue
+                depth[agent_id] += 1
+                pipe.xadd(self._stream(agent_id, lane), {"m": body},
+                          maxlen=self._max_queue_size, approximate=True)
+                BUS_QUEUE_DEPTH.set(depth[agent_id], agent=agent_id)
+        direct = {m.recipient_id for m in accepted if not m.is_broadcast}
+        if direct:
+            pipe.sadd(self._agents_key, *direct)
+        pipe.execute()
+
+        with self._lock:
+            self._total_published += len(accepted)
+            for agent_id in expired:
+                self._expired[agent_id] += 1
+            self._total_expired += len(expired)
+        BUS_MESSAGES.inc(len(accepted), event="published")
+        if expired:
+            BUS_MESSAGES.inc(len(expired), event="expired")
+
+        for message in accepted:
+            self._subscribers.notify(message)
+        return len(accepted)
+
+    # -- consume -----------------------------------------------------------------
+
+    def _ensure_group(self, stream: str) -> None:
+        if stream in self._groups:
+            return
+        try:
+            self._redis.xgroup_create(stream, self._group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add(stream)
+
+    def _read(self, agent_id: str, max_messages: int) -> list[A2AMessage]:
+        """Reclaim stuck entries (at most once a second), then read new ones by lane."""
+        now = time.monotonic()
+        claim = now >= self._next_claim.get(agent_id, 0.0)
+        if claim:
+            self._next_claim[agent_id] = now + _CLAIM_INTERVAL
+
+        entries: list[tuple[str, bytes, dict, bool]] = []
+        for lane in LANES:
+            room = max_messages - len(entries)
+            if room <= 0:
+                break
+            stream = self._stream(agent_id, lane)
+            self._ensure_group(stream)
+            try:
+                if claim:
+                    _, claimed, _ = self._redis.xautoclaim(
+                        stream, self._group, self._consumer, self._claim_idle_ms,
+                        start_id="0-0", count=room)
+                    entries.extend((stream, entry_id, fields, True)
+                                   for entry_id, fields in claimed if fields)
+                    room = max_messages - len(entries)
+                if room > 0:
+                    for _, read in self._redis.xreadgroup(
+                            self._group, self._consumer, {stream: ">"}, count=room) or ():
+                        entries.extend((stream, entry_id, fields, False)
+                                       for entry_id, fields in read)
+            except redis.ResponseError as e:
+                if "NOGROUP" not in str(e):
+                    raise
+                self._groups.discard(stream)            # stream was cleared elsewhere
+
+        if not entries:
+            return []
+
+        wall = time.time()
+        messages: list[A2AMessage] = []
+        stale: list[tuple[str, bytes]] = []
+        reclaimed = 0
+        with self._lock:
+            for stream, entry_id, fields, was_claimed in entries:
+                message = _decode(fields.get(b"m") or fields.get("m"))
+                if wall > message.timestamp + message.ttl:
+                    stale.append((stream, entry_id))
+                    self._expired[agent_id] += 1
+                    continue
+                self._pending[(agent_id, message.message_id)] = (stream, entry_id)
+                messages.append(message)
+                reclaimed += was_claimed
+            self._total_expired += len(stale)
+            self._total_consumed += len(messages)
+            self._total_reclaimed += reclaimed
+        if stale:
+            self._delete(stale)
+            BUS_MESSAGES.inc(len(stale), event="expired")
+        BUS_MESSAGES.inc(len(messages), event="consumed")
+        return messages
+
+    def _wait(self, agent_id: str, timeout: float) -> None:
+        """Block until any of the agent's streams has entries the group has not read."""
+        streams = [self._stream(agent_id, lane) for lane in LANES]
+        for stream in streams:
+            self._ensure_group(stream)
+        pipe = self._redis.pipeline(transaction=False)
+        for stream in streams:
+            pipe.xinfo_groups(stream)
+        ids = {}
+        for stream, groups in zip(streams, pipe.execute()):
+            delivered = [g["last-delivered-id"] for g in groups if _text(g["name"]) == self._group]
+            ids[stream] = delivered[0] if delivered else "0-0"
+        self._redis.xread(ids, count=1, block=max(1, int(timeout * 1000)))
+
+    def consume(self, agent_id: str, max_messages: int = 10,
+                timeout: float | None = 0) -> list[A2AMessage]:
+        """Read messages from an agent's streams; ack() them once handled.
+
+        timeout works as in MockMessageBus.consume: 0 returns at once, > 0
+        waits up to that many seconds, None waits until a message arrives or
+        the bus is closed.
+        """
+        if agent_id not in self._next_claim:
+            self._redis.sadd(self._agents_key, agent_id)   # known agent: receives broadcasts
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            messages = self._read(agent_id, max_messages)
+            if messages or timeout == 0 or self._closed:
+                return messages
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return messages
+            self._wait(agent_id, _POLL_INTERVAL if remaining is None
+                       else min(remaining, _POLL_INTERVAL))
+
+    async def aconsume(self, agent_id: str, max_messages: int = 10,
+                       timeout: float | None = None) -> list[A2AMessage]:
+        """asyncio counterpart of consume(); the wait runs on the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.consume, agent_id, max_messages, timeout)
+
+    def _delete(self, entries: list[tuple[str, bytes]]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for stream, entry_id in entries:
+            pipe.xack(stream, self._group, entry_id)
+            pipe.xdel(stream, entry_id)
+        pipe.execute()
+
+    def _take_pending(self, agent_id: str, message_ids: list[str]) -> list[tuple[str, bytes]]:
+        with self._lock:
+            return [entry for entry in (self._pending.pop((agent_id, mid), None)
+                                        for mid in message_ids) if entry]
+
+    def ack(self, agent_id: str, message_ids: list[str]) -> int:
+        """Acknowledge and delete messages this process consumed; returns how many."""
+        entries = self._take_pending(agent_id, message_ids)
+        if entries:
+            self._delete(entries)
+            with self._lock:
+                self._total_acked += len(entries)
+            BUS_MESSAGES.inc(len(entries), event="acked")
+        return len(entries)
+
+    def nack(self, agent_id: str, message_ids: list[str], delay: float = 0) -> int:
+        """Let messages be reclaimed (by any consumer) after delay seconds."""
+        entries = self._take_pending(agent_id, message_ids)
+        idle = max(0, self._claim_idle_ms - int(delay * 1000))
+        pipe = self._redis.pipeline(transaction=False)
+        for stream, entry_id in entries:
+            pipe.xclaim(stream, self._group, self._consumer, 0, [entry_id],
+                        idle=idle, justid=True)
+        pipe.execute()
+        if entries:
+            self._next_claim[agent_id] = 0.0
+            BUS_MESSAGES.inc(len(entries), event="nacked")
+        return len(entries)
+
+    def _depths(self, agents: list[str]) -> dict[str, tuple[int, int]]:
+        """{agent: (queued, pending)} in one round trip."""
+        pipe = self._redis.pipeline(transaction=False)
+        for agent_id in agents:
+            for lane in LANES:
+                stream = self._stream(agent_id, lane)
+                pipe.xlen(stream)
+                pipe.xinfo_groups(stream)
+        # XINFO fails for a stream that does not exist yet: nothing pending
+        results = iter(pipe.execute(raise_on_error=False))
+        depths = {}
+        for agent_id in agents:
+            queued = pending = 0
+            for _ in LANES:
+                length, groups = next(results), next(results)
+                busy = 0 if isinstance(groups, Exception) else sum(
+                    g["pending"] for g in groups if _text(g["name"]) == self._group)
+                queued += length - busy
+                pending += busy
+            depths[agent_id] = (queued, pending)
+        return depths
+
+    def peek(self, agent_id: str) -> int:
+        """Check how many messages are waiting (not yet delivered) for an agent."""
+        return self._depths([agent_id])[agent_id][0]
+
+    # -- subscribers -------------------------------------------------------------
+
+    def subscribe(self, agent_id: str, callback: Callable[[A2AMessage], None]) -> None:
+        """Subscribe to messages for a specific agent (this process's publishes only)."""
+        self._subscribers.subscribe(agent_id, callback)
+
+    def subscribe_broadcast(self, callback: Callable[[A2AMessage], None]) -> None:
+        """Subscribe to all broadcast messages (this process's publishes only)."""
+        self._subscribers.subscribe_broadcast(callback)
+
+    def flush_subscribers(self, timeout: float | None = None) -> bool:
+        """Wait until subscriber callbacks queued so far have run."""
+        return self._subscribers.flush(timeout)
+
+    # -- admin -------------------------------------------------------------------
+
+    def clear(self, agent_id: str | None = None) -> None:
+        """Delete all streams (or one agent's)."""
+        agents = [agent_id] if agent_id else sorted(
+            _text(a) for a in self._redis.smembers(self._agents_key))
+        streams = [self._stream(a, lane) for a in agents for lane in LANES]
+        pipe = self._redis.pipeline(transaction=False)
+        if streams:
+            pipe.delete(*streams)
+        if agent_id:
+            pipe.srem(self._agents_key, agent_id)
+        else:
+            pipe.delete(self._agents_key)
+        pipe.execute()
+        with self._lock:
+            self._groups.difference_update(streams)
+            for key in [k for k in self._pending if k[0] in agents]:
+                del self._pending[key]
+            for name in agents:
+                self._next_claim.pop(name, None)
+                BUS_QUEUE_DEPTH.set(0, agent=name)
+
+    def close(self) -> None:
+        """Stop waiting consumers (within a second) and the subscriber thread."""
+        self._closed = True
+        self._subscribers.close()
+
+    def get_stats(self) -> dict:
+        """Get message bus statistics, with depth, pending and expired count per queue."""
+        agents = sorted(_text(a) for a in self._redis.smembers(self._agents_key))
+        depths = self._depths(agents) if agents else {}
+        with self._lock:
+            return {
+                "backend": "redis",
+                "consumer": self._consumer,
+                "total_queued": sum(queued for queued, _ in depths.values()),
+                "total_published": self._total_published,
+                "total_consumed": self._total_consumed,
+                "total_reclaimed": self._total_reclaimed,
+                "total_acked": self._total_acked,
+                "total_expired": self._total_expired,
+                "active_queues": len(agents),
+                "max_queue_size": self._max_queue_size,
+                "queues": {
+                    agent_id: {"depth": queued, "in_flight": pending,
+                               "expired": self._expired.get(agent_id, 0)}
+                    for agent_id, (queued, pending) in depths.items()
+                },
+            }
+
+    def __repr__(self) -> str:
+        return f"RedisStreamsBus(prefix={self._prefix!r}, published={self._total_published})"
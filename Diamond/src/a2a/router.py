@@ -9,6 +9,8 @@ from typing import Any
 
 from src.a2a.message import A2AMessage, MessageType, MessagePriority
 from src.a2a.message_bus import MockMessageBus
+from src.a2a.redis_bus import RedisStreamsBus
+from src.a2a.sqlite_bus import SQLiteMessageBus
 from src.agents.agent_registry import AgentRegistry
 from src.agents.base_agent import BaseSpecializedAgent
 
@@ -20,7 +22,8 @@ class MessageRouter:
     built on top of the raw message bus.
     """
 
-    def __init__(self, bus: MockMessageBus, registry: AgentRegistry):
+    def __init__(self, bus: MockMessageBus | SQLiteMessageBus | RedisStreamsBus,
+                 registry: AgentRegistry):
         self._bus = bus
         self._registry = registry
 
@@ -110,9 +113,18 @@ class MessageRouter:
         self._bus.publish(msg)
         return msg
 
-    def get_messages(self, agent_id: str, max_messages: int = 10) -> list[A2AMessage]:
-        """Get pending messages for an agent."""
-        return self._bus.consume(agent_id, max_messages)
+    def get_messages(self, agent_id: str, max_messages: int = 10,
+                     timeout: float | None = 0) -> list[A2AMessage]:
+        """Get pending messages for an agent, waiting up to timeout seconds for one."""
+        return self._bus.consume(agent_id, max_messages, timeout=timeout)
+
+    def ack(self, agent_id: str, message_ids: list[str]) -> int:
+        """Acknowledge handled messages (durable backends redeliver unacked ones)."""
+        return self._bus.ack(agent_id, message_ids)
+
+    def nack(self, agent_id: str, message_ids: list[str], delay: float = 0) -> int:
+        """Hand messages back for redelivery after delay seconds."""
+        return self._bus.nack(agent_id, message_ids, delay)
 
     def pending_count(self, agent_id: str) -> int:
         """Check how many messages are pending for an agent."""
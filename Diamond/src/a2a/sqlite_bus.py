@@ -0,0 +1,386 @@
+"""Durable A2A message bus on SQLite (WAL mode).
+
+MockMessageBus loses every queued delegation when the orchestrator
+restarts. SQLiteMessageBus has the same publish/consume/peek/subscribe API,
+but messages live in one table until the consumer acknowledges them:
+
+    seq, message_id, recipient, lane, expires_at, visible_at, deliveries, body
+
+- consume() leases messages instead of deleting them: their visible_at
+  moves ack_timeout seconds ahead. ack() deletes them; nack() makes them
+  visible again (optionally after a delay). A lease that runs out — the
+  consumer crashed or never acked — is redelivered, so delivery is
+  at-least-once. TTL still bounds how long a message can be retried.
+- Publishes are group-committed. Each publisher appends its rows to a
+  pending batch; whoever finds no write in flight becomes the leader, inserts
+  the whole batch in one transaction and wakes the others. publish() returns
+  only once its rows are committed, and concurrent publishers share one
+  commit (and one fsync with synchronous=FULL).
+- Consume order matches the memory bus: priority lane, then publish order.
+  A broadcast is written as one row per known agent.
+- Per-agent depth is counted in memory (loaded from the table at startup), so
+  the max_queue_size check costs no query.
+
+Selected with config.yaml `a2a.backend: sqlite`; see create_message_bus().
+
+Usage:
+    bus = SQLiteMessageBus("/vault/.a2a_bus.db")
+    bus.publish(message)
+    for message in bus.consume("sales-agent", timeout=5.0):
+        handle(message)
+        bus.ack("sales-agent", [message.message_id])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable
+
+from src.a2a.message import A2AMessage
+from src.a2a.message_bus import PRIORITY_LANES, SubscriberDispatcher
+from src.utils.metrics import BUS_MESSAGES, BUS_QUEUE_DEPTH
+
+logger = logging.getLogger("ai_employee")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id  TEXT NOT NULL,
+    recipient   TEXT NOT NULL,
+    lane        INTEGER NOT NULL,
+    expires_at  REAL NOT NULL,
+    visible_at  REAL NOT NULL DEFAULT 0,
+    deliveries  INTEGER NOT NULL DEFAULT 0,
+    body        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_ready ON messages (recipient, lane, seq);
+CREATE INDEX IF NOT EXISTS messages_id ON messages (recipient, message_id);
+CREATE INDEX IF NOT EXISTS messages_expiry ON messages (expires_at);
+"""
+
+_INSERT = ("INSERT INTO messages (message_id, recipient, lane, expires_at, body) "
+           "VALUES (?, ?, ?, ?, ?)")
+
+# Longest a blocked consume sleeps before looking again (leases running
+# out and other processes' publishes do not notify this process)
+_POLL_INTERVAL = 1.0
+
+
+class SQLiteMessageBus:
+    """At-least-once message bus persisted in a SQLite database."""
+
+    def __init__(self, db_path: str | Path, max_queue_size: int = 1000,
+                 ack_timeout: float = 300.0, synchronous: str = "NORMAL"):
+        self.db_path = Path(db_path)
+        self._max_queue_size = max_queue_size
+        self._ack_timeout = float(ack_timeout)
+        self._lock = threading.RLock()          # connection and counters
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+
+        self._depth: dict[str, int] = defaultdict(int)   # stored rows, leased or not
+        self._expired: dict[str, int] = defaultdict(int)
+        for recipient, count in self._conn.execute(
+                "SELECT recipient, COUNT(*) FROM messages GROUP BY recipient"):
+            self._depth[recipient] = count
+        self._next_sweep = 0.0
+        self._subscribers = SubscriberDispatcher()
+        self._closed = False
+
+        # Group commit: rows wait in _pending for the next leader
+        self._batch_cond = threading.Condition()
+        self._pending: list[tuple] = []
+        self._next_batch = 1
+        self._durable_batch = 0
+        self._writing = False
+        self._batch_errors: dict[int, sqlite3.Error] = {}
+
+        self._total_published = 0
+        self._total_consumed = 0
+        self._total_redelivered = 0
+        self._total_acked = 0
+        self._total_nacked = 0
+        self._total_expired = 0
+        self._commits = 0
+        self._committed_rows = 0
+
+    # -- expiry ------------------------------------------------------------------
+
+    def _expire(self, now: float) -> None:
+        """Delete expired rows, at most once a second (lock held)."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + 1.0
+        expired = self._conn.execute(
+            "SELECT recipient, COUNT(*) FROM messages WHERE expires_at < ? GROUP BY recipient",
+            (now,)).fetchall()
+        if not expired:
+            return
+        with self._conn:
+            self._conn.execute("DELETE FROM messages WHERE expires_at < ?", (now,))
+        for recipient, count in expired:
+            self._depth[recipient] -= count
+            self._expired[recipient] += count
+            self._total_expired += count
+            BUS_MESSAGES.inc(count, event="expired")
+            BUS_QUEUE_DEPTH.set(self._depth[recipient], agent=recipient)
+
+    # -- publish -----------------------------------------------------------------
+
+    def publish(self, message: A2AMessage) -> bool:
+        """Publish a message and return once it is committed.
+
+        Returns True if published, False if the queue is full or the write failed.
+        """
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            if message.is_broadcast:
+                recipients = [agent_id for agent_id, depth in self._depth.items()
+                              if agent_id != message.sender_id and depth < self._max_queue_size]
+            else:
+                if self._depth[message.recipient_id] >= self._max_queue_size:
+                    BUS_MESSAGES.inc(event="dropped")
+                    return False
+                recipients = [message.recipient_id]
+
+            self._total_published += 1
+            BUS_MESSAGES.inc(event="published")
+            expires_at = message.timestamp + message.ttl
+            if now > expires_at:
+                for agent_id in recipients:
+                    self._expired[agent_id] += 1
+                    self._total_expired += 1
+                    BUS_MESSAGES.inc(event="expired")
+                recipients = []
+            for agent_id in recipients:
+                self._depth[agent_id] += 1
+                BUS_QUEUE_DEPTH.set(self._depth[agent_id], agent=agent_id)
+
+        if recipients:
+            body = json.dumps(message.to_dict())
+            lane = PRIORITY_LANES.get(message.priority, 2)
+            rows = [(message.message_id, agent_id, lane, expires_at, body)
+                    for agent_id in recipients]
+            try:
+                self._write(rows)
+            except sqlite3.Error as e:
+                logger.warning(f"[MessageBus] publish of {message.message_id} failed: {e}")
+                with self._lock:
+                    self._total_published -= 1
+                    for agent_id in recipients:
+                        self._depth[agent_id] -= 1
+                return False
+
+        self._subscribers.notify(message)
+        return True
+
+    def _write(self, rows: list[tuple]) -> None:
+        """Group commit: return once a transaction containing rows has committed."""
+        with self._batch_cond:
+            self._pending.extend(rows)
+            ticket = self._next_batch
+            while self._durable_batch < ticket:
+                if self._writing:
+                    self._batch_cond.wait()
+                    continue
+                # Leader: commit everything pending, ours included
+                self._writing = True
+                batch, batch_rows = self._next_batch, self._pending
+                self._next_batch += 1
+                self._pending = []
+                self._batch_cond.release()
+                error = None
+                try:
+                    with self._lock:
+                        with self._conn:
+                            self._conn.executemany(_INSERT, batch_rows)
+                        self._commits += 1
+                        self._committed_rows += len(batch_rows)
+                except sqlite3.Error as e:
+                    error = e
+                finally:
+                    self._batch_cond.acquire()
+                self._writing = False
+                self._durable_batch = batch
+                if error is not None:
+                    self._batch_errors[batch] = error
+                    for old in [b for b in self._batch_errors if b < batch - 64]:
+                        del self._batch_errors[old]
+                self._batch_cond.notify_all()
+            error = self._batch_errors.get(ticket)
+        if error is not None:
+            raise error
+
+    # -- consume -----------------------------------------------------------------
+
+    def _lease(self, agent_id: str, max_messages: int) -> list[A2AMessage]:
+        """Lease up to max_messages visible messages in priority order."""
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            self._depth[agent_id] += 0                  # known agent: receives broadcasts
+            rows = self._conn.execute(
+                "SELECT seq, body, deliveries FROM messages "
+                "WHERE recipient = ? AND visible_at <= ? AND expires_at >= ? "
+                "ORDER BY lane, seq LIMIT ?",
+                (agent_id, now, now, max_messages)).fetchall()
+            if not rows:
+                return []
+            with self._conn:
+                self._conn.execute(
+                    f"UPDATE messages SET visible_at = ?, deliveries = deliveries + 1 "
+                    f"WHERE seq IN ({', '.join('?' * len(rows))})",
+                    (now + self._ack_timeout, *(row[0] for row in rows)))
+            self._total_consumed += len(rows)
+            self._total_redelivered += sum(1 for row in rows if row[2])
+            BUS_MESSAGES.inc(len(rows), event="consumed")
+        return [A2AMessage.from_dict(json.loads(row[1])) for row in rows]
+
+    def consume(self, agent_id: str, max_messages: int = 10,
+                timeout: float | None = 0) -> list[A2AMessage]:
+        """Lease messages from an agent's queue; ack() them once handled.
+
+        timeout works as in MockMessageBus.consume: 0 returns at once, > 0
+        waits up to that many seconds, None waits until a message arrives or
+        the bus is closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._batch_cond:
+                seen = self._durable_batch
+            messages = self._lease(agent_id, max_messages)
+            if messages or timeout == 0 or self._closed:
+                return messages
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return messages
+            with self._batch_cond:
+                if self._durable_batch == seen and not self._closed:
+                    self._batch_cond.wait(
+                        _POLL_INTERVAL if remaining is None else min(remaining, _POLL_INTERVAL))
+
+    async def aconsume(self, agent_id: str, max_messages: int = 10,
+                       timeout: float | None = None) -> list[A2AMessage]:
+        """asyncio counterpart of consume(); the wait runs on the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.consume, agent_id, max_messages, timeout)
+
+    def ack(self, agent_id: str, message_ids: list[str]) -> int:
+        """Delete handled messages; returns how many were found."""
+        if not message_ids:
+            return 0
+        with self._lock:
+            with self._conn:
+                deleted = self._conn.execute(
+                    f"DELETE FROM messages WHERE recipient = ? "
+                    f"AND message_id IN ({', '.join('?' * len(message_ids))})",
+                    (agent_id, *message_ids)).rowcount
+            self._depth[agent_id] -= deleted
+            self._total_acked += deleted
+            BUS_MESSAGES.inc(deleted, event="acked")
+            BUS_QUEUE_DEPTH.set(self._depth[agent_id], agent=agent_id)
+        return deleted
+
+    def nack(self, agent_id: str, message_ids: list[str], delay: float = 0) -> int:
+        """Return leased messages to the queue, visible again after delay seconds."""
+        if not message_ids:
+            return 0
+        with self._lock:
+            with self._conn:
+                updated = self._conn.execute(
+                    f"UPDATE messages SET visible_at = ? WHERE recipient = ? "
+                    f"AND message_id IN ({', '.join('?' * len(message_ids))})",
+                    (time.time() + delay, agent_id, *message_ids)).rowcount
+            self._total_nacked += updated
+            BUS_MESSAGES.inc(updated, event="nacked")
+        with self._batch_cond:
+            self._batch_cond.notify_all()
+        return updated
+
+    def peek(self, agent_id: str) -> int:
+        """Check how many unexpired, unleased messages are waiting for an agent."""
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM messages "
+                "WHERE recipient = ? AND visible_at <= ? AND expires_at >= ?",
+                (agent_id, now, now)).fetchone()[0]
+
+    # -- subscribers -------------------------------------------------------------
+
+    def subscribe(self, agent_id: str, callback: Callable[[A2AMessage], None]) -> None:
+        """Subscribe to messages for a specific agent (this process's publishes only)."""
+        self._subscribers.subscribe(agent_id, callback)
+
+    def subscribe_broadcast(self, callback: Callable[[A2AMessage], None]) -> None:
+        """Subscribe to all broadcast messages (this process's publishes only)."""
+        self._subscribers.subscribe_broadcast(callback)
+
+    def flush_subscribers(self, timeout: float | None = None) -> bool:
+        """Wait until subscriber callbacks queued so far have run."""
+        return self._subscribers.flush(timeout)
+
+    # -- admin -------------------------------------------------------------------
+
+    def clear(self, agent_id: str | None = None) -> None:
+        """Delete all messages (or one agent's)."""
+        with self._lock:
+            with self._conn:
+                if agent_id:
+                    self._conn.execute("DELETE FROM messages WHERE recipient = ?", (agent_id,))
+                else:
+                    self._conn.execute("DELETE FROM messages")
+            for name in ([agent_id] if agent_id else list(self._depth)):
+                self._depth.pop(name, None)
+                BUS_QUEUE_DEPTH.set(0, agent=name)
+
+    def close(self) -> None:
+        """Wake waiting consumers, stop the subscriber thread and close the database."""
+        self._closed = True
+        with self._batch_cond:
+            self._batch_cond.notify_all()
+        self._subscribers.close()
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> dict:
+        """Get message bus statistics, with depth and expired count per queue."""
+        with self._lock:
+            self._expire(time.time())
+            in_flight = dict(self._conn.execute(
+                "SELECT recipient, COUNT(*) FROM messages WHERE visible_at > ? "
+                "GROUP BY recipient", (time.time(),)).fetchall())
+            return {
+                "backend": "sqlite",
+                "path": str(self.db_path),
+                "total_queued": sum(self._depth.values()),
+                "total_published": self._total_published,
+                "total_consumed": self._total_consumed,
+                "total_redelivered": self._total_redelivered,
+                "total_acked": self._total_acked,
+                "total_nacked": self._total_nacked,
+                "total_expired": self._total_expired,
+                "commits": self._commits,
+                "avg_batch": round(self._committed_rows / self._commits, 2) if self._commits else 0,
+                "active_queues": len(self._depth),
+                "max_queue_size": self._max_queue_size,
+                "queues": {
+                    agent_id: {"depth": depth, "in_flight": in_flight.get(agent_id, 0),
+                               "expired": self._expired.get(agent_id, 0)}
+                    for agent_id, depth in self._depth.items()
+                },
+            }
+
+    def __repr__(self) -> str:
+        return f"SQLiteMessageBus(path={str(self.db_path)!r}, published={self._total_published})"
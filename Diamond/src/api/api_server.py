@@ -5,7 +5,9 @@ Mock implementation using Flask. Provides endpoints for:
 - Agent health
 - Task management
 - CRM data
-- Swarm metrics
+- Swarm metrics (JSON at /api/metrics, Prometheus text at /metrics)
+- Audit trail queries
+- Circuit breaker states (Claude CLI, MCP servers)
 
 In DRY_RUN / mock mode, no actual server is started — just the route handlers.
 """
@@ -17,9 +19,18 @@ import time
 from pathlib import Path
 from typing import Any
 
+from src.utils import frontmatter
+from src.utils.archive import get_archive
+from src.utils.audit_query import FILTER_FIELDS, get_audit_trail
+from src.utils.circuit_breaker import OPEN, shared_breaker_states
+from src.utils.folder_index import get_index_for_path
+from src.utils.mcp_cache import get_mcp_cache
+from src.utils.metrics import CONTENT_TYPE, get_registry
+from src.utils.task_catalog import TASK_FOLDERS, get_catalog
+
 # Flask is optional — API can work without it in mock mode
 try:
-    from flask import Flask, jsonify, request
+    from flask import Flask, Response, jsonify, request
     HAS_FLASK = True
 except ImportError:
     HAS_FLASK = False
@@ -74,26 +85,34 @@ class APIServer:
             return {"agents": [], "error": "Registry not initialized"}
         return self._registry.get_swarm_stats()
 
-    def get_tasks(self, folder: str = "Needs_Action") -> dict:
-        """GET /api/tasks — list tasks in a folder."""
+    def get_tasks(self, folder: str = "Needs_Action", include_archived: bool = False) -> dict:
+        """GET /api/tasks — list tasks in a folder (optionally with its monthly archives)."""
         folder_path = self._root / folder
         if not folder_path.exists():
             return {"tasks": [], "folder": folder}
 
-        tasks = []
-        for f in sorted(folder_path.glob("*.md")):
-            tasks.append({
-                "filename": f.name,
-                "size": f.stat().st_size,
-                "modified": f.stat().st_mtime,
-            })
+        tasks = [
+            {"filename": e.name, "size": e.size, "modified": e.mtime}
+            for e in sorted(get_index_for_path(folder_path).entries(), key=lambda e: e.name)
+        ]
+        if include_archived:
+            live = {t["filename"] for t in tasks}
+            tasks += [
+                {"filename": a["name"], "size": a["size"], "modified": a["mtime"],
+                 "archived": a["month"]}
+                for a in get_archive(folder, self._root).listing() if a["name"] not in live
+            ]
         return {"tasks": tasks, "folder": folder, "count": len(tasks)}
 
     def get_metrics(self) -> dict:
-        """GET /api/metrics — performance metrics."""
+        """GET /api/metrics — performance metrics plus MCP / frontmatter cache counters."""
+        caches = {
+            "mcp_cache": get_mcp_cache().get_stats(),
+            "frontmatter_cache": frontmatter.get_cache_stats(),
+        }
         if self._tracker is None:
-            return {"metrics": {}, "error": "Tracker not initialized"}
-        return self._tracker.get_stats()
+            return {"metrics": {}, **caches, "error": "Tracker not initialized"}
+        return {**self._tracker.get_stats(), **caches}
 
     def get_crm_summary(self) -> dict:
         """GET /api/crm — CRM summary."""
@@ -101,18 +120,33 @@ class APIServer:
             return {"crm": {}, "error": "CRM not initialized"}
         return self._crm.get_stats()
 
+    def get_prometheus_metrics(self) -> str:
+        """GET /metrics — counters, gauges and histograms in Prometheus text format."""
+        return get_registry().render()
+
     def get_health(self) -> dict:
         """GET /api/health — system health check."""
+        breakers = shared_breaker_states(self._root)
+        open_names = [name for name, b in breakers.items() if b["state"] == OPEN]
         return {
-            "healthy": True,
+            "healthy": not open_names,
             "timestamp": time.time(),
             "checks": {
                 "api": "ok",
                 "agents": "ok" if self._registry else "not_initialized",
                 "crm": "ok" if self._crm else "not_initialized",
+                "circuit_breakers": f"open: {', '.join(open_names)}" if open_names else "ok",
             },
         }
 
+    def get_circuit_breakers(self) -> dict:
+        """GET /api/circuit-breakers — state of each dependency's circuit breaker."""
+        breakers = shared_breaker_states(self._root)
+        return {
+            "breakers": breakers,
+            "open": [name for name, b in breakers.items() if b["state"] == OPEN],
+        }
+
     def get_folders(self) -> dict:
         """GET /api/folders — count files in each folder."""
         folder_names = [
@@ -123,11 +157,31 @@ class APIServer:
         counts = {}
         for name in folder_names:
             folder = self._root / name
-            if folder.exists():
-                counts[name] = len(list(folder.glob("*.md")))
-            else:
+            if not folder.exists():
                 counts[name] = 0
-        return {"folders": counts}
+            elif name in TASK_FOLDERS:
+                counts[name] = get_catalog(self._root).count(name)
+            else:
+                counts[name] = get_index_for_path(folder).count()
+        archived = {}
+        for name in folder_names:
+            archive = get_archive(name, self._root)
+            if archive.months():
+                archived[name] = archive.count()
+        return {"folders": counts, "archived": archived}
+
+    def get_audit(self, since: Any = None, until: Any = None, limit: int = 100,
+                  **filters: Any) -> dict:
+        """GET /api/audit — audit records by time range and field filters.
+
+        Without since/until, returns the newest `limit` records.
+        """
+        trail = get_audit_trail(self._root)
+        if since is None and until is None:
+            records = trail.tail(limit, **filters)
+        else:
+            records = trail.query(since, until, limit=limit, **filters)
+        return {"records": records, "count": len(records)}
 
     # --- Flask integration ---
 
@@ -147,12 +201,17 @@ class APIServer:
         @self._app.route("/api/tasks")
         def tasks():
             folder = request.args.get("folder", "Needs_Action")
-            return jsonify(self.get_tasks(folder))
+            include_archived = request.args.get("archived", "").lower() in ("1", "true", "yes")
+            return jsonify(self.get_tasks(folder, include_archived))
 
         @self._app.route("/api/metrics")
         def metrics():
             return jsonify(self.get_metrics())
 
+        @self._app.route("/metrics")
+        def prometheus_metrics():
+            return Response(self.get_prometheus_metrics(), content_type=CONTENT_TYPE)
+
         @self._app.route("/api/crm")
         def crm():
             return jsonify(self.get_crm_summary())
@@ -161,10 +220,22 @@ class APIServer:
         def health():
             return jsonify(self.get_health())
 
+        @self._app.route("/api/circuit-breakers")
+        def circuit_breakers():
+            return jsonify(self.get_circuit_breakers())
+
         @self._app.route("/api/folders")
         def folders():
             return jsonify(self.get_folders())
 
+        @self._app.route("/api/audit")
+        def audit():
+            filters = {f: request.args.get(f) for f in FILTER_FIELDS}
+            return jsonify(self.get_audit(
+                request.args.get("since"), request.args.get("until"),
+                request.args.get("limit", 100, type=int), **filters,
+            ))
+
     def run(self, host: str = "127.0.0.1", port: int = 8080):
         """Start the Flask server (non-mock mode only)."""
         if self._mock:
@@ -177,5 +248,5 @@ class APIServer:
         return {
             "mock_mode": self._mock,
             "flask_available": HAS_FLASK,
-            "endpoints": 7,
+            "endpoints": 10,
         }
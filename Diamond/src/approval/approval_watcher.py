@@ -18,7 +18,8 @@ from src.utils.file_ops import (
     safe_move,
     create_task_file,
 )
-from src.utils.logger import log_action, log_error
+from src.utils.logger import log_action, log_error, start_background_writer
+from src.utils.folder_notifier import FolderNotifier
 
 try:
     from colorama import init, Fore, Style
@@ -36,15 +37,33 @@ except ImportError:
 class ApprovalWatcher:
     """Watches Pending_Approval/ and prompts user for decisions."""
 
-    def __init__(self, poll_interval: int = 5):
+    def __init__(self, poll_interval: int = 5, use_events: bool | None = None,
+                 reconcile_interval: int = 60):
         self.poll_interval = poll_interval
+        if use_events is None:
+            use_events = self._load_approval_config().get("watch_mode", "poll") == "events"
+        self.use_events = use_events
+        self.reconcile_interval = reconcile_interval
+        self._notifier: FolderNotifier | None = None
         self._running = True
         signal.signal(signal.SIGINT, self._handle_stop)
         signal.signal(signal.SIGTERM, self._handle_stop)
 
+    @staticmethod
+    def _load_approval_config() -> dict:
+        """Read the `approval:` section of config.yaml (empty if missing)."""
+        from src.config.agent_config import AgentConfig
+
+        try:
+            return AgentConfig._load_config().get("approval", {}) or {}
+        except Exception:
+            return {}
+
     def _handle_stop(self, signum, frame):
         print(f"\n{YELLOW}Approval watcher shutting down...{RESET}")
         self._running = False
+        if self._notifier is not None:
+            self._notifier.wake()
 
     def _display_item(self, filepath: Path) -> tuple[dict, str]:
         """Display an approval item and return (metadata, body)."""
@@ -180,6 +199,13 @@ class ApprovalWatcher:
         print(f"{BOLD}{CYAN}Approval Watcher started. Watching Pending_Approval/{RESET}")
         print(f"Press Ctrl+C to stop.\n")
 
+        if self.use_events and not once:
+            notifier = FolderNotifier(["Pending_Approval"])
+            if notifier.start():
+                self._notifier = notifier
+            else:
+                log_error("Filesystem notifications unavailable", "falling back to polling", "approval")
+
         while self._running:
             count = self.poll_once()
 
@@ -188,8 +214,14 @@ class ApprovalWatcher:
                     print("No pending approvals.")
                 break
 
-            time.sleep(self.poll_interval)
+            if self._notifier is not None:
+                # Wake on a new approval file, or re-scan every reconcile_interval
+                self._notifier.wait(timeout=self.reconcile_interval)
+            else:
+                time.sleep(self.poll_interval)
 
+        if self._notifier is not None:
+            self._notifier.stop()
         print(f"\n{YELLOW}Approval watcher stopped.{RESET}")
 
 
@@ -197,9 +229,13 @@ def main():
     parser = argparse.ArgumentParser(description="HITL Approval Watcher")
     parser.add_argument("--once", action="store_true", help="Check once and exit")
     parser.add_argument("--interval", type=int, default=5, help="Poll interval (seconds)")
+    parser.add_argument("--events", action="store_true", default=None,
+                        help="Wake on filesystem notifications instead of polling "
+                             "(default: approval.watch_mode in config.yaml)")
     args = parser.parse_args()
+    start_background_writer()
 
-    watcher = ApprovalWatcher(poll_interval=args.interval)
+    watcher = ApprovalWatcher(poll_interval=args.interval, use_events=args.events)
     watcher.run(once=args.once)
 
 
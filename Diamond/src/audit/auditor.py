@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import os
 from datetime import datetime, timedelta
@@ -15,9 +16,12 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from src.utils.file_ops import get_project_root, get_folder, list_md_files, count_by_prefix
+from src.utils.file_ops import get_project_root, get_folder
 from src.utils.logger import log_action, audit_log
 from src.utils import frontmatter
+from src.utils.archive import get_archive
+from src.utils.task_catalog import get_catalog
+from src.utils.mcp_async import AsyncMCPClient, run_blocking, run_sync
 
 load_dotenv()
 
@@ -25,35 +29,31 @@ load_dotenv()
 class WeeklyAuditor:
     """Gathers stats from all components and generates a CEO briefing."""
 
-    def __init__(self, mock: bool = False):
+    def __init__(self, mock: bool = False, source_timeout: float = 30):
         self.mock = mock
+        self.source_timeout = source_timeout
         self.project_root = get_project_root()
         self.now = datetime.now()
         self.week_start = self.now - timedelta(days=7)
 
     def gather_task_stats(self) -> dict:
-        """Count tasks in Done/ by type and calculate completion stats."""
-        done_files = list_md_files("Done")
-        done_by_type = count_by_prefix("Done")
-
-        # Count tasks completed in the last 7 days
-        recent = 0
-        for f in done_files:
-            meta, _ = frontmatter.read_file(f)
-            created = meta.get("created", "")
-            if isinstance(created, str) and created >= self.week_start.strftime("%Y-%m-%d"):
-                recent += 1
-
-        # Pending tasks
-        pending_count = len(list_md_files("Needs_Action"))
-        approval_count = len(list_md_files("Pending_Approval"))
+        """Count tasks in Done/ (live and archived) by type and calculate completion stats."""
+        catalog = get_catalog()
+        archived = get_archive("Done", catalog.root)
+        week_start = self.week_start.strftime("%Y-%m-%d")
+
+        done_by_type = catalog.count_by_prefix("Done")
+        for prefix, n in archived.count_by_prefix().items():
+            done_by_type[prefix] = done_by_type.get(prefix, 0) + n
 
         return {
-            "total_done": len(done_files),
-            "done_this_week": recent,
+            "total_done": catalog.count("Done") + archived.count(),
+            # Tasks completed in the last 7 days
+            "done_this_week": (catalog.count("Done", created_since=week_start)
+                               + archived.count(created_since=week_start)),
             "done_by_type": done_by_type,
-            "pending_tasks": pending_count,
-            "pending_approvals": approval_count,
+            "pending_tasks": catalog.count("Needs_Action"),
+            "pending_approvals": catalog.count("Pending_Approval"),
         }
 
     def gather_odoo_stats(self) -> dict:
@@ -67,6 +67,22 @@ class WeeklyAuditor:
         except Exception:
             invoices = []
 
+        return self._odoo_stats(invoices)
+
+    async def agather_odoo_stats(self, client: AsyncMCPClient) -> dict:
+        """Async gather_odoo_stats over a shared AsyncMCPClient."""
+        try:
+            invoices = await client.call_tool(
+                "odoo", "list_invoices", {"limit": 50}, timeout=self.source_timeout
+            )
+            if isinstance(invoices, dict) and "error" in invoices:
+                invoices = []
+        except Exception:
+            invoices = []
+
+        return self._odoo_stats(invoices)
+
+    def _odoo_stats(self, invoices: list[dict]) -> dict:
         if not invoices and self.mock:
             from src.mcp_odoo.odoo_server import MOCK_INVOICES
             invoices = MOCK_INVOICES
@@ -101,6 +117,23 @@ class WeeklyAuditor:
         except Exception:
             summary = {}
 
+        return self._social_stats(summary)
+
+    async def agather_social_stats(self, client: AsyncMCPClient) -> dict:
+        """Async gather_social_stats over a shared AsyncMCPClient."""
+        try:
+            summary = await client.call_tool(
+                "social", "get_social_summary", {"platform": "all", "limit": 5},
+                timeout=self.source_timeout,
+            )
+            if isinstance(summary, dict) and "error" in summary:
+                summary = {}
+        except Exception:
+            summary = {}
+
+        return self._social_stats(summary)
+
+    def _social_stats(self, summary: dict) -> dict:
         if not summary and self.mock:
             from src.mcp_social.mock_social import (
                 MOCK_FACEBOOK_FEED, MOCK_INSTAGRAM_FEED, MOCK_TWITTER_FEED,
@@ -123,50 +156,56 @@ class WeeklyAuditor:
         """Find tasks stuck > 48h or with failed retries."""
         bottlenecks = []
         cutoff = (self.now - timedelta(hours=48)).strftime("%Y-%m-%d %H:%M:%S")
+        catalog = get_catalog()
 
         # Check Needs_Action for old tasks
-        for f in list_md_files("Needs_Action"):
-            meta, _ = frontmatter.read_file(f)
-            created = meta.get("created", "")
-            if isinstance(created, str) and created < cutoff:
-                bottlenecks.append({
-                    "file": f.name,
-                    "issue": "Stuck in Needs_Action > 48 hours",
-                    "created": created,
-                    "priority": meta.get("priority", "medium"),
-                })
+        for row in catalog.find("Needs_Action", created_before=cutoff):
+            bottlenecks.append({
+                "file": row["name"],
+                "issue": "Stuck in Needs_Action > 48 hours",
+                "created": row["created"],
+                "priority": row["priority"] or "medium",
+            })
 
         # Check Pending_Approval for old items
-        for f in list_md_files("Pending_Approval"):
-            meta, _ = frontmatter.read_file(f)
-            created = meta.get("created", "")
-            if isinstance(created, str) and created < cutoff:
-                bottlenecks.append({
-                    "file": f.name,
-                    "issue": "Awaiting approval > 48 hours",
-                    "created": created,
-                    "priority": "high",
-                })
-
-        # Check Errors for failed tasks
-        for f in list_md_files("Errors"):
-            meta, _ = frontmatter.read_file(f)
-            if meta.get("status") == "failed":
-                bottlenecks.append({
-                    "file": f.name,
-                    "issue": f"Failed after {meta.get('max_retries', '?')} retries",
-                    "created": meta.get("created", "?"),
-                    "priority": "high",
-                })
+        for row in catalog.find("Pending_Approval", created_before=cutoff):
+            bottlenecks.append({
+                "file": row["name"],
+                "issue": "Awaiting approval > 48 hours",
+                "created": row["created"],
+                "priority": "high",
+            })
+
+        # Check Errors for failed tasks (only these few files are read, for max_retries)
+        for row in catalog.find("Errors", status="failed"):
+            meta, _ = frontmatter.read_file(catalog.root / row["path"])
+            bottlenecks.append({
+                "file": row["name"],
+                "issue": f"Failed after {meta.get('max_retries', '?')} retries",
+                "created": meta.get("created", "?"),
+                "priority": "high",
+            })
 
         return bottlenecks
 
+    async def gather_all(self) -> tuple[dict, dict, dict, list[dict]]:
+        """Gather every briefing source concurrently.
+
+        Odoo and social go out over one AsyncMCPClient while the vault scans run
+        on worker threads, so the wall-clock time is roughly that of the slowest
+        source rather than the sum.
+        """
+        async with AsyncMCPClient() as client:
+            return tuple(await asyncio.gather(
+                run_blocking(self.gather_task_stats),
+                self.agather_odoo_stats(client),
+                self.agather_social_stats(client),
+                run_blocking(self.detect_bottlenecks),
+            ))
+
     def generate_briefing(self) -> Path:
         """Generate the full Monday briefing markdown file."""
-        task_stats = self.gather_task_stats()
-        odoo_stats = self.gather_odoo_stats()
-        social_stats = self.gather_social_stats()
-        bottlenecks = self.detect_bottlenecks()
+        task_stats, odoo_stats, social_stats, bottlenecks = run_sync(self.gather_all())
 
         date_str = self.now.strftime("%Y-%m-%d")
         week_range = f"{self.week_start.strftime('%b %d')} — {self.now.strftime('%b %d, %Y')}"
@@ -8,6 +8,7 @@ import os
 import time
 from pathlib import Path
 
+from src.utils import task_catalog
 from src.utils.file_ops import get_project_root, get_folder
 from src.utils.logger import log_action, log_error
 
@@ -45,6 +46,7 @@ class ClaimManager:
 
         try:
             os.rename(str(filepath), str(dest_path))
+            task_catalog.note_moved(filepath, dest_path)
             log_action("Claimed", f"{filepath.name} → {self.agent_id}", "claim")
             return dest_path
         except OSError as e:
@@ -67,6 +69,7 @@ class ClaimManager:
 
         try:
             os.rename(str(filepath), str(dest_path))
+            task_catalog.note_moved(filepath, dest_path)
             log_action("Unclaimed", f"{filepath.name} → Needs_Action", "claim")
             return dest_path
         except OSError as e:
@@ -6,13 +6,13 @@ and generates periodic compliance reports.
 
 from __future__ import annotations
 
-import json
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from src.learning.outcome_tracker import OutcomeTracker, Outcome
+from src.utils.audit_query import get_audit_trail, to_epoch
 
 
 class ComplianceReporter:
@@ -104,23 +104,22 @@ class ComplianceReporter:
             "violations": [],
         }
 
-        log_path = self._root / "Logs" / "audit.jsonl"
-        if not log_path.exists():
+        trail = get_audit_trail(self._root)
+        if not trail.exists():
             check["status"] = "warn"
             check["violations"].append({
                 "type": "missing_audit_log",
-                "detail": "No audit.jsonl found in Logs/",
+                "detail": "No audit.jsonl or *_actions.jsonl found in Logs/",
                 "severity": "medium",
             })
             return check
 
-        # Check log is recent (within last 24 hours)
+        # Check log is recent (within last 24 hours) — only the newest record is read
         try:
-            lines = log_path.read_text(encoding="utf-8").strip().split("\n")
-            check["details"] = f"Audit log has {len(lines)} entries"
-            if lines:
-                last_entry = json.loads(lines[-1])
-                age = time.time() - last_entry.get("timestamp", 0)
+            check["details"] = f"Audit log has {trail.count()} entries"
+            last_entry = trail.last()
+            if last_entry:
+                age = time.time() - (to_epoch(last_entry.get("timestamp")) or 0)
                 if age > 86400:  # > 24 hours
                     check["status"] = "warn"
                     check["violations"].append({
@@ -1,15 +1,21 @@
 """Error detection, retry queue, and graceful degradation for the AI Employee.
 
 Creates ERROR_*.md files in Errors/ for failed tasks, queues them for retry,
-and provides notifications for persistent failures.
+and provides notifications for persistent failures. Retryable tasks go on
+the delayed retry queue (src/errors/retry_queue.py) with exponential
+backoff; the orchestrator re-enqueues them when they are due.
 """
 
 import json
 import logging
+import random
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
 
+from src.errors.retry_queue import RetryEntry, RetryQueue, get_retry_queue
+from src.utils.circuit_breaker import CircuitOpenError
 from src.utils.file_ops import get_folder, create_task_file, list_md_files
 from src.utils.logger import log_action, log_error
 
@@ -19,9 +25,16 @@ logger = logging.getLogger("ai_employee")
 class ErrorHandler:
     """Catches exceptions, creates error reports, and manages retry queue."""
 
-    def __init__(self, max_retries: int = 3):
+    def __init__(self, max_retries: int = 3, retry_queue: RetryQueue | None = None):
         self.max_retries = max_retries
         self._retry_counts: dict[str, int] = {}
+        self._retry_queue = retry_queue
+
+    @property
+    def retry_queue(self) -> RetryQueue:
+        if self._retry_queue is None:
+            self._retry_queue = get_retry_queue()
+        return self._retry_queue
 
     def handle_error(
         self,
@@ -32,7 +45,8 @@ class ErrorHandler:
     ) -> Path:
         """Record an error and create an ERROR_*.md in Errors/.
 
-        Returns the path to the error report file.
+        Tasks with a task_filepath that can still be retried are put on the
+        retry queue. Returns the path to the error report file.
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         error_type = type(error).__name__
@@ -44,6 +58,9 @@ class ErrorHandler:
         current = self._retry_counts.get(retry_key, 0) + 1
         self._retry_counts[retry_key] = current
         can_retry = current < self.max_retries
+        retry_at = None
+        if task_filepath and can_retry:
+            retry_at = time.time() + self.retry_queue.delay_for(current)
 
         metadata = {
             "type": "error",
@@ -58,12 +75,17 @@ class ErrorHandler:
         }
         if task_filepath:
             metadata["original_file"] = str(task_filepath)
+        if retry_at is not None:
+            metadata["retry_at"] = datetime.fromtimestamp(retry_at).strftime("%Y-%m-%d %H:%M:%S")
 
         body = f"# Error Report: {task_name}\n\n"
         body += f"**Error:** {error_type}: {error_msg}\n"
         body += f"**Time:** {timestamp}\n"
         body += f"**Retry:** {current}/{self.max_retries}\n"
-        body += f"**Can Retry:** {'Yes' if can_retry else 'No — escalate to human'}\n\n"
+        body += f"**Can Retry:** {'Yes' if can_retry else 'No — escalate to human'}\n"
+        if retry_at is not None:
+            body += f"**Next Attempt:** {metadata['retry_at']}\n"
+        body += "\n"
 
         if context:
             body += f"## Context\n\n{context}\n\n"
@@ -75,6 +97,15 @@ class ErrorHandler:
         safe_task = task_name.replace(" ", "_")[:60]
         error_path = create_task_file("Errors", "ERROR", safe_task, metadata, body)
 
+        if retry_at is not None:
+            self.retry_queue.schedule(
+                task_name, attempt=current, original_file=task_filepath,
+                error_file=error_path, error=f"{error_type}: {error_msg}",
+                delay=retry_at - time.time(),
+            )
+        elif task_filepath:
+            self.retry_queue.remove(task_name)
+
         log_error(
             f"Error captured for {task_name}",
             f"{error_type}: {error_msg} (retry {current}/{self.max_retries})",
@@ -83,6 +114,21 @@ class ErrorHandler:
 
         return error_path
 
+    def defer(self, task_name: str, task_filepath: str | Path,
+              error: CircuitOpenError) -> None:
+        """Put a task back on the retry queue until a dependency's breaker may close.
+
+        An outage is not the task's fault: no ERROR_*.md is written and the
+        deferral does not use up one of its retries.
+        """
+        # Spread the deferred tasks out so they don't all hit the half-open breaker at once
+        delay = error.retry_after * (1 + random.random() * self.retry_queue.jitter) + 1
+        self.retry_queue.schedule(
+            task_name, attempt=self._retry_counts.get(task_name, 0),
+            original_file=task_filepath, error=str(error), delay=delay,
+        )
+        log_action("Deferred", f"{task_name}: {error}", "error_handler")
+
     def can_retry(self, task_name: str) -> bool:
         """Check if a task can still be retried."""
         return self._retry_counts.get(task_name, 0) < self.max_retries
@@ -90,18 +136,25 @@ class ErrorHandler:
     def reset_retries(self, task_name: str) -> None:
         """Reset retry count (e.g. after a successful run)."""
         self._retry_counts.pop(task_name, None)
+        self.retry_queue.remove(task_name)
 
-    def get_pending_retries(self) -> list[Path]:
-        """List error files that are still eligible for retry."""
-        from src.utils import frontmatter
+    def take_due_retries(self) -> list[RetryEntry]:
+        """Pop the retries that are due, carrying their attempt counts over.
 
-        error_files = list_md_files("Errors")
-        retryable = []
-        for f in error_files:
-            meta, _ = frontmatter.read_file(f)
-            if meta.get("can_retry") and meta.get("status") == "pending_retry":
-                retryable.append(f)
-        return retryable
+        The queue is persisted, so after a restart this is what tells the
+        handler how many attempts a task has already used.
+        """
+        due = self.retry_queue.pop_due()
+        for entry in due:
+            self._retry_counts[entry.task_name] = max(
+                self._retry_counts.get(entry.task_name, 0), entry.attempt
+            )
+        return due
+
+    def get_pending_retries(self) -> list[Path]:
+        """List error files of tasks waiting on the retry queue, soonest first."""
+        return [Path(e.error_file) for e in self.retry_queue.entries()
+                if e.error_file and Path(e.error_file).exists()]
 
     def get_failed_tasks(self) -> list[Path]:
         """List error files that have exhausted retries."""
@@ -0,0 +1,228 @@
+"""Delayed retry queue: failed tasks wait here until their backoff has passed.
+
+with_retry sleeps inside the worker, which holds a pool slot (and the poll
+loop waiting on the batch) for the whole backoff. Instead, ErrorHandler
+schedules a failed task here and the orchestrator keeps going:
+
+- a min-heap of (due, seq, task_name) gives the next due retry in O(1) and
+  pops due ones in O(log n); rescheduling a task leaves its old heap entry
+  behind, which is skipped when popped (lazy deletion).
+- delays grow exponentially with jitter (retry.backoff_delay), capped at
+  max_delay.
+- the queue is persisted to .retry_queue.json in the project root after
+  every change (write to .tmp, then os.replace), so pending retries survive
+  a restart.
+- the orchestrator hides waiting tasks from its Needs_Action/ scan and
+  re-enqueues them once due (see Orchestrator._apply_retry_queue).
+
+Settings come from config.yaml `error_recovery:` (base_delay, backoff_factor,
+max_delay, jitter).
+
+Usage:
+    queue = get_retry_queue()
+    entry = queue.schedule("EMAIL_1.md", attempt=1, original_file=path)
+    for entry in queue.pop_due():
+        ...
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from src.utils.retry import backoff_delay
+
+logger = logging.getLogger("ai_employee")
+
+QUEUE_FILE = ".retry_queue.json"
+
+
+@dataclass
+class RetryEntry:
+    """One task waiting for its next attempt."""
+
+    task_name: str
+    due: float
+    attempt: int
+    original_file: str | None = None
+    error_file: str | None = None
+    error: str = ""
+    created: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RetryEntry":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
+class RetryQueue:
+    """Persisted, time-ordered queue of tasks waiting to be retried."""
+
+    def __init__(self, path: str | Path | None = None, base_delay: float = 30.0,
+                 backoff_factor: float = 2.0, max_delay: float = 3600.0,
+                 jitter: float = 0.5):
+        self.path = Path(path) if path is not None else None
+        self.base_delay = base_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._entries: dict[str, RetryEntry] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._load()
+
+    # -- persistence ------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            entries = [RetryEntry.from_dict(e) for e in data.get("entries", [])]
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"[RetryQueue] Ignoring unreadable {self.path.name}: {e}")
+            return
+        for entry in entries:
+            self._entries[entry.task_name] = entry
+            self._heap.append((entry.due, next(self._seq), entry.task_name))
+        heapq.heapify(self._heap)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {"entries": [e.to_dict() for e in sorted(self._entries.values(),
+                                                         key=lambda e: e.due)]}
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"[RetryQueue] Could not persist {self.path.name}: {e}")
+
+    # -- queue operations -------------------------------------------------------
+
+    def delay_for(self, attempt: int) -> float:
+        """Backoff (with jitter) before retry number `attempt`."""
+        return backoff_delay(attempt, self.base_delay, self.backoff_factor,
+                             self.max_delay, self.jitter)
+
+    def schedule(self, task_name: str, attempt: int, original_file: str | Path | None = None,
+                 error_file: str | Path | None = None, error: str = "",
+                 delay: float | None = None) -> RetryEntry:
+        """Queue (or re-queue) task_name for attempt number `attempt` + 1."""
+        if delay is None:
+            delay = self.delay_for(attempt)
+        entry = RetryEntry(
+            task_name=task_name,
+            due=time.time() + delay,
+            attempt=attempt,
+            original_file=str(original_file) if original_file else None,
+            error_file=str(error_file) if error_file else None,
+            error=error[:500],
+        )
+        with self._lock:
+            self._entries[task_name] = entry
+            heapq.heappush(self._heap, (entry.due, next(self._seq), task_name))
+            self._save()
+        return entry
+
+    def _prune(self) -> None:
+        """Drop heap heads that were rescheduled or removed (lock held)."""
+        while self._heap:
+            due, _, name = self._heap[0]
+            entry = self._entries.get(name)
+            if entry is not None and entry.due == due:
+                return
+            heapq.heappop(self._heap)
+
+    def pop_due(self, now: float | None = None) -> list[RetryEntry]:
+        """Remove and return every entry whose time has come, oldest first."""
+        now = time.time() if now is None else now
+        due = []
+        with self._lock:
+            self._prune()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, name = heapq.heappop(self._heap)
+                due.append(self._entries.pop(name))
+                self._prune()
+            if due:
+                self._save()
+        return due
+
+    def next_due(self) -> float | None:
+        """Epoch time of the earliest pending retry, or None if empty."""
+        with self._lock:
+            self._prune()
+            return self._heap[0][0] if self._heap else None
+
+    def get(self, task_name: str) -> RetryEntry | None:
+        return self._entries.get(task_name)
+
+    def is_waiting(self, task_name: str, now: float | None = None) -> bool:
+        """True while task_name is queued and not yet due."""
+        entry = self._entries.get(task_name)
+        return entry is not None and entry.due > (time.time() if now is None else now)
+
+    def remove(self, task_name: str) -> bool:
+        with self._lock:
+            if self._entries.pop(task_name, None) is None:
+                return False
+            self._save()
+            return True
+
+    def entries(self) -> list[RetryEntry]:
+        """Pending entries, soonest first."""
+        with self._lock:
+            return sorted(self._entries.values(), key=lambda e: e.due)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        next_due = self.next_due()
+        return {
+            "pending": len(self._entries),
+            "next_due_in": round(max(0.0, next_due - time.time()), 1) if next_due else None,
+        }
+
+
+_queues: dict[Path, RetryQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def _load_settings() -> dict:
+    try:
+        from src.config.agent_config import AgentConfig
+        return AgentConfig._load_config().get("error_recovery", {}) or {}
+    except Exception:
+        return {}
+
+
+def get_retry_queue(root: str | Path | None = None) -> RetryQueue:
+    """Return the shared retry queue of a project (settings from config.yaml)."""
+    if root is None:
+        from src.utils.file_ops import get_project_root
+        root = get_project_root()
+    path = Path(root) / QUEUE_FILE
+    with _queues_lock:
+        queue = _queues.get(path)
+        if queue is None:
+            settings = _load_settings()
+            queue = _queues[path] = RetryQueue(
+                path,
+                base_delay=float(settings.get("base_delay", 30)),
+                backoff_factor=float(settings.get("backoff_factor", 2)),
+                max_delay=float(settings.get("max_delay", 3600)),
+                jitter=float(settings.get("jitter", 0.5)),
+            )
+        return queue
@@ -0,0 +1,189 @@
+"""Rolling-window error-rate tracker over the JSON-lines audit log.
+
+HealthMonitor.check_error_rate used to re-read all of today's
+*_actions.jsonl and count every failure since midnight. ErrorRateTracker
+follows the log instead:
+
+- it remembers the byte offset (and inode) it has read up to, and each
+  poll parses only the records appended since. A check costs the same
+  whatever the size of the log.
+- records go into per-minute buckets for the last `window_minutes`. Each
+  bucket holds a total count and failures by (action_type, actor). Older
+  buckets are dropped.
+- on the first poll it backfills by reading the file backwards, block by
+  block, until it passes the start of the window.
+- at midnight it drains the rest of yesterday's file before following the
+  new one. A file that shrank or was replaced is re-read from the start.
+
+Usage:
+    tracker = ErrorRateTracker(logs_dir)
+    tracker.poll()
+    tracker.summary()   # {"errors": 3, "errors_per_hour": 3.0, ...}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+_TIMESTAMP_RE = re.compile(rb'"timestamp": "([^"]+)"')
+_FAILED = b'"result": "failed"'
+_BLOCK = 64 * 1024
+
+
+def audit_file_for(logs_dir: Path, day: datetime) -> Path:
+    return logs_dir / f"{day.strftime('%Y-%m-%d')}_actions.jsonl"
+
+
+class ErrorRateTracker:
+    """Tail-follows the daily audit log and keeps per-minute failure counters."""
+
+    def __init__(self, logs_dir: str | Path, window_minutes: int = 60):
+        self.logs_dir = Path(logs_dir)
+        self.window_minutes = window_minutes
+        self._path: Path | None = None
+        self._inode: int | None = None
+        self._offset = 0
+        # minute (epoch // 60) → [records, Counter((action_type, actor) → failures)]
+        self._buckets: dict[int, list] = {}
+        self.bytes_read = 0
+
+    # -- reading ---------------------------------------------------------------
+
+    def _ingest(self, lines: list[bytes], since_minute: int) -> None:
+        for line in lines:
+            match = _TIMESTAMP_RE.search(line)
+            if match is None:
+                continue
+            try:
+                minute = int(datetime.fromisoformat(match.group(1).decode()).timestamp() // 60)
+            except ValueError:
+                continue
+            if minute < since_minute:
+                continue
+            bucket = self._buckets.get(minute)
+            if bucket is None:
+                bucket = self._buckets[minute] = [0, Counter()]
+            bucket[0] += 1
+            if _FAILED in line:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("result") == "failed":
+                    bucket[1][(record.get("action_type", "?"), record.get("actor", "?"))] += 1
+
+    def _read_new(self, path: Path, since_minute: int) -> None:
+        """Read complete lines appended to path since the saved offset."""
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._inode or st.st_size < self._offset:
+                    self._inode, self._offset = st.st_ino, 0  # replaced or truncated
+                if st.st_size == self._offset:
+                    return
+                f.seek(self._offset)
+                data = f.read(st.st_size - self._offset)
+        except FileNotFoundError:
+            return
+        end = data.rfind(b"\n") + 1  # leave a partially written line for next time
+        self._offset += end
+        self.bytes_read += end
+        self._ingest(data[:end].splitlines(), since_minute)
+
+    def _backfill(self, path: Path, since_minute: int) -> None:
+        """Read a file backwards until records fall before the window, then follow it."""
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                size = st.st_size
+                pos = size
+                tail = b""
+                chunks: list[bytes] = []
+                while pos > 0:
+                    step = min(_BLOCK, pos)
+                    pos -= step
+                    f.seek(pos)
+                    block = f.read(step) + tail
+                    # The first (possibly cut) line is carried into the next block
+                    cut = block.find(b"\n") + 1 if pos > 0 else 0
+                    tail, block = block[:cut], block[cut:]
+                    chunks.append(block)
+                    self.bytes_read += step
+                    first = _TIMESTAMP_RE.search(block)
+                    if first and self._minute(first.group(1)) < since_minute:
+                        break
+                else:
+                    chunks.append(tail)
+        except FileNotFoundError:
+            return
+        data = b"".join(reversed(chunks))
+        end = data.rfind(b"\n") + 1
+        self._ingest(data[:end].splitlines(), since_minute)
+        self._path, self._inode = path, st.st_ino
+        self._offset = size - (len(data) - end)
+
+    @staticmethod
+    def _minute(timestamp: bytes) -> int:
+        try:
+            return int(datetime.fromisoformat(timestamp.decode()).timestamp() // 60)
+        except ValueError:
+            return 0
+
+    def poll(self, now: float | None = None) -> None:
+        """Ingest everything appended since the last poll and expire old buckets."""
+        now = time.time() if now is None else now
+        since_minute = int(now // 60) - self.window_minutes + 1
+        today = audit_file_for(self.logs_dir, datetime.fromtimestamp(now))
+
+        if self._path is None:
+            window_start = datetime.fromtimestamp(since_minute * 60)
+            yesterday = audit_file_for(self.logs_dir, window_start)
+            if yesterday != today:
+                self._backfill(yesterday, since_minute)
+            self._backfill(today, since_minute)
+            self._path = today
+            if self._inode is None or not today.exists():
+                self._inode, self._offset = None, 0
+        elif self._path != today:
+            self._read_new(self._path, since_minute)  # drain the previous day
+            self._path, self._inode, self._offset = today, None, 0
+            self._read_new(today, since_minute)
+        else:
+            self._read_new(today, since_minute)
+
+        for minute in [m for m in self._buckets if m < since_minute]:
+            del self._buckets[minute]
+
+    # -- results ---------------------------------------------------------------
+
+    @property
+    def has_data(self) -> bool:
+        return bool(self._buckets) or (self._path is not None and self._path.exists())
+
+    def summary(self) -> dict:
+        """Failures in the window, as a per-hour rate and by action_type / actor."""
+        records = 0
+        failures: Counter = Counter()
+        for total, counter in self._buckets.values():
+            records += total
+            failures.update(counter)
+        errors = sum(failures.values())
+        by_action: Counter = Counter()
+        by_actor: Counter = Counter()
+        for (action_type, actor), n in failures.items():
+            by_action[action_type] += n
+            by_actor[actor] += n
+        return {
+            "window_minutes": self.window_minutes,
+            "records": records,
+            "errors": errors,
+            "errors_per_hour": round(errors * 60 / self.window_minutes, 2),
+            "by_action_type": dict(by_action.most_common()),
+            "by_actor": dict(by_actor.most_common()),
+        }
@@ -1,27 +1,29 @@
-"""Health monitor — checks heartbeats, disk, error rate, generates alerts.
+"""Health monitor — checks heartbeats, disk, error rate, circuit breakers, generates alerts.
 
 Writes health reports to Logs/ and creates ERROR_HEALTH_*.md on critical issues.
 """
 
-import json
-import time
 from datetime import datetime
 from pathlib import Path
 
+from src.health.error_rate import ErrorRateTracker
 from src.health.heartbeat import heartbeat_age, read_heartbeat
+from src.utils.circuit_breaker import OPEN, shared_breaker_states
 from src.utils.file_ops import get_project_root, get_folder, create_task_file
-from src.utils.logger import log_action, log_error
+from src.utils.logger import flush_logs, log_action, log_error
 
 
 class HealthMonitor:
     """Monitors system health and generates alerts."""
 
     def __init__(self, stale_threshold: int = 120, disk_warn_percent: int = 90,
-                 error_rate_threshold: int = 5):
+                 error_rate_threshold: int = 5, error_window_minutes: int = 60):
         self.stale_threshold = stale_threshold
         self.disk_warn_percent = disk_warn_percent
-        self.error_rate_threshold = error_rate_threshold
+        self.error_rate_threshold = error_rate_threshold  # failures per hour
+        self.error_window_minutes = error_window_minutes
         self.project_root = get_project_root()
+        self._error_tracker: ErrorRateTracker | None = None
 
     def check_heartbeat(self, agent_id: str) -> dict:
         """Check if an agent's heartbeat is fresh."""
@@ -49,37 +51,47 @@ class HealthMonitor:
         }
 
     def check_error_rate(self) -> dict:
-        """Check recent error rate from audit logs."""
-        audit_file = get_folder("Logs") / f"{datetime.now().strftime('%Y-%m-%d')}_actions.jsonl"
-        if not audit_file.exists():
+        """Check the failure rate over the last hour of audit records.
+
+        The tracker follows the audit log across checks, so each check only
+        parses records appended since the previous one.
+        """
+        flush_logs()  # include records still queued in this process
+        logs_dir = get_folder("Logs")
+        if self._error_tracker is None or self._error_tracker.logs_dir != logs_dir:
+            self._error_tracker = ErrorRateTracker(logs_dir, self.error_window_minutes)
+        tracker = self._error_tracker
+        tracker.poll()
+        if not tracker.has_data:
             return {"status": "no_data", "error_count": 0, "healthy": True}
 
-        error_count = 0
-        one_hour_ago = time.time() - 3600
-
-        try:
-            with open(audit_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        if record.get("result") == "failed":
-                            error_count += 1
-                    except json.JSONDecodeError:
-                        continue
-        except OSError:
-            pass
-
-        healthy = error_count < self.error_rate_threshold
+        summary = tracker.summary()
+        healthy = summary["errors_per_hour"] < self.error_rate_threshold
         return {
             "status": "healthy" if healthy else "high_error_rate",
-            "error_count": error_count,
+            "error_count": summary["errors"],
+            "errors_per_hour": summary["errors_per_hour"],
+            "window_minutes": summary["window_minutes"],
             "threshold": self.error_rate_threshold,
+            "by_action_type": summary["by_action_type"],
+            "by_actor": summary["by_actor"],
             "healthy": healthy,
         }
 
+    def check_circuit_breakers(self) -> dict:
+        """Report every circuit breaker of the project's processes; any open one is unhealthy.
+
+        Half-open breakers are probing a recovering dependency and count as healthy.
+        """
+        breakers = shared_breaker_states()
+        open_names = [name for name, b in breakers.items() if b["state"] == OPEN]
+        return {
+            "status": "open" if open_names else "healthy",
+            "open": open_names,
+            "breakers": breakers,
+            "healthy": not open_names,
+        }
+
     def run_all_checks(self, agent_ids: list[str] | None = None) -> dict:
         """Run all health checks and return combined report."""
         if agent_ids is None:
@@ -88,11 +100,13 @@ class HealthMonitor:
         heartbeats = {aid: self.check_heartbeat(aid) for aid in agent_ids}
         disk = self.check_disk_usage()
         errors = self.check_error_rate()
+        circuits = self.check_circuit_breakers()
 
         all_healthy = (
             all(h["healthy"] for h in heartbeats.values())
             and disk["healthy"]
             and errors["healthy"]
+            and circuits["healthy"]
         )
 
         report = {
@@ -101,6 +115,7 @@ class HealthMonitor:
             "heartbeats": heartbeats,
             "disk": disk,
             "error_rate": errors,
+            "circuit_breakers": circuits,
         }
 
         # Write health report
@@ -131,7 +146,13 @@ class HealthMonitor:
         content += f"- Used: {report['disk']['used_percent']}%\n"
 
         content += f"\n## Error Rate\n\n"
-        content += f"- Errors: {report['error_rate']['error_count']}\n"
+        content += f"- Errors (last hour): {report['error_rate']['error_count']}\n"
+
+        breakers = report.get("circuit_breakers", {}).get("breakers", {})
+        if breakers:
+            content += f"\n## Circuit Breakers\n\n"
+            for name, b in breakers.items():
+                content += f"- **{name}:** {b['state']} ({b['trips']} trips)\n"
 
         report_path.write_text(content, encoding="utf-8")
         log_action("Health report written", report_path.name, "health")
@@ -149,7 +170,10 @@ class HealthMonitor:
             issues.append(f"Disk usage: {report['disk']['used_percent']}%")
 
         if not report["error_rate"]["healthy"]:
-            issues.append(f"High error rate: {report['error_rate']['error_count']} errors")
+            issues.append(f"High error rate: {report['error_rate']['error_count']} errors in the last hour")
+
+        for name in report.get("circuit_breakers", {}).get("open", []):
+            issues.append(f"Circuit breaker open: {name}")
 
         metadata = {
             "type": "health_alert",
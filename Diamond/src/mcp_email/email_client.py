@@ -1,49 +1,26 @@
 """MCP Email Client — helper to call the MCP email server from scripts."""
 
-import json
-import subprocess
-import sys
 from pathlib import Path
 
 from src.utils.logger import log_action, log_error
+from src.utils.mcp_session import get_session_manager
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 def call_mcp_tool(tool_name: str, arguments: dict) -> dict:
-    """Call an MCP email server tool and return the result.
+    """Call an MCP email server tool and return the JSON-RPC response.
 
-    Spawns the MCP server as a subprocess, sends a JSON-RPC request,
-    and returns the parsed response.
+    Uses the pooled long-lived email server session (one process reused
+    across calls) rather than spawning a new interpreter each time.
     """
-    request = {
-        "jsonrpc": "2.0",
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments},
-        "id": 1,
-    }
-
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "src.mcp_email.email_server"],
-            input=json.dumps(request) + "\n",
-            capture_output=True,
-            text=True,
+        return get_session_manager().request(
+            "email", "tools/call",
+            {"name": tool_name, "arguments": arguments},
             timeout=30,
-            cwd=str(PROJECT_ROOT),
         )
-
-        if result.returncode != 0 and result.stderr:
-            log_error("MCP server error", result.stderr[:500], "mcp_client")
-
-        # Parse the last non-empty line of stdout as JSON response
-        for line in reversed(result.stdout.strip().split("\n")):
-            if line.strip():
-                return json.loads(line)
-
-        return {"error": "No response from MCP server"}
-
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         log_error("MCP server timeout", "", "mcp_client")
         return {"error": "MCP server timed out"}
     except Exception as e:
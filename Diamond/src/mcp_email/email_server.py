@@ -22,19 +22,25 @@ project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.utils.file_ops import get_folder
+from src.utils.jsonrpc import dispatch
 from src.utils.logger import log_action, log_error
 
-load_dotenv(project_root / ".env")
 
 
 # === Configuration ===
 
-DRY_RUN = os.getenv("DRY_RUN", "true").lower() == "true"
-SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
-SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-SMTP_USER = os.getenv("SMTP_USER", "")
-SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
-EMAIL_FROM = os.getenv("EMAIL_FROM", SMTP_USER)
+def _load_settings() -> None:
+    """Read settings from the environment (main() loads .env first)."""
+    global DRY_RUN, SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, EMAIL_FROM
+    DRY_RUN = os.getenv("DRY_RUN", "true").lower() == "true"
+    SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+    SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+    SMTP_USER = os.getenv("SMTP_USER", "")
+    SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+    EMAIL_FROM = os.getenv("EMAIL_FROM", SMTP_USER)
+
+
+_load_settings()
 
 
 # === Tool Definitions ===
@@ -272,6 +278,9 @@ def handle_request(request: dict) -> dict:
 
 def main():
     """Main loop — read JSON-RPC requests from stdin, write responses to stdout."""
+    load_dotenv(project_root / ".env")
+    _load_settings()
+
     for line in sys.stdin:
         line = line.strip()
         if not line:
@@ -289,7 +298,7 @@ def main():
             sys.stdout.flush()
             continue
 
-        response = handle_request(request)
+        response = dispatch(request, handle_request)
         if response is not None:
             sys.stdout.write(json.dumps(response) + "\n")
             sys.stdout.flush()
@@ -1,5 +1,5 @@
 """
-Helper wrapper for calling the Odoo MCP server as a subprocess.
+Helper wrapper for calling the Odoo MCP server over a pooled stdio session.
 
 Usage:
     from src.mcp_odoo.odoo_client import OdooClient
@@ -8,57 +8,51 @@ Usage:
 """
 
 import json
-import subprocess
-import sys
 import logging
 from pathlib import Path
 
+from src.utils.mcp_cache import get_mcp_cache
+from src.utils.mcp_session import get_session_manager
+
 logger = logging.getLogger("odoo_client")
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 class OdooClient:
-    """Client wrapper that spawns the Odoo MCP server as a subprocess."""
+    """Client wrapper around the long-lived Odoo MCP server session."""
 
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
         self.server_module = "src.mcp_odoo.odoo_server"
 
     def call_mcp_tool(self, tool_name: str, arguments: dict = None) -> dict:
-        """Call an MCP tool on the Odoo server via subprocess."""
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "id": 1,
-            "params": {"name": tool_name, "arguments": arguments or {}},
-        }
-        request_json = json.dumps(request) + "\n"
+        """Call an MCP tool on the Odoo server (SAFE tools go through the result cache)."""
+        return get_mcp_cache().call(
+            "odoo", tool_name, arguments, lambda: self._call_session(tool_name, arguments)
+        )
 
+    def _call_session(self, tool_name: str, arguments: dict = None) -> dict:
+        """Call an MCP tool on the Odoo server via its pooled stdio session."""
         try:
-            proc = subprocess.run(
-                [sys.executable, "-m", self.server_module],
-                input=request_json,
-                capture_output=True,
-                text=True,
+            response = get_session_manager().request(
+                "odoo", "tools/call",
+                {"name": tool_name, "arguments": arguments or {}},
                 timeout=self.timeout,
-                cwd=str(PROJECT_ROOT),
             )
-            for line in proc.stdout.strip().split("\n"):
-                if line.strip():
-                    response = json.loads(line)
-                    if "result" in response:
-                        content = response["result"].get("content", [])
-                        if content:
-                            return json.loads(content[0].get("text", "{}"))
-                    elif "error" in response:
-                        return {"error": response["error"].get("message", "Unknown error")}
-            return {"error": "No valid response from Odoo MCP server"}
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return {"error": f"Odoo MCP server timed out after {self.timeout}s"}
         except Exception as e:
             return {"error": f"Odoo MCP client error: {e}"}
 
+        if "result" in response:
+            content = response["result"].get("content", [])
+            if content:
+                return json.loads(content[0].get("text", "{}"))
+        elif "error" in response:
+            return {"error": response["error"].get("message", "Unknown error")}
+        return {"error": "No valid response from Odoo MCP server"}
+
     def list_invoices(self, state=None, move_type=None, limit=50):
         args = {"limit": limit}
         if state:
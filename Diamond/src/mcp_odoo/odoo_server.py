@@ -20,10 +20,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from dotenv import load_dotenv
-load_dotenv()
+
+from src.utils.jsonrpc import dispatch
 
 logger = logging.getLogger("mcp_odoo")
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
 
 # ---------------------------------------------------------------------------
 # Mock data for development / testing
@@ -409,6 +409,9 @@ def _call_tool(req_id, tool_name: str, arguments: dict, odoo: OdooConnection) ->
 
 def main():
     """Run the MCP server reading JSON-RPC from stdin, writing to stdout."""
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+
     odoo = OdooConnection()
     odoo.connect()
 
@@ -430,9 +433,10 @@ def main():
             sys.stdout.flush()
             continue
 
-        response = handle_request(request, odoo)
-        sys.stdout.write(json.dumps(response) + "\n")
-        sys.stdout.flush()
+        response = dispatch(request, lambda req: handle_request(req, odoo))
+        if response is not None:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
 
 
 if __name__ == "__main__":
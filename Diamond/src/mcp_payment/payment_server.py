@@ -16,6 +16,7 @@ from src.mcp_payment.mock_payment import (
     get_accounts, get_balance, get_transactions,
     initiate_payment, get_payment_status,
 )
+from src.utils.jsonrpc import dispatch
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() == "true"
 
@@ -183,9 +184,10 @@ def main():
             continue
         try:
             request = json.loads(line)
-            response = handle_request(request)
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
+            response = dispatch(request, handle_request)
+            if response is not None:
+                sys.stdout.write(json.dumps(response) + "\n")
+                sys.stdout.flush()
         except json.JSONDecodeError:
             error_response = {
                 "jsonrpc": "2.0",
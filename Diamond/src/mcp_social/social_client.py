@@ -1,5 +1,5 @@
 """
-Helper wrapper for calling the Social MCP server as a subprocess.
+Helper wrapper for calling the Social MCP server over a pooled stdio session.
 
 Usage:
     from src.mcp_social.social_client import SocialClient
@@ -8,57 +8,51 @@ Usage:
 """
 
 import json
-import subprocess
-import sys
 import logging
 from pathlib import Path
 
+from src.utils.mcp_cache import get_mcp_cache
+from src.utils.mcp_session import get_session_manager
+
 logger = logging.getLogger("social_client")
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 class SocialClient:
-    """Client wrapper that spawns the Social MCP server as a subprocess."""
+    """Client wrapper around the long-lived Social MCP server session."""
 
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
         self.server_module = "src.mcp_social.social_server"
 
     def call_mcp_tool(self, tool_name: str, arguments: dict = None) -> dict:
-        """Call an MCP tool on the Social server via subprocess."""
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "id": 1,
-            "params": {"name": tool_name, "arguments": arguments or {}},
-        }
-        request_json = json.dumps(request) + "\n"
+        """Call an MCP tool on the Social server (SAFE tools go through the result cache)."""
+        return get_mcp_cache().call(
+            "social", tool_name, arguments, lambda: self._call_session(tool_name, arguments)
+        )
 
+    def _call_session(self, tool_name: str, arguments: dict = None) -> dict:
+        """Call an MCP tool on the Social server via its pooled stdio session."""
         try:
-            proc = subprocess.run(
-                [sys.executable, "-m", self.server_module],
-                input=request_json,
-                capture_output=True,
-                text=True,
+            response = get_session_manager().request(
+                "social", "tools/call",
+                {"name": tool_name, "arguments": arguments or {}},
                 timeout=self.timeout,
-                cwd=str(PROJECT_ROOT),
             )
-            for line in proc.stdout.strip().split("\n"):
-                if line.strip():
-                    response = json.loads(line)
-                    if "result" in response:
-                        content = response["result"].get("content", [])
-                        if content:
-                            return json.loads(content[0].get("text", "{}"))
-                    elif "error" in response:
-                        return {"error": response["error"].get("message", "Unknown error")}
-            return {"error": "No valid response from Social MCP server"}
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return {"error": f"Social MCP server timed out after {self.timeout}s"}
         except Exception as e:
             return {"error": f"Social MCP client error: {e}"}
 
+        if "result" in response:
+            content = response["result"].get("content", [])
+            if content:
+                return json.loads(content[0].get("text", "{}"))
+        elif "error" in response:
+            return {"error": response["error"].get("message", "Unknown error")}
+        return {"error": "No valid response from Social MCP server"}
+
     def post_facebook(self, message: str) -> dict:
         return self.call_mcp_tool("post_facebook", {"message": message})
 
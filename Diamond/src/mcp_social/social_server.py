@@ -8,6 +8,7 @@ Usage:
     echo '{"jsonrpc":"2.0","method":"tools/list","id":1}' | python -m src.mcp_social.social_server
 """
 
+import asyncio
 import json
 import sys
 import os
@@ -18,14 +19,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from dotenv import load_dotenv
-load_dotenv()
 
 logger = logging.getLogger("mcp_social")
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
 
 from src.mcp_social.adapters.facebook_adapter import FacebookAdapter
 from src.mcp_social.adapters.instagram_adapter import InstagramAdapter
 from src.mcp_social.adapters.twitter_adapter import TwitterAdapter
+from src.utils.jsonrpc import dispatch
+from src.utils.mcp_async import run_blocking, run_sync
 
 # ---------------------------------------------------------------------------
 # Adapter registry
@@ -145,30 +146,49 @@ def _handle_post_twitter(args: dict) -> dict:
     return adapter.post_tweet(args["text"])
 
 
-def _handle_get_social_summary(args: dict) -> dict:
-    platform = args.get("platform", "all")
-    limit = args.get("limit", 5)
-    summary = {}
+# Per-section reads each platform makes for get_social_summary
+SUMMARY_SECTIONS = {
+    "facebook": {"feed": "get_page_feed", "notifications": "get_notifications"},
+    "instagram": {"dms": "get_direct_messages", "mentions": "get_mentions"},
+    "twitter": {"mentions": "get_mentions", "dms": "get_dms"},
+}
+
+DEFAULT_SUMMARY_TIMEOUT = 20.0  # seconds; SOCIAL_SUMMARY_TIMEOUT overrides
 
-    platforms = ["facebook", "instagram", "twitter"] if platform == "all" else [platform]
 
+async def _gather_social_summary(platforms: list[str], limit: int, timeout: float) -> dict:
+    """Read every platform section concurrently; a slow section times out alone."""
+    jobs = []
     for p in platforms:
         adapter = _get_adapter(p)
-        section = {}
+        for section, method in SUMMARY_SECTIONS[p].items():
+            jobs.append((p, section, run_blocking(getattr(adapter, method), limit, timeout=timeout)))
+
+    results = await asyncio.gather(*(job for _, _, job in jobs), return_exceptions=True)
+
+    summary = {p: {} for p in platforms}
+    for (p, section, _), result in zip(jobs, results):
+        if isinstance(result, asyncio.TimeoutError):
+            logger.warning(f"Social summary: {p}.{section} timed out after {timeout}s")
+            result = {"error": f"timed out after {timeout}s"}
+        elif isinstance(result, Exception):
+            logger.error(f"Social summary: {p}.{section} failed: {result}")
+            result = {"error": str(result)}
+        summary[p][section] = result
+    return summary
+
 
-        if p == "facebook":
-            section["feed"] = adapter.get_page_feed(limit)
-            section["notifications"] = adapter.get_notifications(limit)
-        elif p == "instagram":
-            section["dms"] = adapter.get_direct_messages(limit)
-            section["mentions"] = adapter.get_mentions(limit)
-        elif p == "twitter":
-            section["mentions"] = adapter.get_mentions(limit)
-            section["dms"] = adapter.get_dms(limit)
+def _handle_get_social_summary(args: dict) -> dict:
+    platform = args.get("platform", "all")
+    limit = args.get("limit", 5)
+    default_timeout = float(os.getenv("SOCIAL_SUMMARY_TIMEOUT", DEFAULT_SUMMARY_TIMEOUT))
+    timeout = args.get("timeout", default_timeout)
 
-        summary[p] = section
+    platforms = ["facebook", "instagram", "twitter"] if platform == "all" else [platform]
+    for p in platforms:
+        _get_adapter(p)  # unknown platform → ValueError before any fan-out
 
-    return summary
+    return run_sync(_gather_social_summary(platforms, limit, timeout))
 
 
 def _handle_draft_social_post(args: dict) -> dict:
@@ -278,6 +298,8 @@ def handle_request(request: dict) -> dict:
 # ---------------------------------------------------------------------------
 
 def main():
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
     logger.info("Social MCP server started (reading from stdin)")
 
     for line in sys.stdin:
@@ -296,9 +318,10 @@ def main():
             sys.stdout.flush()
             continue
 
-        response = handle_request(request)
-        sys.stdout.write(json.dumps(response) + "\n")
-        sys.stdout.flush()
+        response = dispatch(request, handle_request)
+        if response is not None:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ import sys
 import os
 
 from src.mcp_whatsapp.mock_whatsapp import get_chats, get_messages, send_message
+from src.utils.jsonrpc import dispatch
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() == "true"
 
@@ -138,9 +139,10 @@ def main():
             continue
         try:
             request = json.loads(line)
-            response = handle_request(request)
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
+            response = dispatch(request, handle_request)
+            if response is not None:
+                sys.stdout.write(json.dumps(response) + "\n")
+                sys.stdout.flush()
         except json.JSONDecodeError:
             error_response = {
                 "jsonrpc": "2.0",
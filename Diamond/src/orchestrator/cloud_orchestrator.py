@@ -17,8 +17,10 @@ from src.config.domain_router import should_handle, get_cloud_action, CLOUD_ACTI
 from src.claim.claim_manager import ClaimManager
 from src.sync.git_sync import GitVaultSync
 from src.health.heartbeat import write_heartbeat
-from src.utils.file_ops import list_md_files, safe_move, create_task_file
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.file_ops import safe_move, create_task_file
 from src.utils.logger import log_action, audit_log
+from src.utils.metrics import TASKS
 from src.utils import frontmatter
 
 
@@ -44,7 +46,7 @@ class CloudOrchestrator(Orchestrator):
             self.git_sync.pull()
 
         # Step 2: Scan and filter tasks
-        files = list_md_files("Needs_Action", ignore_prefixes=self.IGNORE_PREFIXES)
+        files = self._scan_needs_action()
         new_files = [f for f in files if f.name not in self._processing]
 
         if not new_files:
@@ -81,31 +83,7 @@ class CloudOrchestrator(Orchestrator):
             "cloud_orchestrator",
         )
 
-        processed = 0
-        for task in tasks:
-            if not self._running:
-                break
-
-            # Claim the task
-            claimed_path = self.claim_manager.claim(task["filepath"])
-            if claimed_path is None:
-                continue
-
-            task["filepath"] = claimed_path
-            self._processing.add(task["filename"])
-
-            try:
-                self._process_as_draft(task)
-                processed += 1
-            except Exception as e:
-                log_action(
-                    "Cloud error",
-                    f"{task['filename']}: {e}",
-                    "cloud_orchestrator",
-                )
-                self.claim_manager.unclaim(claimed_path)
-            finally:
-                self._processing.discard(task["filename"])
+        processed = self._run_tasks(tasks, self._handle_cloud_task)
 
         # Step 5: Heartbeat + git push
         write_heartbeat(self.agent_id)
@@ -114,6 +92,31 @@ class CloudOrchestrator(Orchestrator):
 
         return processed
 
+    def _handle_cloud_task(self, task: dict) -> bool:
+        """Pool worker: claim a task and process it as a draft."""
+        claimed_path = self.claim_manager.claim(task["filepath"])
+        if claimed_path is None:
+            return False
+
+        task["filepath"] = claimed_path
+        try:
+            self._process_as_draft(task)
+            return True
+        except CircuitOpenError as e:
+            # A dependency is down: hand the task back and wait out the breaker
+            TASKS.inc(type=task["task_type"], outcome="deferred")
+            released = self.claim_manager.unclaim(claimed_path)
+            self.error_handler.defer(task["filename"], released or claimed_path, e)
+            return False
+        except Exception as e:
+            log_action(
+                "Cloud error",
+                f"{task['filename']}: {e}",
+                "cloud_orchestrator",
+            )
+            self.claim_manager.unclaim(claimed_path)
+            return False
+
     def _process_as_draft(self, task: dict) -> None:
         """Process task in draft-only mode: create plan, force approval."""
         filepath = task["filepath"]
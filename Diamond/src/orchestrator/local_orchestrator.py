@@ -17,7 +17,8 @@ from src.config.domain_router import should_handle
 from src.claim.claim_manager import ClaimManager
 from src.sync.git_sync import GitVaultSync
 from src.health.heartbeat import write_heartbeat
-from src.utils.file_ops import list_md_files, safe_move
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.file_ops import safe_move
 from src.utils.logger import log_action, audit_log
 
 
@@ -71,7 +72,7 @@ class LocalOrchestrator(Orchestrator):
         self.claim_manager.cleanup_stale(max_age_seconds=3600)
 
         # Step 3: Scan tasks
-        files = list_md_files("Needs_Action", ignore_prefixes=self.IGNORE_PREFIXES)
+        files = self._scan_needs_action()
         new_files = [f for f in files if f.name not in self._processing]
 
         if not new_files:
@@ -90,38 +91,7 @@ class LocalOrchestrator(Orchestrator):
             "local_orchestrator",
         )
 
-        processed = 0
-        for task in tasks:
-            if not self._running:
-                break
-
-            # Claim the task
-            claimed_path = self.claim_manager.claim(task["filepath"])
-            if claimed_path is None:
-                continue
-
-            task["filepath"] = claimed_path
-            self._processing.add(task["filename"])
-
-            try:
-                self._process_task(task)
-                processed += 1
-                self.error_handler.reset_retries(task["filename"])
-            except Exception as e:
-                log_action(
-                    "Local error",
-                    f"{task['filename']}: {e}",
-                    "local_orchestrator",
-                )
-                self.claim_manager.unclaim(claimed_path)
-                self.error_handler.handle_error(
-                    e,
-                    task_name=task["filename"],
-                    task_filepath=task["filepath"],
-                    context=f"Local processing failed for type={task['task_type']}",
-                )
-            finally:
-                self._processing.discard(task["filename"])
+        processed = self._run_tasks(tasks, self._handle_local_task)
 
         # Step 5: Heartbeat + git push
         write_heartbeat(self.agent_id)
@@ -129,3 +99,33 @@ class LocalOrchestrator(Orchestrator):
             self.git_sync.push()
 
         return processed
+
+    def _handle_local_task(self, task: dict) -> bool:
+        """Pool worker: claim a task and run it through the full pipeline."""
+        claimed_path = self.claim_manager.claim(task["filepath"])
+        if claimed_path is None:
+            return False
+
+        task["filepath"] = claimed_path
+        try:
+            self._process_task(task)
+            self.error_handler.reset_retries(task["filename"])
+            return True
+        except CircuitOpenError as e:
+            self.claim_manager.unclaim(claimed_path)
+            self.error_handler.defer(task["filename"], task["filepath"], e)
+            return False
+        except Exception as e:
+            log_action(
+                "Local error",
+                f"{task['filename']}: {e}",
+                "local_orchestrator",
+            )
+            self.claim_manager.unclaim(claimed_path)
+            self.error_handler.handle_error(
+                e,
+                task_name=task["filename"],
+                task_filepath=task["filepath"],
+                context=f"Local processing failed for type={task['task_type']}",
+            )
+            return False
@@ -2,7 +2,9 @@
 
 Gold Tier enhancements:
 - New prefixes: ODOO_, FACEBOOK_, INSTAGRAM_, TWITTER_, SOCIAL_, AUDIT_, ERROR_
-- Error recovery with retry decorator + ErrorHandler
+- Error recovery via ErrorHandler and the delayed retry queue
+- Circuit breaker around the Claude CLI: during an outage tasks are deferred
+  instead of each waiting out the 120s timeout
 - Audit logging (JSON-lines) for all actions
 - Ralph Wiggum loop integration for complex multi-step tasks
 
@@ -22,12 +24,13 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from src.utils import frontmatter
+from src.utils import frontmatter, profiler, tracing
 from src.utils.file_ops import (
     get_folder,
     get_project_root,
@@ -35,9 +38,12 @@ from src.utils.file_ops import (
     safe_move,
     create_task_file,
 )
-from src.utils.logger import log_action, log_error, audit_log
-from src.utils.retry import with_retry, RetryExhausted
+from src.utils.circuit_breaker import CircuitOpenError, get_breaker
+from src.utils.logger import log_action, log_error, audit_log, start_background_writer
+from src.utils.metrics import CLAUDE_LATENCY, TASKS, start_http_server
 from src.errors.error_handler import ErrorHandler, graceful_call
+from src.orchestrator.task_pool import TaskPool
+from src.utils.folder_notifier import FolderNotifier
 
 load_dotenv()
 
@@ -65,7 +71,9 @@ class Orchestrator:
     COMPLEX_PREFIXES = ["ODOO_", "AUDIT_"]
 
     def __init__(self, dry_run: bool = False, poll_interval: int = 10,
-                 ralph_enabled: bool = True):
+                 ralph_enabled: bool = True, max_workers: int | None = None,
+                 type_limits: dict[str, int] | None = None,
+                 watch_mode: str | None = None):
         self.dry_run = dry_run
         self.poll_interval = poll_interval
         self.ralph_enabled = ralph_enabled
@@ -73,14 +81,43 @@ class Orchestrator:
         self.claude_cmd = os.getenv("CLAUDE_CMD", "claude")
         self._running = True
         self._processing: set[str] = set()
+        self._processing_lock = threading.Lock()
         self.error_handler = ErrorHandler(max_retries=3)
 
+        # Worker pool — limits come from config.yaml `orchestrator:` unless given
+        orch_config = self._load_orchestrator_config()
+        if max_workers is None:
+            max_workers = int(os.getenv("ORCHESTRATOR_MAX_WORKERS",
+                                        orch_config.get("max_workers", 4)))
+        if type_limits is None:
+            type_limits = orch_config.get("type_limits") or {}
+        self.pool = TaskPool(max_workers=max_workers, type_limits=type_limits)
+
+        # Ingestion mode: "poll" re-scans every poll_interval; "events" wakes on
+        # filesystem notifications and re-scans every reconcile_interval as a safety net
+        self.watch_mode = watch_mode or orch_config.get("watch_mode", "poll")
+        self.reconcile_interval = int(orch_config.get("reconcile_interval", 60))
+        self._notifier: FolderNotifier | None = None
+        self._event_files: list[Path] | None = None
+
         signal.signal(signal.SIGINT, self._handle_stop)
         signal.signal(signal.SIGTERM, self._handle_stop)
 
     def _handle_stop(self, signum, frame):
         log_action("Orchestrator", "Shutting down...")
         self._running = False
+        if self._notifier is not None:
+            self._notifier.wake()
+
+    @staticmethod
+    def _load_orchestrator_config() -> dict:
+        """Read the `orchestrator:` section of config.yaml (empty if missing)."""
+        from src.config.agent_config import AgentConfig
+
+        try:
+            return AgentConfig._load_config().get("orchestrator", {}) or {}
+        except Exception:
+            return {}
 
     @staticmethod
     def _invoke_claude_raw(claude_cmd: str, project_root: str, skill_name: str, context: str) -> str:
@@ -102,6 +139,10 @@ class Orchestrator:
 
         Returns Claude's response text. In dry-run mode, returns a placeholder.
         """
+        with tracing.span(f"claude:{skill_name}"):
+            return self._invoke_skill(skill_name, context)
+
+    def _invoke_skill(self, skill_name: str, context: str) -> str:
         start = time.time()
 
         if self.dry_run:
@@ -112,32 +153,34 @@ class Orchestrator:
             return f"[DRY-RUN] Skill '{skill_name}' would be invoked with context."
 
         try:
-            # Use retry wrapper for resilience
-            @with_retry(max_attempts=2, backoff_factor=2)
-            def _call():
-                return self._invoke_claude_raw(
+            with get_breaker("claude").guard():
+                response = self._invoke_claude_raw(
                     self.claude_cmd, str(self.project_root), skill_name, context
                 )
-
-            response = _call()
+            CLAUDE_LATENCY.observe(time.time() - start, skill=skill_name, result="success")
             duration = int((time.time() - start) * 1000)
             audit_log("skill_invoke", actor="orchestrator",
                       params={"skill": skill_name},
                       result="success", duration_ms=duration)
             return response
 
-        except RetryExhausted as e:
+        except CircuitOpenError:
+            audit_log("skill_invoke", actor="orchestrator",
+                      params={"skill": skill_name}, result="circuit_open")
+            raise
+
+        except (RuntimeError, subprocess.TimeoutExpired):
+            # No backoff in the worker: the task fails now and ErrorHandler puts
+            # it on the delayed retry queue, so this slot moves on to other tasks
+            CLAUDE_LATENCY.observe(time.time() - start, skill=skill_name, result="failed")
             duration = int((time.time() - start) * 1000)
             audit_log("skill_invoke", actor="orchestrator",
                       params={"skill": skill_name},
                       result="failed", duration_ms=duration)
-            self.error_handler.handle_error(
-                e, task_name=f"skill:{skill_name}",
-                context=f"Failed to invoke {skill_name} after retries"
-            )
-            return f"Error: {e}"
+            raise
 
         except FileNotFoundError:
+            CLAUDE_LATENCY.observe(time.time() - start, skill=skill_name, result="cli_not_found")
             log_error("Claude CLI not found", f"Command: {self.claude_cmd}", "orchestrator")
             audit_log("skill_invoke", actor="orchestrator",
                       params={"skill": skill_name},
@@ -145,7 +188,14 @@ class Orchestrator:
             return "Error: Claude CLI not found"
 
     def _classify_task(self, filepath: Path) -> dict:
-        """Read and classify a task file."""
+        """Read and classify a task file, starting its trace."""
+        trace_id = tracing.new_trace_id()
+        with tracing.span("classify", trace_id=trace_id, file=filepath.name):
+            task = self._classify_file(filepath)
+        task["trace_id"] = trace_id
+        return task
+
+    def _classify_file(self, filepath: Path) -> dict:
         metadata, body = frontmatter.read_file(filepath)
 
         # Determine task type from filename prefix or metadata
@@ -217,8 +267,10 @@ class Orchestrator:
 
         # Step 1b: Handle ERROR_ tasks
         if task_type == "error":
-            self._invoke_claude("handle_error", f"File: {filename}\n\nContent:\n{task['body']}")
-            safe_move(filepath, "Done")
+            with tracing.span("execute"):
+                self._invoke_claude("handle_error", f"File: {filename}\n\nContent:\n{task['body']}")
+            with tracing.span("move"):
+                safe_move(filepath, "Done")
             return
 
         # Step 2: Invoke create_plan skill
@@ -230,12 +282,14 @@ class Orchestrator:
             f"Content:\n{task['body']}"
         )
 
-        plan_response = self._invoke_claude("create_plan", plan_context)
+        with tracing.span("plan"):
+            plan_response = self._invoke_claude("create_plan", plan_context)
         log_action("Plan created", filename, "orchestrator")
 
         # Step 3: Check approval requirement
         if task["requires_approval"]:
-            self._route_to_approval(task, plan_response)
+            with tracing.span("approval"):
+                self._route_to_approval(task, plan_response)
             return
 
         # Step 4: Execute (no approval needed) — route to correct skill
@@ -247,15 +301,18 @@ class Orchestrator:
         )
 
         skill = self._get_skill_for_type(task_type)
-        self._invoke_claude(skill, exec_context)
+        with tracing.span("execute", skill=skill):
+            self._invoke_claude(skill, exec_context)
         log_action("Task executed", filename, "orchestrator")
 
         # Step 5: Cleanup — move to Done/
-        safe_move(filepath, "Done")
+        with tracing.span("move"):
+            safe_move(filepath, "Done")
         log_action("Moved to Done", filename, "orchestrator")
 
         # Step 6: Update dashboard
-        self._invoke_claude("update_dashboard", f"Task completed: {filename}")
+        with tracing.span("dashboard"):
+            self._invoke_claude("update_dashboard", f"Task completed: {filename}")
 
         duration = int((time.time() - start) * 1000)
         audit_log("task_complete", actor="orchestrator",
@@ -285,8 +342,10 @@ class Orchestrator:
         audit_log("ralph_start", actor="ralph_wiggum",
                   params={"file": task["filename"]}, task_name=task["filename"])
 
-        loop = RalphWiggumLoop(filepath, max_iterations=15, dry_run=self.dry_run)
-        result = loop.run()
+        loop = RalphWiggumLoop(filepath, max_iterations=15, dry_run=self.dry_run,
+                               use_events=self.watch_mode == "events")
+        with tracing.span("ralph"):
+            result = loop.run()
 
         audit_log("ralph_complete", actor="ralph_wiggum",
                   params={"file": task["filename"], "iterations": result.get("iterations", 0)},
@@ -341,20 +400,91 @@ class Orchestrator:
             f"Content:\n{task['body']}"
         )
 
-        self._invoke_claude("execute_action", exec_context)
+        with tracing.span("execute", skill="execute_action"):
+            self._invoke_claude("execute_action", exec_context)
         log_action("Executed approved action", filename, "orchestrator")
 
-        safe_move(filepath, "Done")
+        with tracing.span("move"):
+            safe_move(filepath, "Done")
         log_action("Moved to Done", filename, "orchestrator")
 
-        self._invoke_claude("update_dashboard", f"Executed approved action: {filename}")
+        with tracing.span("dashboard"):
+            self._invoke_claude("update_dashboard", f"Executed approved action: {filename}")
         audit_log("execute_approved", actor="orchestrator",
                   params={"file": filename}, approval_status="approved",
                   result="success", task_name=filename)
 
+    def _scan_needs_action(self) -> list[Path]:
+        """Return candidate task files from Needs_Action/.
+
+        In events mode, only the files reported by the notifier since the last
+        poll are returned; otherwise (or on a reconciliation pass) the whole
+        folder is listed.
+        """
+        event_files, self._event_files = self._event_files, None
+        if not event_files:
+            return self._apply_retry_queue(
+                list_md_files("Needs_Action", ignore_prefixes=self.IGNORE_PREFIXES)
+            )
+
+        files = {
+            f.name: f for f in event_files
+            if f.exists()
+            and f.parent.name == "Needs_Action"
+            and not any(f.name.startswith(p) for p in self.IGNORE_PREFIXES)
+        }
+        return self._apply_retry_queue(sorted(files.values(), key=lambda f: f.stat().st_mtime))
+
+    def _apply_retry_queue(self, files: list[Path]) -> list[Path]:
+        """Hide tasks waiting out a retry backoff; add the ones now due.
+
+        A failed task stays in Needs_Action/ (or is unclaimed back there), so
+        a due retry is re-enqueued by picking its file up again. If the file
+        has moved on since the failure, the retry is dropped.
+        """
+        queue = self.error_handler.retry_queue
+        due = []
+        for entry in self.error_handler.take_due_retries():
+            path = get_folder("Needs_Action") / entry.task_name
+            if path.exists():
+                due.append(path)
+                log_action("Retry due", f"{entry.task_name} (attempt {entry.attempt + 1})", "orchestrator")
+            else:
+                log_action("Retry dropped", f"{entry.task_name} no longer in Needs_Action", "orchestrator")
+
+        if not len(queue) and not due:
+            return files
+        ready = [f for f in files if not queue.is_waiting(f.name)]
+        names = {f.name for f in ready}
+        return ready + [f for f in due if f.name not in names]
+
+    def _wait_for_work(self) -> None:
+        """Sleep until the next poll: a notification in events mode, or poll_interval."""
+        if self._notifier is None:
+            time.sleep(self.poll_interval)
+            return
+        # [] on timeout → full reconciliation scan in the next poll; wake early
+        # when a queued retry falls due
+        timeout = self.reconcile_interval
+        next_retry = self.error_handler.retry_queue.next_due()
+        if next_retry is not None:
+            timeout = max(0.0, min(timeout, next_retry - time.time()))
+        self._event_files = self._notifier.wait(timeout=timeout)
+
+    def _start_notifier(self) -> None:
+        """Start filesystem notifications for Needs_Action/ when in events mode."""
+        if self.watch_mode != "events":
+            return
+        notifier = FolderNotifier(["Needs_Action"])
+        if notifier.start():
+            self._notifier = notifier
+            log_action("Orchestrator", f"Event-driven ingestion on (reconcile every {self.reconcile_interval}s)", "orchestrator")
+        else:
+            log_error("Filesystem notifications unavailable", "falling back to polling", "orchestrator")
+
     def poll_once(self) -> int:
         """Check Needs_Action/ and process new files."""
-        files = list_md_files("Needs_Action", ignore_prefixes=self.IGNORE_PREFIXES)
+        files = self._scan_needs_action()
 
         new_files = [f for f in files if f.name not in self._processing]
         if not new_files:
@@ -365,27 +495,52 @@ class Orchestrator:
 
         log_action("Orchestrator", f"Found {len(tasks)} task(s) to process", "orchestrator")
 
-        processed = 0
-        for task in tasks:
-            if not self._running:
-                break
+        return self._run_tasks(tasks, self._handle_task)
 
-            self._processing.add(task["filename"])
-            try:
-                self._process_task(task)
-                processed += 1
-                self.error_handler.reset_retries(task["filename"])
-            except Exception as e:
-                log_error(f"Failed to process {task['filename']}", str(e), "orchestrator")
-                self.error_handler.handle_error(
-                    e, task_name=task["filename"],
-                    task_filepath=task["filepath"],
-                    context=f"Processing failed for task type={task['task_type']}"
-                )
-            finally:
-                self._processing.discard(task["filename"])
+    def _handle_task(self, task: dict) -> bool:
+        """Pool worker: run one task through the pipeline, capturing errors."""
+        try:
+            self._process_task(task)
+            self.error_handler.reset_retries(task["filename"])
+            TASKS.inc(type=task["task_type"], outcome="success")
+            return True
+        except CircuitOpenError as e:
+            TASKS.inc(type=task["task_type"], outcome="deferred")
+            self.error_handler.defer(task["filename"], task["filepath"], e)
+            return False
+        except Exception as e:
+            TASKS.inc(type=task["task_type"], outcome="failure")
+            log_error(f"Failed to process {task['filename']}", str(e), "orchestrator")
+            self.error_handler.handle_error(
+                e, task_name=task["filename"],
+                task_filepath=task["filepath"],
+                context=f"Processing failed for task type={task['task_type']}"
+            )
+            return False
+
+    def _run_tasks(self, tasks: list[dict], handler) -> int:
+        """Run handler over priority-sorted tasks on the worker pool.
+
+        Tasks already in flight (tracked in _processing) are skipped. Returns
+        the number of tasks the handler reported as processed.
+        """
+        with self._processing_lock:
+            batch = [t for t in tasks if t["filename"] not in self._processing]
+            self._processing.update(t["filename"] for t in batch)
+
+        def traced(task: dict):
+            with tracing.trace("task", trace_id=task.get("trace_id"),
+                               file=task["filename"], type=task["task_type"]) as span:
+                ok = handler(task)
+                if not ok:
+                    span.status = "error"
+                return ok
 
-        return processed
+        try:
+            return self.pool.run(batch, traced, keep_running=lambda: self._running)
+        finally:
+            with self._processing_lock:
+                self._processing.difference_update(t["filename"] for t in batch)
 
     def run(self, once: bool = False) -> None:
         """Main loop — watch Needs_Action/ and process tasks."""
@@ -394,16 +549,25 @@ class Orchestrator:
         audit_log("orchestrator_start", actor="orchestrator",
                   params={"mode": mode, "ralph_enabled": self.ralph_enabled})
 
+        if not once:
+            self._start_notifier()
+
         self.poll_once()
 
         if once:
+            self.pool.shutdown(wait=True)
             log_action("Orchestrator", "Single run complete.", "orchestrator")
             return
 
         while self._running:
-            time.sleep(self.poll_interval)
-            self.poll_once()
-
+            self._wait_for_work()
+            if self._running:
+                self.poll_once()
+
+        # Let in-flight tasks finish before exiting
+        if self._notifier is not None:
+            self._notifier.stop()
+        self.pool.shutdown(wait=True)
         log_action("Orchestrator", "Stopped.", "orchestrator")
         audit_log("orchestrator_stop", actor="orchestrator")
 
@@ -414,14 +578,31 @@ def main():
     parser.add_argument("--once", action="store_true", help="Process current files and exit")
     parser.add_argument("--interval", type=int, default=10, help="Poll interval (seconds)")
     parser.add_argument("--no-ralph", action="store_true", help="Disable Ralph Wiggum loop")
+    parser.add_argument("--watch", choices=["poll", "events"], default=None,
+                        help="Ingestion mode (default: orchestrator.watch_mode in config.yaml)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Max concurrent tasks (default: orchestrator.max_workers in config.yaml)")
     parser.add_argument("--role", choices=["cloud", "local", "gold", "diamond"], default="diamond",
                         help="Agent role: cloud (draft-only), local (full), gold (legacy), diamond (swarm)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Serve Prometheus /metrics on this port (default: metrics.port in config.yaml)")
+    profiler.add_arguments(parser)
     args = parser.parse_args()
+    start_background_writer()
+
+    metrics_port = args.metrics_port
+    if metrics_port is None:
+        from src.config.agent_config import AgentConfig
+        metrics_port = (AgentConfig._load_config().get("metrics") or {}).get("port")
+    if metrics_port:
+        start_http_server(metrics_port)
 
     kwargs = dict(
         dry_run=args.dry_run,
         poll_interval=args.interval,
         ralph_enabled=not args.no_ralph,
+        max_workers=args.workers,
+        watch_mode=args.watch,
     )
 
     if args.role == "cloud":
@@ -436,7 +617,11 @@ def main():
     else:
         orchestrator = Orchestrator(**kwargs)
 
-    orchestrator.run(once=args.once)
+    profiling = profiler.setup(f"orchestrator_{args.role}", args, target=orchestrator)
+    try:
+        orchestrator.run(once=args.once)
+    finally:
+        profiling.close()
 
 
 if __name__ == "__main__":
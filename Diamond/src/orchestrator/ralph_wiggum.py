@@ -28,9 +28,11 @@ import time
 from enum import Enum
 from pathlib import Path
 
+from src.utils.circuit_breaker import get_breaker
 from src.utils.file_ops import get_project_root, get_folder, safe_move
+from src.utils.folder_notifier import FolderNotifier
 from src.utils.logger import log_action, audit_log
-from src.utils import frontmatter
+from src.utils import frontmatter, tracing
 
 logger = logging.getLogger("ai_employee")
 
@@ -57,12 +59,17 @@ STATE_SKILLS = {
 class RalphWiggumLoop:
     """Drives a complex task through multiple Claude invocations to completion."""
 
+    # Folders inspected for file-movement state detection
+    WATCH_FOLDERS = ["Needs_Action", "Pending_Approval", "Approved", "Done", "Errors"]
+
     def __init__(self, task_filepath: str | Path, max_iterations: int = 15,
-                 dry_run: bool = False):
+                 dry_run: bool = False, use_events: bool = False):
         self.task_filepath = Path(task_filepath)
         self.task_id = self.task_filepath.stem
         self.max_iterations = max_iterations
         self.dry_run = dry_run
+        self.use_events = use_events
+        self._notifier: FolderNotifier | None = None
         self.project_root = get_project_root()
         self.claude_cmd = os.getenv("CLAUDE_CMD", "claude")
 
@@ -113,10 +120,17 @@ class RalphWiggumLoop:
 
     def _invoke_claude(self, skill_name: str, context: str) -> str:
         """Invoke a Claude CLI skill."""
+        with tracing.span(f"claude:{skill_name}"):
+            return self._invoke_skill(skill_name, context)
+
+    def _invoke_skill(self, skill_name: str, context: str) -> str:
         if self.dry_run:
             log_action(f"[DRY-RUN] Ralph would invoke", skill_name, "ralph_wiggum")
             return f"[DRY-RUN] {skill_name} would process {self.task_id}"
 
+        # Raises CircuitOpenError while the CLI is down; the orchestrator defers the task
+        breaker = get_breaker("claude")
+        breaker.before_call()
         prompt = f"Use the {skill_name} skill. Context:\n\n{context}"
         try:
             result = subprocess.run(
@@ -126,21 +140,24 @@ class RalphWiggumLoop:
                 timeout=120,
                 cwd=str(self.project_root),
             )
-            if result.returncode != 0:
-                return f"Error: {result.stderr[:500]}"
-            return result.stdout.strip()
         except subprocess.TimeoutExpired:
+            breaker.record_failure()
             return "Error: Claude CLI timed out"
         except FileNotFoundError:
+            breaker.record_failure()
             return "Error: Claude CLI not found"
+        if result.returncode != 0:
+            breaker.record_failure()
+            return f"Error: {result.stderr[:500]}"
+        breaker.record_success()
+        return result.stdout.strip()
 
     def _detect_file_location(self) -> str | None:
         """Check which folder the task file currently lives in.
 
         Returns the folder name or None if file not found.
         """
-        check_folders = ["Needs_Action", "Pending_Approval", "Approved", "Done", "Errors"]
-        for folder_name in check_folders:
+        for folder_name in self.WATCH_FOLDERS:
             folder = get_folder(folder_name)
             # Check for exact filename or variants (with APPROVE_, EXECUTE_ prefix)
             for candidate in folder.glob("*.md"):
@@ -148,6 +165,29 @@ class RalphWiggumLoop:
                     return folder_name
         return None
 
+    def _wait_for_movement(self, timeout: float) -> None:
+        """Wait until this task's file lands in a watched folder, or timeout.
+
+        With use_events, returns as soon as a matching file appears;
+        otherwise simply sleeps.
+        """
+        if self.use_events and self._notifier is None:
+            notifier = FolderNotifier(self.WATCH_FOLDERS)
+            if notifier.start():
+                self._notifier = notifier
+            else:
+                self.use_events = False
+
+        if self._notifier is None:
+            time.sleep(timeout)
+            return
+
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            changed = self._notifier.wait(timeout=remaining)
+            if any(self.task_id in p.stem for p in changed):
+                return
+
     def _build_context(self) -> str:
         """Build context for Claude invocation based on current state."""
         # Read the current task file content if it still exists
@@ -185,55 +225,57 @@ class RalphWiggumLoop:
             if current in (TaskState.COMPLETED, TaskState.FAILED):
                 break
 
-            self.state["iteration"] += 1
-            self._save_state()
-
-            # Determine which skill to invoke
-            skill = STATE_SKILLS.get(current)
-            if not skill:
-                # For AWAITING_APPROVAL, we just check file location
+            with tracing.span("ralph_iteration", iteration=self.state["iteration"] + 1,
+                              state=current.value):
+                self.state["iteration"] += 1
+                self._save_state()
+
+                # Determine which skill to invoke
+                skill = STATE_SKILLS.get(current)
+                if not skill:
+                    # For AWAITING_APPROVAL, we just check file location
+                    location = self._detect_file_location()
+                    if location == "Approved":
+                        self._transition(TaskState.APPROVED, "File found in Approved/")
+                        continue
+                    elif location == "Done":
+                        self._transition(TaskState.COMPLETED, "File found in Done/")
+                        continue
+                    elif location == "Errors":
+                        self._transition(TaskState.FAILED, "File found in Errors/")
+                        continue
+                    else:
+                        # Still waiting for approval — sleep and check again
+                        log_action("Ralph Wiggum", f"Waiting for approval ({self.task_id})", "ralph_wiggum")
+                        self._wait_for_movement(5)
+                        continue
+
+                # Build context and invoke Claude
+                context = self._build_context()
+                output = self._invoke_claude(skill, context)
+                self.state["prior_output"] = output[:2000]  # Keep last output for re-injection
+                self._save_state()
+
+                # Check where the file ended up after Claude processed it
                 location = self._detect_file_location()
-                if location == "Approved":
-                    self._transition(TaskState.APPROVED, "File found in Approved/")
-                    continue
-                elif location == "Done":
-                    self._transition(TaskState.COMPLETED, "File found in Done/")
-                    continue
+
+                # State transitions based on file location
+                if location == "Done":
+                    self._transition(TaskState.COMPLETED, "File reached Done/")
+                elif location == "Pending_Approval":
+                    self._transition(TaskState.AWAITING_APPROVAL, "File routed to approval")
+                elif location == "Approved":
+                    self._transition(TaskState.APPROVED, "File approved")
                 elif location == "Errors":
-                    self._transition(TaskState.FAILED, "File found in Errors/")
-                    continue
+                    self._transition(TaskState.FAILED, "File moved to Errors/")
                 else:
-                    # Still waiting for approval — sleep and check again
-                    log_action("Ralph Wiggum", f"Waiting for approval ({self.task_id})", "ralph_wiggum")
-                    time.sleep(5)
-                    continue
-
-            # Build context and invoke Claude
-            context = self._build_context()
-            output = self._invoke_claude(skill, context)
-            self.state["prior_output"] = output[:2000]  # Keep last output for re-injection
-            self._save_state()
-
-            # Check where the file ended up after Claude processed it
-            location = self._detect_file_location()
-
-            # State transitions based on file location
-            if location == "Done":
-                self._transition(TaskState.COMPLETED, "File reached Done/")
-            elif location == "Pending_Approval":
-                self._transition(TaskState.AWAITING_APPROVAL, "File routed to approval")
-            elif location == "Approved":
-                self._transition(TaskState.APPROVED, "File approved")
-            elif location == "Errors":
-                self._transition(TaskState.FAILED, "File moved to Errors/")
-            else:
-                # File still in Needs_Action or skill output suggests more work
-                if current == TaskState.CREATED:
-                    self._transition(TaskState.PLANNED, "Plan created")
-                elif current == TaskState.PLANNED:
-                    self._transition(TaskState.EXECUTING, "Execution started")
-                elif current == TaskState.APPROVED:
-                    self._transition(TaskState.EXECUTING, "Approved action executing")
+                    # File still in Needs_Action or skill output suggests more work
+                    if current == TaskState.CREATED:
+                        self._transition(TaskState.PLANNED, "Plan created")
+                    elif current == TaskState.PLANNED:
+                        self._transition(TaskState.EXECUTING, "Execution started")
+                    elif current == TaskState.APPROVED:
+                        self._transition(TaskState.EXECUTING, "Approved action executing")
 
             # Small delay between iterations
             time.sleep(1)
@@ -246,6 +288,10 @@ class RalphWiggumLoop:
             if self.task_filepath.exists():
                 safe_move(self.task_filepath, "Errors")
 
+        if self._notifier is not None:
+            self._notifier.stop()
+            self._notifier = None
+
         # Cleanup state file on completion
         result = {
             "task_id": self.task_id,
@@ -11,7 +11,7 @@ Extends the Platinum orchestrator with multi-agent delegation:
 Architecture:
   SwarmOrchestrator
     ├── AgentRegistry (4 specialized agents)
-    ├── MessageBus (in-memory A2A)
+    ├── MessageBus (A2A; in-memory or SQLite per a2a.backend)
     ├── MessageRouter (delegation/results)
     ├── OutcomeTracker (learning)
     ├── PromptOptimizer (self-improvement)
@@ -28,14 +28,17 @@ from src.orchestrator.orchestrator import Orchestrator
 from src.agents.agent_registry import AgentRegistry, create_default_registry
 from src.agents.base_agent import BaseSpecializedAgent
 from src.agents.security_agent import SecurityAgent
-from src.a2a.message_bus import MockMessageBus
+from src.a2a.message_bus import create_message_bus
 from src.a2a.message import A2AMessage, MessageType
 from src.a2a.router import MessageRouter
 from src.learning.outcome_tracker import OutcomeTracker, TaskOutcome, Outcome
 from src.learning.prompt_optimizer import PromptOptimizer
 from src.learning.performance_metrics import PerformanceMetrics
+from src.utils import tracing
+from src.utils.circuit_breaker import CircuitOpenError
 from src.utils.logger import log_action, audit_log
-from src.utils.file_ops import list_md_files, safe_move, get_project_root
+from src.utils.metrics import DELEGATION_LATENCY, TASKS
+from src.utils.file_ops import safe_move, get_project_root
 
 
 class SwarmOrchestrator(Orchestrator):
@@ -46,13 +49,13 @@ class SwarmOrchestrator(Orchestrator):
     """
 
     def __init__(self, dry_run: bool = False, poll_interval: int = 10,
-                 ralph_enabled: bool = True):
+                 ralph_enabled: bool = True, **kwargs):
         super().__init__(dry_run=dry_run, poll_interval=poll_interval,
-                         ralph_enabled=ralph_enabled)
+                         ralph_enabled=ralph_enabled, **kwargs)
 
         # Diamond components
         self.registry = create_default_registry()
-        self.bus = MockMessageBus(max_queue_size=1000)
+        self.bus = create_message_bus()
         self.router = MessageRouter(self.bus, self.registry)
         self.tracker = OutcomeTracker()
         self.optimizer = PromptOptimizer(self.tracker, min_sample_size=10)
@@ -67,7 +70,7 @@ class SwarmOrchestrator(Orchestrator):
 
     def poll_once(self) -> int:
         """Scan + delegate to specialized agents."""
-        files = list_md_files("Needs_Action", ignore_prefixes=self.IGNORE_PREFIXES)
+        files = self._scan_needs_action()
 
         new_files = [f for f in files if f.name not in self._processing]
         if not new_files:
@@ -80,20 +83,7 @@ class SwarmOrchestrator(Orchestrator):
         audit_log("swarm_poll", actor="swarm",
                   params={"task_count": len(tasks)})
 
-        processed = 0
-        for task in tasks:
-            if not self._running:
-                break
-
-            self._processing.add(task["filename"])
-            try:
-                self._delegate_task(task)
-                processed += 1
-            except Exception as e:
-                log_action("Swarm Error", f"{task['filename']}: {e}", "swarm")
-                self._record_outcome(task, Outcome.FAILURE, 0, str(e))
-            finally:
-                self._processing.discard(task["filename"])
+        processed = self._run_tasks(tasks, self._handle_delegation)
 
         # Periodic optimization
         self._optimization_counter += processed
@@ -103,6 +93,25 @@ class SwarmOrchestrator(Orchestrator):
 
         return processed
 
+    def _handle_delegation(self, task: dict) -> bool:
+        """Pool worker: delegate one task, recording a failure outcome on error."""
+        try:
+            self._delegate_task(task)
+            self.error_handler.reset_retries(task["filename"])
+            return True
+        except CircuitOpenError as e:
+            self.error_handler.defer(task["filename"], task["filepath"], e)
+            return False
+        except Exception as e:
+            log_action("Swarm Error", f"{task['filename']}: {e}", "swarm")
+            self._record_outcome(task, Outcome.FAILURE, 0, str(e))
+            self.error_handler.handle_error(
+                e, task_name=task["filename"],
+                task_filepath=task["filepath"],
+                context=f"Swarm delegation failed for type={task['task_type']}"
+            )
+            return False
+
     def _delegate_task(self, task: dict) -> None:
         """Delegate a task to the best specialized agent."""
         filename = task["filename"]
@@ -114,6 +123,7 @@ class SwarmOrchestrator(Orchestrator):
             # No specialized agent — fall back to base orchestrator
             log_action("Swarm", f"No agent for {filename}, using base pipeline", "swarm")
             self._process_task(task)
+            TASKS.inc(type=task.get("task_type", "unknown"), outcome="success")
             return
 
         log_action("Swarm", f"Delegating {filename} → {agent.agent_id}", "swarm")
@@ -123,9 +133,10 @@ class SwarmOrchestrator(Orchestrator):
 
         # Security pre-check
         if self._security and agent.AGENT_TYPE != "security":
-            scan = self._security.scan_outgoing(
-                task.get("body", ""), task.get("task_type", "unknown")
-            )
+            with tracing.span("security_scan"):
+                scan = self._security.scan_outgoing(
+                    task.get("body", ""), task.get("task_type", "unknown")
+                )
             if not scan["passed"]:
                 log_action("Security", f"Blocked {filename}: {scan['issues']}", "swarm")
                 audit_log("security_block", actor="security",
@@ -134,8 +145,13 @@ class SwarmOrchestrator(Orchestrator):
                 task["requires_approval"] = True
 
         # Delegate to agent
-        result = agent.process_task(task, dry_run=self.dry_run)
+        with tracing.span("execute", agent=agent.agent_id) as span:
+            result = agent.process_task(task, dry_run=self.dry_run)
+            if span is not None and result["status"] != "success":
+                span.status = "error"
         duration_ms = int((time.time() - start) * 1000)
+        DELEGATION_LATENCY.observe(time.time() - start, agent_type=agent.AGENT_TYPE,
+                                   outcome=result["status"])
 
         if result["status"] == "success":
             self._record_outcome(task, Outcome.SUCCESS, duration_ms,
@@ -143,9 +159,11 @@ class SwarmOrchestrator(Orchestrator):
 
             # Route based on approval requirement
             if task.get("requires_approval", False):
-                self._route_to_approval(task, result.get("result", ""))
+                with tracing.span("approval"):
+                    self._route_to_approval(task, result.get("result", ""))
             else:
-                safe_move(task["filepath"], "Done")
+                with tracing.span("move"):
+                    safe_move(task["filepath"], "Done")
                 log_action("Swarm", f"Completed {filename} via {agent.agent_id}", "swarm")
         else:
             self._record_outcome(task, Outcome.FAILURE, duration_ms,
@@ -156,6 +174,7 @@ class SwarmOrchestrator(Orchestrator):
                         duration_ms: int, details: str) -> None:
         """Record task outcome for learning."""
         agent = self.registry.find_best_agent(task)
+        TASKS.inc(type=task.get("task_type", "unknown"), outcome=outcome.value)
         self.tracker.record(TaskOutcome(
             task_id=task.get("filename", "unknown"),
             task_type=task.get("task_type", "unknown"),
@@ -186,6 +205,7 @@ class SwarmOrchestrator(Orchestrator):
             "orchestrator": "swarm",
             "tier": "diamond",
             "dry_run": self.dry_run,
+            "pool": self.pool.get_stats(),
             "agents": self.registry.get_swarm_stats(),
             "bus": self.bus.get_stats(),
             "learning": {
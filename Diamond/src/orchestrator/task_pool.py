@@ -0,0 +1,123 @@
+"""Task Pool — bounded worker pool for running orchestrator tasks in parallel.
+
+Each task makes several blocking Claude CLI calls, so running them one at a
+time lets a single slow ODOO_ task hold up every EMAIL_ task behind it.
+The pool runs tasks on a thread pool with:
+
+- a global concurrency limit (max_workers)
+- optional per-task-type limits (e.g. {"odoo": 1, "audit": 1})
+- priority-preserving dispatch: whenever a slot frees up, the highest-priority
+  pending task whose type still has capacity is started next
+- `inline` mode runs the batch on the calling thread, one task at a time.
+  The profiler sets it for --profile-polls, since cProfile only sees the
+  thread that runs it.
+
+Usage:
+    pool = TaskPool(max_workers=4, type_limits={"odoo": 1})
+    processed = pool.run(tasks, handler)   # blocks until the batch is done
+    pool.shutdown()
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+logger = logging.getLogger("ai_employee")
+
+
+class TaskPool:
+    """Runs task handlers concurrently with global and per-type limits."""
+
+    def __init__(self, max_workers: int = 4, type_limits: dict[str, int] | None = None):
+        self.max_workers = max(1, int(max_workers))
+        self.type_limits = {k: max(1, int(v)) for k, v in (type_limits or {}).items()}
+        self._executor: ThreadPoolExecutor | None = None
+        self.inline = False
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="task-worker"
+            )
+        return self._executor
+
+    def _has_capacity(self, task_type: str, in_flight: dict[Future, dict]) -> bool:
+        """Check whether another task of this type may start now."""
+        limit = self.type_limits.get(task_type)
+        if limit is None:
+            return True
+        running = sum(1 for t in in_flight.values() if t.get("task_type") == task_type)
+        return running < limit
+
+    def run(self, tasks: list[dict], handler: Callable[[dict], bool],
+            keep_running: Callable[[], bool] = lambda: True) -> int:
+        """Run handler(task) for every task and wait for the batch to finish.
+
+        Tasks must already be sorted by priority. The handler returns True if
+        the task was processed. When keep_running() turns False, no new tasks
+        are started but in-flight tasks are allowed to finish.
+
+        Returns the number of tasks the handler reported as processed.
+        """
+        if self.inline:
+            return self._run_inline(tasks, handler, keep_running)
+
+        pending = list(tasks)
+        in_flight: dict[Future, dict] = {}
+        processed = 0
+        executor = self._get_executor()
+
+        while pending or in_flight:
+            if keep_running():
+                i = 0
+                while len(in_flight) < self.max_workers and i < len(pending):
+                    task = pending[i]
+                    if self._has_capacity(task.get("task_type", "unknown"), in_flight):
+                        pending.pop(i)
+                        in_flight[executor.submit(handler, task)] = task
+                    else:
+                        i += 1
+            else:
+                pending.clear()
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = in_flight.pop(future)
+                try:
+                    if future.result():
+                        processed += 1
+                except Exception as e:
+                    logger.error(f"[TaskPool] {task.get('filename', '?')} crashed: {e}")
+
+        return processed
+
+    def _run_inline(self, tasks: list[dict], handler: Callable[[dict], bool],
+                    keep_running: Callable[[], bool]) -> int:
+        processed = 0
+        for task in tasks:
+            if not keep_running():
+                break
+            try:
+                if handler(task):
+                    processed += 1
+            except Exception as e:
+                logger.error(f"[TaskPool] {task.get('filename', '?')} crashed: {e}")
+        return processed
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads, letting in-flight tasks finish if wait=True."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def get_stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "type_limits": dict(self.type_limits),
+            "inline": self.inline,
+        }
@@ -22,10 +22,10 @@ from dotenv import load_dotenv
 from src.utils.file_ops import (
     create_task_file,
     get_folder,
-    list_md_files,
-    count_by_prefix,
 )
-from src.utils.logger import log_action, log_error, audit_log
+from src.utils import profiler
+from src.utils.logger import log_action, log_error, audit_log, start_background_writer
+from src.utils.task_catalog import get_catalog
 
 load_dotenv()
 
@@ -111,13 +111,14 @@ class AIScheduler:
         log_action("Scheduler", "Triggering Monday briefing", "scheduler")
 
         # Gather stats
-        done_count = len(list_md_files("Done"))
-        pending_count = len(list_md_files("Needs_Action"))
-        approval_count = len(list_md_files("Pending_Approval"))
-        approved_count = len(list_md_files("Approved"))
-        rejected_count = len(list_md_files("Rejected"))
-        error_count = len(list_md_files("Errors"))
-        done_by_type = count_by_prefix("Done")
+        catalog = get_catalog()
+        done_count = catalog.count("Done")
+        pending_count = catalog.count("Needs_Action")
+        approval_count = catalog.count("Pending_Approval")
+        approved_count = catalog.count("Approved")
+        rejected_count = catalog.count("Rejected")
+        error_count = catalog.count("Errors")
+        done_by_type = catalog.count_by_prefix("Done")
 
         # Check for latest briefing from Sunday audit
         briefing_files = sorted(get_folder("Briefings").glob("*.md"), reverse=True)
@@ -198,6 +199,20 @@ class AIScheduler:
         log_action("Sunday audit task created", filepath.name, "scheduler")
         audit_log("schedule_trigger", actor="scheduler", params={"job": "weekly_audit"})
 
+    def archive_old_files(self) -> None:
+        """Nightly retention — roll old Done/, Errors/ and Logs/ files into monthly archives."""
+        from src.utils.archive import apply_retention
+
+        log_action("Scheduler", "Applying retention", "scheduler")
+        summary = apply_retention(dry_run=self.dry_run)
+        for folder, months in summary.items():
+            total = sum(months.values())
+            if total:
+                verb = "Would archive" if self.dry_run else "Archived"
+                log_action(f"{verb} {folder}", f"{total} files ({', '.join(months)})", "scheduler")
+        audit_log("schedule_trigger", actor="scheduler",
+                  params={"job": "archive", "dry_run": self.dry_run})
+
     def setup_schedules(self) -> None:
         """Configure all recurring schedules."""
         daily_time = os.getenv("DAILY_SCAN_TIME", "09:00")
@@ -205,6 +220,7 @@ class AIScheduler:
         post_time = os.getenv("WEEKLY_POST_TIME", "16:00")
         briefing_time = os.getenv("MONDAY_BRIEFING_TIME", "08:00")
         audit_time = os.getenv("SUNDAY_AUDIT_TIME", "23:00")
+        archive_time = os.getenv("ARCHIVE_TIME", "02:30")
 
         schedule.every().day.at(daily_time).do(self.daily_scan)
         log_action("Schedule set", f"Daily scan at {daily_time}", "scheduler")
@@ -218,6 +234,13 @@ class AIScheduler:
         schedule.every().sunday.at(audit_time).do(self.sunday_audit)
         log_action("Schedule set", f"Sunday audit at {audit_time}", "scheduler")
 
+        schedule.every().day.at(archive_time).do(self.archive_old_files)
+        log_action("Schedule set", f"Retention archive at {archive_time}", "scheduler")
+
+    def tick(self) -> None:
+        """One pass of the main loop: run the jobs that are due."""
+        schedule.run_pending()
+
     def run(self, once: bool = False) -> None:
         """Main scheduler loop."""
         mode = "dry-run" if self.dry_run else "live"
@@ -233,7 +256,7 @@ class AIScheduler:
 
         log_action("Scheduler", "Entering main loop. Press Ctrl+C to stop.", "scheduler")
         while self._running:
-            schedule.run_pending()
+            self.tick()
             time.sleep(60)
 
         log_action("Scheduler", "Stopped.", "scheduler")
@@ -245,23 +268,30 @@ def main():
     parser.add_argument("--once", action="store_true", help="Run all jobs once and exit")
     parser.add_argument(
         "--trigger",
-        choices=["daily_scan", "weekly_post", "monday_briefing", "weekly_audit"],
+        choices=["daily_scan", "weekly_post", "monday_briefing", "weekly_audit", "archive"],
         help="Trigger a specific job immediately",
     )
+    profiler.add_arguments(parser)
     args = parser.parse_args()
+    start_background_writer()
 
     sched = AIScheduler(dry_run=args.dry_run)
-
-    if args.trigger:
-        job = {
-            "daily_scan": sched.daily_scan,
-            "weekly_post": sched.weekly_linkedin_post,
-            "monday_briefing": sched.monday_briefing,
-            "weekly_audit": sched.sunday_audit,
-        }[args.trigger]
-        job()
-    else:
-        sched.run(once=args.once)
+    profiling = profiler.setup("scheduler", args, target=sched, poll_method="tick")
+
+    try:
+        if args.trigger:
+            job = {
+                "daily_scan": sched.daily_scan,
+                "weekly_post": sched.weekly_linkedin_post,
+                "monday_briefing": sched.monday_briefing,
+                "weekly_audit": sched.sunday_audit,
+                "archive": sched.archive_old_files,
+            }[args.trigger]
+            job()
+        else:
+            sched.run(once=args.once)
+    finally:
+        profiling.close()
 
 
 if __name__ == "__main__":
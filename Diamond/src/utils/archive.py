@@ -0,0 +1,348 @@
+"""Monthly compressed archives for the ever-growing Done/, Errors/ and Logs/.
+
+Files older than the configured retention (config.yaml
+`compliance.retention`, days per folder) are rolled into
+<Folder>/archive/YYYY-MM.jsonl.gz, partitioned by file mtime, and removed
+from the live folder, so listings, the folder index and git sync only see
+recent work.
+
+Layout of one month:
+- YYYY-MM.jsonl.gz — a series of gzip members (blocks of up to BLOCK_BYTES of
+  JSON lines), so the whole file is still valid for zcat / gzip.open.
+  Each line is {"name", "mtime", "archived_at", "text"}.
+- YYYY-MM.idx.json — {"end": bytes, "entries": {name: [block_offset,
+  block_length, line, mtime, size, created]}}. A lookup reads and inflates one
+  block. Counts and prefix/created filters are answered from the index
+  alone.
+
+Archiving appends new blocks after the indexed end (truncating any bytes a
+crashed run left behind), fsyncs, writes the index atomically, and only then
+unlinks the live files.
+
+Read helpers (read_task, task_names, count, count_by_prefix) search the
+live folder first and then the archives, so callers do not care where a
+task lives.
+
+Usage:
+    python -m src.utils.archive            # apply compliance.retention
+    python -m src.utils.archive --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.utils import folder_index, frontmatter, task_catalog
+
+ARCHIVE_DIR = "archive"
+BLOCK_BYTES = 64 * 1024
+DEFAULT_RETENTION = {"Done": 30, "Errors": 30, "Logs": 30}
+
+# Files that are appended to forever and must stay live
+KEEP_LIVE = {"audit.jsonl"}
+
+_SUFFIXES = {"Logs": (".md", ".jsonl")}
+_MONTH_RE = re.compile(r"^(\d{4}-\d{2})\.idx\.json$")
+
+
+def _suffixes(folder: str) -> tuple[str, ...]:
+    return _SUFFIXES.get(folder, (".md",))
+
+
+class FolderArchive:
+    """The archive/ subfolder of one live folder."""
+
+    def __init__(self, folder_path: str | Path):
+        self.folder_path = Path(folder_path)
+        self.path = self.folder_path / ARCHIVE_DIR
+        self._indexes: dict[str, tuple[int, dict]] = {}  # month → (idx mtime_ns, index)
+        self._lock = threading.RLock()
+
+    # -- index -----------------------------------------------------------------
+
+    def _data_path(self, month: str) -> Path:
+        return self.path / f"{month}.jsonl.gz"
+
+    def _index_path(self, month: str) -> Path:
+        return self.path / f"{month}.idx.json"
+
+    def months(self) -> list[str]:
+        """Archived months, oldest first."""
+        if not self.path.is_dir():
+            return []
+        return sorted(m.group(1) for m in map(_MONTH_RE.match, os.listdir(self.path)) if m)
+
+    def index(self, month: str) -> dict:
+        """Offset index of one month (cached until the file changes)."""
+        path = self._index_path(month)
+        with self._lock:
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return {"end": 0, "entries": {}}
+            cached = self._indexes.get(month)
+            if cached is None or cached[0] != mtime_ns:
+                cached = (mtime_ns, json.loads(path.read_text(encoding="utf-8")))
+                self._indexes[month] = cached
+            return cached[1]
+
+    def _entries(self) -> Iterator[tuple[str, str, list]]:
+        for month in self.months():
+            for name, entry in self.index(month)["entries"].items():
+                yield month, name, entry
+
+    # -- writing ---------------------------------------------------------------
+
+    def _append(self, month: str, files: list[Path]) -> None:
+        """Append files to a month's archive and publish the new index."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        index = self.index(month)
+        entries = dict(index["entries"])
+        end = index["end"]
+        data_path = self._data_path(month)
+        data_path.touch()
+        archived_at = datetime.now().isoformat(timespec="seconds")
+
+        with open(data_path, "r+b") as f:
+            f.truncate(end)  # drop blocks of a run that died before its index
+            f.seek(end)
+            block: list[bytes] = []
+            names: list[tuple[str, float, int, str | None]] = []
+
+            def flush():
+                nonlocal end
+                data = gzip.compress(b"".join(block), compresslevel=6, mtime=0)
+                f.write(data)
+                for line, (name, mtime, size, created) in enumerate(names):
+                    entries[name] = [end, len(data), line, mtime, size, created]
+                end += len(data)
+                block.clear()
+                names.clear()
+
+            pending = 0
+            for path in files:
+                st = path.stat()
+                text = path.read_text(encoding="utf-8", errors="replace")
+                created = None
+                if path.suffix == ".md":
+                    created = frontmatter.parse(text)[0].get("created")
+                    created = created if isinstance(created, str) else None
+                record = {"name": path.name, "mtime": st.st_mtime,
+                          "archived_at": archived_at, "text": text}
+                line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+                block.append(line)
+                names.append((path.name, st.st_mtime, st.st_size, created))
+                pending += len(line)
+                if pending >= BLOCK_BYTES:
+                    flush()
+                    pending = 0
+            if block:
+                flush()
+            f.flush()
+            os.fsync(f.fileno())
+
+        tmp = self._index_path(month).with_suffix(".tmp")
+        tmp.write_text(json.dumps({"end": end, "entries": entries}), encoding="utf-8")
+        os.replace(tmp, self._index_path(month))
+
+    def archive_older_than(self, days: float, now: float | None = None,
+                           dry_run: bool = False) -> dict[str, int]:
+        """Roll live files with mtime older than `days` into monthly archives.
+
+        Returns {month: files archived}.
+        """
+        cutoff = (now or time.time()) - days * 86400
+        folder = self.folder_path.name
+        by_month: dict[str, list[Path]] = {}
+        with os.scandir(self.folder_path) as it:
+            for de in it:
+                if (de.name in KEEP_LIVE or not de.name.endswith(_suffixes(folder))
+                        or not de.is_file()):
+                    continue
+                mtime = de.stat().st_mtime
+                if mtime < cutoff:
+                    month = datetime.fromtimestamp(mtime).strftime("%Y-%m")
+                    by_month.setdefault(month, []).append(Path(de.path))
+
+        summary = {}
+        with self._lock:
+            for month, files in sorted(by_month.items()):
+                files.sort(key=lambda p: (p.stat().st_mtime, p.name))
+                if not dry_run:
+                    self._append(month, files)
+                    for path in files:
+                        path.unlink()
+                        frontmatter.invalidate(path)
+                        folder_index.note_changed(path)
+                        task_catalog.note_written(path)  # gone → row dropped
+                summary[month] = len(files)
+        return summary
+
+    # -- reading ---------------------------------------------------------------
+
+    def find(self, name: str) -> tuple[str, list] | None:
+        """(month, index entry) of the newest archived copy of name."""
+        for month in reversed(self.months()):
+            entry = self.index(month)["entries"].get(name)
+            if entry is not None:
+                return month, entry
+        return None
+
+    def read_record(self, name: str) -> dict | None:
+        found = self.find(name)
+        if found is None:
+            return None
+        month, (offset, length, line, *_) = found
+        with open(self._data_path(month), "rb") as f:
+            f.seek(offset)
+            block = gzip.decompress(f.read(length))
+        return json.loads(block.splitlines()[line])
+
+    def read_text(self, name: str) -> str | None:
+        record = self.read_record(name)
+        return record["text"] if record else None
+
+    def iter_records(self, month: str | None = None) -> Iterator[dict]:
+        """Every archived record (optionally of one month), oldest month first."""
+        for m in [month] if month else self.months():
+            path = self._data_path(m)
+            if not path.exists():
+                continue
+            end = self.index(m)["end"]
+            with open(path, "rb") as f:
+                data = f.read(end)
+            for line in gzip.decompress(data).splitlines():
+                yield json.loads(line)
+
+    def names(self) -> list[str]:
+        return [name for _, name, _ in self._entries()]
+
+    def listing(self) -> list[dict]:
+        """{name, size, mtime, month} of every archived file, oldest month first."""
+        return [{"name": name, "size": entry[4], "mtime": entry[3], "month": month}
+                for month, name, entry in self._entries()]
+
+    def count(self, prefix: str | None = None, created_since: str | None = None) -> int:
+        n = 0
+        for _, name, entry in self._entries():
+            if prefix is not None and folder_index.task_prefix(name) != prefix:
+                continue
+            if created_since is not None and not (entry[5] and entry[5] >= created_since):
+                continue
+            n += 1
+        return n
+
+    def count_by_prefix(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for _, name, _ in self._entries():
+            prefix = folder_index.task_prefix(name)
+            counts[prefix] = counts.get(prefix, 0) + 1
+        return counts
+
+    def get_stats(self) -> dict:
+        months = self.months()
+        return {
+            "months": months,
+            "files": sum(len(self.index(m)["entries"]) for m in months),
+            "bytes": sum(self.index(m)["end"] for m in months),
+        }
+
+
+_archives: dict[Path, FolderArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(folder: str, root: str | Path | None = None) -> FolderArchive:
+    """Return the shared archive of a project folder (e.g. "Done")."""
+    if root is None:
+        from src.utils.file_ops import get_project_root
+        root = get_project_root()
+    path = Path(root) / folder
+    with _archives_lock:
+        archive = _archives.get(path)
+        if archive is None:
+            archive = _archives[path] = FolderArchive(path)
+        return archive
+
+
+def load_retention() -> dict[str, float]:
+    """Days each folder stays live, from config.yaml compliance.retention."""
+    from src.config.agent_config import AgentConfig
+
+    cfg = AgentConfig._load_config().get("compliance", {}).get("retention")
+    return dict(DEFAULT_RETENTION if cfg is None else cfg)
+
+
+def apply_retention(retention: dict[str, float] | None = None, dry_run: bool = False,
+                    root: str | Path | None = None) -> dict[str, dict[str, int]]:
+    """Archive every configured folder. Returns {folder: {month: files}}."""
+    retention = load_retention() if retention is None else retention
+    summary = {}
+    for folder, days in retention.items():
+        archive = get_archive(folder, root)
+        if days is None or not archive.folder_path.is_dir():
+            continue
+        summary[folder] = archive.archive_older_than(days, dry_run=dry_run)
+    return summary
+
+
+# -- live + archive read helpers -----------------------------------------------
+
+def read_task(folder: str, name: str, root: str | Path | None = None) -> tuple[dict[str, Any], str]:
+    """Read a task's (metadata, body) from the live folder, else from the archive."""
+    archive = get_archive(folder, root)
+    live = archive.folder_path / name
+    if live.exists():
+        return frontmatter.read_file(live)
+    text = archive.read_text(name)
+    if text is None:
+        return {}, ""
+    return frontmatter.parse(text)
+
+
+def task_names(folder: str, root: str | Path | None = None) -> list[str]:
+    """Names in the live folder followed by archived names not also live."""
+    archive = get_archive(folder, root)
+    live = [e.name for e in folder_index.get_index_for_path(archive.folder_path).entries()]
+    seen = set(live)
+    return live + [n for n in archive.names() if n not in seen]
+
+
+def count(folder: str, prefix: str | None = None, root: str | Path | None = None) -> int:
+    """Live + archived file count."""
+    archive = get_archive(folder, root)
+    return folder_index.get_index_for_path(archive.folder_path).count(prefix) + archive.count(prefix)
+
+
+def count_by_prefix(folder: str, root: str | Path | None = None) -> dict[str, int]:
+    """Live + archived counts grouped by task prefix."""
+    archive = get_archive(folder, root)
+    counts = folder_index.get_index_for_path(archive.folder_path).count_by_prefix()
+    for prefix, n in archive.count_by_prefix().items():
+        counts[prefix] = counts.get(prefix, 0) + n
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive old Done/, Errors/ and Logs/ files")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be archived")
+    args = parser.parse_args()
+
+    for folder, months in apply_retention(dry_run=args.dry_run).items():
+        verb = "would archive" if args.dry_run else "archived"
+        total = sum(months.values())
+        detail = ", ".join(f"{m}: {n}" for m, n in months.items()) or "nothing old enough"
+        print(f"{folder}: {verb} {total} files ({detail})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,569 @@
+"""Time-range queries over the JSON-lines audit trail.
+
+The audit trail is Logs/audit.jsonl plus one Logs/YYYY-MM-DD_actions.jsonl
+per day (see logger.audit_log). Before this module, every reader loaded
+whole files to look at a few records. Here each file gets a sparse sidecar
+index, Logs/.audit_index/<file>.idx.json:
+
+- one entry per block of INDEX_EVERY records: [offset, length, count,
+  min_ts, max_ts]. The bytes after the last full block (fewer than
+  INDEX_EVERY records) are not indexed and are always scanned.
+- the index grows incrementally from its recorded end. A log that shrank
+  or was replaced (new inode) is re-indexed from the start.
+
+Queries (time range plus action_type / actor / task_name / result /
+agent_id filters) mmap the file and parse only blocks whose
+[min_ts, max_ts] overlaps the range. Lines that cannot contain a filter
+value are skipped before json.loads. Unfiltered counts of blocks wholly
+inside the range come from the index alone. Tail reads ("last record",
+"last N") seek backwards from the end of the file block by block.
+
+Daily files older than the Logs retention live in Logs/archive/ (see
+archive.FolderArchive). AuditTrail reads them too: the archive's offset
+index locates the one gzip block holding a day's file, and only days inside
+the requested range are inflated.
+
+Timestamps may be ISO strings (audit_log) or epoch floats (older
+audit.jsonl writers). Both are compared as epoch seconds.
+
+Usage:
+    trail = get_audit_trail()
+    trail.last()                                    # newest record
+    trail.tail(20, result="failed")
+    trail.query(since=time.time() - 3600, actor="cloud-01")
+    trail.count(since=..., action_type="email_send")
+
+    python -m src.utils.audit_query --since 2026-10-17T09:00 --result failed
+    python -m src.utils.audit_query --tail 20
+    python -m src.utils.audit_query --count --actor cloud-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import mmap
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.utils.archive import FolderArchive
+
+INDEX_DIR = ".audit_index"
+INDEX_EVERY = 256
+LEGACY_FILE = "audit.jsonl"
+FILTER_FIELDS = ("action_type", "actor", "task_name", "result", "agent_id")
+
+_DAILY_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_actions\.jsonl$")
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*("[^"]*"|-?[0-9][0-9.eE+-]*)')
+_BLOCK = 64 * 1024
+
+
+def to_epoch(value: Any) -> float | None:
+    """Epoch seconds from an ISO string, a number or a datetime (else None)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _line_ts(line: bytes) -> float | None:
+    match = _TIMESTAMP_RE.search(line)
+    if match is None:
+        return None
+    raw = match.group(1)
+    return to_epoch(raw[1:-1].decode() if raw.startswith(b'"') else raw.decode())
+
+
+def _needles(filters: dict[str, str]) -> list[bytes]:
+    """Byte strings every matching line must contain (ASCII values only)."""
+    return [json.dumps(v).encode() for v in filters.values() if v.isascii()]
+
+
+def _matches(record: dict, since: float | None, until: float | None,
+             filters: dict[str, str]) -> bool:
+    for key, value in filters.items():
+        if record.get(key) != value:
+            return False
+    if since is None and until is None:
+        return True
+    ts = to_epoch(record.get("timestamp"))
+    if ts is None:
+        return False
+    return (since is None or ts >= since) and (until is None or ts <= until)
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[tuple[mmap.mmap | bytes | None, int, int]]:
+    """Yield (read-only mmap, size, inode); (None, 0, 0) if the file is missing."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        yield None, 0, 0
+        return
+    with f:
+        st = os.fstat(f.fileno())
+        if st.st_size == 0:
+            yield b"", 0, st.st_ino
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm, st.st_size, st.st_ino
+
+
+def _check_filters(filters: dict[str, Any]) -> dict[str, str]:
+    unknown = set(filters) - set(FILTER_FIELDS)
+    if unknown:
+        raise TypeError(f"Unknown audit filter(s): {', '.join(sorted(unknown))}")
+    return {k: v for k, v in filters.items() if v is not None}
+
+
+class AuditLog:
+    """One JSON-lines audit file with its sparse (timestamp, offset) index."""
+
+    def __init__(self, path: str | Path, index_path: str | Path | None = None,
+                 index_every: int = INDEX_EVERY):
+        self.path = Path(path)
+        self.index_path = (Path(index_path) if index_path
+                           else self.path.parent / INDEX_DIR / f"{self.path.name}.idx.json")
+        self.index_every = index_every
+        self._index: dict | None = None
+        self._lock = threading.RLock()
+
+    # -- index -----------------------------------------------------------------
+
+    def _empty_index(self, inode: int) -> dict:
+        return {"inode": inode, "every": self.index_every, "end": 0, "blocks": []}
+
+    def _load_index(self, inode: int) -> dict:
+        if self._index is None:
+            try:
+                self._index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._index = self._empty_index(inode)
+        return self._index
+
+    def _save_index(self) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._index), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass  # the index is only an accelerator; it is rebuilt next time
+
+    def _refresh(self, mm: mmap.mmap | bytes, size: int, inode: int) -> dict:
+        """Extend the index over records appended since the last call."""
+        index = self._load_index(inode)
+        if (index.get("inode") != inode or index.get("every") != self.index_every
+                or index["end"] > size):
+            index = self._index = self._empty_index(inode)
+
+        every = self.index_every
+        start = pos = index["end"]
+        count, lo, hi = 0, None, None
+        added = False
+        while pos < size:
+            nl = mm.find(b"\n", pos, size)
+            if nl < 0:
+                break  # partially written last line
+            ts = _line_ts(mm[pos:nl])
+            if ts is not None:
+                lo = ts if lo is None or ts < lo else lo
+                hi = ts if hi is None or ts > hi else hi
+            count += 1
+            pos = nl + 1
+            if count == every:
+                index["blocks"].append([start, pos - start, count, lo, hi])
+                index["end"] = start = pos
+                count, lo, hi = 0, None, None
+                added = True
+        if added:
+            self._save_index()
+        return index
+
+    def reindex(self) -> int:
+        """Drop and rebuild the sidecar index. Returns indexed blocks."""
+        with self._lock:
+            self._index = None
+            try:
+                self.index_path.unlink()
+            except FileNotFoundError:
+                pass
+            with _mapped(self.path) as (mm, size, inode):
+                if mm is None:
+                    return 0
+                return len(self._refresh(mm, size, inode)["blocks"])
+
+    # -- reading ---------------------------------------------------------------
+
+    def _regions(self, index: dict, size: int, since: float | None,
+                 until: float | None) -> list[tuple[int, int]]:
+        """Byte ranges that may hold records in [since, until], merged."""
+        regions: list[tuple[int, int]] = []
+        for offset, length, _count, lo, hi in index["blocks"]:
+            if lo is not None and ((since is not None and hi < since)
+                                   or (until is not None and lo > until)):
+                continue
+            if regions and regions[-1][1] == offset:
+                regions[-1] = (regions[-1][0], offset + length)
+            else:
+                regions.append((offset, offset + length))
+        if index["end"] < size:
+            if regions and regions[-1][1] == index["end"]:
+                regions[-1] = (regions[-1][0], size)
+            else:
+                regions.append((index["end"], size))
+        return regions
+
+    @staticmethod
+    def _scan(mm: mmap.mmap | bytes, start: int, end: int, needles: list[bytes],
+              since: float | None, until: float | None,
+              filters: dict[str, str]) -> Iterator[dict]:
+        pos = start
+        while pos < end:
+            nl = mm.find(b"\n", pos, end)
+            if nl < 0:
+                break
+            line = mm[pos:nl]
+            pos = nl + 1
+            if any(n not in line for n in needles):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and _matches(record, since, until, filters):
+                yield record
+
+    def query(self, since: Any = None, until: Any = None, limit: int | None = None,
+              **filters: Any) -> list[dict]:
+        """Records in [since, until] matching every field filter, in file order."""
+        since, until = to_epoch(since), to_epoch(until)
+        filters = _check_filters(filters)
+        needles = _needles(filters)
+        out: list[dict] = []
+        with self._lock, _mapped(self.path) as (mm, size, inode):
+            if not size:
+                return out
+            index = self._refresh(mm, size, inode)
+            for start, end in self._regions(index, size, since, until):
+                for record in self._scan(mm, start, end, needles, since, until, filters):
+                    out.append(record)
+                    if limit is not None and len(out) >= limit:
+                        return out
+        return out
+
+    def count(self, since: Any = None, until: Any = None, **filters: Any) -> int:
+        """Matching records. Unfiltered whole blocks inside the range are not read."""
+        since, until = to_epoch(since), to_epoch(until)
+        filters = _check_filters(filters)
+        needles = _needles(filters)
+        total = 0
+        with self._lock, _mapped(self.path) as (mm, size, inode):
+            if not size:
+                return 0
+            index = self._refresh(mm, size, inode)
+            for offset, length, n, lo, hi in index["blocks"]:
+                if lo is not None and ((since is not None and hi < since)
+                                       or (until is not None and lo > until)):
+                    continue
+                if (not filters and lo is not None
+                        and (since is None or lo >= since) and (until is None or hi <= until)):
+                    total += n
+                    continue
+                total += sum(1 for _ in self._scan(mm, offset, offset + length, needles,
+                                                   since, until, filters))
+            total += sum(1 for _ in self._scan(mm, index["end"], size, needles,
+                                               since, until, filters))
+        return total
+
+    def tail(self, n: int = 1, **filters: Any) -> list[dict]:
+        """The last n matching records (oldest first), read backwards from EOF."""
+        filters = _check_filters(filters)
+        needles = _needles(filters)
+        found: list[dict] = []
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return found
+        with f:
+            pos = os.fstat(f.fileno()).st_size
+            carry = b""
+            while pos > 0 and len(found) < n:
+                step = min(_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step) + carry
+                # A line cut by the block boundary is completed by the next read
+                if pos > 0:
+                    cut = block.find(b"\n") + 1
+                    if not cut:
+                        carry = block  # one line longer than a block: keep reading
+                        continue
+                    carry, block = block[:cut], block[cut:]
+                for line in reversed(block.split(b"\n")):
+                    if not line or any(nd not in line for nd in needles):
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and _matches(record, None, None, filters):
+                        found.append(record)
+                        if len(found) >= n:
+                            break
+        found.reverse()
+        return found
+
+    def last(self, **filters: Any) -> dict | None:
+        """The newest matching record, or None."""
+        records = self.tail(1, **filters)
+        return records[0] if records else None
+
+    def get_stats(self) -> dict:
+        with self._lock, _mapped(self.path) as (mm, size, inode):
+            if not size:
+                return {"file": self.path.name, "bytes": 0, "records": 0, "blocks": 0}
+            index = self._refresh(mm, size, inode)
+            unindexed = sum(1 for _ in self._scan(mm, index["end"], size, [], None, None, {}))
+            return {
+                "file": self.path.name,
+                "bytes": size,
+                "records": sum(b[2] for b in index["blocks"]) + unindexed,
+                "blocks": len(index["blocks"]),
+            }
+
+
+class ArchivedAuditLog:
+    """A daily audit file rolled into Logs/archive/, read through the archive index.
+
+    Archived files no longer change, so there is no sidecar index: a query
+    inflates the one gzip block that holds the file and scans it.
+    """
+
+    def __init__(self, archive: FolderArchive, name: str):
+        self.archive = archive
+        self.path = archive.folder_path / name
+        self.name = name
+
+    def _data(self) -> bytes:
+        text = self.archive.read_text(self.name) or ""
+        if text and not text.endswith("\n"):
+            text += "\n"
+        return text.encode("utf-8")
+
+    def query(self, since: Any = None, until: Any = None, limit: int | None = None,
+              **filters: Any) -> list[dict]:
+        since, until = to_epoch(since), to_epoch(until)
+        filters = _check_filters(filters)
+        data = self._data()
+        out: list[dict] = []
+        for record in AuditLog._scan(data, 0, len(data), _needles(filters), since, until, filters):
+            out.append(record)
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+    def count(self, since: Any = None, until: Any = None, **filters: Any) -> int:
+        return len(self.query(since, until, **filters))
+
+    def tail(self, n: int = 1, **filters: Any) -> list[dict]:
+        return self.query(**filters)[-n:] if n else []
+
+    def last(self, **filters: Any) -> dict | None:
+        records = self.tail(1, **filters)
+        return records[0] if records else None
+
+    def reindex(self) -> int:
+        return 0
+
+    def get_stats(self) -> dict:
+        data = self._data()
+        return {"file": self.name, "bytes": len(data), "records": data.count(b"\n"),
+                "blocks": 0}
+
+
+class AuditTrail:
+    """All audit files in a Logs/ folder: audit.jsonl, the daily *_actions.jsonl
+    and the daily files already rolled into Logs/archive/."""
+
+    def __init__(self, logs_dir: str | Path, index_every: int = INDEX_EVERY):
+        self.logs_dir = Path(logs_dir)
+        self.index_every = index_every
+        self.archive = FolderArchive(self.logs_dir)
+        self._logs: dict[tuple[str, bool], AuditLog | ArchivedAuditLog] = {}
+        self._lock = threading.Lock()
+
+    def _log(self, name: str, archived: bool = False) -> AuditLog | ArchivedAuditLog:
+        with self._lock:
+            log = self._logs.get((name, archived))
+            if log is None:
+                log = self._logs[(name, archived)] = (
+                    ArchivedAuditLog(self.archive, name) if archived
+                    else AuditLog(self.logs_dir / name, index_every=self.index_every))
+            return log
+
+    def daily_files(self) -> list[tuple[str, str, bool]]:
+        """(YYYY-MM-DD, name, archived) of each daily audit file, oldest first.
+
+        A day that is both live and archived is read from the live folder.
+        """
+        try:
+            names = os.listdir(self.logs_dir)
+        except FileNotFoundError:
+            return []
+        days = {}
+        for name in self.archive.names():
+            match = _DAILY_RE.match(name)
+            if match:
+                days[name] = (match.group(1), name, True)
+        for name in names:
+            match = _DAILY_RE.match(name)
+            if match:
+                days[name] = (match.group(1), name, False)
+        return sorted(days.values())
+
+    def files(self, since: float | None = None,
+              until: float | None = None) -> list[AuditLog | ArchivedAuditLog]:
+        """Audit files that may hold records in [since, until]."""
+        first = datetime.fromtimestamp(since).strftime("%Y-%m-%d") if since is not None else ""
+        last = datetime.fromtimestamp(until).strftime("%Y-%m-%d") if until is not None else "9999"
+        logs = [self._log(name, archived) for day, name, archived in self.daily_files()
+                if first <= day <= last]
+        if (self.logs_dir / LEGACY_FILE).exists():
+            logs.insert(0, self._log(LEGACY_FILE))
+        return logs
+
+    def exists(self) -> bool:
+        return bool(self.files())
+
+    def query(self, since: Any = None, until: Any = None, limit: int | None = None,
+              **filters: Any) -> list[dict]:
+        """Matching records from every file, merged in timestamp order.
+
+        With a limit, daily files are read oldest first and reading stops
+        once limit records are found: days do not overlap, so later files
+        cannot hold earlier records. audit.jsonl spans every day and is
+        read up to limit records as well.
+        """
+        since, until = to_epoch(since), to_epoch(until)
+        per_file: list[list[dict]] = []
+        found = 0
+        for log in self.files(since, until):
+            if log.path.name == LEGACY_FILE:
+                per_file.append(log.query(since, until, limit, **filters))
+                continue
+            if limit is not None and found >= limit:
+                break
+            records = log.query(since, until, None if limit is None else limit - found,
+                                **filters)
+            per_file.append(records)
+            found += len(records)
+        merged = heapq.merge(*per_file, key=lambda r: to_epoch(r.get("timestamp")) or 0.0)
+        out = []
+        for record in merged:
+            out.append(record)
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+    def count(self, since: Any = None, until: Any = None, **filters: Any) -> int:
+        since, until = to_epoch(since), to_epoch(until)
+        return sum(log.count(since, until, **filters) for log in self.files(since, until))
+
+    def tail(self, n: int = 1, **filters: Any) -> list[dict]:
+        """The last n matching records across files (oldest first).
+
+        Daily files are read newest first and reading stops once n records
+        are found; audit.jsonl is always consulted.
+        """
+        found: list[dict] = []
+        for _day, name, archived in reversed(self.daily_files()):
+            found = self._log(name, archived).tail(n - len(found), **filters) + found
+            if len(found) >= n:
+                break
+        if (self.logs_dir / LEGACY_FILE).exists():
+            found += self._log(LEGACY_FILE).tail(n, **filters)
+            found.sort(key=lambda r: to_epoch(r.get("timestamp")) or 0.0)
+        return found[-n:] if n else []
+
+    def last(self, **filters: Any) -> dict | None:
+        records = self.tail(1, **filters)
+        return records[0] if records else None
+
+    def reindex(self) -> int:
+        return sum(log.reindex() for log in self.files())
+
+    def get_stats(self) -> dict:
+        files = [log.get_stats() for log in self.files()]
+        return {
+            "files": len(files),
+            "records": sum(f["records"] for f in files),
+            "bytes": sum(f["bytes"] for f in files),
+            "index_blocks": sum(f["blocks"] for f in files),
+        }
+
+
+_trails: dict[Path, AuditTrail] = {}
+_trails_lock = threading.Lock()
+
+
+def get_audit_trail(root: str | Path | None = None) -> AuditTrail:
+    """Return the shared audit trail of a project's Logs/ folder."""
+    if root is None:
+        from src.utils.file_ops import get_project_root
+        root = get_project_root()
+    path = Path(root) / "Logs"
+    with _trails_lock:
+        trail = _trails.get(path)
+        if trail is None:
+            trail = _trails[path] = AuditTrail(path)
+        return trail
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the JSON-lines audit trail")
+    parser.add_argument("--since", help="ISO timestamp or epoch seconds")
+    parser.add_argument("--until", help="ISO timestamp or epoch seconds")
+    for field in FILTER_FIELDS:
+        parser.add_argument(f"--{field.replace('_', '-')}", dest=field)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--tail", type=int, metavar="N", help="Print the last N matching records")
+    parser.add_argument("--count", action="store_true", help="Print the number of matches")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the sidecar indexes")
+    parser.add_argument("--stats", action="store_true")
+    args = parser.parse_args()
+
+    trail = get_audit_trail()
+    filters = {f: getattr(args, f) for f in FILTER_FIELDS}
+    if args.reindex:
+        print(f"Indexed {trail.reindex()} blocks")
+    elif args.stats:
+        print(json.dumps(trail.get_stats(), indent=2))
+    elif args.count:
+        print(trail.count(args.since, args.until, **filters))
+    elif args.tail:
+        for record in trail.tail(args.tail, **filters):
+            print(json.dumps(record, default=str))
+    else:
+        for record in trail.query(args.since, args.until, args.limit, **filters):
+            print(json.dumps(record, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Per-dependency circuit breakers for the Claude CLI and the MCP servers.
+
+Without a breaker, an outage costs every task the full call timeout (120s
+for the Claude CLI, 30s for MCP) plus its retries. A breaker counts
+consecutive failures of one dependency and stops calling it for a while:
+
+- closed: calls go through; `failure_threshold` consecutive failures open it.
+- open: calls fail fast with CircuitOpenError until `reset_timeout` seconds
+  have passed.
+- half_open: up to `half_open_max_calls` trial calls go through. A success
+  closes the breaker; a failure opens it again for another reset_timeout.
+
+Breakers are named "claude" and "mcp:<server>" and are shared by the whole
+process. A task that hits an open breaker is deferred through the retry
+queue until the breaker may let calls through again (ErrorHandler.defer).
+It does not use up one of its retries. Tasks that do not touch the broken
+dependency keep flowing.
+
+Every transition is also written to .circuit_breakers.db in the project
+root (BreakerStateStore). The health monitor and the API server run as
+their own processes and read that (shared_breaker_states) to see the
+orchestrators' breakers.
+
+Thresholds come from config.yaml `circuit_breakers:`. `overrides` holds
+per-breaker settings.
+
+Usage:
+    breaker = get_breaker("mcp:odoo")
+    with breaker.guard():          # raises CircuitOpenError while open
+        result = send()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.utils.metrics import CIRCUIT_STATE
+
+logger = logging.getLogger("ai_employee")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+STATE_FILE = ".circuit_breakers.db"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_after:.0f}s")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker around one dependency."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0,
+                 half_open_max_calls: int = 1, clock: Callable[[], float] = time.monotonic,
+                 shared: bool = False):
+        self.name = name
+        self.shared = shared  # publish transitions to the project's BreakerStateStore
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.half_open_max_calls = max(1, int(half_open_max_calls))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self.trips = 0
+        self.rejected = 0
+        CIRCUIT_STATE.set(0, breaker=name)
+
+    def _set_state(self, state: str) -> None:
+        """Switch state (lock held)."""
+        if state == self._state:
+            return
+        previous, self._state = self._state, state
+        if state == OPEN:
+            self._opened_at = self._clock()
+            self.trips += 1
+        elif state == HALF_OPEN:
+            self._trials = 0
+        elif state == CLOSED:
+            self._failures = 0
+        CIRCUIT_STATE.set(_STATE_VALUES[state], breaker=self.name)
+        if self.shared:
+            opened_at = time.time() - (self._clock() - self._opened_at)
+            get_state_store().write(self.name, state, self._failures, self.failure_threshold,
+                                    self.reset_timeout, opened_at, self.trips)
+        log = logger.warning if state == OPEN else logger.info
+        log(f"[CircuitBreaker] {self.name}: {previous} → {state}")
+
+    def _refresh(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._set_state(HALF_OPEN)
+
+    def _retry_after(self) -> float:
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a trial call through (0 if not open)."""
+        with self._lock:
+            self._refresh()
+            return self._retry_after()
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError."""
+        with self._lock:
+            self._refresh()
+            if self._state == HALF_OPEN:
+                if self._trials < self.half_open_max_calls:
+                    self._trials += 1
+                    return
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.reset_timeout)
+            if self._state == OPEN:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self._retry_after())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._set_state(OPEN)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Admit the call, then record its outcome (any exception is a failure)."""
+        self.before_call()
+        try:
+            yield
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._set_state(CLOSED)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return {
+                "state": self._state,
+                "failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "retry_after": round(self._retry_after(), 1),
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+class BreakerStateStore:
+    """Last transition of each breaker, shared by every process of one project.
+
+    One SQLite row per breaker name. Whichever process transitioned a
+    breaker last owns its row. Writes are best effort: a locked or missing
+    database never fails the call that tripped the breaker.
+    """
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=2, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS breakers (name TEXT PRIMARY KEY, state TEXT, "
+                "failures INTEGER, failure_threshold INTEGER, reset_timeout REAL, "
+                "opened_at REAL, trips INTEGER, pid INTEGER, updated_at REAL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def write(self, name: str, state: str, failures: int, failure_threshold: int,
+              reset_timeout: float, opened_at: float, trips: int) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO breakers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (name, state, failures, failure_threshold, reset_timeout,
+                         opened_at, trips, os.getpid(), time.time()),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"[CircuitBreaker] could not publish {name} state: {e}")
+
+    def read(self) -> dict[str, dict]:
+        """{name: stats} from the rows, with open breakers past reset_timeout as half_open."""
+        if not self.db_path.exists():
+            return {}
+        try:
+            with self._lock:
+                rows = self._connect().execute("SELECT * FROM breakers").fetchall()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"[CircuitBreaker] could not read shared states: {e}")
+            return {}
+        now = time.time()
+        states = {}
+        for (name, state, failures, threshold, reset_timeout, opened_at, trips,
+             pid, updated_at) in rows:
+            retry_after = max(0.0, opened_at + reset_timeout - now) if state == OPEN else 0.0
+            if state == OPEN and not retry_after:
+                state = HALF_OPEN
+            states[name] = {
+                "state": state,
+                "failures": failures,
+                "failure_threshold": threshold,
+                "reset_timeout": reset_timeout,
+                "retry_after": round(retry_after, 1),
+                "trips": trips,
+                "pid": pid,
+                "updated_at": updated_at,
+            }
+        return states
+
+
+_stores: dict[Path, BreakerStateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(root: str | Path | None = None) -> BreakerStateStore:
+    """Return the shared breaker state store of a project."""
+    if root is None:
+        from src.utils.file_ops import get_project_root
+        root = get_project_root()
+    path = Path(root) / STATE_FILE
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = BreakerStateStore(path)
+        return store
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _settings(name: str) -> dict:
+    try:
+        from src.config.agent_config import AgentConfig
+        config = AgentConfig._load_config().get("circuit_breakers", {}) or {}
+    except Exception:
+        config = {}
+    settings = {k: v for k, v in config.items() if k != "overrides"}
+    settings.update((config.get("overrides") or {}).get(name) or {})
+    return settings
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a dependency, creating it from config."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            settings = _settings(name)
+            breaker = _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.get("failure_threshold", 5),
+                reset_timeout=settings.get("reset_timeout", 60),
+                half_open_max_calls=settings.get("half_open_max_calls", 1),
+                shared=True,
+            )
+        return breaker
+
+
+def breaker_states() -> dict[str, dict]:
+    """{name: stats} for every breaker created in this process."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: b.get_stats() for name, b in sorted(breakers.items())}
+
+
+def shared_breaker_states(root: str | Path | None = None) -> dict[str, dict]:
+    """{name: stats} of every breaker in any process of the project.
+
+    This process's breakers report their live stats; rows written by other
+    processes (e.g. the orchestrators, seen from the health monitor) take
+    precedence over this process's copy of the same breaker.
+    """
+    states = breaker_states()
+    for name, row in get_state_store(root).read().items():
+        if name not in states or row["pid"] != os.getpid():
+            states[name] = row
+    return dict(sorted(states.items()))
+
+
+def reset_breakers() -> None:
+    """Close every breaker (tests, or an operator after fixing an outage)."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    for breaker in breakers:
+        breaker.reset()
@@ -11,12 +11,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from src.utils import frontmatter
+from src.utils import folder_index, frontmatter, task_catalog
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 def get_project_root() -> Path:
     """Return the project root directory."""
-    return Path(__file__).resolve().parent.parent.parent
+    return _PROJECT_ROOT
 
 
 def get_folder(name: str) -> Path:
@@ -27,15 +30,21 @@ def get_folder(name: str) -> Path:
 
 
 def list_md_files(folder: str, ignore_prefixes: Optional[list[str]] = None) -> list[Path]:
-    """List all .md files in a folder, optionally ignoring certain prefixes."""
-    path = get_folder(folder)
-    files = sorted(path.glob("*.md"), key=lambda f: f.stat().st_mtime)
-    if ignore_prefixes:
-        files = [
-            f for f in files
-            if not any(f.name.startswith(prefix) for prefix in ignore_prefixes)
-        ]
-    return files
+    """List all .md files in a folder (oldest first), optionally ignoring certain prefixes.
+
+    Served from the shared folder index, which only re-reads what changed.
+    """
+    return folder_index.get_index(folder).list(ignore_prefixes)
+
+
+def oldest_md_files(folder: str, n: int, ignore_prefixes: Optional[list[str]] = None) -> list[Path]:
+    """Return the n oldest .md files in a folder."""
+    return folder_index.get_index(folder).oldest(n, ignore_prefixes)
+
+
+def count_md_files(folder: str, prefix: Optional[str] = None) -> int:
+    """Count .md files in a folder, optionally only those with a task prefix (e.g. "EMAIL")."""
+    return folder_index.get_index(folder).count(prefix)
 
 
 def safe_move(src: str | Path, dest_folder: str, overwrite: bool = False) -> Path:
@@ -59,6 +68,11 @@ def safe_move(src: str | Path, dest_folder: str, overwrite: bool = False) -> Pat
         dest_path = dest_dir / f"{stem}_{ts}{suffix}"
 
     shutil.move(str(src_path), str(dest_path))
+    frontmatter.invalidate(src_path)
+    frontmatter.invalidate(dest_path)
+    folder_index.note_changed(src_path)
+    folder_index.note_changed(dest_path)
+    task_catalog.note_moved(src_path, dest_path)
     return dest_path
 
 
@@ -84,7 +98,7 @@ def create_task_file(
     if "created" not in metadata:
         metadata["created"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    frontmatter.write_file(filepath, metadata, body)
+    frontmatter.write_file(filepath, metadata, body)  # also updates parse cache and catalog
     return filepath
 
 
@@ -110,10 +124,4 @@ def count_by_prefix(folder: str) -> dict[str, int]:
 
     Returns a dict like {"EMAIL": 3, "LINKEDIN": 2, "EXECUTE": 1}.
     """
-    files = list_md_files(folder)
-    counts: dict[str, int] = {}
-    for f in files:
-        parts = f.stem.split("_", 1)
-        prefix = parts[0] if len(parts) > 1 else "OTHER"
-        counts[prefix] = counts.get(prefix, 0) + 1
-    return counts
+    return folder_index.get_index(folder).count_by_prefix()
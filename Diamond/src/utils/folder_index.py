@@ -0,0 +1,262 @@
+"""In-process index of the .md files in each vault folder.
+
+list_md_files() used to glob a folder and stat every file on every call, and
+it is called on every poll by every orchestrator, by count_by_prefix, the
+scheduler, the auditor and the error handler. FolderIndex keeps, per folder,
+each file's name, mtime, size and prefix, and refreshes incrementally:
+
+- the folder's own mtime is checked first — unchanged means no readdir at all
+- on change, os.scandir lists names only; just the new names are stat()ed and
+  vanished names dropped, so the work is proportional to the changes
+- a name whose inode changed (replaced via write-to-temp + os.replace) is
+  re-stat()ed; the inode comes free with the directory listing
+- in-place rewrites (which do not touch the folder mtime) are reported by our
+  own writers through note_changed() — frontmatter.write_file, safe_move, etc.
+- a folder modified within RACY_WINDOW_NS of the last scan is re-listed on the
+  next query, so coarse filesystem timestamps cannot hide a change
+
+Queries ("list by mtime", "count by prefix", "oldest N", "count") are answered
+from the cached entries. They match the old glob + sort for every change made
+through our writers and for files created, deleted, renamed or replaced by
+anyone. The exception: a file rewritten in place (same inode) by an outside
+writer keeps its cached mtime and size, and so its position in the mtime
+order, until note_changed() or refresh(force=True). Its name and count are
+never stale.
+
+Usage:
+    from src.utils.folder_index import get_index
+    get_index("Done").count_by_prefix()
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from pathlib import Path
+
+# Directory mtimes within this window of a scan are not trusted (timestamp
+# granularity is a few ms on ext4/tmpfs, up to 2s on FAT/SMB mounts).
+RACY_WINDOW_NS = 1_000_000_000
+
+
+def task_prefix(name: str) -> str:
+    """Prefix of a task filename ("EMAIL_foo.md" → "EMAIL"), or "OTHER"."""
+    parts = name.rsplit(".", 1)[0].split("_", 1)
+    return parts[0] if len(parts) > 1 else "OTHER"
+
+
+class IndexEntry:
+    """Cached stat data for one file."""
+
+    __slots__ = ("folder", "name", "mtime", "mtime_ns", "size", "ino", "prefix", "_path")
+
+    def __init__(self, folder: Path, name: str, st: os.stat_result):
+        self.folder = folder
+        self.name = name
+        self.mtime = st.st_mtime
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self.ino = st.st_ino
+        self.prefix = task_prefix(name)
+        self._path = None
+
+    @property
+    def path(self) -> Path:
+        # Built on first use — count queries never need a Path at all
+        if self._path is None:
+            self._path = self.folder / self.name
+        return self._path
+
+    @property
+    def sort_key(self) -> tuple[int, str]:
+        return self.mtime_ns, self.name
+
+
+class FolderIndex:
+    """Incrementally maintained listing of one folder's files."""
+
+    def __init__(self, path: str | Path, suffix: str = ".md"):
+        self.path = Path(path)
+        self.suffix = suffix
+        self._entries: dict[str, IndexEntry] = {}
+        self._order: list[tuple[int, str]] = []      # sorted (mtime_ns, name)
+        self._prefix_counts: dict[str, int] = {}
+        self._dir_mtime_ns: int | None = None
+        self._racy = True
+        self._lock = threading.RLock()
+        self.scans = 0
+        self.stats_taken = 0
+        self.version = 0  # bumped on every add/remove, for derived caches
+
+    # -- maintenance -----------------------------------------------------------
+
+    def _add(self, entry: IndexEntry, keep_sorted: bool = True) -> None:
+        self._entries[entry.name] = entry
+        if keep_sorted:
+            bisect.insort(self._order, entry.sort_key)
+        else:
+            self._order.append(entry.sort_key)
+        self._prefix_counts[entry.prefix] = self._prefix_counts.get(entry.prefix, 0) + 1
+        self.version += 1
+
+    def _remove(self, name: str) -> None:
+        entry = self._entries.pop(name)
+        i = bisect.bisect_left(self._order, entry.sort_key)
+        del self._order[i]
+        remaining = self._prefix_counts[entry.prefix] - 1
+        if remaining:
+            self._prefix_counts[entry.prefix] = remaining
+        else:
+            del self._prefix_counts[entry.prefix]
+        self.version += 1
+
+    def refresh(self, force: bool = False) -> None:
+        """Bring the index up to date with the directory."""
+        with self._lock:
+            try:
+                dir_mtime_ns = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                self.path.mkdir(parents=True, exist_ok=True)
+                dir_mtime_ns = os.stat(self.path).st_mtime_ns
+
+            if not force and not self._racy and dir_mtime_ns == self._dir_mtime_ns:
+                return
+
+            scan_started_ns = time.time_ns()
+            found: dict[str, os.DirEntry] = {}
+            with os.scandir(self.path) as it:
+                for de in it:
+                    if de.name.endswith(self.suffix) and de.is_file():
+                        found[de.name] = de
+            self.scans += 1
+
+            for name, entry in list(self._entries.items()):
+                de = found.get(name)
+                if de is None or de.inode() != entry.ino:
+                    self._remove(name)
+            added = [de for name, de in found.items() if name not in self._entries]
+            bulk = len(added) > 64  # e.g. the first scan: append, then sort once
+            for de in added:
+                try:
+                    st = de.stat()
+                except FileNotFoundError:
+                    continue
+                self.stats_taken += 1
+                self._add(IndexEntry(self.path, de.name, st), keep_sorted=not bulk)
+            if bulk:
+                self._order.sort()
+
+            self._dir_mtime_ns = dir_mtime_ns
+            self._racy = dir_mtime_ns >= scan_started_ns - RACY_WINDOW_NS
+
+    def _stat(self, path: Path) -> IndexEntry | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        self.stats_taken += 1
+        return IndexEntry(path.parent, path.name, st)
+
+    def note_changed(self, path: str | Path) -> None:
+        """Re-stat one file after it was written, created or removed in place."""
+        path = Path(path)
+        if not path.name.endswith(self.suffix):
+            return
+        with self._lock:
+            if self._dir_mtime_ns is None:
+                return  # never scanned — the first query lists everything
+            if path.name in self._entries:
+                self._remove(path.name)
+            entry = self._stat(path)
+            if entry is not None:
+                self._add(entry)
+
+    # -- queries ---------------------------------------------------------------
+
+    def _filtered(self, keys, ignore_prefixes: list[str] | None) -> list[Path]:
+        entries = (self._entries[name] for _, name in keys)
+        if ignore_prefixes:
+            prefixes = tuple(ignore_prefixes)
+            return [e.path for e in entries if not e.name.startswith(prefixes)]
+        return [e.path for e in entries]
+
+    def list(self, ignore_prefixes: list[str] | None = None) -> list[Path]:
+        """All files, oldest mtime first."""
+        self.refresh()
+        with self._lock:
+            return self._filtered(self._order, ignore_prefixes)
+
+    def oldest(self, n: int, ignore_prefixes: list[str] | None = None) -> list[Path]:
+        """The n files with the oldest mtime."""
+        self.refresh()
+        with self._lock:
+            if not ignore_prefixes:
+                return self._filtered(self._order[:n], None)
+            result = []
+            prefixes = tuple(ignore_prefixes)
+            for _, name in self._order:
+                if not name.startswith(prefixes):
+                    result.append(self._entries[name].path)
+                    if len(result) == n:
+                        break
+            return result
+
+    def count(self, prefix: str | None = None) -> int:
+        """Number of files, optionally only those with the given task prefix."""
+        self.refresh()
+        with self._lock:
+            if prefix is None:
+                return len(self._entries)
+            return self._prefix_counts.get(prefix, 0)
+
+    def count_by_prefix(self) -> dict[str, int]:
+        self.refresh()
+        with self._lock:
+            return dict(self._prefix_counts)
+
+    def entries(self) -> list[IndexEntry]:
+        """Cached entries (name, mtime, size, prefix), oldest first."""
+        self.refresh()
+        with self._lock:
+            return [self._entries[name] for _, name in self._order]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "files": len(self._entries),
+                "scans": self.scans,
+                "stats_taken": self.stats_taken,
+            }
+
+
+_indexes: dict[Path, FolderIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index_for_path(path: str | Path) -> FolderIndex:
+    """Return the shared index for an absolute folder path."""
+    path = Path(path)
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = FolderIndex(path)
+        return index
+
+
+def get_index(folder: str) -> FolderIndex:
+    """Return the shared index for a project folder name (e.g. "Done")."""
+    from src.utils.file_ops import get_project_root
+
+    return get_index_for_path(get_project_root() / folder)
+
+
+def note_changed(path: str | Path) -> None:
+    """Tell the index of path's folder (if any) that the file changed."""
+    path = Path(path)
+    with _indexes_lock:
+        index = _indexes.get(path.parent)
+    if index is not None:
+        index.note_changed(path)
@@ -0,0 +1,164 @@
+"""Filesystem notifications for vault folders (watchdog / inotify).
+
+Lets long-running loops react to new .md files as soon as they are written
+instead of re-globbing a folder every few seconds. Files are queued when they
+are closed-for-write or moved into a watched folder (claim-by-move, safe_move).
+On platforms without close events, creation/modification events are used.
+
+watchdog is optional — if it is not installed, start() returns False and
+callers keep their existing polling behaviour.
+
+Usage:
+    notifier = FolderNotifier(["Needs_Action"])
+    if notifier.start():
+        new_files = notifier.wait(timeout=60)   # [] on timeout → reconcile scan
+    notifier.stop()
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from src.utils.file_ops import get_folder
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = object
+    HAS_WATCHDOG = False
+
+# inotify reports IN_CLOSE_WRITE, so partially written files are never queued
+CLOSE_EVENTS_SUPPORTED = sys.platform.startswith("linux")
+
+
+class _QueueingHandler(FileSystemEventHandler):
+    """watchdog handler that forwards relevant file events to the notifier."""
+
+    def __init__(self, notifier: FolderNotifier):
+        super().__init__()
+        self._notifier = notifier
+
+    def on_closed(self, event):
+        if not event.is_directory:
+            self._notifier._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._notifier._enqueue(event.dest_path)
+
+    def on_created(self, event):
+        if event.is_directory:
+            return
+        if not CLOSE_EVENTS_SUPPORTED:
+            self._notifier._enqueue(event.src_path)
+            return
+        # inotify reports a rename from an unwatched folder as a creation. A file
+        # that is still being written is empty here and is queued on close instead.
+        try:
+            if os.path.getsize(event.src_path) > 0:
+                self._notifier._enqueue(event.src_path)
+        except OSError:
+            pass
+
+    def on_modified(self, event):
+        if not event.is_directory and not CLOSE_EVENTS_SUPPORTED:
+            self._notifier._enqueue(event.src_path)
+
+
+class FolderNotifier:
+    """Queues files that land in one or more project folders."""
+
+    def __init__(self, folders: list[str], suffix: str = ".md", debounce: float = 0.05):
+        self.folders = list(folders)
+        self.suffix = suffix
+        self.debounce = debounce
+        self._pending: dict[str, Path] = {}
+        self._cond = threading.Condition()
+        self._observer = None
+        self._woken = False
+
+    @property
+    def active(self) -> bool:
+        return self._observer is not None
+
+    def start(self) -> bool:
+        """Start watching. Returns False if notifications are unavailable."""
+        if not HAS_WATCHDOG:
+            return False
+        if self._observer is not None:
+            return True
+
+        observer = Observer()
+        handler = _QueueingHandler(self)
+        try:
+            for name in self.folders:
+                observer.schedule(handler, str(get_folder(name)), recursive=False)
+            observer.daemon = True
+            observer.start()
+        except OSError:
+            return False
+
+        self._observer = observer
+        return True
+
+    def stop(self) -> None:
+        """Stop the watchdog observer thread."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        with self._cond:
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        """Interrupt a blocked wait() (e.g. from a shutdown signal handler)."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    def _enqueue(self, path: str) -> None:
+        p = Path(path)
+        if p.suffix != self.suffix:
+            return
+        with self._cond:
+            self._pending[str(p)] = p
+            self._cond.notify_all()
+
+    def drain(self) -> list[Path]:
+        """Return and clear all queued paths, in arrival order."""
+        with self._cond:
+            paths = list(self._pending.values())
+            self._pending.clear()
+            return paths
+
+    def wait(self, timeout: float | None = None) -> list[Path]:
+        """Block until at least one file is queued or the timeout expires.
+
+        Returns the queued paths ([] on timeout). A short debounce window
+        lets a burst of files be picked up together.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._pending and not self._woken and self._observer is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._woken = False
+
+        if self._pending and self.debounce:
+            time.sleep(self.debounce)
+        return self.drain()
+
+    def __enter__(self) -> FolderNotifier:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
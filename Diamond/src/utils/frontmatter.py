@@ -5,12 +5,234 @@ Format:
     key: value
     ---
     # Body content here
+
+parse() and dump() take a fast path for the flat key → scalar (str, bool,
+int, null) maps that create_task_file writes, and fall back to full YAML for
+anything else (lists, nested maps, floats, dates, wrapped or escaped values).
+The fast dump is byte-identical to yaml.dump for the documents it accepts;
+the fallback parser uses libyaml's CSafeLoader when it is available.
+
+read_file() keeps a bounded LRU cache of parsed (metadata, body) keyed by
+(path, st_mtime_ns, st_size), so re-reading an unchanged task file costs one
+stat() instead of a YAML parse. write_file(), file_ops.safe_move() and
+file_ops.create_task_file() invalidate entries; get_cache_stats() reports
+the hit rate. write_file() also records task files in the task catalog.
 """
 
+import copy
+import os
+import re
+import threading
+from collections import OrderedDict
+
 import yaml
 from pathlib import Path
 from typing import Any
 
+from src.utils import folder_index, task_catalog
+
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CACHE_MAX_ENTRIES = 10_000  # larger than a typical Done/ so full audits stay warm
+
+
+class _ParseCache:
+    """LRU of path → (mtime_ns, size, metadata, body)."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, int, dict, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str, st: os.stat_result) -> tuple[dict, str] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2], entry[3]
+
+    def put(self, key: str, st: os.stat_result, metadata: dict, body: str) -> None:
+        with self._lock:
+            self._entries[key] = (st.st_mtime_ns, st.st_size, metadata, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+_cache = _ParseCache()
+
+
+def _copy_metadata(metadata: dict) -> dict:
+    """Copy cached metadata so callers can mutate it (values are mostly scalars)."""
+    return {
+        k: (copy.deepcopy(v) if isinstance(v, (dict, list)) else v)
+        for k, v in metadata.items()
+    }
+
+
+def invalidate(filepath: str | Path) -> None:
+    """Drop a file's cached parse (called after it is written, moved or deleted)."""
+    _cache.invalidate(os.path.abspath(filepath))
+
+
+def configure_cache(max_entries: int) -> None:
+    """Resize the parse cache (evicting least-recently-used entries if shrinking)."""
+    with _cache._lock:
+        _cache.max_entries = max_entries
+        while len(_cache._entries) > max_entries:
+            _cache._entries.popitem(last=False)
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss counters for the read_file parse cache."""
+    return _cache.get_stats()
+
+
+# ---------------------------------------------------------------------------
+# Fast path for flat scalar maps
+# ---------------------------------------------------------------------------
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = yaml.resolver.Resolver()
+
+_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*):(?: (.*))?")
+_PLAIN_VALUE_RE = re.compile(r"[^\s\-?:,\[\]{}#&*!|>'\"%@`][^:#\t]*")
+_SINGLE_QUOTED_RE = re.compile(r"'((?:[^']|'')*)'")
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"\\]*)"')
+_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_BOOL_VALUES = {"yes": True, "no": False, "true": True, "false": False,
+                "on": True, "off": False}
+
+_DUMP_WIDTH = 80  # yaml.dump wraps long scalars past this column
+
+
+def _resolve(value: str) -> str:
+    return _resolver.resolve(yaml.ScalarNode, value, (True, False))
+
+
+def _fast_scalar(raw: str | None):
+    """Decode one value, or raise ValueError if it needs the full parser."""
+    if raw is None or raw == "":
+        return None
+    if raw != raw.rstrip() or not raw.isprintable():
+        raise ValueError(raw)
+
+    m = _SINGLE_QUOTED_RE.fullmatch(raw)
+    if m:
+        return m.group(1).replace("''", "'")
+    m = _DOUBLE_QUOTED_RE.fullmatch(raw)
+    if m:
+        return m.group(1)
+    if not _PLAIN_VALUE_RE.fullmatch(raw):
+        raise ValueError(raw)
+
+    tag = _resolve(raw)
+    if tag == _STR_TAG:
+        return raw
+    if tag == "tag:yaml.org,2002:bool":
+        return _BOOL_VALUES[raw.lower()]
+    if tag == "tag:yaml.org,2002:null":
+        return None
+    if tag == "tag:yaml.org,2002:int" and _INT_RE.fullmatch(raw):
+        return int(raw)
+    raise ValueError(raw)  # floats, timestamps, octal/hex/sexagesimal ints, ...
+
+
+def _fast_parse(yaml_block: str) -> dict[str, Any] | None:
+    """Parse a flat `key: scalar` block; None means "use full YAML"."""
+    if not yaml_block:
+        return None
+    metadata = {}
+    try:
+        for line in yaml_block.split("\n"):
+            m = _LINE_RE.fullmatch(line)
+            if not m or _resolve(m.group(1)) != _STR_TAG:
+                return None
+            metadata[m.group(1)] = _fast_scalar(m.group(2))
+    except ValueError:
+        return None
+    return metadata
+
+
+def _allows_block_plain(value: str) -> bool:
+    """Emitter.analyze_scalar's allow_block_plain, for one-line printable ASCII."""
+    if value[0] == " " or value[-1] == " " or value.startswith(("---", "...")):
+        return False
+    first = value[0]
+    if first in "#,[]{}&*!|>'\"%@`":
+        return False
+    if first in "?:-" and (len(value) == 1 or value[1] == " "):
+        return False
+    return ": " not in value[1:] and not value[1:].endswith(":") and " #" not in value
+
+
+def _fast_dump_str(value: str) -> str | None:
+    """Render a string value the way yaml.dump chooses its style; None if unsure."""
+    if not (value.isascii() and value.isprintable()):
+        return None  # yaml.dump double-quotes and escapes these
+    if value and _allows_block_plain(value) and _resolve(value) == _STR_TAG:
+        return value
+    # Empty, indicator-laden, or would read back as another type (yes, 1, 2026-01-01 ...)
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _fast_dump(metadata: dict[str, Any]) -> str | None:
+    """Serialise a flat scalar map exactly as yaml.dump would; None if not flat."""
+    lines = []
+    for key, value in metadata.items():
+        if type(key) is not str or not _LINE_RE.fullmatch(f"{key}:"):
+            return None
+        if _resolve(key) != _STR_TAG:
+            return None
+
+        if value is None:
+            text = "null"
+        elif value is True:
+            text = "true"
+        elif value is False:
+            text = "false"
+        elif type(value) is int:
+            text = str(value)
+        elif type(value) is str:
+            text = _fast_dump_str(value)
+            if text is None:
+                return None
+        else:
+            return None
+
+        line = f"{key}: {text}"
+        if len(line) > _DUMP_WIDTH:
+            return None
+        lines.append(line)
+    return "\n".join(lines)
+
 
 def parse(text: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown text.
@@ -30,8 +252,12 @@ def parse(text: str) -> tuple[dict[str, Any], str]:
     yaml_block = text[3:end].strip()
     body = text[end + 3:].strip()
 
+    metadata = _fast_parse(yaml_block)
+    if metadata is not None:
+        return metadata, body
+
     try:
-        metadata = yaml.safe_load(yaml_block)
+        metadata = yaml.load(yaml_block, Loader=_SafeLoader)
         if not isinstance(metadata, dict):
             return {}, text
     except yaml.YAMLError:
@@ -45,17 +271,33 @@ def dump(metadata: dict[str, Any], body: str) -> str:
     if not metadata:
         return body
 
-    yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False).strip()
+    yaml_str = _fast_dump(metadata)
+    if yaml_str is None:
+        yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False).strip()
     return f"---\n{yaml_str}\n---\n\n{body}"
 
 
 def read_file(filepath: str | Path) -> tuple[dict[str, Any], str]:
-    """Read a markdown file and return (metadata, body)."""
+    """Read a markdown file and return (metadata, body).
+
+    Unchanged files are served from the parse cache; the returned metadata is
+    always a fresh dict the caller may modify.
+    """
     path = Path(filepath)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return {}, ""
+
+    key = os.path.abspath(path)
+    cached = _cache.get(key, st)
+    if cached is not None:
+        return _copy_metadata(cached[0]), cached[1]
+
     text = path.read_text(encoding="utf-8")
-    return parse(text)
+    metadata, body = parse(text)
+    _cache.put(key, st, metadata, body)
+    return _copy_metadata(metadata), body
 
 
 def write_file(filepath: str | Path, metadata: dict[str, Any], body: str) -> None:
@@ -64,3 +306,6 @@ def write_file(filepath: str | Path, metadata: dict[str, Any], body: str) -> Non
     path.parent.mkdir(parents=True, exist_ok=True)
     content = dump(metadata, body)
     path.write_text(content, encoding="utf-8")
+    invalidate(path)
+    folder_index.note_changed(path)
+    task_catalog.note_written(path, metadata)
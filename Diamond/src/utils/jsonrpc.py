@@ -0,0 +1,46 @@
+"""JSON-RPC 2.0 message dispatch shared by the MCP server stdio loops.
+
+A line on stdin is either a single request object or a batch array of
+request objects. dispatch() routes both to the server's handle_request()
+and returns what should be written back:
+
+- a single request → its response dict
+- a batch → a list of responses (one per request that produced one)
+- nothing to answer (e.g. notifications only) → None
+
+Usage:
+    response = dispatch(json.loads(line), handle_request)
+    if response is not None:
+        sys.stdout.write(json.dumps(response) + "\\n")
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+INTERNAL_ERROR = -32603
+
+
+def error_response(req_id: Any, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+
+
+def _dispatch_one(request: Any, handler: Callable[[dict], dict | None]) -> dict | None:
+    if not isinstance(request, dict):
+        return error_response(None, INVALID_REQUEST, "Invalid Request")
+    try:
+        return handler(request)
+    except Exception as e:
+        return error_response(request.get("id"), INTERNAL_ERROR, f"Internal error: {e}")
+
+
+def dispatch(message: Any, handler: Callable[[dict], dict | None]) -> dict | list | None:
+    """Handle a decoded JSON-RPC message (single request or batch array)."""
+    if isinstance(message, list):
+        if not message:
+            return error_response(None, INVALID_REQUEST, "Invalid Request: empty batch")
+        responses = [r for r in (_dispatch_one(m, handler) for m in message) if r is not None]
+        return responses or None
+    return _dispatch_one(message, handler)
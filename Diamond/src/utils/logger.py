@@ -1,22 +1,249 @@
 """Structured logging to Logs/ folder and console.
 
 Includes JSON-lines audit logger for machine-parseable action trails.
+
+Every record is appended with a single O_APPEND write() of whole lines (the
+markdown header goes in the same write as the first line when we create the
+file), so the orchestrator, watchers and scheduler can share a log file
+without interleaving partial lines.
+
+Long-running processes call start_background_writer(): records are then
+queued and a writer thread batches them per target file, flushing when
+`logging.flush_bytes` are buffered, after `logging.flush_interval_ms`, on
+flush_logs() and at exit. `logging.fsync` (none | flush) decides whether each
+flush is fsync()ed. Without the writer every call writes through directly.
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
-from src.utils.file_ops import get_folder
+from src.utils import file_ops
+from src.utils.tracing import current_trace_id
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+
+
+def _append(path: Path, data: bytes, header: bytes | None = None, fsync: bool = False) -> None:
+    """Append whole lines to path with one O_APPEND write.
+
+    The header is prepended only if this call creates the file (O_EXCL), so
+    two processes racing to start the same log cannot both write it.
+    """
+    try:
+        fd = os.open(path, _OPEN_FLAGS)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(path, _OPEN_FLAGS | os.O_CREAT | os.O_EXCL, 0o644)
+            if header:
+                data = header + data
+        except FileExistsError:
+            fd = os.open(path, _OPEN_FLAGS)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+_STOP = object()
+
+
+class BackgroundLogWriter:
+    """Queue-fed thread that batches log lines per file.
+
+    Lines for the same file are joined and written with one O_APPEND write
+    per flush; a flush happens once flush_bytes are buffered, flush_interval
+    seconds after the first unflushed line, on flush() and on stop().
+    """
+
+    def __init__(self, flush_interval: float = 0.2, flush_bytes: int = 64 * 1024,
+                 fsync: str = "none"):
+        if fsync not in ("none", "flush"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync == "flush"
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self.records = 0
+        self.writes = 0
+        self.flushes = 0
+        self.errors = 0
+
+    def start(self) -> "BackgroundLogWriter":
+        self._thread.start()
+        return self
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def submit(self, path: Path, line: bytes, header: bytes | None = None) -> None:
+        self._queue.put((path, line, header))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until everything submitted so far is written."""
+        if not self.alive:
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        if self.alive:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        pending: dict[Path, tuple[bytes | None, list[bytes]]] = {}
+        buffered = 0
+        deadline = None
+        stop = False
+        while not stop:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            waiters = []
+            while item is not None:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    path, line, header = item
+                    pending.setdefault(path, (header, []))[1].append(line)
+                    buffered += len(line)
+                    self.records += 1
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                if buffered >= self.flush_bytes:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            if pending and (stop or waiters or buffered >= self.flush_bytes
+                            or time.monotonic() >= deadline):
+                self._write(pending)
+                pending = {}
+                buffered = 0
+                deadline = None
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, pending: dict) -> None:
+        for path, (header, lines) in pending.items():
+            try:
+                _append(path, b"".join(lines), header, self.fsync)
+                self.writes += 1
+            except OSError as e:
+                self.errors += 1
+                _console.error(f"Log write to {path} failed: {e}")
+        self.flushes += 1
+
+    def get_stats(self) -> dict:
+        return {"records": self.records, "writes": self.writes, "flushes": self.flushes,
+                "errors": self.errors, "alive": self.alive}
+
+
+_writer: BackgroundLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def _load_logging_config() -> dict:
+    from src.config.agent_config import AgentConfig
+
+    return AgentConfig._load_config().get("logging", {}) or {}
+
+
+def start_background_writer(flush_interval: float | None = None, flush_bytes: int | None = None,
+                            fsync: str | None = None, force: bool = False) -> BackgroundLogWriter | None:
+    """Route log writes through a background writer (config.yaml `logging`).
+
+    Returns None when `logging.background_writer` is disabled, unless force.
+    """
+    global _writer
+    cfg = _load_logging_config()
+    if not force and not cfg.get("background_writer", True):
+        return None
+    with _writer_lock:
+        if _writer is None or not _writer.alive:
+            _writer = BackgroundLogWriter(
+                flush_interval=(flush_interval if flush_interval is not None
+                                else cfg.get("flush_interval_ms", 200) / 1000),
+                flush_bytes=flush_bytes if flush_bytes is not None else cfg.get("flush_bytes", 65536),
+                fsync=fsync or cfg.get("fsync", "none"),
+            ).start()
+            atexit.register(stop_background_writer)
+        return _writer
+
+
+def stop_background_writer() -> None:
+    """Flush and stop the background writer; later records write through."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
+
+
+def flush_logs() -> None:
+    """Make every record logged so far visible on disk (no-op without the writer)."""
+    writer = _writer
+    if writer is not None:
+        writer.flush()
+
+
+_fsync_direct: bool | None = None  # write-through fsync policy, loaded on first use
+
+
+def _emit(path: Path, line: str, header: str | None = None) -> None:
+    global _fsync_direct
+    data = line.encode("utf-8")
+    head = header.encode("utf-8") if header else None
+    writer = _writer
+    if writer is not None and writer.alive:
+        writer.submit(path, data, head)
+        return
+    if _fsync_direct is None:
+        _fsync_direct = _load_logging_config().get("fsync", "none") == "flush"
+    _append(path, data, head, fsync=_fsync_direct)
+
+
+_paths: dict[tuple, Path] = {}
+
+
+def _log_path(filename: str) -> Path:
+    """Logs/<filename> under the current project root (memoised — pathlib is slow)."""
+    root = file_ops.get_project_root()
+    key = (root, filename)
+    path = _paths.get(key)
+    if path is None:
+        if len(_paths) > 1024:
+            _paths.clear()
+        path = _paths[key] = root / "Logs" / filename
+    return path
 
 
 def _get_log_file(task_name: str = "system") -> Path:
     """Get the log file path for today + task."""
-    logs_dir = get_folder("Logs")
     date_str = datetime.now().strftime("%Y-%m-%d")
-    return logs_dir / f"{date_str}_{task_name}.md"
+    return _log_path(f"{date_str}_{task_name}.md")
 
 
 def _setup_console_logger() -> logging.Logger:
@@ -47,13 +274,9 @@ def log_action(action: str, details: str = "", task_name: str = "system") -> Non
         entry += f": {details}"
     entry += "\n"
 
-    # Append to log file, creating header if new
-    if not log_file.exists():
-        header = f"# Log: {task_name}\n\n**Date:** {timestamp[:10]}\n\n## Actions\n\n"
-        log_file.write_text(header + entry, encoding="utf-8")
-    else:
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(entry)
+    # Header is written only by whoever creates the file
+    header = f"# Log: {task_name}\n\n**Date:** {timestamp[:10]}\n\n## Actions\n\n"
+    _emit(log_file, entry, header)
 
 
 def log_error(error: str, details: str = "", task_name: str = "system") -> None:
@@ -68,12 +291,8 @@ def log_error(error: str, details: str = "", task_name: str = "system") -> None:
         entry += f": {details}"
     entry += "\n"
 
-    if not log_file.exists():
-        header = f"# Log: {task_name}\n\n**Date:** {timestamp[:10]}\n\n## Actions\n\n"
-        log_file.write_text(header + entry, encoding="utf-8")
-    else:
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(entry)
+    header = f"# Log: {task_name}\n\n**Date:** {timestamp[:10]}\n\n## Actions\n\n"
+    _emit(log_file, entry, header)
 
 
 # ---------------------------------------------------------------------------
@@ -82,9 +301,8 @@ def log_error(error: str, details: str = "", task_name: str = "system") -> None:
 
 def _get_audit_file() -> Path:
     """Get today's JSON-lines audit log path."""
-    logs_dir = get_folder("Logs")
     date_str = datetime.now().strftime("%Y-%m-%d")
-    return logs_dir / f"{date_str}_actions.jsonl"
+    return _log_path(f"{date_str}_actions.jsonl")
 
 
 def audit_log(
@@ -100,7 +318,7 @@ def audit_log(
     """Append a machine-parseable JSON-lines audit record.
 
     Fields: timestamp, action_type, actor, agent_id, params, approval_status,
-            result, duration_ms, task_name
+            result, duration_ms, task_name, trace_id (when inside a trace)
     """
     record = {
         "timestamp": datetime.now().isoformat(),
@@ -119,7 +337,13 @@ def audit_log(
         record["duration_ms"] = duration_ms
     if task_name:
         record["task_name"] = task_name
+    trace_id = current_trace_id()
+    if trace_id:
+        record["trace_id"] = trace_id
+
+    _emit(_get_audit_file(), json.dumps(record, default=str) + "\n")
+
 
-    audit_file = _get_audit_file()
-    with open(audit_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, default=str) + "\n")
+def write_jsonl(filename: str, record: dict) -> None:
+    """Append one JSON record to Logs/<filename> (e.g. "traces/<day>_spans.jsonl")."""
+    _emit(_log_path(filename), json.dumps(record, default=str) + "\n")
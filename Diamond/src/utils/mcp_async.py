@@ -0,0 +1,142 @@
+"""asyncio MCP client — concurrent fan-out across servers and data sources.
+
+The synchronous call_mcp() blocks its thread for the whole round trip, so
+code that needs Odoo, social and task stats pays the sum of their latencies.
+AsyncMCPClient lets callers await many calls at once:
+
+- gather([...]) fans calls out across servers with a per-call timeout
+- every call goes through call_mcp() on a worker thread, so it shares the
+  pooled sessions, transport config, result cache, tool policy, metrics,
+  circuit breaker and tracing with synchronous callers
+- a timed-out or cancelled await returns at once; the underlying call_mcp()
+  finishes (or times out) on its own and the session stays in the pool
+
+Blocking helpers (file scans, SDK calls) can join the same fan-out through
+run_blocking(), which runs them on a daemon thread with a timeout. The
+timeout bounds wall time: neither the await nor asyncio.run() waits for a
+thread that overran it.
+
+Usage:
+    async with AsyncMCPClient() as client:
+        invoices, summary = await client.gather([
+            ("odoo", "list_invoices", {"limit": 50}),
+            ("social", "get_social_summary", {"platform": "all"}),
+        ], timeout=20)
+
+    run_sync(coro)   # from synchronous code, even inside a running loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import threading
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger("ai_employee")
+
+
+class AsyncMCPClient:
+    """Awaitable MCP tool calls with fan-out, per-call timeouts and cancellation."""
+
+    def __init__(self, servers: dict[str, str] | None = None, cache: bool = True,
+                 transport: str | None = None):
+        if servers is None:
+            from src.utils.mcp_registry import MCP_SERVERS
+            servers = MCP_SERVERS
+        self.servers = dict(servers)
+        self.cache = cache
+        self.transport = transport
+
+    async def call_tool(self, server_name: str, tool_name: str, arguments: dict | None = None,
+                        timeout: float | None = 30, role: str | None = None) -> Any:
+        """Call a tool through call_mcp() and return its parsed result.
+
+        Raises what call_mcp() raises (RuntimeError on tool errors,
+        PermissionError, CircuitOpenError, ...), or TimeoutError once
+        timeout seconds have passed.
+        """
+        from src.utils.mcp_registry import call_mcp
+
+        if server_name not in self.servers:
+            raise ValueError(f"Unknown MCP server: {server_name}")
+        return await run_blocking(
+            call_mcp, server_name, tool_name, arguments or {},
+            timeout or 30, role, self.transport, self.cache,
+            timeout=timeout,
+        )
+
+    async def gather(self, calls: list[tuple[str, str, dict | None]],
+                     timeout: float | None = 30, role: str | None = None,
+                     return_exceptions: bool = True) -> list:
+        """Run (server, tool, args) calls concurrently; results come back in order.
+
+        Each call gets its own timeout. With return_exceptions (the default) a
+        failed or timed-out call yields its exception in place of a result;
+        otherwise the first failure cancels the remaining calls and is raised.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(server, tool, args, timeout=timeout, role=role)
+              for server, tool, args in calls),
+            return_exceptions=return_exceptions,
+        )
+
+    async def close(self) -> None:
+        """Nothing to release: server sessions belong to the shared MCPSessionManager."""
+
+    async def __aenter__(self) -> AsyncMCPClient:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+async def run_blocking(fn: Callable[..., Any], *args, timeout: float | None = None) -> Any:
+    """Run a blocking callable on its own daemon thread, bounded by timeout.
+
+    A timed-out thread cannot be interrupted; its result is simply discarded.
+    The thread is not part of the loop's default executor, so asyncio.run()
+    returns without joining it and the timeout bounds wall time, not just the
+    await.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    context = contextvars.copy_context()
+
+    def settle(result: Any, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def worker() -> None:
+        try:
+            result, error = context.run(fn, *args), None
+        except BaseException as e:  # noqa: BLE001 — re-raised in the awaiting task
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # loop already closed: the caller gave up long ago
+
+    threading.Thread(target=worker, name=f"run_blocking:{getattr(fn, '__name__', 'fn')}",
+                     daemon=True).start()
+    return await asyncio.wait_for(future, timeout)
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() normally; when called from inside a running event loop
+    (e.g. a handler invoked by async code) the coroutine runs on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,210 @@
+"""Result cache for read-only (SAFE) MCP tools.
+
+The auditor, finance agent and scheduler call list_invoices, list_partners,
+get_balance etc. many times within a few minutes. MCPCache memoises those
+results so repeated reads skip the server round trip:
+
+- only tools classified SAFE in config/tool_policy are cached
+- keys are (server, tool, canonical JSON of the arguments)
+- each tool has its own TTL (config.yaml `mcp.cache.ttl`, with a default)
+- LRU eviction bounded by entry count and by total payload bytes
+- any DRAFT/DANGEROUS call on a server invalidates that server's entries
+
+Results are stored as JSON text, so every hit returns a fresh copy that the
+caller may mutate freely.
+
+Usage:
+    from src.utils.mcp_cache import get_mcp_cache
+    result = get_mcp_cache().call("odoo", "list_invoices", {"limit": 5}, fetch)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from src.config.tool_policy import SAFE, get_classification
+
+MISS = object()
+
+
+def make_key(server_name: str, tool_name: str, arguments: dict | None) -> tuple[str, str, str]:
+    """Build a cache key; argument order and whitespace do not matter."""
+    canonical = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return server_name, tool_name, canonical
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """Error payloads are never cached."""
+    return not (isinstance(result, dict) and "error" in result)
+
+
+class MCPCache:
+    """Thread-safe TTL + LRU cache for SAFE MCP tool results."""
+
+    def __init__(self, default_ttl: float = 60, tool_ttls: dict[str, float] | None = None,
+                 max_entries: int = 1024, max_bytes: int = 8 * 1024 * 1024,
+                 enabled: bool = True):
+        self.default_ttl = default_ttl
+        self.tool_ttls = dict(tool_ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        # key → (expires_at, payload_json)
+        self._entries: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        self._bytes = 0
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def ttl_for(self, tool_name: str) -> float:
+        return self.tool_ttls.get(tool_name, self.default_ttl)
+
+    def is_cacheable_tool(self, tool_name: str) -> bool:
+        return (self.enabled and get_classification(tool_name) == SAFE
+                and self.ttl_for(tool_name) > 0)
+
+    # -- low-level operations ------------------------------------------------
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached result for key, or the MISS sentinel."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return MISS
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                self._drop_locked(key)
+                self._expirations += 1
+                self._misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return json.loads(payload)
+
+    def put(self, key: tuple, result: Any, generation: int | None = None) -> bool:
+        """Store a result. Skipped if the server was invalidated since `generation`."""
+        try:
+            payload = json.dumps(result, default=str)
+        except (TypeError, ValueError):
+            return False
+        size = len(payload)
+        if size > self.max_bytes:
+            return False
+
+        server_name, tool_name, _ = key
+        with self._lock:
+            if generation is not None and self._generations.get(server_name, 0) != generation:
+                return False
+            if key in self._entries:
+                self._drop_locked(key)
+            self._entries[key] = (time.monotonic() + self.ttl_for(tool_name), payload)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._drop_locked(oldest)
+                self._evictions += 1
+        return True
+
+    def _drop_locked(self, key: tuple) -> None:
+        _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    def generation(self, server_name: str) -> int:
+        with self._lock:
+            return self._generations.get(server_name, 0)
+
+    def invalidate_server(self, server_name: str) -> int:
+        """Drop every entry for a server. Returns the number of entries removed."""
+        with self._lock:
+            self._generations[server_name] = self._generations.get(server_name, 0) + 1
+            stale = [k for k in self._entries if k[0] == server_name]
+            for key in stale:
+                self._drop_locked(key)
+            self._invalidations += 1
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # -- call wrapper ----------------------------------------------------------
+
+    def call(self, server_name: str, tool_name: str, arguments: dict | None,
+             fetch: Callable[[], Any]) -> Any:
+        """Serve a SAFE tool from cache, or run fetch() and apply write-through rules.
+
+        Non-SAFE tools always run and invalidate the server's entries both
+        before and after the call, so a read racing with the write cannot
+        repopulate the cache with pre-write data.
+        """
+        if not self.is_cacheable_tool(tool_name):
+            if get_classification(tool_name) == SAFE:
+                return fetch()
+            self.invalidate_server(server_name)
+            try:
+                return fetch()
+            finally:
+                self.invalidate_server(server_name)
+
+        key = make_key(server_name, tool_name, arguments)
+        cached = self.get(key)
+        if cached is not MISS:
+            return cached
+
+        generation = self.generation(server_name)
+        result = fetch()
+        if is_cacheable_result(result):
+            self.put(key, result, generation)
+        return result
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expired": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+
+_cache: MCPCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_mcp_cache() -> MCPCache:
+    """Return the process-wide MCP result cache (configured from config.yaml)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from src.config.agent_config import AgentConfig
+
+            cfg = AgentConfig._load_config().get("mcp", {}).get("cache", {}) or {}
+            ttls = dict(cfg.get("ttl") or {})
+            default_ttl = ttls.pop("default", 60)
+            _cache = MCPCache(
+                default_ttl=default_ttl,
+                tool_ttls=ttls,
+                max_entries=cfg.get("max_entries", 1024),
+                max_bytes=int(cfg.get("max_mb", 8) * 1024 * 1024),
+                enabled=cfg.get("enabled", True),
+            )
+        return _cache
@@ -1,20 +1,48 @@
 """Unified MCP server registry and caller — Platinum Tier.
 
 Routes tool calls to the correct MCP server via subprocess.
-Includes tool policy enforcement for cloud/local role separation.
+Includes tool policy enforcement for cloud/local role separation, and a
+result cache for SAFE (read-only) tools — see mcp_cache.
+
+Transports (config.yaml `mcp.transport`, or the `transport` argument):
+- "session" (default): pooled long-lived server processes (see mcp_session)
+- "spawn": one fresh subprocess per call (legacy behaviour)
+- "in_process": import the server module once and call handle_request()
+  directly — for the local role and tests, where isolation buys nothing
+
+Each server has a circuit breaker ("mcp:<server>", see circuit_breaker).
+Only transport failures count against it: timeouts, dead sessions, missing
+responses, and error results saying the backend is unreachable. A tool-level
+answer such as {"error": "Invoice 7 not found"} shows the server is up, so it
+counts as a success. While the breaker is open, calls that miss the cache
+raise CircuitOpenError at once instead of waiting out the timeout. Calls are not retried in place: a
+backoff sleep would hold the caller's pool worker, so failures surface to
+ErrorHandler, which schedules the task on the retry queue.
 
 Usage:
-    from src.utils.mcp_registry import call_mcp
+    from src.utils.mcp_registry import call_mcp, call_mcp_batch
     result = call_mcp("email", "send_email", {"to": "x@y.com", "subject": "Hi", "body": "Hello"})
+    invoices, partners = call_mcp_batch("odoo", [("list_invoices", {}), ("list_partners", {})])
 """
 
+import importlib
+import itertools
 import json
 import logging
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import Callable
 
-from src.utils.retry import with_retry
+from src.utils import tracing
+from src.utils.circuit_breaker import get_breaker
+from src.config.tool_policy import SAFE, get_classification
+from src.utils.jsonrpc import dispatch
+from src.utils.mcp_cache import MISS, get_mcp_cache, is_cacheable_result, make_key
+from src.utils.mcp_session import MCPSessionError, get_session_manager, parse_tool_result
+from src.utils.metrics import MCP_LATENCY
 
 logger = logging.getLogger("ai_employee")
 
@@ -29,6 +57,142 @@ MCP_SERVERS = {
     "payment": "src.mcp_payment.payment_server",
 }
 
+TRANSPORTS = ("session", "spawn", "in_process")
+
+# Error text meaning the server or its backend could not be reached, as
+# opposed to a business answer from a healthy server
+_UNREACHABLE_MARKERS = (
+    "timed out", "timeout", "connect", "unreachable", "refused",
+    "unavailable", "network", "no valid response", "no response",
+)
+
+
+def _says_unreachable(message: str) -> bool:
+    message = message.lower()
+    return any(marker in message for marker in _UNREACHABLE_MARKERS)
+
+
+def is_transport_failure(result: dict | None = None, error: BaseException | None = None) -> bool:
+    """Whether a call's outcome should count against the server's circuit breaker.
+
+    Timeouts and MCPSessionError always count. A RuntimeError (a JSON-RPC
+    error) or an {"error": ...} result counts only if it says the server or
+    its backend is unreachable.
+    """
+    if error is not None:
+        if isinstance(error, (TimeoutError, subprocess.TimeoutExpired, MCPSessionError)):
+            return True
+        if type(error) is RuntimeError:
+            return _says_unreachable(str(error))
+        return True
+    if isinstance(result, dict) and "error" in result:
+        return _says_unreachable(str(result["error"]))
+    return False
+
+
+def _default_transport(role: str | None = None) -> str:
+    """Transport from config.yaml: `mcp.role_transports[role]`, else `mcp.transport`."""
+    from src.config.agent_config import AgentConfig
+
+    mcp_config = AgentConfig._load_config().get("mcp", {})
+    role_transports = mcp_config.get("role_transports") or {}
+    if role and role in role_transports:
+        return role_transports[role]
+    return mcp_config.get("transport", "session")
+
+
+# ---------------------------------------------------------------------------
+# In-process transport
+# ---------------------------------------------------------------------------
+
+_in_process_handlers: dict[str, Callable[[dict], dict]] = {}
+_in_process_lock = threading.Lock()
+_in_process_ids = itertools.count(1)
+
+
+def _load_in_process_handler(server_name: str) -> Callable[[dict], dict]:
+    """Import a server module once and return its request handler."""
+    with _in_process_lock:
+        handler = _in_process_handlers.get(server_name)
+        if handler is not None:
+            return handler
+
+        module = importlib.import_module(MCP_SERVERS[server_name])
+        if server_name == "odoo":
+            # odoo_server.handle_request takes the connection, which is not
+            # thread-safe; pool workers share it one request at a time
+            odoo = module.OdooConnection()
+            odoo.connect()
+            odoo_lock = threading.Lock()
+
+            def handler(request: dict) -> dict:
+                with odoo_lock:
+                    return module.handle_request(request, odoo)
+        else:
+            handler = module.handle_request
+
+        _in_process_handlers[server_name] = handler
+        return handler
+
+
+def _in_process_request(server_name: str, method: str, params: dict | None = None) -> dict:
+    """Dispatch a JSON-RPC request to an in-process server handler."""
+    request = {"jsonrpc": "2.0", "method": method, "id": next(_in_process_ids)}
+    if params is not None:
+        request["params"] = params
+    return _load_in_process_handler(server_name)(request)
+
+
+def _in_process_batch(server_name: str, requests: list[tuple[str, dict | None]]) -> list[dict]:
+    """Dispatch a JSON-RPC batch to an in-process server handler."""
+    messages = []
+    for method, params in requests:
+        message = {"jsonrpc": "2.0", "method": method, "id": next(_in_process_ids)}
+        if params is not None:
+            message["params"] = params
+        messages.append(message)
+    responses = dispatch(messages, _load_in_process_handler(server_name)) or []
+    return _order_batch(messages, responses)
+
+
+def _order_batch(messages: list[dict], responses: list[dict]) -> list[dict]:
+    """Match batch responses (which may arrive in any order) back to their requests."""
+    by_id = {r.get("id"): r for r in responses if isinstance(r, dict)}
+    missing = {"error": {"code": -32603, "message": "No response for batch item"}}
+    return [by_id.get(m["id"], missing) for m in messages]
+
+
+def _raw_batch(server_module: str, requests: list[tuple[str, dict | None]],
+               timeout: int = 30) -> list[dict]:
+    """Spawn one subprocess for the MCP server and send a single JSON-RPC batch."""
+    messages = []
+    for i, (method, params) in enumerate(requests, start=1):
+        message = {"jsonrpc": "2.0", "method": method, "id": i}
+        if params is not None:
+            message["params"] = params
+        messages.append(message)
+
+    proc = subprocess.run(
+        [sys.executable, "-m", server_module],
+        input=json.dumps(messages) + "\n",
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        cwd=str(PROJECT_ROOT),
+    )
+
+    for line in proc.stdout.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        response = json.loads(line)
+        if isinstance(response, list):
+            return _order_batch(messages, response)
+        if "error" in response:
+            raise RuntimeError(response["error"].get("message", "MCP server error"))
+
+    raise RuntimeError("No valid response from MCP server")
+
 
 def _raw_call(server_module: str, tool_name: str, arguments: dict, timeout: int = 30) -> dict:
     """Spawn a subprocess for the MCP server and send a single tool call."""
@@ -54,27 +218,59 @@ def _raw_call(server_module: str, tool_name: str, arguments: dict, timeout: int
         if not line:
             continue
         response = json.loads(line)
-        if "result" in response:
-            content = response["result"].get("content", [])
-            if content:
-                return json.loads(content[0].get("text", "{}"))
-        elif "error" in response:
+        if "result" in response and response["result"].get("content"):
+            return parse_tool_result(response)
+        if "error" in response:
             raise RuntimeError(response["error"].get("message", "MCP server error"))
 
     raise RuntimeError("No valid response from MCP server")
 
 
-@with_retry(max_attempts=2, backoff_factor=2)
+def _check_policy(server_name: str, tool_name: str, role: str | None) -> None:
+    """Raise PermissionError if the role may not call this tool on this server."""
+    if not role:
+        return
+
+    from src.config.tool_policy import is_allowed, is_local_only_server
+    from src.config.agent_config import AgentRole
+
+    agent_role = AgentRole(role)
+
+    if is_local_only_server(server_name) and agent_role == AgentRole.CLOUD:
+        raise PermissionError(
+            f"Server '{server_name}' is local-only, not available on cloud"
+        )
+
+    if not is_allowed(tool_name, agent_role):
+        raise PermissionError(
+            f"Tool '{tool_name}' is blocked for role '{role}'"
+        )
+
+
+def _resolve_transport(transport: str | None, role: str | None) -> str:
+    transport = transport or _default_transport(role)
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown MCP transport: {transport}. Available: {list(TRANSPORTS)}")
+    return transport
+
+
 def call_mcp(server_name: str, tool_name: str, arguments: dict = None,
-             timeout: int = 30, role: str | None = None) -> dict:
+             timeout: int = 30, role: str | None = None,
+             transport: str | None = None, cache: bool = True) -> dict:
     """Call a tool on a registered MCP server.
 
+    SAFE tools are served from the MCP result cache when possible; DRAFT and
+    DANGEROUS tools invalidate the server's cached entries.
+
     Args:
         server_name: One of "email", "odoo", "social", "whatsapp", "payment"
         tool_name: The tool to invoke (e.g. "send_email", "list_invoices")
         arguments: Tool arguments dict
         timeout: Subprocess timeout in seconds
         role: Agent role for policy enforcement (cloud/local/gold)
+        transport: "session" (pooled process), "spawn" (process per call) or
+            "in_process" (direct handle_request call). Defaults from config.yaml.
+        cache: Set False to bypass the result cache for this call
 
     Returns:
         The tool result dict
@@ -82,7 +278,11 @@ def call_mcp(server_name: str, tool_name: str, arguments: dict = None,
     Raises:
         ValueError: If server_name is not registered
         PermissionError: If tool is blocked by policy for this role
-        RetryExhausted: If all retry attempts fail
+        CircuitOpenError: If the server's circuit breaker is open
+        RuntimeError: If the server returns an error or no valid response
+        TimeoutError, MCPSessionError: On transport failures. These are not
+            retried here; the failed task goes to ErrorHandler and the retry
+            queue (see src/errors/retry_queue.py).
     """
     if server_name not in MCP_SERVERS:
         raise ValueError(
@@ -91,30 +291,163 @@ def call_mcp(server_name: str, tool_name: str, arguments: dict = None,
         )
 
     # Enforce tool policy if role is provided
-    if role:
-        from src.config.tool_policy import is_allowed, is_local_only_server
-        from src.config.agent_config import AgentRole
-
-        agent_role = AgentRole(role)
-
-        if is_local_only_server(server_name) and agent_role == AgentRole.CLOUD:
-            raise PermissionError(
-                f"Server '{server_name}' is local-only, not available on cloud"
-            )
-
-        if not is_allowed(tool_name, agent_role):
-            raise PermissionError(
-                f"Tool '{tool_name}' is blocked for role '{role}'"
-            )
+    _check_policy(server_name, tool_name, role)
+    transport = _resolve_transport(transport, role)
 
     server_module = MCP_SERVERS[server_name]
     logger.info(f"MCP call: {server_name}.{tool_name}({arguments})")
 
-    result = _raw_call(server_module, tool_name, arguments or {}, timeout=timeout)
+    def send():
+        if transport == "session":
+            return get_session_manager().call_tool(
+                server_name, tool_name, arguments or {}, timeout=timeout
+            )
+        if transport == "in_process":
+            return parse_tool_result(_in_process_request(
+                server_name, "tools/call", {"name": tool_name, "arguments": arguments or {}}
+            ))
+        return _raw_call(server_module, tool_name, arguments or {}, timeout=timeout)
+
+    def fetch():
+        breaker = get_breaker(f"mcp:{server_name}")
+        breaker.before_call()
+        start = time.perf_counter()
+        outcome = "error"
+        failed = True
+        try:
+            result = send()
+            outcome = "success" if is_cacheable_result(result) else "tool_error"
+            failed = is_transport_failure(result)
+            return result
+        except Exception as e:
+            failed = is_transport_failure(error=e)
+            raise
+        finally:
+            MCP_LATENCY.observe(time.perf_counter() - start, server=server_name,
+                                tool=tool_name, result=outcome)
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    with tracing.span(f"mcp:{server_name}.{tool_name}", transport=transport):
+        if cache:
+            result = get_mcp_cache().call(server_name, tool_name, arguments, fetch)
+        else:
+            result = fetch()
     logger.info(f"MCP result: {server_name}.{tool_name} → {str(result)[:200]}")
     return result
 
 
+def call_mcp_batch(server_name: str, calls: list[tuple[str, dict | None]],
+                   timeout: int = 30, role: str | None = None,
+                   transport: str | None = None, cache: bool = True) -> list:
+    """Call several tools on one MCP server in a single JSON-RPC batch round trip.
+
+    Args:
+        server_name: One of "email", "odoo", "social", "whatsapp", "payment"
+        calls: [(tool_name, arguments), ...], executed by the server in order
+        timeout: Timeout in seconds for the whole batch
+        role: Agent role for policy enforcement; checked for every call
+            before anything is sent
+        transport: As for call_mcp
+        cache: SAFE results are served from / stored in the MCP result cache.
+            A batch containing any DRAFT/DANGEROUS tool bypasses the cache and
+            invalidates the server's entries.
+
+    Returns:
+        One result per call, in order. A call that fails on the server yields
+        {"error": message} rather than failing the whole batch.
+
+    Raises:
+        ValueError: If server_name or transport is unknown
+        PermissionError: If any tool is blocked by policy for this role
+        CircuitOpenError: If the server's circuit breaker is open
+        RuntimeError, TimeoutError, MCPSessionError: On transport failures,
+            which are not retried here (see call_mcp)
+    """
+    if server_name not in MCP_SERVERS:
+        raise ValueError(
+            f"Unknown MCP server: {server_name}. "
+            f"Available: {list(MCP_SERVERS.keys())}"
+        )
+
+    calls = [(tool_name, arguments or {}) for tool_name, arguments in calls]
+    for tool_name, _ in calls:
+        _check_policy(server_name, tool_name, role)
+    transport = _resolve_transport(transport, role)
+    if not calls:
+        return []
+
+    logger.info(f"MCP batch: {server_name} × {len(calls)} ({', '.join(t for t, _ in calls)})")
+
+    mcp_cache = get_mcp_cache() if cache else None
+    has_writes = any(get_classification(tool_name) != SAFE for tool_name, _ in calls)
+    results: list = [MISS] * len(calls)
+    generation = 0
+
+    if mcp_cache is not None:
+        if has_writes:
+            mcp_cache.invalidate_server(server_name)
+        else:
+            for i, (tool_name, arguments) in enumerate(calls):
+                if mcp_cache.is_cacheable_tool(tool_name):
+                    results[i] = mcp_cache.get(make_key(server_name, tool_name, arguments))
+            generation = mcp_cache.generation(server_name)
+
+    pending = [i for i, result in enumerate(results) if result is MISS]
+    requests = [
+        ("tools/call", {"name": calls[i][0], "arguments": calls[i][1]}) for i in pending
+    ]
+    breaker = get_breaker(f"mcp:{server_name}")
+    try:
+        if requests:
+            breaker.before_call()
+            try:
+                if transport == "session":
+                    responses = get_session_manager().request_batch(
+                        server_name, requests, timeout=timeout, resend=not has_writes
+                    )
+                elif transport == "in_process":
+                    responses = _in_process_batch(server_name, requests)
+                else:
+                    responses = _raw_batch(MCP_SERVERS[server_name], requests, timeout=timeout)
+            except Exception as e:
+                if is_transport_failure(error=e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                raise
+        else:
+            responses = []
+    finally:
+        if mcp_cache is not None and has_writes:
+            mcp_cache.invalidate_server(server_name)
+
+    for i, response in zip(pending, responses):
+        try:
+            results[i] = parse_tool_result(response)
+        except RuntimeError as e:
+            results[i] = {"error": str(e)}
+            continue
+        tool_name, arguments = calls[i]
+        if (mcp_cache is not None and not has_writes
+                and mcp_cache.is_cacheable_tool(tool_name)
+                and is_cacheable_result(results[i])):
+            mcp_cache.put(make_key(server_name, tool_name, arguments), results[i], generation)
+
+    if requests:
+        # As in call_mcp, only an unreachable backend counts as a failure
+        if any(is_transport_failure(results[i]) for i in pending):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    logger.info(f"MCP batch result: {server_name} × {len(calls)} "
+                f"({len(calls) - len(pending)} cached)")
+    return results
+
+
 def list_servers(role: str | None = None) -> dict[str, str]:
     """Return the registry of MCP server names to modules.
 
@@ -136,11 +469,21 @@ def list_servers(role: str | None = None) -> dict[str, str]:
     return servers
 
 
-def list_tools(server_name: str, timeout: int = 10) -> list[dict]:
+def list_tools(server_name: str, timeout: int = 10,
+               transport: str | None = None) -> list[dict]:
     """List available tools on a specific MCP server."""
     if server_name not in MCP_SERVERS:
         raise ValueError(f"Unknown MCP server: {server_name}")
 
+    transport = transport or _default_transport()
+    if transport == "in_process":
+        response = _in_process_request(server_name, "tools/list")
+        return response.get("result", {}).get("tools", [])
+    if transport == "session":
+        response = get_session_manager().request(server_name, "tools/list", timeout=timeout,
+                                                 resend=True)
+        return response.get("result", {}).get("tools", [])
+
     request = {
         "jsonrpc": "2.0",
         "method": "tools/list",
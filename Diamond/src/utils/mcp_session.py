@@ -0,0 +1,420 @@
+"""Persistent MCP server sessions — one long-lived stdio process per server.
+
+Spawning `python -m src.mcp_*` for every tool call re-imports dotenv,
+logging and the platform adapters, and reconnects to Odoo/SMTP/social APIs
+each time. MCPSession keeps a single server process open and multiplexes
+JSON-RPC requests over its stdin/stdout:
+
+- responses are matched to requests by JSON-RPC `id`
+- JSON-RPC batches are sent as one line and answered as one line
+- an `initialize` handshake health-checks the server on startup
+- a crashed server is restarted on the next call. A call is only re-sent
+  on the fresh process if it never reached the old one, or if its tool is
+  SAFE (re-sending send_email or a payment could duplicate it)
+- a server with no call in flight for longer than `idle_timeout` is recycled
+
+Usage:
+    from src.utils.mcp_session import get_session_manager
+    result = get_session_manager().call_tool("odoo", "list_invoices", {"limit": 5})
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import json
+import logging
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger("ai_employee")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class MCPSessionError(RuntimeError):
+    """Raised when a session's server process is unavailable or died mid-call.
+
+    `sent` is False when the request was never written to the server, so
+    it is safe to send again.
+    """
+
+    def __init__(self, message: str, sent: bool = True):
+        super().__init__(message)
+        self.sent = sent
+
+
+def parse_tool_result(response: dict) -> dict:
+    """Extract the tool result dict from a tools/call JSON-RPC response.
+
+    A result flagged isError always comes back as a dict with an "error"
+    key, even when the server's error text is not JSON.
+    Raises RuntimeError if the response carries a JSON-RPC error.
+    """
+    if "result" in response:
+        content = response["result"].get("content", [])
+        text = content[0].get("text", "{}") if content else "{}"
+        if response["result"].get("isError"):
+            try:
+                result = json.loads(text)
+            except ValueError:
+                result = None
+            return result if isinstance(result, dict) and "error" in result else {"error": text}
+        return json.loads(text)
+    if "error" in response:
+        raise RuntimeError(response["error"].get("message", "MCP server error"))
+    raise RuntimeError("No valid response from MCP server")
+
+
+class MCPSession:
+    """A single long-lived MCP server process speaking JSON-RPC over stdio."""
+
+    def __init__(self, server_name: str, module: str, cwd: str | Path = PROJECT_ROOT,
+                 startup_timeout: float = 15.0):
+        self.server_name = server_name
+        self.module = module
+        self.cwd = str(cwd)
+        self.startup_timeout = startup_timeout
+        self._proc: subprocess.Popen | None = None
+        self._ids = itertools.count(1)
+        self._pending: dict[int, dict] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stderr_tail: deque[str] = deque(maxlen=20)
+        self.started_at: float = 0.0
+        self.last_used: float = 0.0
+        self.in_flight = 0
+        self.calls = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    @property
+    def busy(self) -> bool:
+        return self.in_flight > 0
+
+    @property
+    def pid(self) -> int | None:
+        return self._proc.pid if self._proc else None
+
+    def start(self) -> None:
+        """Spawn the server process and run the initialize health check."""
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", self.module],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=self.cwd,
+        )
+        threading.Thread(target=self._read_stdout, args=(self._proc,),
+                         name=f"mcp-{self.server_name}-out", daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(self._proc,),
+                         name=f"mcp-{self.server_name}-err", daemon=True).start()
+
+        self.started_at = time.time()
+        self.last_used = self.started_at
+        try:
+            response = self.request("initialize", {}, timeout=self.startup_timeout)
+        except (MCPSessionError, TimeoutError) as e:
+            self.close()
+            raise MCPSessionError(f"{self.server_name} failed initialize: {e}") from e
+        if "result" not in response:
+            self.close()
+            raise MCPSessionError(f"{self.server_name} rejected initialize: {response}")
+        logger.info(f"MCP session started: {self.server_name} (pid={self.pid})")
+
+    def _read_stdout(self, proc: subprocess.Popen) -> None:
+        """Reader thread: dispatch each response line to its waiting caller."""
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"[MCP {self.server_name}] non-JSON output: {line[:200]}")
+                continue
+            if isinstance(response, list):
+                for item in response:
+                    self._deliver(item)
+            else:
+                self._deliver(response)
+
+        # EOF — the server exited; fail everything still waiting
+        with self._pending_lock:
+            waiters = list(self._pending.values())
+            self._pending.clear()
+        for waiter in waiters:
+            waiter["error"] = MCPSessionError(
+                f"{self.server_name} exited: {' | '.join(self._stderr_tail)[-500:]}"
+            )
+            waiter["event"].set()
+
+    def _deliver(self, response: dict) -> None:
+        with self._pending_lock:
+            waiter = self._pending.pop(response.get("id"), None)
+        if waiter is None:
+            logger.warning(f"[MCP {self.server_name}] unmatched response id={response.get('id')}")
+            return
+        waiter["response"] = response
+        waiter["event"].set()
+
+    def _read_stderr(self, proc: subprocess.Popen) -> None:
+        for line in proc.stderr:
+            self._stderr_tail.append(line.rstrip())
+
+    def request(self, method: str, params: dict | None = None,
+                timeout: float = 30) -> dict:
+        """Send a JSON-RPC request and wait for the response with the same id."""
+        return self._exchange([(method, params)], timeout, batch=False)[0]
+
+    def request_batch(self, requests: list[tuple[str, dict | None]],
+                      timeout: float = 30) -> list[dict]:
+        """Send several (method, params) requests as one JSON-RPC batch.
+
+        Returns the responses in request order. The timeout covers the whole batch.
+        """
+        return self._exchange(requests, timeout, batch=True)
+
+    def _exchange(self, requests: list[tuple[str, dict | None]], timeout: float,
+                  batch: bool) -> list[dict]:
+        """Write one line (a request object or a batch array) and await every reply."""
+        if not self.alive:
+            raise MCPSessionError(f"{self.server_name} server is not running", sent=False)
+
+        messages, waiters = [], []
+        with self._pending_lock:
+            self.in_flight += 1
+            self.last_used = time.time()
+            for method, params in requests:
+                req_id = next(self._ids)
+                waiter = {"event": threading.Event(), "response": None, "error": None}
+                self._pending[req_id] = waiter
+                waiters.append((req_id, waiter))
+                message = {"jsonrpc": "2.0", "method": method, "id": req_id}
+                if params is not None:
+                    message["params"] = params
+                messages.append(message)
+
+        try:
+            return self._send_and_wait(messages, waiters, timeout, batch)
+        finally:
+            with self._pending_lock:
+                self.in_flight -= 1
+                self.last_used = time.time()
+
+    def _send_and_wait(self, messages: list[dict], waiters: list[tuple[int, dict]],
+                       timeout: float, batch: bool) -> list[dict]:
+        def forget():
+            with self._pending_lock:
+                for req_id, _ in waiters:
+                    self._pending.pop(req_id, None)
+
+        payload = messages if batch else messages[0]
+        try:
+            with self._write_lock:
+                self._proc.stdin.write(json.dumps(payload) + "\n")
+                self._proc.stdin.flush()
+        except (OSError, ValueError, AttributeError) as e:
+            forget()
+            raise MCPSessionError(f"{self.server_name} write failed: {e}", sent=False) from e
+
+        deadline = time.monotonic() + timeout
+        for _, waiter in waiters:
+            if not waiter["event"].wait(max(0.0, deadline - time.monotonic())):
+                forget()
+                label = f"batch of {len(messages)}" if batch else messages[0]["method"]
+                raise TimeoutError(f"{self.server_name}.{label} timed out after {timeout}s")
+
+        self.calls += len(waiters)
+        for _, waiter in waiters:
+            if waiter["error"] is not None:
+                raise waiter["error"]
+        return [waiter["response"] for _, waiter in waiters]
+
+    def call_tool(self, tool_name: str, arguments: dict | None = None,
+                  timeout: float = 30) -> dict:
+        """Invoke tools/call and return the parsed tool result."""
+        response = self.request(
+            "tools/call", {"name": tool_name, "arguments": arguments or {}}, timeout=timeout
+        )
+        return parse_tool_result(response)
+
+    def close(self) -> None:
+        """Close stdin so the server exits, killing it if it does not."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def get_stats(self) -> dict:
+        return {
+            "server": self.server_name,
+            "pid": self.pid,
+            "alive": self.alive,
+            "calls": self.calls,
+            "uptime_s": round(time.time() - self.started_at, 1) if self.alive else 0,
+            "idle_s": round(time.time() - self.last_used, 1) if self.alive else 0,
+        }
+
+
+class MCPSessionManager:
+    """Keeps one MCPSession per registered server, restarting and recycling them."""
+
+    def __init__(self, servers: dict[str, str] | None = None, idle_timeout: float = 300):
+        if servers is None:
+            from src.utils.mcp_registry import MCP_SERVERS
+            servers = MCP_SERVERS
+        self.servers = dict(servers)
+        self.idle_timeout = idle_timeout
+        self._sessions: dict[str, MCPSession] = {}
+        self._lock = threading.Lock()
+        self._start_locks: dict[str, threading.Lock] = {}
+        self._restarts = 0
+        self._recycled = 0
+
+    def _reap_idle_locked(self, now: float) -> None:
+        for name, session in list(self._sessions.items()):
+            if session.busy:
+                continue  # a long call is still running on it
+            if self.idle_timeout and now - session.last_used > self.idle_timeout:
+                logger.info(f"MCP session recycled after idle: {name}")
+                session.close()
+                del self._sessions[name]
+                self._recycled += 1
+
+    def get(self, server_name: str) -> MCPSession:
+        """Return a live session for the server, starting or restarting as needed."""
+        if server_name not in self.servers:
+            raise ValueError(f"Unknown MCP server: {server_name}")
+
+        with self._lock:
+            self._reap_idle_locked(time.time())
+            session = self._sessions.get(server_name)
+            if session is not None and session.alive:
+                return session
+            start_lock = self._start_locks.setdefault(server_name, threading.Lock())
+
+        # Start outside the manager lock, so a slow server start does not hold
+        # up calls to other servers; start_lock allows one start per server
+        with start_lock:
+            with self._lock:
+                session = self._sessions.get(server_name)
+                if session is not None and session.alive:
+                    return session  # another worker started it meanwhile
+                dead = self._sessions.pop(server_name, None)
+                if dead is not None:
+                    self._restarts += 1
+            if dead is not None:
+                logger.warning(f"MCP session for {server_name} died — restarting")
+                dead.close()
+            session = MCPSession(server_name, self.servers[server_name])
+            session.start()
+            with self._lock:
+                self._sessions[server_name] = session
+            return session
+
+    def _discard(self, server_name: str, session: MCPSession) -> None:
+        """Close a failed session, unregistering it only if it is still the current one.
+
+        Another worker may already have replaced it with a fresh session,
+        which must not be closed.
+        """
+        with self._lock:
+            if self._sessions.get(server_name) is session:
+                del self._sessions[server_name]
+        session.close()
+
+    def request(self, server_name: str, method: str, params: dict | None = None,
+                timeout: float = 30, resend: bool = False) -> dict:
+        """Send a raw JSON-RPC request, retrying once on a fresh process if it crashed.
+
+        The retry only happens if the request never reached the old process,
+        or if `resend` says it is safe to run twice.
+        """
+        session = self.get(server_name)
+        try:
+            return session.request(method, params, timeout=timeout)
+        except MCPSessionError as e:
+            self._discard(server_name, session)
+            if e.sent and not resend:
+                raise
+            return self.get(server_name).request(method, params, timeout=timeout)
+
+    def request_batch(self, server_name: str, requests: list[tuple[str, dict | None]],
+                      timeout: float = 30, resend: bool = False) -> list[dict]:
+        """Send a JSON-RPC batch, retrying once on a fresh process as request() does."""
+        session = self.get(server_name)
+        try:
+            return session.request_batch(requests, timeout=timeout)
+        except MCPSessionError as e:
+            self._discard(server_name, session)
+            if e.sent and not resend:
+                raise
+            return self.get(server_name).request_batch(requests, timeout=timeout)
+
+    def call_tool(self, server_name: str, tool_name: str, arguments: dict | None = None,
+                  timeout: float = 30) -> dict:
+        """Call a tool on a pooled server and return the parsed result."""
+        from src.config.tool_policy import SAFE, get_classification
+
+        response = self.request(
+            server_name, "tools/call",
+            {"name": tool_name, "arguments": arguments or {}}, timeout=timeout,
+            resend=get_classification(tool_name) == SAFE,
+        )
+        return parse_tool_result(response)
+
+    def close(self, server_name: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(server_name, None)
+        if session is not None:
+            session.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": {n: s.get_stats() for n, s in self._sessions.items()},
+                "restarts": self._restarts,
+                "recycled": self._recycled,
+                "idle_timeout": self.idle_timeout,
+            }
+
+
+_manager: MCPSessionManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> MCPSessionManager:
+    """Return the process-wide session manager (created on first use)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            from src.config.agent_config import AgentConfig
+
+            idle_timeout = AgentConfig._load_config().get("mcp", {}).get("idle_timeout", 300)
+            _manager = MCPSessionManager(idle_timeout=idle_timeout)
+            atexit.register(_manager.close_all)
+        return _manager
@@ -0,0 +1,335 @@
+"""In-process metrics registry served in Prometheus text exposition format.
+
+/api/metrics returns snapshot JSON. A scraper needs monotonic counters and
+latency histograms instead, so this module keeps a small registry with no
+external dependency:
+
+- Counter: monotonically increasing, e.g. tasks by type and outcome
+- Gauge: set to the current value, e.g. bus queue depth per agent
+- Histogram: fixed cumulative buckets plus _sum and _count, e.g. Claude CLI
+  latency per skill
+
+Label values are passed as keyword arguments (`TASKS.inc(type="email",
+outcome="success")`). Collectors registered with
+`register_collector` refresh gauges that are cheaper to read at scrape time
+than to maintain, such as folder depths.
+
+`render()` produces exposition format 0.0.4. It is served at /metrics by
+APIServer (Flask) or by `start_http_server` (stdlib, for processes without
+Flask, e.g. `python -m src.orchestrator.orchestrator --metrics-port 9108`).
+
+Usage:
+    from src.utils.metrics import CLAUDE_LATENCY, render
+    with CLAUDE_LATENCY.time(skill="create_plan", result="success"):
+        ...
+    print(render())
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+
+logger = logging.getLogger("ai_employee")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...],
+                   extra: tuple[str, str] | None = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    TYPE = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[n]) for n in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}") from e
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.TYPE}"]
+
+
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    TYPE = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items
+        ]
+
+
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # per-bucket (non-cumulative) counts, +Inf last, then sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            counts = state[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the wall time of the with-block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return sum(state[0]) if state else 0
+
+    def sum(self, **labels) -> float:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[1] if state else 0.0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1])) for k, v in self._values.items())
+        lines = self._header()
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                le = ("le", _format_value(bound) if math.isinf(bound) else repr(float(bound)))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} "
+                             f"{cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics plus scrape-time collectors."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help: str, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, tuple(labelnames), **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as {metric.TYPE} "
+                                 f"with labels {metric.labelnames}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        return self._metrics.get(name)
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """Run collector before every render (e.g. to refresh gauges)."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception as e:
+                logger.debug(f"Metrics collector {collector!r} failed: {e}")
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset every metric's values (registrations are kept)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    return REGISTRY
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+# -- AI Employee metrics ---------------------------------------------------------
+
+TASKS = REGISTRY.counter(
+    "ai_employee_tasks_total", "Tasks processed by type and outcome", ("type", "outcome"))
+CLAUDE_LATENCY = REGISTRY.histogram(
+    "ai_employee_claude_call_seconds", "Claude CLI call latency by skill and result",
+    ("skill", "result"))
+MCP_LATENCY = REGISTRY.histogram(
+    "ai_employee_mcp_call_seconds", "MCP tool call latency (cache misses) by server, tool and result",
+    ("server", "tool", "result"))
+DELEGATION_LATENCY = REGISTRY.histogram(
+    "ai_employee_delegation_seconds", "Swarm delegation latency by agent type and outcome",
+    ("agent_type", "outcome"))
+BUS_QUEUE_DEPTH = REGISTRY.gauge(
+    "ai_employee_bus_queue_depth", "Messages waiting in the A2A bus per agent", ("agent",))
+BUS_MESSAGES = REGISTRY.counter(
+    "ai_employee_bus_messages_total", "A2A bus messages by event (published, consumed, acked, nacked, expired, dropped)",
+    ("event",))
+FOLDER_DEPTH = REGISTRY.gauge(
+    "ai_employee_folder_depth", "Task files in each vault folder", ("folder",))
+RETRIES = REGISTRY.counter(
+    "ai_employee_retries_total", "Retry attempts by function", ("function",))
+RETRIES_EXHAUSTED = REGISTRY.counter(
+    "ai_employee_retries_exhausted_total", "Calls that failed after every retry", ("function",))
+CIRCUIT_STATE = REGISTRY.gauge(
+    "ai_employee_circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+    ("breaker",))
+
+
+def _collect_folder_depths() -> None:
+    from src.utils.task_catalog import TASK_FOLDERS, get_catalog
+
+    catalog = get_catalog()
+    for folder in TASK_FOLDERS:
+        if (catalog.root / folder).is_dir():
+            FOLDER_DEPTH.set(catalog.count(folder), folder=folder)
+
+
+REGISTRY.register_collector(_collect_folder_depths)
+
+
+# -- stdlib HTTP endpoint --------------------------------------------------------
+
+def start_http_server(port: int, host: str = "127.0.0.1",
+                      registry: MetricsRegistry | None = None) -> ThreadingHTTPServer:
+    """Serve GET /metrics on a daemon thread. Port 0 picks a free port."""
+    registry = registry or REGISTRY
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Metrics served at http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,287 @@
+"""Sampling profiler for the long-running daemons (orchestrator, watchers, scheduler).
+
+Under PM2 these processes run for days. When one of them starts burning
+CPU, restarting it under a profiler loses the state that caused it, so the
+profiler is built in:
+
+- StackSampler: a daemon thread that snapshots every thread's Python stack
+  (sys._current_frames) every `interval` seconds and counts identical
+  stacks. It samples wall-clock time: a thread blocked in sleep or a
+  subprocess shows up where it waits. Overhead at the default 100 Hz is a
+  few percent of one core, and nothing is paid while it is off.
+- output goes to Logs/profiles/<name>_<timestamp>.collapsed (Brendan Gregg
+  collapsed stacks, "thread;frame;frame count", for flamegraph.pl) and
+  .speedscope.json (open at https://www.speedscope.app).
+- `--profile` samples from start-up until exit. SIGUSR2 toggles sampling
+  in a running process: the first signal starts it, the second writes the
+  files (`kill -USR2 <pid>`, `pm2 sendSignal SIGUSR2 orchestrator`).
+- `--profile-polls N` runs the next N poll cycles under cProfile and dumps
+  Logs/profiles/<name>_poll_<timestamp>.pstats (view with `python -m
+  pstats` or snakeviz). cProfile only sees the thread that runs it, so
+  while a poll is profiled the target's TaskPool (`target.pool`, the
+  orchestrators) runs its tasks inline on the polling thread, one at a
+  time. Use the sampler to see the pool running concurrently.
+
+Usage:
+    profiler.add_arguments(parser)
+    args = parser.parse_args()
+    profiling = profiler.setup("orchestrator", args, target=orchestrator)
+    try:
+        orchestrator.run()
+    finally:
+        profiling.close()
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable
+
+logger = logging.getLogger("ai_employee")
+
+PROFILES_DIR = "profiles"
+DEFAULT_INTERVAL = 0.01
+
+
+def profiles_dir() -> Path:
+    from src.utils.file_ops import get_project_root
+    return get_project_root() / "Logs" / PROFILES_DIR
+
+
+def _frame_label(code: CodeType) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Counts sampled Python stacks of every thread in the process."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        # (thread name, (code, ...) root first) → samples
+        self._counts: Counter = Counter()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.samples = 0
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "StackSampler":
+        if self.running:
+            return self
+        self._stop.clear()
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+        self.stopped_at = time.time()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        names: dict[int, str] = {}
+        names_at = 0.0
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            if now - names_at > 1.0:
+                names = {t.ident: t.name for t in threading.enumerate()}
+                names_at = now
+            frames = sys._current_frames()
+            with self._lock:
+                for tid, frame in frames.items():
+                    if tid == me:
+                        continue
+                    stack = []
+                    while frame is not None:
+                        stack.append(frame.f_code)
+                        frame = frame.f_back
+                    stack.reverse()
+                    self._counts[(names.get(tid, f"thread-{tid}"), tuple(stack))] += 1
+                self.samples += 1
+
+    def stacks(self) -> dict[tuple[str, tuple[CodeType, ...]], int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def collapsed(self) -> list[str]:
+        """Lines of "thread;outer;...;leaf count", heaviest first."""
+        lines = []
+        for (thread, stack), n in sorted(self.stacks().items(), key=lambda kv: -kv[1]):
+            frames = ";".join(_frame_label(c).replace(";", ":") for c in stack)
+            lines.append(f"{thread};{frames} {n}" if frames else f"{thread} {n}")
+        return lines
+
+    def speedscope(self, name: str) -> dict:
+        """Speedscope file-format document with one sampled profile per thread."""
+        frames: list[dict] = []
+        index: dict[CodeType, int] = {}
+        profiles: dict[str, dict] = {}
+        for (thread, stack), n in self.stacks().items():
+            ids = []
+            for code in stack:
+                i = index.get(code)
+                if i is None:
+                    i = index[code] = len(frames)
+                    frames.append({"name": code.co_name, "file": code.co_filename,
+                                   "line": code.co_firstlineno})
+                ids.append(i)
+            profile = profiles.setdefault(thread, {
+                "type": "sampled", "name": thread, "unit": "seconds",
+                "startValue": 0, "endValue": 0, "samples": [], "weights": [],
+            })
+            profile["samples"].append(ids)
+            profile["weights"].append(n * self.interval)
+            profile["endValue"] += n * self.interval
+        ordered = sorted(profiles.values(), key=lambda p: -p["endValue"])
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "ai-employee profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": ordered,
+        }
+
+    def write(self, name: str, folder: Path | None = None) -> list[Path]:
+        """Write <name>_<timestamp>.collapsed and .speedscope.json; returns the paths."""
+        folder = folder or profiles_dir()
+        folder.mkdir(parents=True, exist_ok=True)
+        stem = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        collapsed = folder / f"{stem}.collapsed"
+        collapsed.write_text("\n".join(self.collapsed()) + "\n", encoding="utf-8")
+        speedscope = folder / f"{stem}.speedscope.json"
+        speedscope.write_text(json.dumps(self.speedscope(stem)), encoding="utf-8")
+        return [collapsed, speedscope]
+
+
+class ProfilerControl:
+    """Sampler on/off (flag or signal) plus per-poll cProfile for one process."""
+
+    def __init__(self, name: str, interval: float = DEFAULT_INTERVAL,
+                 folder: Path | None = None):
+        self.name = name
+        self.interval = interval
+        self.folder = folder
+        self.sampler: StackSampler | None = None
+        self.written: list[Path] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.sampler is None or not self.sampler.running:
+                self.sampler = StackSampler(self.interval).start()
+                logger.info(f"[Profiler] {self.name}: sampling every {self.interval * 1000:.0f}ms")
+
+    def stop(self) -> list[Path]:
+        """Stop sampling and write the output files (nothing if not sampling)."""
+        with self._lock:
+            sampler, self.sampler = self.sampler, None
+        if sampler is None or not sampler.running:
+            return []
+        sampler.stop()
+        paths = sampler.write(self.name, self.folder)
+        self.written.extend(paths)
+        logger.info(f"[Profiler] {self.name}: {sampler.samples} samples → {paths[0].parent}")
+        return paths
+
+    def toggle(self) -> None:
+        if self.sampler is not None and self.sampler.running:
+            self.stop()
+        else:
+            self.start()
+
+    def install_signal(self, signum: int | None = None) -> bool:
+        """Toggle sampling on SIGUSR2 (or signum). False where unsupported."""
+        signum = signum if signum is not None else getattr(signal, "SIGUSR2", None)
+        if signum is None or threading.current_thread() is not threading.main_thread():
+            return False
+
+        def handler(_signum, _frame):
+            # Stopping joins the sampler and writes files: do it off the main thread
+            threading.Thread(target=self.toggle, name="profiler-toggle", daemon=True).start()
+
+        signal.signal(signum, handler)
+        return True
+
+    def wrap_poll(self, func: Callable, polls: int, pool: Any = None) -> Callable:
+        """Run the next `polls` calls of func under cProfile, one .pstats file each.
+
+        A TaskPool passed as `pool` runs inline during those calls, so its
+        tasks are in the profile.
+        """
+        remaining = polls
+        lock = threading.Lock()
+
+        def profiled(*args: Any, **kwargs: Any):
+            nonlocal remaining
+            with lock:
+                if remaining <= 0:
+                    return func(*args, **kwargs)
+                remaining -= 1
+            prof = cProfile.Profile()
+            if pool is not None:
+                pool.inline = True
+            try:
+                return prof.runcall(func, *args, **kwargs)
+            finally:
+                if pool is not None:
+                    pool.inline = False
+                folder = self.folder or profiles_dir()
+                folder.mkdir(parents=True, exist_ok=True)
+                path = folder / f"{self.name}_poll_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.pstats"
+                prof.dump_stats(path)
+                self.written.append(path)
+                logger.info(f"[Profiler] {self.name}: poll profile → {path}")
+
+        profiled.__wrapped__ = func
+        return profiled
+
+    def close(self) -> list[Path]:
+        return self.stop()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true",
+                       help="Sample stacks from start-up; write Logs/profiles/ on exit "
+                            "(SIGUSR2 toggles sampling at any time)")
+    group.add_argument("--profile-interval", type=float, default=DEFAULT_INTERVAL * 1000,
+                       metavar="MS", help="Sampling interval in milliseconds (default 10)")
+    group.add_argument("--profile-polls", type=int, default=0, metavar="N",
+                       help="Run the next N poll cycles under cProfile (.pstats per poll)")
+
+
+def setup(name: str, args: argparse.Namespace | None = None, target: Any = None,
+          poll_method: str = "poll_once") -> ProfilerControl:
+    """Install the SIGUSR2 toggle and apply --profile / --profile-polls."""
+    interval = getattr(args, "profile_interval", DEFAULT_INTERVAL * 1000) / 1000
+    control = ProfilerControl(name, interval=interval)
+    control.install_signal()
+    if getattr(args, "profile", False):
+        control.start()
+    polls = getattr(args, "profile_polls", 0)
+    if polls and target is not None:
+        setattr(target, poll_method, control.wrap_poll(getattr(target, poll_method), polls,
+                                                       pool=getattr(target, "pool", None)))
+    return control
@@ -1,5 +1,9 @@
 """Exponential backoff retry decorator for resilient MCP and API calls.
 
+with_retry sleeps in the calling thread, so it suits short in-call retries.
+Task-level retries that should not hold a worker go through the delayed
+retry queue (src/errors/retry_queue.py), which shares backoff_delay().
+
 Usage:
     @with_retry(max_attempts=3, backoff_factor=2)
     def call_external_api():
@@ -8,8 +12,11 @@ Usage:
 
 import functools
 import logging
+import random
 import time
 
+from src.utils.metrics import RETRIES, RETRIES_EXHAUSTED
+
 logger = logging.getLogger("ai_employee")
 
 
@@ -25,13 +32,35 @@ class RetryExhausted(Exception):
         )
 
 
-def with_retry(max_attempts: int = 3, backoff_factor: float = 2.0, base_delay: float = 1.0):
+def backoff_delay(attempt: int, base_delay: float = 1.0, backoff_factor: float = 2.0,
+                  max_delay: float | None = None, jitter: float = 0.0) -> float:
+    """Delay before retry number `attempt` (1-based): base_delay * factor^(attempt-1).
+
+    The delay is capped at max_delay, then up to `jitter` (0..1) of it is
+    randomly taken off so failures that happened together do not all retry
+    at the same instant.
+    """
+    delay = base_delay * (backoff_factor ** max(0, attempt - 1))
+    if max_delay is not None:
+        delay = min(delay, max_delay)
+    if jitter:
+        delay *= 1 - min(1.0, jitter) * random.random()
+    return delay
+
+
+def with_retry(max_attempts: int = 3, backoff_factor: float = 2.0, base_delay: float = 1.0,
+               max_delay: float | None = None, jitter: float = 0.0,
+               give_up_on: tuple[type[BaseException], ...] = ()):
     """Decorator that retries a function with exponential backoff.
 
     Args:
         max_attempts: Maximum number of attempts (including first try).
         backoff_factor: Multiplier for delay between retries (1s, 2s, 4s...).
         base_delay: Initial delay in seconds before first retry.
+        max_delay: Upper bound on a single delay (None = unbounded).
+        jitter: Fraction (0..1) of each delay randomly taken off.
+        give_up_on: Exception types re-raised at once, without retrying or
+            wrapping in RetryExhausted (e.g. CircuitOpenError).
     """
 
     def decorator(func):
@@ -41,15 +70,19 @@ def with_retry(max_attempts: int = 3, backoff_factor: float = 2.0, base_delay: f
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
+                except give_up_on:
+                    raise
                 except Exception as e:
                     last_error = e
                     if attempt == max_attempts:
+                        RETRIES_EXHAUSTED.inc(function=func.__name__)
                         logger.error(
                             f"[Retry] {func.__name__} failed after {max_attempts} attempts: {e}"
                         )
                         raise RetryExhausted(func.__name__, max_attempts, e) from e
 
-                    delay = base_delay * (backoff_factor ** (attempt - 1))
+                    delay = backoff_delay(attempt, base_delay, backoff_factor, max_delay, jitter)
+                    RETRIES.inc(function=func.__name__)
                     logger.warning(
                         f"[Retry] {func.__name__} attempt {attempt}/{max_attempts} "
                         f"failed ({e}), retrying in {delay:.1f}s..."
@@ -0,0 +1,344 @@
+"""SQLite catalog of task files — indexed answers to folder and status queries.
+
+The auditor, scheduler and API repeatedly ask "how many tasks finished this
+week, of which type", "what has been stuck for more than 48h" and "how many
+files are in each folder". Answering those by parsing every file's
+frontmatter is O(files). TaskCatalog keeps one row per task file in
+<project root>/.task_catalog.db (WAL mode, so readers never block the writer
+and several processes can share it):
+
+    path, folder, name, prefix, type, priority, status, created, moved_at,
+    mtime_ns, size
+
+Rows are kept current two ways:
+- our writers report changes as they happen — frontmatter.write_file
+  (and so create_task_file) through note_written(), file_ops.safe_move and
+  ClaimManager.claim/unclaim through note_moved()
+- before a query, a folder is reconciled against its FolderIndex: only when
+  the index changed, and only files whose (mtime_ns, size) differ from the
+  row are parsed. This picks up files dropped in by hand or by git sync.
+
+Only the task folders (TASK_FOLDERS, including In_Progress/<agent>/) are
+catalogued. `python -m src.utils.task_catalog rebuild` recreates the catalog
+from disk.
+
+Usage:
+    from src.utils.task_catalog import get_catalog
+    get_catalog().count("Done", created_since="2026-10-10")
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.utils import folder_index
+
+logger = logging.getLogger("ai_employee")
+
+CATALOG_FILENAME = ".task_catalog.db"
+
+TASK_FOLDERS = (
+    "Inbox", "Needs_Action", "In_Progress", "Pending_Approval",
+    "Approved", "Rejected", "Done", "Errors",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    path      TEXT PRIMARY KEY,
+    folder    TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    prefix    TEXT NOT NULL,
+    type      TEXT,
+    priority  TEXT,
+    status    TEXT,
+    created   TEXT,
+    moved_at  REAL,
+    mtime_ns  INTEGER,
+    size      INTEGER
+);
+CREATE INDEX IF NOT EXISTS tasks_folder_prefix ON tasks (folder, prefix);
+CREATE INDEX IF NOT EXISTS tasks_folder_created ON tasks (folder, created);
+CREATE INDEX IF NOT EXISTS tasks_folder_status ON tasks (folder, status);
+"""
+
+_COLUMNS = ("path", "folder", "name", "prefix", "type", "priority", "status",
+            "created", "moved_at", "mtime_ns", "size")
+
+_UPSERT = f"""
+INSERT INTO tasks ({", ".join(_COLUMNS)}) VALUES ({", ".join("?" * len(_COLUMNS))})
+ON CONFLICT (path) DO UPDATE SET
+    type = excluded.type, priority = excluded.priority, status = excluded.status,
+    created = excluded.created, mtime_ns = excluded.mtime_ns, size = excluded.size
+"""
+
+
+def _text(value: Any) -> str | None:
+    """Frontmatter value as stored: strings only (matches the old isinstance checks)."""
+    return value if isinstance(value, str) else None
+
+
+class TaskCatalog:
+    """One project root's task catalog."""
+
+    def __init__(self, root: str | Path, db_path: str | Path | None = None):
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path else self.root / CATALOG_FILENAME
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._synced: dict[str, int] = {}  # folder → FolderIndex.version last reconciled
+        self.syncs = 0
+        self.parsed = 0
+
+    # -- path helpers ----------------------------------------------------------
+
+    def relative(self, path: str | Path) -> str | None:
+        """Catalog key for a path, or None if it is not a task file under root."""
+        path = Path(path)
+        if path.suffix != ".md":
+            return None
+        try:
+            rel = Path(os.path.abspath(path)).relative_to(os.path.abspath(self.root))
+        except ValueError:
+            return None
+        if len(rel.parts) < 2 or rel.parts[0] not in TASK_FOLDERS:
+            return None
+        return rel.as_posix()
+
+    def _row(self, rel: str, metadata: dict, st: os.stat_result, moved_at: float) -> tuple:
+        folder, _, name = rel.rpartition("/")
+        return (
+            rel, folder, name, folder_index.task_prefix(name),
+            _text(metadata.get("type")), _text(metadata.get("priority")),
+            _text(metadata.get("status")), _text(metadata.get("created")),
+            moved_at, st.st_mtime_ns, st.st_size,
+        )
+
+    # -- writer hooks ----------------------------------------------------------
+
+    def note_written(self, path: str | Path, metadata: dict | None = None) -> None:
+        """Record a task file that was just written (metadata avoids a re-parse)."""
+        rel = self.relative(path)
+        if rel is None:
+            return
+        path = Path(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._delete(rel)
+            return
+        if metadata is None:
+            from src.utils import frontmatter
+            metadata, _ = frontmatter.read_file(path)
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, self._row(rel, metadata, st, time.time()))
+
+    def note_moved(self, src: str | Path, dest: str | Path) -> None:
+        """Record a move/rename; the row keeps its metadata and gets a new moved_at."""
+        src_rel, dest_rel = self.relative(src), self.relative(dest)
+        if dest_rel is None:
+            if src_rel is not None:
+                self._delete(src_rel)
+            return
+        folder, _, name = dest_rel.rpartition("/")
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE path = ?", (dest_rel,))
+            moved = 0
+            if src_rel is not None:
+                moved = self._conn.execute(
+                    "UPDATE tasks SET path = ?, folder = ?, name = ?, prefix = ?, moved_at = ? "
+                    "WHERE path = ?",
+                    (dest_rel, folder, name, folder_index.task_prefix(name), time.time(), src_rel),
+                ).rowcount
+        if not moved:
+            self.note_written(dest)
+
+    def _delete(self, rel: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE path = ?", (rel,))
+
+    # -- reconciliation --------------------------------------------------------
+
+    def sync(self, folder: str, force: bool = False) -> None:
+        """Bring one folder's rows in line with the files on disk."""
+        from src.utils import frontmatter
+
+        path = self.root / folder
+        if not path.is_dir():
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM tasks WHERE folder = ?", (folder,))
+            self._synced.pop(folder, None)
+            return
+
+        index = folder_index.get_index_for_path(path)
+        index.refresh()
+        version = index.version
+        with self._lock:
+            if not force and self._synced.get(folder) == version:
+                return
+            entries = index.entries()
+            rows = {
+                name: (mtime_ns, size)
+                for name, mtime_ns, size in self._conn.execute(
+                    "SELECT name, mtime_ns, size FROM tasks WHERE folder = ?", (folder,)
+                )
+            }
+            upserts = []
+            for entry in entries:
+                if rows.pop(entry.name, None) == (entry.mtime_ns, entry.size):
+                    continue
+                try:
+                    st = entry.path.stat()
+                except FileNotFoundError:
+                    continue
+                metadata, _ = frontmatter.read_file(entry.path)
+                upserts.append(self._row(f"{folder}/{entry.name}", metadata, st, st.st_mtime))
+            with self._conn:
+                self._conn.executemany(_UPSERT, upserts)
+                self._conn.executemany(
+                    "DELETE FROM tasks WHERE path = ?", [(f"{folder}/{n}",) for n in rows]
+                )
+            self._synced[folder] = version
+            self.syncs += 1
+            self.parsed += len(upserts)
+
+    def folders(self) -> list[str]:
+        """Every task folder on disk, with In_Progress/<agent> subfolders."""
+        result = list(TASK_FOLDERS)
+        in_progress = self.root / "In_Progress"
+        if in_progress.is_dir():
+            result += sorted(
+                f"In_Progress/{d.name}" for d in in_progress.iterdir()
+                if d.is_dir() and not d.name.startswith(".")
+            )
+        return result
+
+    def rebuild(self) -> int:
+        """Drop every row and re-catalog all task folders from disk."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM tasks")
+            self._synced.clear()
+            for folder in self.folders():
+                self.sync(folder, force=True)
+            return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    # -- queries ---------------------------------------------------------------
+
+    def count(self, folder: str, prefix: str | None = None,
+              created_since: str | None = None) -> int:
+        """Number of tasks in a folder, optionally by prefix and/or created >= a date."""
+        self.sync(folder)
+        sql, params = "SELECT COUNT(*) FROM tasks WHERE folder = ?", [folder]
+        if prefix is not None:
+            sql += " AND prefix = ?"
+            params.append(prefix)
+        if created_since is not None:
+            sql += " AND created >= ?"
+            params.append(created_since)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def count_by_prefix(self, folder: str) -> dict[str, int]:
+        self.sync(folder)
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT prefix, COUNT(*) FROM tasks WHERE folder = ? GROUP BY prefix", (folder,)
+            ))
+
+    def find(self, folder: str, created_before: str | None = None,
+             status: str | None = None) -> list[dict]:
+        """Rows in a folder (oldest mtime first), filtered by created < date and/or status.
+
+        A task without a (string) created date counts as older than any date,
+        as the old frontmatter scan compared "" < date.
+        """
+        self.sync(folder)
+        sql, params = f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE folder = ?", [folder]
+        if created_before is not None:
+            sql += " AND (created < ? OR created IS NULL)"
+            params.append(created_before)
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(status)
+        sql += " ORDER BY mtime_ns, name"
+        with self._lock:
+            return [dict(zip(_COLUMNS, row)) for row in self._conn.execute(sql, params)]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return {"path": str(self.db_path), "rows": rows, "syncs": self.syncs,
+                "parsed": self.parsed}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_catalogs: dict[Path, TaskCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(root: str | Path | None = None) -> TaskCatalog:
+    """Return the shared catalog for a project root (default: the current one)."""
+    if root is None:
+        from src.utils.file_ops import get_project_root
+        root = get_project_root()
+    root = Path(root)
+    with _catalogs_lock:
+        catalog = _catalogs.get(root)
+        if catalog is None:
+            catalog = _catalogs[root] = TaskCatalog(root)
+        return catalog
+
+
+def _hook(method: str, *args) -> None:
+    # Catalog upkeep must never fail the file operation it follows; a missed
+    # update is repaired by the next sync of that folder.
+    try:
+        getattr(get_catalog(), method)(*args)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Task catalog {method} failed: {e}")
+
+
+def note_written(path: str | Path, metadata: dict | None = None) -> None:
+    """Tell the current project's catalog that a task file was written."""
+    if Path(path).suffix == ".md":
+        _hook("note_written", path, metadata)
+
+
+def note_moved(src: str | Path, dest: str | Path) -> None:
+    """Tell the current project's catalog that a task file was moved."""
+    if Path(dest).suffix == ".md":
+        _hook("note_moved", src, dest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task catalog maintenance")
+    parser.add_argument("command", choices=["rebuild", "stats"])
+    args = parser.parse_args()
+
+    catalog = get_catalog()
+    if args.command == "rebuild":
+        start = time.perf_counter()
+        rows = catalog.rebuild()
+        print(f"Catalogued {rows} task files in {time.perf_counter() - start:.2f}s "
+              f"→ {catalog.db_path}")
+    else:
+        print(catalog.get_stats())
+        for folder in catalog.folders():
+            print(f"  {folder:<28} {catalog.count(folder):8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""Lightweight span tracing through the task pipeline.
+
+A task's audit record has one duration_ms for the whole pipeline. Tracing
+breaks it into nested spans, so a slow EMAIL_ task shows whether the time
+went to create_plan, the execute skill, safe_move or update_dashboard:
+
+- `trace(name, trace_id=None, **attrs)` opens a root span and makes its
+  trace id current for the thread (contextvars). Every task gets one trace
+  id, assigned when it is classified.
+- `span(name, **attrs)` nests under the current span. It is a no-op when no
+  trace is active, so instrumented helpers (call_mcp, _invoke_claude) cost
+  nothing outside a task.
+- the current trace id is stamped on audit_log records and used as the
+  default A2AMessage.correlation_id. A consumer continues the trace with
+  `trace("handle", trace_id=message.correlation_id)`.
+- finished spans are appended to Logs/traces/YYYY-MM-DD_spans.jsonl
+  through the logger's background writer. Each is {"trace_id", "span_id",
+  "parent_id", "name", "start", "duration_ms", "status", "attrs"}.
+
+config.yaml `tracing.enabled: false` turns export off.
+
+Usage:
+    with tracing.trace("task", file=filename):
+        with tracing.span("plan"):
+            ...
+
+    python -m src.utils.tracing slowest --limit 5      # flame-style tree
+    python -m src.utils.tracing phases                 # time per span name
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+TRACES_DIR = "traces"
+
+_current: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("span", default=None)
+_enabled: bool | None = None
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+@dataclass
+class Span:
+    trace_id: str
+    name: str
+    parent_id: str | None = None
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    start: float = field(default_factory=time.time)
+    attrs: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    duration_ms: float = 0.0
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def to_dict(self) -> dict:
+        record = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+        }
+        if self.attrs:
+            record["attrs"] = self.attrs
+        return record
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def current_trace_id() -> str | None:
+    span = _current.get()
+    return span.trace_id if span is not None else None
+
+
+def _is_enabled() -> bool:
+    global _enabled
+    if _enabled is None:
+        try:
+            from src.config.agent_config import AgentConfig
+            _enabled = bool((AgentConfig._load_config().get("tracing") or {}).get("enabled", True))
+        except Exception:
+            _enabled = True
+    return _enabled
+
+
+def _export(span: Span) -> None:
+    if not _is_enabled():
+        return
+    from src.utils import logger
+
+    date_str = datetime.fromtimestamp(span.start).strftime("%Y-%m-%d")
+    logger.write_jsonl(f"{TRACES_DIR}/{date_str}_spans.jsonl", span.to_dict())
+
+
+@contextmanager
+def _run(span: Span) -> Iterator[Span]:
+    token = _current.set(span)
+    started = time.perf_counter()
+    try:
+        yield span
+    except BaseException as e:
+        span.status = "error"
+        span.attrs.setdefault("error", f"{type(e).__name__}: {e}"[:200])
+        raise
+    finally:
+        span.duration_ms = (time.perf_counter() - started) * 1000
+        _current.reset(token)
+        _export(span)
+
+
+@contextmanager
+def trace(name: str, trace_id: str | None = None, **attrs: Any) -> Iterator[Span]:
+    """Open a root span of trace_id (a new trace if None) and make it current."""
+    with _run(Span(trace_id=trace_id or new_trace_id(), name=name, attrs=attrs)) as span:
+        yield span
+
+
+@contextmanager
+def span(name: str, trace_id: str | None = None, **attrs: Any) -> Iterator[Span | None]:
+    """Child of the current span; a root span of trace_id if given; else a no-op."""
+    parent = _current.get()
+    if parent is None and trace_id is None:
+        yield None
+        return
+    if parent is not None and trace_id in (None, parent.trace_id):
+        new = Span(trace_id=parent.trace_id, name=name, parent_id=parent.span_id, attrs=attrs)
+    else:
+        new = Span(trace_id=trace_id, name=name, attrs=attrs)
+    with _run(new) as s:
+        yield s
+
+
+# -- reading and reporting -------------------------------------------------------
+
+def traces_dir(root: str | Path | None = None) -> Path:
+    if root is None:
+        from src.utils.file_ops import get_project_root
+        root = get_project_root()
+    return Path(root) / "Logs" / TRACES_DIR
+
+
+def load_spans(days: list[str] | None = None, root: str | Path | None = None) -> list[dict]:
+    """Spans from Logs/traces/ (all days, or the given YYYY-MM-DD days)."""
+    folder = traces_dir(root)
+    if not folder.is_dir():
+        return []
+    if days:
+        paths = [folder / f"{d}_spans.jsonl" for d in days]
+    else:
+        paths = sorted(folder.glob("*_spans.jsonl"))
+    spans = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        spans.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            continue
+    return spans
+
+
+def group_traces(spans: list[dict]) -> dict[str, list[dict]]:
+    traces: dict[str, list[dict]] = {}
+    for s in spans:
+        traces.setdefault(s["trace_id"], []).append(s)
+    return traces
+
+
+def trace_duration_ms(spans: list[dict]) -> float:
+    """Wall time from the first span start to the last span end."""
+    start = min(s["start"] for s in spans)
+    end = max(s["start"] + s["duration_ms"] / 1000 for s in spans)
+    return (end - start) * 1000
+
+
+def slowest_traces(spans: list[dict], limit: int = 5) -> list[tuple[str, float, list[dict]]]:
+    ranked = [(tid, trace_duration_ms(ss), ss) for tid, ss in group_traces(spans).items()]
+    ranked.sort(key=lambda t: t[1], reverse=True)
+    return ranked[:limit]
+
+
+def phase_totals(spans: list[dict]) -> dict[str, dict]:
+    """{span name: {"count", "total_ms", "max_ms"}} over every span, slowest first."""
+    totals: dict[str, dict] = {}
+    for s in spans:
+        t = totals.setdefault(s["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        t["count"] += 1
+        t["total_ms"] += s["duration_ms"]
+        t["max_ms"] = max(t["max_ms"], s["duration_ms"])
+    return dict(sorted(totals.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
+
+
+def format_flame(spans: list[dict], width: int = 40) -> list[str]:
+    """Indented span tree with bars proportional to the trace's wall time."""
+    total = trace_duration_ms(spans) or 1.0
+    ids = {s["span_id"] for s in spans}
+    children: dict[str | None, list[dict]] = {}
+    for s in spans:
+        parent = s["parent_id"] if s["parent_id"] in ids else None
+        children.setdefault(parent, []).append(s)
+
+    lines: list[str] = []
+
+    def walk(parent: str | None, depth: int) -> None:
+        for s in sorted(children.get(parent, []), key=lambda x: x["start"]):
+            bar = "█" * max(1, round(width * s["duration_ms"] / total))
+            label = ("  " * depth + s["name"])[:40]
+            flag = "  !" if s.get("status") == "error" else ""
+            lines.append(f"  {label:<40} {s['duration_ms']:10.1f} ms  {bar}{flag}")
+            walk(s["span_id"], depth + 1)
+
+    walk(None, 0)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-phase task traces")
+    sub = parser.add_subparsers(dest="command", required=True)
+    slow = sub.add_parser("slowest", help="Flame-style breakdown of the slowest traces")
+    slow.add_argument("--limit", type=int, default=5)
+    slow.add_argument("--day", action="append", help="YYYY-MM-DD (repeatable; default all)")
+    phases = sub.add_parser("phases", help="Total time per span name")
+    phases.add_argument("--day", action="append")
+    show = sub.add_parser("show", help="Flame-style breakdown of one trace")
+    show.add_argument("trace_id")
+    args = parser.parse_args()
+
+    spans = load_spans(getattr(args, "day", None))
+    if args.command == "slowest":
+        for trace_id, duration, trace_spans in slowest_traces(spans, args.limit):
+            roots = [s for s in trace_spans if s["name"] == "task"] or trace_spans
+            label = (roots[0].get("attrs") or {}).get("file", "")
+            print(f"\ntrace {trace_id}  {label}  {duration:.1f} ms")
+            print("\n".join(format_flame(trace_spans)))
+    elif args.command == "phases":
+        print(f"{'span':<32} {'count':>7} {'total ms':>12} {'avg ms':>10} {'max ms':>10}")
+        for name, t in phase_totals(spans).items():
+            print(f"{name:<32} {t['count']:>7} {t['total_ms']:>12.1f} "
+                  f"{t['total_ms'] / t['count']:>10.1f} {t['max_ms']:>10.1f}")
+    else:
+        trace_spans = group_traces(spans).get(args.trace_id)
+        if not trace_spans:
+            print(f"No spans for trace {args.trace_id}")
+            return
+        print(f"trace {args.trace_id}  {trace_duration_ms(trace_spans):.1f} ms")
+        print("\n".join(format_flame(trace_spans)))
+
+
+if __name__ == "__main__":
+    main()
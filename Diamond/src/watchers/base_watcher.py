@@ -14,7 +14,8 @@ from pathlib import Path
 from typing import Any
 
 from src.utils.file_ops import get_project_root, create_task_file, get_folder
-from src.utils.logger import log_action, log_error
+from src.utils import profiler
+from src.utils.logger import log_action, log_error, start_background_writer
 
 
 class BaseWatcher(abc.ABC):
@@ -159,7 +160,13 @@ class BaseWatcher(abc.ABC):
         parser.add_argument("--dry-run", action="store_true", help="Don't create files")
         parser.add_argument("--once", action="store_true", help="Poll once and exit")
         parser.add_argument("--interval", type=int, default=300, help="Poll interval (seconds)")
+        profiler.add_arguments(parser)
         args = parser.parse_args()
+        start_background_writer()
 
         watcher = cls(mock=args.mock, dry_run=args.dry_run, poll_interval=args.interval, **kwargs)
-        watcher.run(once=args.once)
+        profiling = profiler.setup(f"{cls.NAME}_watcher", args, target=watcher)
+        try:
+            watcher.run(once=args.once)
+        finally:
+            profiling.close()
@@ -74,7 +74,7 @@ class TestAPIServer:
     def test_stats(self, api):
         stats = api.get_stats()
         assert stats["mock_mode"] is True
-        assert stats["endpoints"] == 7
+        assert stats["endpoints"] == 10
 
     def test_run_mock_mode(self, api):
         result = api.run()
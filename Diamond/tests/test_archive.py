@@ -0,0 +1,155 @@
+"""Tests for the monthly Done/, Errors/ and Logs/ archives."""
+
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from src.api.api_server import APIServer
+from src.audit.auditor import WeeklyAuditor
+from src.utils import archive, file_ops, frontmatter
+from src.utils.archive import FolderArchive, apply_retention, get_archive
+from src.utils.task_catalog import get_catalog
+
+DAY = 86400
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Done", "Errors", "Logs", "Needs_Action", "Pending_Approval"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+def _task(project, name, age_days, folder="Done", **meta):
+    path = project / folder / name
+    frontmatter.write_file(path, meta or {"status": "done"}, f"# {name}\n")
+    t = time.time() - age_days * DAY
+    os.utime(path, (t, t))
+    return path
+
+
+def _month(age_days):
+    return datetime.fromtimestamp(time.time() - age_days * DAY).strftime("%Y-%m")
+
+
+class TestFolderArchive:
+    def test_archives_only_old_files(self, project):
+        old = _task(project, "EMAIL_old.md", 90)
+        new = _task(project, "EMAIL_new.md", 1)
+        summary = get_archive("Done").archive_older_than(30)
+
+        assert summary == {_month(90): 1}
+        assert not old.exists() and new.exists()
+        assert (project / "Done" / "archive" / f"{_month(90)}.jsonl.gz").exists()
+        assert file_ops.list_md_files("Done") == [new]
+
+    def test_read_back_exact_text(self, project):
+        path = _task(project, "EMAIL_a.md", 60, subject="Re: hi", created="2026-01-02 10:00:00")
+        text = path.read_text()
+        done = get_archive("Done")
+        done.archive_older_than(30)
+        assert done.read_text("EMAIL_a.md") == text
+        meta, body = archive.read_task("Done", "EMAIL_a.md")
+        assert meta["subject"] == "Re: hi"
+        assert body == "# EMAIL_a.md"
+
+    def test_whole_file_is_valid_gzip_jsonl(self, project, monkeypatch):
+        monkeypatch.setattr(archive, "BLOCK_BYTES", 200)  # force several blocks
+        for i in range(10):
+            _task(project, f"EMAIL_{i}.md", 60)
+        done = get_archive("Done")
+        done.archive_older_than(30)
+        path = project / "Done" / "archive" / f"{_month(60)}.jsonl.gz"
+        with gzip.open(path, "rt") as f:
+            names = sorted(json.loads(line)["name"] for line in f)
+        assert names == sorted(f"EMAIL_{i}.md" for i in range(10))
+        assert len({e[0] for e in done.index(_month(60))["entries"].values()}) > 1
+        assert all(done.read_text(f"EMAIL_{i}.md") for i in range(10))
+
+    def test_appends_to_existing_month(self, project):
+        done = get_archive("Done")
+        _task(project, "EMAIL_1.md", 60)
+        done.archive_older_than(30)
+        _task(project, "EMAIL_2.md", 60)
+        done.archive_older_than(30)
+        assert sorted(done.names()) == ["EMAIL_1.md", "EMAIL_2.md"]
+        assert len(list(done.iter_records())) == 2
+
+    def test_discards_bytes_past_indexed_end(self, project):
+        done = get_archive("Done")
+        _task(project, "EMAIL_1.md", 60)
+        done.archive_older_than(30)
+        with open(done.path / f"{_month(60)}.jsonl.gz", "ab") as f:
+            f.write(b"partial block from a crashed run")
+        _task(project, "EMAIL_2.md", 60)
+        done.archive_older_than(30)
+        assert [r["name"] for r in done.iter_records()] == ["EMAIL_1.md", "EMAIL_2.md"]
+        assert done.read_text("EMAIL_2.md")
+
+    def test_dry_run_keeps_files(self, project):
+        old = _task(project, "EMAIL_old.md", 90)
+        assert get_archive("Done").archive_older_than(30, dry_run=True) == {_month(90): 1}
+        assert old.exists()
+        assert get_archive("Done").months() == []
+
+    def test_counts_from_index(self, project):
+        _task(project, "EMAIL_a.md", 60, created="2026-01-05 10:00:00")
+        _task(project, "ODOO_b.md", 60, created="2025-12-01 10:00:00")
+        _task(project, "EMAIL_c.md", 1)
+        get_archive("Done").archive_older_than(30)
+        done = get_archive("Done")
+        assert done.count() == 2
+        assert done.count(prefix="EMAIL") == 1
+        assert done.count(created_since="2026-01-01") == 1
+        assert archive.count_by_prefix("Done") == {"EMAIL": 2, "ODOO": 1}
+        assert archive.count("Done") == 3
+        assert archive.task_names("Done") == ["EMAIL_c.md", "EMAIL_a.md", "ODOO_b.md"]
+
+
+class TestRetention:
+    def test_logs_keep_audit_jsonl_live(self, project):
+        logs = project / "Logs"
+        t = time.time() - 60 * DAY
+        for name in ["2026-01-01_system.md", "2026-01-01_actions.jsonl", "audit.jsonl"]:
+            (logs / name).write_text("x\n")
+            os.utime(logs / name, (t, t))
+
+        summary = apply_retention({"Logs": 30})
+        assert summary == {"Logs": {_month(60): 2}}
+        assert [p.name for p in logs.iterdir() if p.is_file()] == ["audit.jsonl"]
+        assert get_archive("Logs").read_text("2026-01-01_actions.jsonl") == "x\n"
+
+    def test_default_retention_from_config(self):
+        retention = archive.load_retention()
+        assert set(retention) >= {"Done", "Errors", "Logs"}
+
+
+class TestReaders:
+    def test_auditor_counts_archived_tasks(self, project):
+        _task(project, "EMAIL_a.md", 60)
+        _task(project, "ODOO_b.md", 1)
+        apply_retention({"Done": 30})
+        stats = WeeklyAuditor(mock=True).gather_task_stats()
+        assert stats["total_done"] == 2
+        assert stats["done_by_type"] == {"EMAIL": 1, "ODOO": 1}
+        assert get_catalog().count("Done") == 1
+
+    def test_api_lists_archived_on_request(self, project):
+        _task(project, "EMAIL_a.md", 60)
+        _task(project, "ODOO_b.md", 1)
+        apply_retention({"Done": 30})
+        api = APIServer(project)
+        assert [t["filename"] for t in api.get_tasks("Done")["tasks"]] == ["ODOO_b.md"]
+        tasks = api.get_tasks("Done", include_archived=True)["tasks"]
+        assert [t.get("archived") for t in tasks] == [None, _month(60)]
+        assert api.get_folders()["archived"] == {"Done": 1}
+
+
+def test_folder_archive_without_archive_dir(tmp_path):
+    assert FolderArchive(tmp_path).months() == []
+    assert FolderArchive(tmp_path).read_text("missing.md") is None
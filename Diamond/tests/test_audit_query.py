@@ -0,0 +1,193 @@
+"""Tests for indexed audit-trail queries."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.api_server import APIServer
+from src.compliance.compliance_reporter import ComplianceReporter
+from src.utils.audit_query import AuditLog, AuditTrail, get_audit_trail
+from src.utils.logger import audit_log
+
+START = datetime(2026, 10, 17, 8, 0, 0)
+
+
+def _write(path, n, start=START, step=timedelta(seconds=10), **fields):
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(n):
+            record = {"timestamp": (start + i * step).isoformat(), "action_type": "task",
+                      "actor": "orchestrator", "result": "success", "seq": i}
+            record.update({k: v(i) if callable(v) else v for k, v in fields.items()})
+            f.write(json.dumps(record) + "\n")
+
+
+@pytest.fixture
+def logs(tmp_path):
+    (tmp_path / "Logs").mkdir()
+    return tmp_path / "Logs"
+
+
+class TestAuditLog:
+    def test_time_range_reads_only_overlapping_blocks(self, logs, monkeypatch):
+        path = logs / "2026-10-17_actions.jsonl"
+        _write(path, 1000)
+        log = AuditLog(path, index_every=100)
+        since, until = START + timedelta(seconds=5000), START + timedelta(seconds=5990)
+
+        scanned = []
+        original = AuditLog._scan
+        monkeypatch.setattr(AuditLog, "_scan", staticmethod(
+            lambda mm, s, e, *a: scanned.append((s, e)) or original(mm, s, e, *a)))
+        records = log.query(since, until)
+
+        assert [r["seq"] for r in records] == list(range(500, 600))
+        assert len(scanned) == 1  # one block of 100 records, nothing unindexed
+        assert scanned[0][1] - scanned[0][0] < path.stat().st_size / 5
+
+    def test_field_filters(self, logs):
+        path = logs / "audit.jsonl"
+        _write(path, 300, actor=lambda i: f"agent-{i % 3}",
+               result=lambda i: "failed" if i % 10 == 0 else "success")
+        log = AuditLog(path, index_every=64)
+        failed = log.query(actor="agent-0", result="failed")
+        assert [r["seq"] for r in failed] == list(range(0, 300, 30))
+        assert log.count(result="failed") == 30
+        assert log.count() == 300
+        with pytest.raises(TypeError):
+            log.query(colour="red")
+
+    def test_index_is_incremental_and_persisted(self, logs):
+        path = logs / "audit.jsonl"
+        _write(path, 250)
+        AuditLog(path, index_every=100).count()
+        index = json.loads((logs / ".audit_index" / "audit.jsonl.idx.json").read_text())
+        assert len(index["blocks"]) == 2
+
+        _write(path, 100, start=START + timedelta(hours=1))
+        log = AuditLog(path, index_every=100)
+        assert log.count() == 350
+        assert len(log._index["blocks"]) == 3
+
+    def test_replaced_file_is_reindexed(self, logs):
+        path = logs / "audit.jsonl"
+        _write(path, 300)
+        log = AuditLog(path, index_every=100)
+        assert log.count() == 300
+        path.unlink()
+        _write(path, 50, actor="new")
+        assert log.count() == 50
+        assert log.count(actor="new") == 50
+
+    def test_epoch_timestamps(self, logs):
+        path = logs / "audit.jsonl"
+        now = time.time()
+        path.write_text("".join(json.dumps({"timestamp": now - 100 + i, "action": "x"}) + "\n"
+                                for i in range(100)))
+        assert len(AuditLog(path, index_every=10).query(since=now - 10)) == 10
+
+    def test_tail_reads_backwards(self, logs):
+        path = logs / "audit.jsonl"
+        _write(path, 5000, result=lambda i: "failed" if i in (17, 4990) else "success")
+        log = AuditLog(path)
+        assert log.last()["seq"] == 4999
+        assert [r["seq"] for r in log.tail(3)] == [4997, 4998, 4999]
+        assert [r["seq"] for r in log.tail(5, result="failed")] == [17, 4990]
+        path.write_bytes(path.read_bytes() + b'{"timestamp": "2026-10-1')  # partial write
+        assert log.last()["seq"] == 4999
+
+    def test_tail_line_longer_than_read_block(self, logs):
+        path = logs / "audit.jsonl"
+        _write(path, 3)
+        _write(path, 1, start=START + timedelta(minutes=1), seq=3, note="x" * 200_000)
+        path.write_bytes(path.read_bytes().rstrip(b"\n"))  # no newline in the last 64 KiB
+        log = AuditLog(path)
+        assert [r["seq"] for r in log.tail(2)] == [2, 3]
+        assert len(log.last()["note"]) == 200_000
+
+    def test_missing_and_empty_files(self, logs):
+        assert AuditLog(logs / "none.jsonl").query() == []
+        assert AuditLog(logs / "none.jsonl").last() is None
+        (logs / "empty.jsonl").touch()
+        assert AuditLog(logs / "empty.jsonl").count() == 0
+
+
+class TestAuditTrail:
+    def test_spans_daily_files_in_order(self, logs):
+        _write(logs / "2026-10-16_actions.jsonl", 10, start=START - timedelta(days=1))
+        _write(logs / "2026-10-17_actions.jsonl", 10)
+        trail = AuditTrail(logs)
+        assert trail.count() == 20
+        records = trail.query(since=START - timedelta(minutes=1))
+        assert len(records) == 10
+        assert trail.tail(12)[0]["timestamp"].startswith("2026-10-16")
+        assert trail.last()["timestamp"].startswith("2026-10-17")
+
+    def test_range_skips_other_days(self, logs):
+        _write(logs / "2026-10-16_actions.jsonl", 10, start=START - timedelta(days=1))
+        _write(logs / "2026-10-17_actions.jsonl", 10)
+        trail = AuditTrail(logs)
+        assert [log.path.name for log in trail.files(since=START.timestamp())] == [
+            "2026-10-17_actions.jsonl"]
+
+    def test_reads_archived_days(self, logs):
+        import os
+
+        from src.utils.archive import FolderArchive
+
+        old = logs / "2026-08-01_actions.jsonl"
+        _write(old, 10, start=START - timedelta(days=77), actor="archived")
+        os.utime(old, (time.time() - 60 * 86400,) * 2)
+        _write(logs / "2026-10-17_actions.jsonl", 10)
+        FolderArchive(logs).archive_older_than(30)
+        assert not old.exists()
+
+        trail = AuditTrail(logs)
+        assert trail.count() == 20
+        assert [r["seq"] for r in trail.query(actor="archived", limit=3)] == [0, 1, 2]
+        assert trail.tail(11)[0]["actor"] == "archived"
+        early = trail.files(until=(START - timedelta(days=2)).timestamp())
+        assert [log.path.name for log in early] == [
+            "2026-08-01_actions.jsonl"]
+
+    def test_limit_stops_reading_later_days(self, logs, monkeypatch):
+        for day in range(5):
+            _write(logs / f"2026-10-1{day}_actions.jsonl", 10,
+                   start=START - timedelta(days=5 - day))
+        read = []
+        original = AuditLog.query
+        monkeypatch.setattr(AuditLog, "query",
+                            lambda self, *a, **k: read.append(self.path.name) or original(self, *a, **k))
+        records = AuditTrail(logs).query(limit=15)
+        assert [r["seq"] for r in records] == list(range(10)) + list(range(5))
+        assert read == ["2026-10-10_actions.jsonl", "2026-10-11_actions.jsonl"]
+
+    def test_includes_audit_log_written_by_logger(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+        audit_log("email_send", actor="cloud-01", result="failed", task_name="EMAIL_1.md")
+        audit_log("email_send", actor="cloud-01")
+        trail = get_audit_trail(tmp_path)
+        assert [r["result"] for r in trail.query(task_name="EMAIL_1.md")] == ["failed"]
+        assert trail.last(actor="cloud-01")["result"] == "success"
+
+
+class TestCallers:
+    def test_compliance_uses_newest_record(self, logs):
+        path = logs / "audit.jsonl"
+        _write(path, 100, start=datetime.now() - timedelta(days=3))
+        checks = {c["name"]: c for c in ComplianceReporter(logs.parent).run_compliance_check()["checks"]}
+        assert checks["audit_log"]["status"] == "warn"
+        assert checks["audit_log"]["details"] == "Audit log has 100 entries"
+
+        _write(logs / f"{datetime.now():%Y-%m-%d}_actions.jsonl", 1, start=datetime.now())
+        checks = {c["name"]: c for c in ComplianceReporter(logs.parent).run_compliance_check()["checks"]}
+        assert checks["audit_log"]["status"] == "pass"
+
+    def test_api_audit(self, logs):
+        _write(logs / "2026-10-17_actions.jsonl", 50, actor=lambda i: f"a{i % 2}")
+        api = APIServer(logs.parent)
+        assert [r["seq"] for r in api.get_audit(limit=2)["records"]] == [48, 49]
+        result = api.get_audit(since=START.isoformat(), until=START + timedelta(seconds=95),
+                               actor="a1")
+        assert [r["seq"] for r in result["records"]] == [1, 3, 5, 7, 9]
@@ -1,5 +1,8 @@
 """Tests for the weekly business auditor."""
 
+import asyncio
+import time
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -76,6 +79,16 @@ class TestWeeklyAuditor:
             issues = [b["issue"] for b in bottlenecks]
             assert any("Stuck" in i or "Failed" in i for i in issues)
 
+    def test_task_without_created_is_flagged(self, tmp_project):
+        frontmatter.write_file(tmp_project / "Needs_Action" / "EMAIL_undated.md",
+                               {"type": "email"}, "# No created field\n")
+        frontmatter.write_file(tmp_project / "Needs_Action" / "EMAIL_new.md",
+                               {"type": "email", "created": "2999-01-01 00:00:00"}, "# New\n")
+        with patch("src.utils.file_ops.get_project_root", return_value=tmp_project):
+            stuck = {b["file"] for b in WeeklyAuditor(mock=True).detect_bottlenecks()
+                     if b["issue"].startswith("Stuck")}
+        assert stuck == {"EMAIL_old.md", "EMAIL_undated.md"}
+
     def test_generate_briefing(self, tmp_project):
         with patch("src.utils.file_ops.get_project_root", return_value=tmp_project):
             with patch("src.utils.file_ops.get_folder") as mock_get_folder:
@@ -96,3 +109,35 @@ class TestWeeklyAuditor:
                 assert "Revenue" in content
                 assert "Social Media" in content
                 assert "Bottlenecks" in content
+
+
+class TestConcurrentGather:
+    def test_gather_all_returns_every_source(self, tmp_project):
+        with patch("src.utils.file_ops.get_project_root", return_value=tmp_project):
+            auditor = WeeklyAuditor(mock=True)
+            task_stats, odoo_stats, social_stats, bottlenecks = asyncio.run(auditor.gather_all())
+        assert task_stats["total_done"] == 4
+        assert "total_revenue_collected" in odoo_stats
+        assert "facebook" in social_stats
+        assert isinstance(bottlenecks, list)
+
+    def test_sources_run_concurrently(self, tmp_project):
+        def slow(result):
+            def fn(*args):
+                time.sleep(0.3)
+                return result
+            return fn
+
+        async def slow_async(result):
+            await asyncio.sleep(0.3)
+            return result
+
+        auditor = WeeklyAuditor(mock=True)
+        auditor.gather_task_stats = slow({})
+        auditor.detect_bottlenecks = slow([])
+        auditor.agather_odoo_stats = lambda client: slow_async({})
+        auditor.agather_social_stats = lambda client: slow_async({})
+
+        start = time.perf_counter()
+        asyncio.run(auditor.gather_all())
+        assert time.perf_counter() - start < 0.9
@@ -0,0 +1,222 @@
+"""Tests for the per-dependency circuit breakers and their wiring."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.api.api_server import APIServer
+from src.health.health_monitor import HealthMonitor
+from src.orchestrator.orchestrator import Orchestrator
+from src.orchestrator.ralph_wiggum import RalphWiggumLoop
+from src.utils import circuit_breaker, mcp_registry
+from src.utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, get_breaker,
+)
+from src.utils.metrics import CIRCUIT_STATE
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Needs_Action", "In_Progress", "Done", "Logs", "Pending_Approval",
+                   "Approved", "Errors"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def closed_breakers():
+    circuit_breaker.reset_breakers()
+    yield
+    circuit_breaker.reset_breakers()
+
+
+def _fail(breaker):
+    with pytest.raises(RuntimeError):
+        with breaker.guard():
+            raise RuntimeError("down")
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = CircuitBreaker("unit", failure_threshold=3, reset_timeout=30, clock=FakeClock())
+        for _ in range(2):
+            _fail(breaker)
+        assert breaker.state == CLOSED
+        _fail(breaker)
+        assert breaker.state == OPEN
+        assert CIRCUIT_STATE.value(breaker="unit") == 2
+
+        with pytest.raises(CircuitOpenError) as exc:
+            with breaker.guard():
+                pytest.fail("must not be called while open")
+        assert exc.value.retry_after == pytest.approx(30)
+        assert breaker.get_stats()["rejected"] == 1
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("unit", failure_threshold=2, clock=FakeClock())
+        _fail(breaker)
+        with breaker.guard():
+            pass
+        _fail(breaker)
+        assert breaker.state == CLOSED
+
+    def test_half_open_trial(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("unit", failure_threshold=1, reset_timeout=10, clock=clock)
+        _fail(breaker)
+        clock.now += 10
+        assert breaker.state == HALF_OPEN
+
+        breaker.before_call()                       # the single trial call
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == OPEN and breaker.trips == 2
+
+        clock.now += 10
+        with breaker.guard():
+            pass
+        assert breaker.state == CLOSED
+
+    def test_config_overrides(self, monkeypatch):
+        config = {"circuit_breakers": {"failure_threshold": 4, "reset_timeout": 20,
+                                       "overrides": {"claude": {"failure_threshold": 2}}}}
+        monkeypatch.setattr("src.config.agent_config.AgentConfig._load_config",
+                            staticmethod(lambda *a, **k: config))
+        monkeypatch.setattr(circuit_breaker, "_breakers", {})
+        assert get_breaker("claude").failure_threshold == 2
+        assert get_breaker("claude").reset_timeout == 20
+        assert get_breaker("mcp:email").failure_threshold == 4
+
+
+class TestWiring:
+    def test_mcp_calls_fail_fast_while_open(self):
+        breaker = get_breaker("mcp:email")
+        calls = []
+
+        def broken(*args, **kwargs):
+            calls.append(1)
+            raise subprocess.TimeoutExpired("email", 30)
+
+        with patch.object(mcp_registry, "_in_process_request", side_effect=broken), \
+                patch("time.sleep"):
+            for _ in range(breaker.failure_threshold):
+                try:
+                    mcp_registry.call_mcp("email", "send_email", {}, transport="in_process")
+                except Exception:
+                    pass
+            assert breaker.state == OPEN
+            attempts = len(calls)
+            with pytest.raises(CircuitOpenError):
+                mcp_registry.call_mcp("email", "send_email", {}, transport="in_process")
+        assert len(calls) == attempts
+
+        # Other servers are unaffected
+        mcp_registry.call_mcp("payment", "list_accounts", {}, transport="in_process", cache=False)
+
+    def test_not_found_results_keep_breaker_closed(self):
+        from src.utils.mcp_async import AsyncMCPClient, run_sync
+
+        breaker = get_breaker("mcp:payment")
+        for _ in range(breaker.failure_threshold + 1):
+            result = mcp_registry.call_mcp("payment", "get_balance", {"account_id": "nope"},
+                                           transport="in_process", cache=False)
+            assert result == {"error": "Account not found: nope"}
+        mcp_registry.call_mcp_batch("payment", [("get_balance", {"account_id": "nope"})],
+                                    transport="in_process", cache=False)
+        client = AsyncMCPClient(cache=False, transport="in_process")
+        run_sync(client.call_tool("payment", "get_balance", {"account_id": "nope"}))
+        assert breaker.state == CLOSED
+
+    def test_unreachable_backend_results_count_as_failures(self):
+        breaker = get_breaker("mcp:odoo")
+        unreachable = {"error": "[Errno 111] Connection refused"}
+        with patch.object(mcp_registry, "parse_tool_result", return_value=unreachable):
+            for _ in range(breaker.failure_threshold - 1):
+                mcp_registry.call_mcp("odoo", "list_invoices", {},
+                                      transport="in_process", cache=False)
+            assert breaker.state == CLOSED
+            mcp_registry.call_mcp_batch("odoo", [("list_invoices", {})],
+                                        transport="in_process", cache=False)
+        assert breaker.state == OPEN
+
+    def test_transport_failure_classification(self):
+        from src.utils.mcp_session import MCPSessionError
+
+        assert mcp_registry.is_transport_failure(error=TimeoutError())
+        assert mcp_registry.is_transport_failure(error=MCPSessionError("died"))
+        assert mcp_registry.is_transport_failure(error=RuntimeError("No valid response from MCP server"))
+        assert not mcp_registry.is_transport_failure(error=RuntimeError("Unknown tool: x"))
+        assert not mcp_registry.is_transport_failure({"error": "Invoice 7 not found"})
+        assert not mcp_registry.is_transport_failure({"balance": 10})
+
+    def test_is_error_result_without_json_text(self):
+        from src.utils.mcp_session import parse_tool_result
+
+        response = {"result": {"content": [{"type": "text", "text": "Error sending email: x"}],
+                               "isError": True}}
+        assert parse_tool_result(response) == {"error": "Error sending email: x"}
+
+    def test_open_claude_breaker_defers_task_without_error_report(self, project):
+        for name in ("EMAIL_a.md", "EMAIL_b.md"):
+            (project / "Needs_Action" / name).write_text("---\ntype: email\n---\nHi")
+        get_breaker("claude")._set_state(OPEN)
+        orch = Orchestrator(dry_run=False, ralph_enabled=False)
+
+        with patch.object(Orchestrator, "_invoke_claude_raw") as raw:
+            assert orch.poll_once() == 0
+        raw.assert_not_called()
+        queue = orch.error_handler.retry_queue
+        assert queue.is_waiting("EMAIL_a.md") and queue.is_waiting("EMAIL_b.md")
+        assert queue.get("EMAIL_a.md").attempt == 0
+        assert list((project / "Errors").glob("ERROR_*.md")) == []
+        assert orch.poll_once() == 0                 # deferred, not re-run
+
+    def test_ralph_raises_while_open(self, project):
+        task = project / "Needs_Action" / "ODOO_sync.md"
+        task.write_text("---\ntype: odoo\n---\nSync")
+        loop = RalphWiggumLoop(task, dry_run=False)
+        get_breaker("claude")._set_state(OPEN)
+        with pytest.raises(CircuitOpenError):
+            loop._invoke_claude("create_plan", "ctx")
+
+    def test_health_and_api_report_open_breakers(self, project):
+        get_breaker("mcp:odoo")._set_state(OPEN)
+        report = HealthMonitor().run_all_checks(agent_ids=[])
+        assert report["circuit_breakers"]["open"] == ["mcp:odoo"]
+        assert report["overall_status"] == "degraded"
+        assert "mcp:odoo" in (project / "Logs").joinpath(
+            f"{report['timestamp'][:10]}_health.md").read_text()
+
+        api = APIServer(project)
+        assert api.get_circuit_breakers()["breakers"]["mcp:odoo"]["state"] == OPEN
+        assert api.get_health()["healthy"] is False
+
+    def test_states_shared_across_processes(self, project):
+        script = ("import sys; from pathlib import Path; from src.utils import file_ops; "
+                  "file_ops.get_project_root = lambda: Path(sys.argv[1]); "
+                  "from src.utils.circuit_breaker import get_breaker; "
+                  "get_breaker('mcp:whatsapp')._set_state('open')")
+        subprocess.run([sys.executable, "-c", script, str(project)], check=True,
+                       cwd=Path(__file__).resolve().parent.parent, timeout=30)
+
+        assert HealthMonitor().check_circuit_breakers()["open"] == ["mcp:whatsapp"]
+        api = APIServer(project)
+        assert api.get_circuit_breakers()["breakers"]["mcp:whatsapp"]["state"] == OPEN
+        assert api.get_health()["checks"]["circuit_breakers"] == "open: mcp:whatsapp"
+
+        get_breaker("mcp:whatsapp")._set_state(OPEN)    # this process's own transitions
+        get_breaker("mcp:whatsapp").reset()              # are published too
+        assert api.get_circuit_breakers()["open"] == []
@@ -98,3 +98,17 @@ class TestCloudOrchestrator:
         cloud_orch.poll_once()
         # After processing, task should no longer be in Needs_Action
         assert not task.exists()
+
+    def test_open_breaker_defers_task(self, tmp_project, cloud_orch):
+        from src.utils.circuit_breaker import CircuitOpenError
+
+        task = tmp_project / "Needs_Action" / "EMAIL_outage_001.md"
+        task.write_text("---\ntype: email\npriority: medium\n---\nReply\n")
+        error = CircuitOpenError("mcp:email", 30)
+
+        with patch.object(cloud_orch, "_process_as_draft", side_effect=error), \
+                patch.object(cloud_orch.error_handler, "defer") as defer:
+            assert cloud_orch.poll_once() == 0
+
+        defer.assert_called_once_with("EMAIL_outage_001.md", task, error)
+        assert task.exists()  # unclaimed back to Needs_Action
@@ -0,0 +1,147 @@
+"""Tests for the rolling-window audit-log error-rate tracker."""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.health.error_rate import ErrorRateTracker, audit_file_for
+from src.health.health_monitor import HealthMonitor
+from src.utils.logger import audit_log
+
+NOW = datetime(2026, 10, 17, 12, 0, 0)
+
+
+def _record(ts: datetime, result="success", action_type="task", actor="orchestrator") -> str:
+    return json.dumps({"timestamp": ts.isoformat(), "action_type": action_type,
+                       "actor": actor, "result": result}) + "\n"
+
+
+def _append(path, *lines):
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+@pytest.fixture
+def logs(tmp_path):
+    return tmp_path
+
+
+class TestErrorRateTracker:
+    def test_counts_only_the_last_hour(self, logs):
+        path = audit_file_for(logs, NOW)
+        _append(path,
+                _record(NOW - timedelta(hours=3), "failed"),
+                _record(NOW - timedelta(minutes=90), "failed"),
+                _record(NOW - timedelta(minutes=30), "failed", "email_send", "cloud"),
+                _record(NOW - timedelta(minutes=10), "failed", "email_send", "local"),
+                _record(NOW - timedelta(minutes=5)))
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=NOW.timestamp())
+        summary = tracker.summary()
+        assert summary["errors"] == 2
+        assert summary["errors_per_hour"] == 2.0
+        assert summary["records"] == 3
+        assert summary["by_action_type"] == {"email_send": 2}
+        assert summary["by_actor"] == {"cloud": 1, "local": 1}
+
+    def test_window_slides(self, logs):
+        path = audit_file_for(logs, NOW)
+        _append(path, _record(NOW - timedelta(minutes=50), "failed"))
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=NOW.timestamp())
+        assert tracker.summary()["errors"] == 1
+        tracker.poll(now=(NOW + timedelta(minutes=15)).timestamp())
+        assert tracker.summary()["errors"] == 0
+
+    def test_poll_reads_only_appended_bytes(self, logs):
+        path = audit_file_for(logs, NOW)
+        _append(path, *[_record(NOW - timedelta(minutes=1)) for _ in range(100)])
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=NOW.timestamp())
+        before = tracker.bytes_read
+        line = _record(NOW, "failed")
+        _append(path, line)
+        tracker.poll(now=NOW.timestamp())
+        assert tracker.bytes_read - before == len(line)
+        assert tracker.summary()["errors"] == 1
+
+    def test_partial_line_waits_for_newline(self, logs):
+        path = audit_file_for(logs, NOW)
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=NOW.timestamp())
+        line = _record(NOW, "failed")
+        _append(path, line[:20])
+        tracker.poll(now=NOW.timestamp())
+        assert tracker.summary()["errors"] == 0
+        _append(path, line[20:])
+        tracker.poll(now=NOW.timestamp())
+        assert tracker.summary()["errors"] == 1
+
+    def test_backfill_reads_only_the_tail(self, logs):
+        path = audit_file_for(logs, NOW)
+        old = _record(NOW - timedelta(hours=6))
+        _append(path, *[old] * 20_000)
+        _append(path, _record(NOW - timedelta(minutes=2), "failed"))
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=NOW.timestamp())
+        assert tracker.summary()["errors"] == 1
+        assert tracker.bytes_read < os.path.getsize(path) / 4
+
+    def test_replaced_file_is_reread(self, logs):
+        path = audit_file_for(logs, NOW)
+        _append(path, *[_record(NOW) for _ in range(10)])
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=NOW.timestamp())
+        path.unlink()
+        _append(path, _record(NOW, "failed"))
+        tracker.poll(now=NOW.timestamp())
+        assert tracker.summary()["errors"] == 1
+
+    def test_midnight_rollover(self, logs):
+        midnight = datetime(2026, 10, 18, 0, 0, 0)
+        yesterday = audit_file_for(logs, midnight - timedelta(minutes=1))
+        _append(yesterday, _record(midnight - timedelta(minutes=20), "failed"))
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=(midnight - timedelta(minutes=5)).timestamp())
+        _append(yesterday, _record(midnight - timedelta(minutes=2), "failed"))
+        _append(audit_file_for(logs, midnight), _record(midnight + timedelta(minutes=1), "failed"))
+        tracker.poll(now=(midnight + timedelta(minutes=2)).timestamp())
+        assert tracker.summary()["errors"] == 3
+
+    def test_first_poll_after_midnight_backfills_yesterday(self, logs):
+        midnight = datetime(2026, 10, 18, 0, 0, 0)
+        _append(audit_file_for(logs, midnight - timedelta(minutes=1)),
+                _record(midnight - timedelta(minutes=30), "failed"))
+        tracker = ErrorRateTracker(logs)
+        tracker.poll(now=(midnight + timedelta(minutes=10)).timestamp())
+        assert tracker.summary()["errors"] == 1
+
+
+class TestHealthMonitorErrorRate:
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+        (tmp_path / "Logs").mkdir()
+        return tmp_path
+
+    def test_high_error_rate(self, project):
+        monitor = HealthMonitor(error_rate_threshold=3)
+        audit_log("email_send", actor="cloud-01", result="failed")
+        assert monitor.check_error_rate()["healthy"] is True
+
+        for _ in range(3):
+            audit_log("email_send", actor="cloud-01", result="failed")
+        result = monitor.check_error_rate()
+        assert result["status"] == "high_error_rate"
+        assert result["error_count"] == 4
+        assert result["errors_per_hour"] == 4.0
+        assert result["by_actor"] == {"cloud-01": 4}
+
+    def test_failures_older_than_an_hour_do_not_count(self, project):
+        path = audit_file_for(project / "Logs", datetime.now())
+        _append(path, *[_record(datetime.now() - timedelta(hours=2), "failed")] * 10)
+        result = HealthMonitor(error_rate_threshold=5).check_error_rate()
+        assert result["healthy"] is True
+        assert result["error_count"] == 0
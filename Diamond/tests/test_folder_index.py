@@ -0,0 +1,133 @@
+"""Tests for the incremental folder index behind list_md_files."""
+
+import os
+import time
+
+import pytest
+
+from src.utils import file_ops, folder_index
+from src.utils.folder_index import FolderIndex, task_prefix
+
+
+def _write(path, mtime=None, text="x"):
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def _age_dir(path, seconds=10):
+    """Push the folder mtime into the past so the index trusts it."""
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+@pytest.fixture
+def folder(tmp_path):
+    d = tmp_path / "Done"
+    d.mkdir()
+    base = time.time() - 1000
+    _write(d / "EMAIL_b.md", base + 2)
+    _write(d / "EMAIL_a.md", base + 1)
+    _write(d / "ODOO_c.md", base + 3)
+    _write(d / "README.md", base + 4)
+    _write(d / "notes.txt", base)
+    return d
+
+
+class TestFolderIndex:
+    def test_list_matches_glob_sorted_by_mtime(self, folder):
+        expected = sorted(folder.glob("*.md"), key=lambda f: f.stat().st_mtime)
+        assert FolderIndex(folder).list() == expected
+
+    def test_ignore_prefixes(self, folder):
+        names = [p.name for p in FolderIndex(folder).list(ignore_prefixes=["EMAIL_"])]
+        assert names == ["ODOO_c.md", "README.md"]
+
+    def test_count_by_prefix(self, folder):
+        index = FolderIndex(folder)
+        assert index.count_by_prefix() == {"EMAIL": 2, "ODOO": 1, "OTHER": 1}
+        assert index.count() == 4
+        assert index.count("EMAIL") == 2
+
+    def test_oldest(self, folder):
+        index = FolderIndex(folder)
+        assert [p.name for p in index.oldest(2)] == ["EMAIL_a.md", "EMAIL_b.md"]
+        assert [p.name for p in index.oldest(1, ignore_prefixes=["EMAIL_"])] == ["ODOO_c.md"]
+
+    def test_unchanged_folder_is_not_rescanned(self, folder, monkeypatch):
+        monkeypatch.setattr(folder_index, "RACY_WINDOW_NS", 0)
+        _age_dir(folder)
+        index = FolderIndex(folder)
+        index.list()
+        index.list()
+        index.count_by_prefix()
+        assert index.scans == 1
+
+    def test_only_new_files_are_stated(self, folder):
+        index = FolderIndex(folder)
+        index.list()
+        assert index.stats_taken == 4
+        _write(folder / "EMAIL_new.md")
+        (folder / "ODOO_c.md").unlink()
+        names = [p.name for p in index.list()]
+        assert index.stats_taken == 5
+        assert "EMAIL_new.md" in names
+        assert "ODOO_c.md" not in names
+        assert index.count_by_prefix() == {"EMAIL": 3, "OTHER": 1}
+
+    def test_rapid_changes_are_not_missed(self, folder):
+        index = FolderIndex(folder)
+        for i in range(20):
+            _write(folder / f"EMAIL_burst_{i}.md")
+            assert index.count("EMAIL") == 3 + i
+
+    def test_note_changed_tracks_in_place_rewrite(self, folder):
+        index = FolderIndex(folder)
+        index.list()
+        _write(folder / "EMAIL_a.md", time.time(), text="rewritten")
+        index.note_changed(folder / "EMAIL_a.md")
+        entries = index.entries()
+        assert entries[-1].name == "EMAIL_a.md"
+        assert entries[-1].size == len("rewritten")
+
+    def test_replaced_file_is_restated(self, folder):
+        index = FolderIndex(folder)
+        index.list()
+        tmp = _write(folder / "EMAIL_a.tmp", time.time(), text="replaced")
+        os.replace(tmp, folder / "EMAIL_a.md")       # same name, new inode
+        entries = index.entries()
+        assert entries[-1].name == "EMAIL_a.md"
+        assert entries[-1].size == len("replaced")
+
+    def test_missing_folder_is_created(self, tmp_path):
+        index = FolderIndex(tmp_path / "New")
+        assert index.list() == []
+        assert (tmp_path / "New").is_dir()
+
+    def test_task_prefix(self):
+        assert task_prefix("EMAIL_x_y.md") == "EMAIL"
+        assert task_prefix("README.md") == "OTHER"
+
+
+class TestFileOpsIntegration:
+    @pytest.fixture(autouse=True)
+    def project(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+        return tmp_path
+
+    def test_create_and_move_are_visible(self, project):
+        task = file_ops.create_task_file("Needs_Action", "EMAIL", "hello", {}, "body")
+        assert file_ops.list_md_files("Needs_Action") == [task]
+        moved = file_ops.safe_move(task, "Done")
+        assert file_ops.list_md_files("Needs_Action") == []
+        assert file_ops.list_md_files("Done") == [moved]
+        assert file_ops.count_md_files("Done", "EMAIL") == 1
+        assert file_ops.count_by_prefix("Done") == {"EMAIL": 1}
+
+    def test_oldest_md_files(self, project):
+        paths = [file_ops.create_task_file("Done", "EMAIL", f"t{i}", {}, "b") for i in range(3)]
+        for i, p in enumerate(paths):
+            os.utime(p, (1000 + i, 1000 + i))
+            folder_index.note_changed(p)
+        assert file_ops.oldest_md_files("Done", 2) == paths[:2]
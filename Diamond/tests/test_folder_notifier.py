@@ -0,0 +1,70 @@
+"""Tests for filesystem-notification based folder watching."""
+
+import time
+
+import pytest
+
+from src.utils.folder_notifier import FolderNotifier, HAS_WATCHDOG
+from src.utils.file_ops import create_task_file, safe_move
+from src.orchestrator.orchestrator import Orchestrator
+
+pytestmark = pytest.mark.skipif(not HAS_WATCHDOG, reason="watchdog not installed")
+
+
+@pytest.fixture
+def tmp_project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Needs_Action", "Done", "Logs", "Errors", "Pending_Approval"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+class TestFolderNotifier:
+    def test_queues_new_file(self, tmp_project):
+        with FolderNotifier(["Needs_Action"]) as notifier:
+            assert notifier.active
+            create_task_file("Needs_Action", "EMAIL", "n_001", {"type": "email"}, "Hi")
+            files = notifier.wait(timeout=5)
+        assert [f.name for f in files] == ["EMAIL_n_001.md"]
+
+    def test_queues_moved_in_file(self, tmp_project):
+        src = create_task_file("Done", "EMAIL", "n_002", {"type": "email"}, "Hi")
+        with FolderNotifier(["Needs_Action"]) as notifier:
+            safe_move(src, "Needs_Action")
+            files = notifier.wait(timeout=5)
+        assert any(f.name == "EMAIL_n_002.md" for f in files)
+
+    def test_ignores_other_suffixes(self, tmp_project):
+        with FolderNotifier(["Needs_Action"]) as notifier:
+            (tmp_project / "Needs_Action" / "notes.txt").write_text("x")
+            assert notifier.wait(timeout=0.3) == []
+
+    def test_wait_times_out_empty(self, tmp_project):
+        with FolderNotifier(["Needs_Action"]) as notifier:
+            start = time.monotonic()
+            assert notifier.wait(timeout=0.2) == []
+            assert time.monotonic() - start < 2
+
+    def test_wake_interrupts_wait(self, tmp_project):
+        with FolderNotifier(["Needs_Action"]) as notifier:
+            notifier.wake()
+            start = time.monotonic()
+            notifier.wait(timeout=5)
+            assert time.monotonic() - start < 1
+
+
+class TestOrchestratorEvents:
+    def test_scan_uses_event_files(self, tmp_project):
+        create_task_file("Needs_Action", "EMAIL", "a", {"type": "email"}, "A")
+        b = create_task_file("Needs_Action", "EMAIL", "b", {"type": "email"}, "B")
+        orch = Orchestrator(dry_run=True, watch_mode="events")
+        orch._event_files = [b]
+        assert [f.name for f in orch._scan_needs_action()] == ["EMAIL_b.md"]
+        # Next poll without events is a full reconciliation scan
+        assert len(orch._scan_needs_action()) == 2
+
+    def test_scan_skips_missing_and_ignored(self, tmp_project):
+        plan = create_task_file("Needs_Action", "Plan", "x", {"type": "plan"}, "P")
+        orch = Orchestrator(dry_run=True, watch_mode="events")
+        orch._event_files = [plan, tmp_project / "Needs_Action" / "GONE.md"]
+        assert orch._scan_needs_action() == []
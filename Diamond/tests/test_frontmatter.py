@@ -5,7 +5,8 @@ from pathlib import Path
 
 import pytest
 
-from src.utils.frontmatter import parse, dump, read_file, write_file
+from src.utils import frontmatter
+from src.utils.frontmatter import parse, dump, read_file, write_file, get_cache_stats
 
 
 class TestParse:
@@ -83,3 +84,100 @@ class TestRoundTrip:
         meta, body = read_file(tmp_path / "nope.md")
         assert meta == {}
         assert body == ""
+
+
+class TestParseCache:
+    @pytest.fixture
+    def task(self, tmp_path):
+        path = tmp_path / "EMAIL_task.md"
+        write_file(path, {"type": "email", "tags": ["a"]}, "# Body")
+        return path
+
+    def test_repeated_reads_hit_cache(self, task, monkeypatch):
+        read_file(task)
+        calls = []
+        monkeypatch.setattr(frontmatter, "parse", lambda text: calls.append(text) or ({}, ""))
+        before = get_cache_stats()["hits"]
+        meta, body = read_file(task)
+        assert meta == {"type": "email", "tags": ["a"]}
+        assert body == "# Body"
+        assert calls == []
+        assert get_cache_stats()["hits"] == before + 1
+
+    def test_cached_metadata_is_a_copy(self, task):
+        meta, _ = read_file(task)
+        meta["type"] = "changed"
+        meta["tags"].append("b")
+        assert read_file(task)[0] == {"type": "email", "tags": ["a"]}
+
+    def test_write_file_invalidates(self, task):
+        read_file(task)
+        write_file(task, {"type": "odoo"}, "# New")
+        assert read_file(task) == ({"type": "odoo"}, "# New")
+
+    def test_external_change_detected_by_stat(self, task):
+        read_file(task)
+        task.write_text("---\ntype: external\n---\n\n# Edited outside\n")
+        assert read_file(task)[0] == {"type": "external"}
+
+    def test_safe_move_invalidates(self, tmp_path, monkeypatch):
+        from src.utils import file_ops
+
+        monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+        task = file_ops.create_task_file("Needs_Action", "EMAIL", "x", {"type": "email"}, "b")
+        read_file(task)
+        moved = file_ops.safe_move(task, "Done")
+        assert read_file(task) == ({}, "")
+        assert read_file(moved)[0]["type"] == "email"
+
+    def test_lru_bound(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(frontmatter, "_cache", frontmatter._ParseCache(max_entries=2))
+        for i in range(3):
+            p = tmp_path / f"t{i}.md"
+            write_file(p, {"i": i}, "b")
+            read_file(p)
+        assert get_cache_stats()["entries"] == 2
+
+
+class TestFastPath:
+    DOCS = [
+        {"type": "email", "priority": "high", "status": "pending",
+         "from": "alice@example.com", "subject": "Re: Invoice #42",
+         "created": "2026-10-17 10:00:00", "requires_approval": True, "retries": 0},
+        {"type": "odoo", "amount": 1500, "approved": False, "notes": None},
+        {"yes": "no", "on": "off", "value": "1.5", "date": "2026-10-17", "zero": "012"},
+        {"text": "it's quoted", "empty": "", "lead": " space", "long": "word " * 20},
+        {"tags": ["a", "b"], "nested": {"k": "v"}, "ratio": 0.5},
+    ]
+
+    @pytest.mark.parametrize("meta", DOCS)
+    def test_dump_matches_yaml(self, meta):
+        import yaml
+
+        expected = yaml.dump(meta, default_flow_style=False, sort_keys=False).strip()
+        assert dump(meta, "body") == f"---\n{expected}\n---\n\nbody"
+
+    @pytest.mark.parametrize("meta", DOCS)
+    def test_parse_matches_yaml(self, meta):
+        import yaml
+
+        text = dump(meta, "body")
+        block = text.split("---")[1].strip()
+        parsed, body = parse(text)
+        assert parsed == yaml.safe_load(block)
+        assert body == "body"
+
+    def test_flat_documents_take_fast_path(self):
+        assert frontmatter._fast_dump(self.DOCS[0]) is not None
+        assert frontmatter._fast_parse(dump(self.DOCS[0], "")[4:].split("\n---")[0]) is not None
+
+    def test_complex_documents_fall_back(self):
+        assert frontmatter._fast_dump(self.DOCS[4]) is None
+        assert frontmatter._fast_parse("tags:\n- a\n- b") is None
+        assert frontmatter._fast_parse("when: 2026-10-17") is None
+        assert frontmatter._fast_parse("n: 0x1f") is None
+
+    def test_resolves_scalars_like_yaml(self):
+        assert frontmatter._fast_parse("a: yes\nb: Off\nc: ~\nd: 42\ne: '42'\nf:") == {
+            "a": True, "b": False, "c": None, "d": 42, "e": "42", "f": None,
+        }
@@ -8,6 +8,14 @@ from src.sync.conflict_resolver import resolve_conflicts, get_strategy
 from src.sync.sync_watcher import SyncWatcher
 
 
+@pytest.fixture(autouse=True)
+def project(tmp_path, monkeypatch):
+    """Keep sync and conflict logs out of the real vault."""
+    (tmp_path / "Logs").mkdir()
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    return tmp_path
+
+
 class TestGitVaultSync:
     def test_pull_returns_success(self):
         sync = GitVaultSync("test-agent")
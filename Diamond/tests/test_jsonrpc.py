@@ -0,0 +1,36 @@
+"""Tests for JSON-RPC single/batch dispatch used by the MCP server loops."""
+
+from src.utils.jsonrpc import INTERNAL_ERROR, INVALID_REQUEST, dispatch
+
+
+def echo(request):
+    return {"jsonrpc": "2.0", "id": request.get("id"), "result": request.get("method")}
+
+
+class TestDispatch:
+    def test_single_request(self):
+        assert dispatch({"id": 1, "method": "ping"}, echo)["result"] == "ping"
+
+    def test_batch_returns_list_in_order(self):
+        responses = dispatch([{"id": 1, "method": "a"}, {"id": 2, "method": "b"}], echo)
+        assert [r["result"] for r in responses] == ["a", "b"]
+
+    def test_empty_batch_is_invalid(self):
+        response = dispatch([], echo)
+        assert response["error"]["code"] == INVALID_REQUEST
+
+    def test_invalid_batch_member(self):
+        responses = dispatch([{"id": 1, "method": "a"}, 42], echo)
+        assert responses[0]["result"] == "a"
+        assert responses[1]["error"]["code"] == INVALID_REQUEST
+
+    def test_handler_exception_becomes_error(self):
+        def boom(request):
+            raise KeyError("x")
+
+        responses = dispatch([{"id": 7, "method": "a"}], boom)
+        assert responses[0]["id"] == 7
+        assert responses[0]["error"]["code"] == INTERNAL_ERROR
+
+    def test_no_responses(self):
+        assert dispatch([{"method": "notify"}], lambda r: None) is None
@@ -0,0 +1,130 @@
+"""Tests for Logs/ writers: O_APPEND line writes and the background writer."""
+
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from src.utils import logger
+from src.utils.logger import BackgroundLogWriter, _append
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    yield tmp_path
+    logger.stop_background_writer()
+
+
+def _log_file(project, task):
+    return next((project / "Logs").glob(f"*_{task}.md"))
+
+
+class TestDirectWrites:
+    def test_header_written_once(self, project):
+        logger.log_action("First", "a", "unit")
+        logger.log_error("Second", "b", "unit")
+        text = _log_file(project, "unit").read_text()
+        assert text.count("# Log: unit") == 1
+        lines = text.splitlines()
+        assert lines[-2].endswith("** First: a")
+        assert lines[-1].endswith("ERROR** Second: b")
+
+    def test_audit_log_jsonl(self, project):
+        logger.audit_log("task_done", actor="tester", params={"n": 1})
+        [path] = (project / "Logs").glob("*_actions.jsonl")
+        record = json.loads(path.read_text())
+        assert record["action_type"] == "task_done"
+        assert record["params"] == {"n": 1}
+
+    def test_append_creates_missing_folder(self, tmp_path):
+        path = tmp_path / "new" / "x.md"
+        _append(path, b"line\n", b"header\n")
+        _append(path, b"line2\n", b"header\n")
+        assert path.read_text() == "header\nline\nline2\n"
+
+
+class TestBackgroundWriter:
+    def test_records_buffered_until_flush(self, project):
+        logger.start_background_writer(flush_interval=60, force=True)
+        logger.audit_log("queued")
+        assert not list((project / "Logs").glob("*_actions.jsonl"))
+        logger.flush_logs()
+        [path] = (project / "Logs").glob("*_actions.jsonl")
+        assert json.loads(path.read_text())["action_type"] == "queued"
+
+    def test_batches_lines_per_file(self, project):
+        writer = logger.start_background_writer(flush_interval=60, force=True)
+        for i in range(100):
+            logger.log_action("Step", str(i), "batched")
+        logger.flush_logs()
+        lines = [l for l in _log_file(project, "batched").read_text().splitlines()
+                 if l.startswith("- ")]
+        assert [l.rsplit(": ", 1)[1] for l in lines] == [str(i) for i in range(100)]
+        assert writer.records == 100
+        assert writer.writes == 1
+
+    def test_flushes_on_interval(self, tmp_path):
+        writer = BackgroundLogWriter(flush_interval=0.05).start()
+        writer.submit(tmp_path / "a.log", b"x\n")
+        deadline = time.time() + 2
+        while not (tmp_path / "a.log").exists() and time.time() < deadline:
+            time.sleep(0.01)
+        assert (tmp_path / "a.log").read_text() == "x\n"
+        writer.stop()
+
+    def test_flushes_on_size(self, tmp_path):
+        writer = BackgroundLogWriter(flush_interval=60, flush_bytes=10).start()
+        writer.submit(tmp_path / "a.log", b"0123456789\n")
+        deadline = time.time() + 2
+        while not (tmp_path / "a.log").exists() and time.time() < deadline:
+            time.sleep(0.01)
+        assert (tmp_path / "a.log").exists()
+        writer.stop()
+
+    def test_stop_flushes(self, project):
+        logger.start_background_writer(flush_interval=60, force=True)
+        logger.log_action("Last words", "", "shutdown")
+        logger.stop_background_writer()
+        assert "Last words" in _log_file(project, "shutdown").read_text()
+
+    def test_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            BackgroundLogWriter(fsync="sometimes")
+        writer = BackgroundLogWriter(fsync="flush").start()
+        writer.submit(tmp_path / "a.log", b"x\n")
+        assert writer.flush()
+        assert (tmp_path / "a.log").read_text() == "x\n"
+        writer.stop()
+
+    def test_disabled_in_config(self, project, monkeypatch):
+        monkeypatch.setattr(logger, "_load_logging_config", lambda: {"background_writer": False})
+        assert logger.start_background_writer() is None
+        logger.audit_log("direct")
+        assert list((project / "Logs").glob("*_actions.jsonl"))
+
+
+def _hammer(path, tag, n):
+    writer = BackgroundLogWriter(flush_interval=0.001, flush_bytes=512).start()
+    for i in range(n):
+        writer.submit(path, f"{tag}:{i}:{'x' * 200}\n".encode())
+    writer.stop()
+
+
+def test_processes_never_interleave_lines(tmp_path):
+    path = tmp_path / "shared.log"
+    procs = [multiprocessing.Process(target=_hammer, args=(path, t, 500)) for t in "abcd"]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2000
+    for line in lines:
+        tag, i, pad = line.split(":")
+        assert tag in "abcd" and pad == "x" * 200
+    for tag in "abcd":
+        seq = [int(l.split(":")[1]) for l in lines if l.startswith(tag)]
+        assert seq == list(range(500))
@@ -0,0 +1,168 @@
+"""Tests for the asyncio MCP client."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.mcp_async import AsyncMCPClient, run_blocking, run_sync
+from src.utils.mcp_registry import MCP_SERVERS
+
+
+def _client():
+    return AsyncMCPClient(servers={k: MCP_SERVERS[k] for k in ("payment", "odoo")},
+                          cache=False, transport="session")
+
+
+class TestAsyncMCPClient:
+    def test_call_tool(self):
+        async def go():
+            async with _client() as client:
+                return await client.call_tool("payment", "list_accounts")
+
+        assert "accounts" in asyncio.run(go())
+
+    def test_gather_across_servers(self):
+        async def go():
+            async with _client() as client:
+                return await client.gather([
+                    ("payment", "list_accounts", {}),
+                    ("odoo", "list_invoices", {"limit": 2}),
+                    ("payment", "get_balance", {"account_id": "acc_001"}),
+                ])
+
+        accounts, invoices, balance = asyncio.run(go())
+        assert "accounts" in accounts
+        assert len(invoices) == 2
+        assert balance["balance"] == 125000.00
+
+    def test_failures_returned_in_place(self):
+        async def go():
+            async with _client() as client:
+                return await client.gather([
+                    ("payment", "no_such_tool", {}),
+                    ("payment", "list_accounts", {}),
+                ])
+
+        failed, ok = asyncio.run(go())
+        assert isinstance(failed, RuntimeError)
+        assert "accounts" in ok
+
+    def test_uses_pooled_session(self):
+        from src.utils.mcp_session import get_session_manager
+
+        async def go():
+            async with _client() as client:
+                await client.call_tool("payment", "list_accounts")
+                return await client.call_tool("payment", "list_accounts")
+
+        asyncio.run(go())
+        first = get_session_manager().get("payment").pid
+        asyncio.run(go())
+        assert get_session_manager().get("payment").pid == first
+
+    def test_timeout_leaves_session_usable(self):
+        async def go():
+            async with _client() as client:
+                await client.call_tool("payment", "list_accounts")  # start the server
+                with pytest.raises(asyncio.TimeoutError):
+                    await client.call_tool("payment", "list_accounts", timeout=0)
+                return await client.call_tool("payment", "list_accounts")
+
+        assert "accounts" in asyncio.run(go())
+
+    def test_cancellation(self):
+        async def go():
+            async with _client() as client:
+                await client.call_tool("payment", "list_accounts")
+                task = asyncio.create_task(client.call_tool("payment", "list_accounts"))
+                await asyncio.sleep(0)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                return await client.call_tool("payment", "list_accounts")
+
+        assert "accounts" in asyncio.run(go())
+
+    def test_routes_through_call_mcp(self, monkeypatch):
+        from src.utils import mcp_registry
+
+        seen = []
+        real = mcp_registry.call_mcp
+        monkeypatch.setattr(mcp_registry, "call_mcp",
+                            lambda *a, **k: seen.append(a[:3]) or real(*a, **k))
+
+        async def go():
+            async with _client() as client:
+                return await client.call_tool("payment", "list_accounts")
+
+        assert "accounts" in asyncio.run(go())
+        assert seen == [("payment", "list_accounts", {})]
+
+    def test_policy_enforced(self):
+        async def go():
+            async with _client() as client:
+                await client.call_tool("payment", "list_accounts", role="cloud")
+
+        with pytest.raises(PermissionError):
+            asyncio.run(go())
+
+    def test_unknown_server(self):
+        async def go():
+            async with _client() as client:
+                await client.call_tool("email", "list_drafts")
+
+        with pytest.raises(ValueError):
+            asyncio.run(go())
+
+
+class TestHelpers:
+    def test_run_blocking_fans_out(self):
+        async def go():
+            return await asyncio.gather(*(run_blocking(time.sleep, 0.2) for _ in range(4)))
+
+        start = time.perf_counter()
+        asyncio.run(go())
+        assert time.perf_counter() - start < 0.6
+
+    def test_run_blocking_timeout(self):
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run_blocking(time.sleep, 2, timeout=0.05))
+        assert time.perf_counter() - start < 0.5   # asyncio.run does not join the thread
+
+    def test_run_sync_timeout_bounds_wall_time(self):
+        async def inner():
+            return await run_blocking(time.sleep, 2, timeout=0.05)
+
+        async def outer():
+            return run_sync(inner())
+
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            run_sync(inner())
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(outer())                    # helper-thread path
+        assert time.perf_counter() - start < 0.5
+
+    def test_run_blocking_errors_and_context(self):
+        from contextvars import ContextVar
+
+        var = ContextVar("var", default=None)
+
+        async def go():
+            var.set("caller")
+            return await run_blocking(var.get)
+
+        assert asyncio.run(go()) == "caller"
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(run_blocking(lambda: 1 / 0))
+
+    def test_run_sync_inside_running_loop(self):
+        async def inner():
+            return 42
+
+        async def outer():
+            return run_sync(inner())
+
+        assert asyncio.run(outer()) == 42
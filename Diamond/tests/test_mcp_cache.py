@@ -0,0 +1,143 @@
+"""Tests for the SAFE-tool MCP result cache."""
+
+import time
+
+import pytest
+
+from src.utils import mcp_cache
+from src.utils.mcp_cache import MCPCache, get_mcp_cache, make_key
+from src.utils.mcp_registry import call_mcp
+
+
+class Counter:
+    def __init__(self, result=None):
+        self.calls = 0
+        self.result = result if result is not None else {"items": [1, 2, 3]}
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture
+def cache():
+    return MCPCache(default_ttl=60)
+
+
+class TestMCPCache:
+    def test_safe_tool_is_cached(self, cache):
+        fetch = Counter()
+        assert cache.call("odoo", "list_invoices", {"limit": 5}, fetch) == {"items": [1, 2, 3]}
+        assert cache.call("odoo", "list_invoices", {"limit": 5}, fetch) == {"items": [1, 2, 3]}
+        assert fetch.calls == 1
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_key_ignores_argument_order(self):
+        assert make_key("odoo", "t", {"a": 1, "b": 2}) == make_key("odoo", "t", {"b": 2, "a": 1})
+        assert make_key("odoo", "t", None) == make_key("odoo", "t", {})
+
+    def test_hits_return_copies(self, cache):
+        fetch = Counter()
+        first = cache.call("odoo", "list_partners", {}, fetch)
+        first["items"].append(99)
+        assert cache.call("odoo", "list_partners", {}, fetch) == {"items": [1, 2, 3]}
+
+    def test_non_safe_tools_not_cached(self, cache):
+        fetch = Counter()
+        cache.call("odoo", "create_invoice_draft", {}, fetch)
+        cache.call("odoo", "create_invoice_draft", {}, fetch)
+        assert fetch.calls == 2
+        assert cache.get_stats()["entries"] == 0
+
+    def test_write_invalidates_server(self, cache):
+        reads = Counter()
+        cache.call("odoo", "list_invoices", {}, reads)
+        cache.call("social", "get_social_summary", {}, Counter())
+        cache.call("odoo", "post_invoice", {"invoice_id": 1}, Counter())
+        cache.call("odoo", "list_invoices", {}, reads)
+        assert reads.calls == 2
+        # other servers keep their entries
+        assert cache.get_stats()["entries"] == 2
+
+    def test_stale_read_not_stored_after_write(self, cache):
+        key = make_key("odoo", "list_invoices", {})
+        generation = cache.generation("odoo")
+        cache.invalidate_server("odoo")  # a write lands while the read is in flight
+        assert cache.put(key, {"stale": True}, generation) is False
+        assert cache.get_stats()["entries"] == 0
+
+    def test_ttl_expiry(self):
+        cache = MCPCache(default_ttl=60, tool_ttls={"get_balance": 0.05})
+        fetch = Counter()
+        cache.call("payment", "get_balance", {}, fetch)
+        time.sleep(0.1)
+        cache.call("payment", "get_balance", {}, fetch)
+        assert fetch.calls == 2
+        assert cache.get_stats()["expired"] == 1
+
+    def test_zero_ttl_disables_tool(self):
+        cache = MCPCache(tool_ttls={"get_balance": 0})
+        fetch = Counter()
+        cache.call("payment", "get_balance", {}, fetch)
+        cache.call("payment", "get_balance", {}, fetch)
+        assert fetch.calls == 2
+
+    def test_errors_not_cached(self, cache):
+        fetch = Counter({"error": "boom"})
+        cache.call("odoo", "list_invoices", {}, fetch)
+        cache.call("odoo", "list_invoices", {}, fetch)
+        assert fetch.calls == 2
+
+    def test_lru_entry_limit(self):
+        cache = MCPCache(max_entries=2)
+        for i in range(3):
+            cache.call("odoo", "read_invoice", {"invoice_id": i}, Counter())
+        cache.call("odoo", "read_invoice", {"invoice_id": 2}, Counter())  # most recent
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        fetch = Counter()
+        cache.call("odoo", "read_invoice", {"invoice_id": 0}, fetch)
+        assert fetch.calls == 1
+
+    def test_memory_cap(self):
+        cache = MCPCache(max_bytes=200)
+        for i in range(5):
+            cache.call("odoo", "read_invoice", {"invoice_id": i}, Counter({"data": "x" * 80}))
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 200
+        assert stats["entries"] == 2
+
+    def test_disabled(self):
+        cache = MCPCache(enabled=False)
+        fetch = Counter()
+        cache.call("odoo", "list_invoices", {}, fetch)
+        cache.call("odoo", "list_invoices", {}, fetch)
+        assert fetch.calls == 2
+
+
+class TestCallMCPCache:
+    def test_call_mcp_uses_cache(self):
+        cache = get_mcp_cache()
+        cache.invalidate_server("payment")
+        before = cache.get_stats()["hits"]
+        first = call_mcp("payment", "list_accounts", {}, transport="in_process")
+        second = call_mcp("payment", "list_accounts", {}, transport="in_process")
+        assert first == second
+        assert cache.get_stats()["hits"] == before + 1
+
+    def test_bypass(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(mcp_cache.MCPCache, "call",
+                            lambda *a, **kw: calls.append(a) or {})
+        call_mcp("payment", "list_accounts", {}, transport="in_process", cache=False)
+        assert calls == []
+
+    def test_api_metrics_include_cache(self, tmp_path):
+        from src.api.api_server import APIServer
+
+        metrics = APIServer(tmp_path).get_metrics()
+        assert "hits" in metrics["mcp_cache"]
+        assert "misses" in metrics["mcp_cache"]
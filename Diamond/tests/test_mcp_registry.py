@@ -0,0 +1,147 @@
+"""Tests for MCP registry transports."""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.utils import mcp_registry
+from src.utils.mcp_cache import get_mcp_cache
+from src.utils.mcp_registry import call_mcp, call_mcp_batch, list_tools
+
+
+class TestInProcessTransport:
+    def test_call_tool(self):
+        result = call_mcp("payment", "list_accounts", {}, transport="in_process")
+        assert "accounts" in result
+
+    def test_odoo_gets_shared_connection(self):
+        invoices = call_mcp("odoo", "list_invoices", {"limit": 1}, transport="in_process")
+        assert len(invoices) == 1
+        handler = mcp_registry._in_process_handlers["odoo"]
+        call_mcp("odoo", "list_partners", {}, transport="in_process")
+        assert mcp_registry._in_process_handlers["odoo"] is handler
+
+    def test_odoo_connection_used_by_one_thread_at_a_time(self, monkeypatch):
+        import threading
+        import time
+
+        from src.mcp_odoo import odoo_server
+
+        mcp_registry._load_in_process_handler("odoo")
+        active, peak = [0], [0]
+        real = odoo_server.handle_request
+
+        def tracked(request, odoo):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            active[0] -= 1
+            return real(request, odoo)
+
+        monkeypatch.setattr(odoo_server, "handle_request", tracked)
+        threads = [threading.Thread(target=call_mcp, args=("odoo", "list_partners", {}),
+                                    kwargs={"transport": "in_process", "cache": False})
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak[0] == 1
+
+    def test_server_import_has_no_side_effects(self):
+        script = ("import dotenv, logging; calls = []; "
+                  "dotenv.load_dotenv = lambda *a, **k: calls.append(a); "
+                  "import src.mcp_odoo.odoo_server, src.mcp_social.social_server, "
+                  "src.mcp_email.email_server; "
+                  "assert not calls and not logging.getLogger().handlers, calls")
+        subprocess.run([sys.executable, "-c", script], check=True,
+                       cwd=mcp_registry.PROJECT_ROOT, timeout=30)
+
+    def test_matches_session_transport(self):
+        in_process = call_mcp("payment", "list_accounts", {}, transport="in_process")
+        session = call_mcp("payment", "list_accounts", {}, transport="session")
+        assert in_process == session
+
+    def test_policy_still_enforced(self):
+        with pytest.raises(PermissionError):
+            call_mcp("email", "send_email", {"to": "a@b.c"}, role="cloud",
+                     transport="in_process")
+
+        with pytest.raises(PermissionError):
+            call_mcp("payment", "list_accounts", {}, role="cloud", transport="in_process")
+
+    def test_tool_error_raises(self):
+        with pytest.raises(RuntimeError):
+            call_mcp("payment", "no_such_tool", {}, transport="in_process")
+
+    def test_list_tools(self):
+        names = {t["name"] for t in list_tools("payment", transport="in_process")}
+        assert "list_accounts" in names
+
+
+class TestTransportSelection:
+    def test_unknown_transport(self):
+        with pytest.raises(ValueError):
+            call_mcp("payment", "list_accounts", {}, transport="carrier_pigeon")
+
+    def test_role_override(self, monkeypatch):
+        from src.config.agent_config import AgentConfig
+
+        monkeypatch.setattr(AgentConfig, "_load_config", staticmethod(lambda: {
+            "mcp": {"transport": "session", "role_transports": {"local": "in_process"}},
+        }))
+        assert mcp_registry._default_transport("local") == "in_process"
+        assert mcp_registry._default_transport("cloud") == "session"
+        assert mcp_registry._default_transport() == "session"
+
+
+class TestBatch:
+    @pytest.mark.parametrize("server", sorted(mcp_registry.MCP_SERVERS))
+    def test_server_loop_answers_batches(self, server):
+        responses = mcp_registry._raw_batch(
+            mcp_registry.MCP_SERVERS[server], [("initialize", {}), ("tools/list", None)]
+        )
+        assert "serverInfo" in responses[0]["result"]
+        assert responses[1]["result"]["tools"]
+
+    @pytest.mark.parametrize("transport", ["session", "in_process", "spawn"])
+    def test_call_mcp_batch(self, transport):
+        accounts, balance, missing = call_mcp_batch("payment", [
+            ("list_accounts", {}),
+            ("get_balance", {"account_id": "acc_001"}),
+            ("get_balance", {"account_id": "nope"}),
+        ], transport=transport, cache=False)
+        assert "accounts" in accounts
+        assert balance["balance"] == 125000.00
+        assert "error" in missing
+
+    def test_odoo_batch(self):
+        invoices, partners = call_mcp_batch(
+            "odoo", [("list_invoices", {}), ("list_partners", {})], transport="session"
+        )
+        assert invoices and partners
+
+    def test_empty_batch(self):
+        assert call_mcp_batch("payment", [], transport="in_process") == []
+
+    def test_policy_checked_for_every_call(self):
+        with pytest.raises(PermissionError):
+            call_mcp_batch("email", [("list_drafts", {}), ("send_email", {})],
+                           role="cloud", transport="in_process")
+
+    def test_batch_uses_cache(self):
+        cache = get_mcp_cache()
+        cache.invalidate_server("payment")
+        call_mcp_batch("payment", [("list_accounts", {})], transport="in_process")
+        hits = cache.get_stats()["hits"]
+        call_mcp_batch("payment", [("list_accounts", {}), ("list_transactions", {})],
+                       transport="in_process")
+        assert cache.get_stats()["hits"] == hits + 1
+
+    def test_batch_with_write_invalidates(self):
+        cache = get_mcp_cache()
+        call_mcp("payment", "list_accounts", {}, transport="in_process")
+        call_mcp_batch("payment", [("payment_status", {"payment_id": "x"}),
+                                   ("initiate_payment", {})], transport="in_process")
+        assert not any(k[0] == "payment" for k in cache._entries)
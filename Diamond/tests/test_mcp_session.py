@@ -0,0 +1,188 @@
+"""Tests for persistent MCP server sessions."""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from src.utils.mcp_registry import MCP_SERVERS
+from src.utils.mcp_session import MCPSession, MCPSessionError, MCPSessionManager
+
+
+@pytest.fixture
+def manager():
+    mgr = MCPSessionManager(servers={"payment": MCP_SERVERS["payment"]}, idle_timeout=300)
+    yield mgr
+    mgr.close_all()
+
+
+class TestMCPSession:
+    def test_start_runs_initialize(self):
+        session = MCPSession("payment", MCP_SERVERS["payment"])
+        session.start()
+        try:
+            assert session.alive
+            assert session.calls == 1  # the initialize handshake
+        finally:
+            session.close()
+        assert not session.alive
+
+    def test_call_tool(self):
+        session = MCPSession("payment", MCP_SERVERS["payment"])
+        session.start()
+        try:
+            result = session.call_tool("list_accounts", {})
+            assert "accounts" in result
+        finally:
+            session.close()
+
+    def test_bad_module_fails_initialize(self):
+        session = MCPSession("bogus", "src.does_not_exist", startup_timeout=5)
+        with pytest.raises(MCPSessionError):
+            session.start()
+        assert not session.alive
+
+
+class TestMCPSessionManager:
+    def test_reuses_process(self, manager):
+        manager.call_tool("payment", "list_accounts")
+        pid = manager.get("payment").pid
+        manager.call_tool("payment", "list_accounts")
+        assert manager.get("payment").pid == pid
+
+    def test_concurrent_calls_matched_by_id(self, manager):
+        results = {}
+
+        def worker(i):
+            results[i] = manager.call_tool("payment", "payment_status",
+                                           {"payment_id": f"missing-{i}"})
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, result in results.items():
+            assert f"missing-{i}" in result["error"]
+
+    def test_restarts_crashed_server(self, manager):
+        session = manager.get("payment")
+        old_pid = session.pid
+        session._proc.kill()
+        session._proc.wait()
+
+        manager.call_tool("payment", "list_accounts")
+        assert manager.get("payment").pid != old_pid
+        assert manager.get_stats()["restarts"] == 1
+
+    def test_recycles_idle_server(self, manager):
+        session = manager.get("payment")
+        old_pid = session.pid
+        session.last_used = time.time() - 1000
+
+        assert manager.get("payment").pid != old_pid
+        assert manager.get_stats()["recycled"] == 1
+
+    def test_unknown_server(self, manager):
+        with pytest.raises(ValueError):
+            manager.get("nope")
+
+    def test_stats(self, manager):
+        manager.call_tool("payment", "list_accounts")
+        stats = manager.get_stats()
+        assert stats["sessions"]["payment"]["alive"] is True
+        assert stats["sessions"]["payment"]["calls"] >= 2
+
+    def test_request_batch(self, manager):
+        responses = manager.request_batch("payment", [
+            ("tools/list", None),
+            ("tools/call", {"name": "list_accounts", "arguments": {}}),
+        ])
+        assert responses[0]["result"]["tools"]
+        assert "result" in responses[1]
+
+    def test_busy_session_is_not_recycled(self, manager):
+        """A slow call must not be killed as idle by a concurrent get()."""
+        session = manager.get("payment")
+        pid = session.pid
+        manager.idle_timeout = 0.01
+        os.kill(pid, signal.SIGSTOP)          # the call below hangs until SIGCONT
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(
+            manager.call_tool("payment", "list_accounts", timeout=10)))
+        try:
+            worker.start()
+            time.sleep(0.2)
+            assert session.busy
+            assert manager.get("payment").pid == pid
+        finally:
+            os.kill(pid, signal.SIGCONT)
+        worker.join(10)
+        assert "accounts" in result
+        assert manager.get_stats()["recycled"] == 0
+
+    def test_dangerous_call_not_resent_after_crash(self, manager):
+        session = manager.get("payment")
+        os.kill(session.pid, signal.SIGSTOP)
+        errors = []
+
+        def pay():
+            try:
+                manager.call_tool("payment", "initiate_payment", {"amount": 1}, timeout=10)
+            except MCPSessionError as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=pay)
+        worker.start()
+        time.sleep(0.2)
+        session._proc.kill()                  # dies after the request was written
+        worker.join(10)
+        assert len(errors) == 1 and errors[0].sent
+        assert manager.get_stats()["restarts"] == 0    # no second process was asked
+
+    def test_unsent_request_is_retried(self, manager):
+        session = manager.get("payment")
+        session._proc.stdin.close()           # the write fails before anything is sent
+        result = manager.call_tool("payment", "initiate_payment",
+                                   {"amount": 1, "recipient": "x"})
+        assert manager.get("payment") is not session
+        assert isinstance(result, dict)
+
+    def test_failed_call_leaves_replacement_session_open(self, manager, monkeypatch):
+        stale = manager.get("payment")
+        stale._proc.stdin.close()             # the next write on it fails
+        with manager._lock:
+            del manager._sessions["payment"]
+        fresh = manager.get("payment")        # another worker's replacement
+
+        real_get = manager.get
+        handed_out = iter([stale])            # this worker still holds the stale one
+        monkeypatch.setattr(manager, "get", lambda name: next(handed_out, None) or real_get(name))
+        manager.call_tool("payment", "list_accounts")
+        assert manager.get("payment") is fresh
+        assert fresh.alive and not stale.alive
+
+    def test_start_does_not_hold_manager_lock(self, manager, monkeypatch):
+        started = threading.Event()
+        release = threading.Event()
+        real_start = MCPSession.start
+
+        def slow_start(session):
+            started.set()
+            release.wait(10)
+            real_start(session)
+
+        monkeypatch.setattr(MCPSession, "start", slow_start)
+        worker = threading.Thread(target=manager.get, args=("payment",))
+        worker.start()
+        try:
+            assert started.wait(10)
+            assert manager._lock.acquire(timeout=1)
+            manager._lock.release()
+        finally:
+            release.set()
+            worker.join(10)
+        assert manager.get("payment").alive
@@ -1,5 +1,7 @@
 """Tests for A2A message bus."""
 
+import asyncio
+import threading
 import time
 import pytest
 from src.a2a.message import A2AMessage, MessageType, MessagePriority
@@ -135,6 +137,7 @@ class TestMockMessageBus:
         received = []
         bus.subscribe("agent-b", lambda m: received.append(m))
         bus.publish(_make_msg())
+        assert bus.flush_subscribers(timeout=5)
         assert len(received) == 1
 
     def test_stats(self):
@@ -143,3 +146,174 @@ class TestMockMessageBus:
         stats = bus.get_stats()
         assert stats["total_published"] == 1
         assert stats["backend"] == "memory"
+
+    def test_fifo_within_priority(self):
+        bus = MockMessageBus()
+        for i in range(5):
+            bus.publish(_make_msg(priority=MessagePriority.HIGH, payload={"i": i}))
+            bus.publish(_make_msg(priority=MessagePriority.LOW, payload={"i": i}))
+        messages = bus.consume("agent-b", max_messages=10)
+        assert [m.payload["i"] for m in messages] == [0, 1, 2, 3, 4] * 2
+        assert [m.priority for m in messages[:5]] == [MessagePriority.HIGH] * 5
+
+    def test_depth_counters_track_consume_and_expiry(self):
+        bus = MockMessageBus()
+        expired = _make_msg(priority=MessagePriority.URGENT)
+        expired.timestamp = time.time() - 7200
+        bus.publish(expired)
+        for _ in range(3):
+            bus.publish(_make_msg())
+        bus.publish(_make_msg(recipient="agent-c"))
+        assert bus.peek("agent-b") == 3
+        assert bus.get_stats()["total_queued"] == 4
+
+        assert len(bus.consume("agent-b", max_messages=2)) == 2
+        assert bus.peek("agent-b") == 1
+        assert bus.get_stats()["total_queued"] == 2
+
+        bus.clear("agent-c")
+        stats = bus.get_stats()
+        assert stats["total_queued"] == 1
+        assert stats["total_consumed"] == 2
+        assert stats["queues"]["agent-b"] == {"depth": 1, "expired": 1}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+
+class TestExpiryWheel:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from src.a2a import message_bus
+        clock = FakeClock()
+        monkeypatch.setattr(message_bus, "time", clock)
+        return clock
+
+    def _msg(self, clock, recipient="agent-b", ttl=10, **kwargs):
+        msg = _make_msg(recipient=recipient, **kwargs)
+        msg.timestamp, msg.ttl = clock.now, ttl
+        return msg
+
+    def test_idle_queue_is_swept_and_frees_capacity(self, clock):
+        bus = MockMessageBus(max_queue_size=2)
+        bus.publish(self._msg(clock, ttl=5))
+        bus.publish(self._msg(clock, ttl=50))
+        assert bus.publish(self._msg(clock)) is False
+
+        clock.now += 7                       # only another agent's traffic
+        bus.publish(self._msg(clock, recipient="agent-z"))
+        stats = bus.get_stats()
+        assert stats["queues"]["agent-b"] == {"depth": 1, "expired": 1}
+        assert stats["total_expired"] == 1 and stats["total_queued"] == 2
+        assert bus.publish(self._msg(clock)) is True
+
+    def test_dead_entries_are_compacted(self, clock):
+        bus = MockMessageBus(max_queue_size=10_000)
+        for _ in range(500):
+            bus.publish(self._msg(clock, ttl=1))
+        bus.publish(self._msg(clock, ttl=100))
+        clock.now += 3
+        assert bus.peek("agent-b") == 1
+        queue = bus._queues["agent-b"]
+        assert queue.stored == 1
+        assert not bus._wheel or all(len(s) == 1 for s in bus._wheel.values())
+
+    def test_broadcast_is_one_shared_entry(self, clock):
+        bus = MockMessageBus()
+        for agent in ("agent-a", "agent-c", "agent-d"):
+            bus.consume(agent)               # register the queues
+        bus.publish(self._msg(clock, recipient="all", priority=MessagePriority.URGENT))
+        [slot] = bus._wheel.values()
+        [entry] = slot
+        assert len(entry.holders) == 2       # sender agent-a excluded
+
+        bus.publish(self._msg(clock, sender="x", recipient="agent-c"))
+        assert bus.consume("agent-c")[0].is_broadcast  # urgent lane first
+        assert len(entry.holders) == 1
+        assert bus.consume("agent-d")[0].is_broadcast
+        assert entry not in bus._wheel.get(entry.slot, ())
+
+    def test_broadcast_expiry_counts_per_queue(self, clock):
+        bus = MockMessageBus()
+        for agent in ("agent-c", "agent-d"):
+            bus.consume(agent)
+        bus.publish(self._msg(clock, recipient="all", ttl=2))
+        assert bus.get_stats()["total_queued"] == 2
+        clock.now += 4
+        stats = bus.get_stats()
+        assert stats["total_queued"] == 0 and stats["total_expired"] == 2
+        assert stats["queues"]["agent-c"]["expired"] == 1
+        assert bus.consume("agent-d") == []
+
+
+class TestBlockingConsume:
+    def test_waits_for_publish(self):
+        bus = MockMessageBus()
+        timer = threading.Timer(0.05, lambda: bus.publish(_make_msg()))
+        timer.start()
+        start = time.monotonic()
+        messages = bus.consume("agent-b", timeout=5)
+        assert len(messages) == 1
+        assert time.monotonic() - start < 2
+        timer.join()
+
+    def test_timeout_returns_empty(self):
+        bus = MockMessageBus()
+        start = time.monotonic()
+        assert bus.consume("agent-b", timeout=0.1) == []
+        assert 0.09 <= time.monotonic() - start < 1
+
+    def test_other_queue_does_not_wake(self):
+        bus = MockMessageBus()
+        bus.publish(_make_msg(recipient="agent-c"))
+        assert bus.consume("agent-b", timeout=0.05) == []
+
+    def test_close_releases_waiters(self):
+        bus = MockMessageBus()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(bus.consume("agent-b", timeout=None)))
+        waiter.start()
+        time.sleep(0.05)
+        bus.close()
+        waiter.join(2)
+        assert result == [[]]
+
+    def test_aconsume(self):
+        bus = MockMessageBus()
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, lambda: threading.Thread(
+                target=bus.publish, args=(_make_msg(),)).start())
+            messages = await bus.aconsume("agent-b", timeout=5)
+            empty = await bus.aconsume("agent-b", timeout=0.05)
+            return messages, empty
+
+        messages, empty = asyncio.run(scenario())
+        assert len(messages) == 1 and empty == []
+        assert bus._queues["agent-b"].async_waiters == []
+
+    def test_slow_subscriber_does_not_block_publish(self):
+        bus = MockMessageBus()
+        release = threading.Event()
+        received = []
+
+        def slow(message):
+            release.wait(5)
+            received.append(message.payload["i"])
+
+        bus.subscribe("agent-b", slow)
+        start = time.monotonic()
+        for i in range(3):
+            bus.publish(_make_msg(payload={"i": i}))
+        assert time.monotonic() - start < 1
+        assert len(bus.consume("agent-b")) == 3
+        release.set()
+        assert bus.flush_subscribers(timeout=5)
+        assert received == [0, 1, 2]
+        bus.close()
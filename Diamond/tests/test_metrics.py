@@ -0,0 +1,130 @@
+"""Tests for the Prometheus metrics registry and its wiring."""
+
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from src.a2a.message import A2AMessage, MessageType
+from src.a2a.message_bus import MockMessageBus
+from src.api.api_server import APIServer
+from src.orchestrator.orchestrator import Orchestrator
+from src.utils import metrics
+from src.utils.mcp_registry import call_mcp
+from src.utils.metrics import MetricsRegistry, start_http_server
+from src.utils.retry import RetryExhausted, with_retry
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+            for line in text.splitlines() if line and not line.startswith("#")}
+
+
+class TestRegistry:
+    def test_counter_and_gauge_exposition(self, registry):
+        tasks = registry.counter("tasks_total", "Tasks", ("type", "outcome"))
+        tasks.inc(type="email", outcome="success")
+        tasks.inc(2, type="email", outcome="success")
+        depth = registry.gauge("depth", "Depth", ("agent",))
+        depth.set(4, agent='sales "1"')
+
+        text = registry.render()
+        assert "# TYPE tasks_total counter" in text
+        assert "# HELP depth Depth" in text
+        samples = _samples(text)
+        assert samples['tasks_total{type="email",outcome="success"}'] == 3
+        assert samples['depth{agent="sales \\"1\\""}'] == 4
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        latency = registry.histogram("latency_seconds", "Latency", ("skill",),
+                                     buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            latency.observe(value, skill="plan")
+        samples = _samples(registry.render())
+        assert samples['latency_seconds_bucket{skill="plan",le="0.1"}'] == 1
+        assert samples['latency_seconds_bucket{skill="plan",le="1.0"}'] == 3
+        assert samples['latency_seconds_bucket{skill="plan",le="+Inf"}'] == 4
+        assert samples['latency_seconds_count{skill="plan"}'] == 4
+        assert samples['latency_seconds_sum{skill="plan"}'] == pytest.approx(4.25)
+
+    def test_label_and_type_checks(self, registry):
+        counter = registry.counter("c_total", "C", ("a",))
+        with pytest.raises(ValueError):
+            counter.inc(b="x")
+        with pytest.raises(ValueError):
+            counter.inc(-1, a="x")
+        with pytest.raises(ValueError):
+            registry.gauge("c_total", "C", ("a",))
+        assert registry.counter("c_total", "C", ("a",)) is counter
+
+    def test_collectors_run_on_render(self, registry):
+        gauge = registry.gauge("g", "G")
+        registry.register_collector(lambda: gauge.set(7))
+        assert _samples(registry.render())["g"] == 7
+
+    def test_http_scrape(self, registry):
+        registry.counter("scraped_total", "S").inc()
+        server = start_http_server(0, registry=registry)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as resp:
+                assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert "scraped_total 1" in resp.read().decode()
+        finally:
+            server.shutdown()
+
+
+class TestWiring:
+    def test_bus_queue_depth_and_messages(self):
+        bus = MockMessageBus()
+        published = metrics.BUS_MESSAGES.value(event="published")
+        for _ in range(3):
+            bus.publish(A2AMessage(sender_id="a", recipient_id="metrics-agent",
+                                   message_type=MessageType.TASK_DELEGATION, payload={}))
+        assert metrics.BUS_QUEUE_DEPTH.value(agent="metrics-agent") == 3
+        bus.consume("metrics-agent", max_messages=2)
+        assert metrics.BUS_QUEUE_DEPTH.value(agent="metrics-agent") == 1
+        assert metrics.BUS_MESSAGES.value(event="published") - published == 3
+
+    def test_retry_counts(self):
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=0)
+        def flaky_for_metrics():
+            calls.append(1)
+            raise RuntimeError("down")
+
+        before = metrics.RETRIES.value(function="flaky_for_metrics")
+        with pytest.raises(RetryExhausted):
+            flaky_for_metrics()
+        assert metrics.RETRIES.value(function="flaky_for_metrics") - before == 2
+        assert metrics.RETRIES_EXHAUSTED.value(function="flaky_for_metrics") >= 1
+
+    def test_mcp_latency(self):
+        labels = dict(server="payment", tool="list_accounts", result="success")
+        before = metrics.MCP_LATENCY.count(**labels)
+        call_mcp("payment", "list_accounts", {}, transport="in_process", cache=False)
+        assert metrics.MCP_LATENCY.count(**labels) == before + 1
+
+    def test_claude_latency(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+        orch = Orchestrator(dry_run=False)
+        labels = dict(skill="metrics_skill", result="success")
+        before = metrics.CLAUDE_LATENCY.count(**labels)
+        with patch.object(Orchestrator, "_invoke_claude_raw", return_value="ok"):
+            assert orch._invoke_claude("metrics_skill", "ctx") == "ok"
+        assert metrics.CLAUDE_LATENCY.count(**labels) == before + 1
+
+    def test_api_serves_folder_depths(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+        (tmp_path / "Needs_Action").mkdir()
+        for i in range(2):
+            (tmp_path / "Needs_Action" / f"EMAIL_{i}.md").write_text("---\ntype: email\n---\n")
+        text = APIServer(tmp_path).get_prometheus_metrics()
+        assert _samples(text)['ai_employee_folder_depth{folder="Needs_Action"}'] == 2
+        assert "# TYPE ai_employee_claude_call_seconds histogram" in text
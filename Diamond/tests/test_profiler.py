@@ -0,0 +1,159 @@
+"""Tests for the built-in sampling profiler."""
+
+import argparse
+import json
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from src.utils import logger, profiler
+from src.utils.profiler import ProfilerControl, StackSampler
+from src.watchers.gmail_watcher import GmailWatcher
+
+
+def busy_loop_for_profiler(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_loop_for_profiler, args=(stop,), name="busy")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestStackSampler:
+    def test_collapsed_stacks(self, busy_thread, tmp_path):
+        sampler = StackSampler(interval=0.002).start()
+        assert _wait_for(lambda: sampler.samples >= 20)
+        sampler.stop()
+
+        lines = sampler.collapsed()
+        busy = [l for l in lines if l.startswith("busy;")]
+        assert busy and any("busy_loop_for_profiler (test_profiler.py:" in l for l in busy)
+        assert not any(l.startswith("stack-sampler") for l in lines)
+        total = sum(int(l.rsplit(" ", 1)[1]) for l in busy)
+        assert total == sampler.samples
+
+    def test_speedscope_document(self, busy_thread, tmp_path):
+        sampler = StackSampler(interval=0.002).start()
+        assert _wait_for(lambda: sampler.samples >= 10)
+        sampler.stop()
+
+        collapsed, speedscope = sampler.write("unit", tmp_path)
+        assert collapsed.suffix == ".collapsed"
+        doc = json.loads(speedscope.read_text())
+        frames = doc["shared"]["frames"]
+        busy = next(p for p in doc["profiles"] if p["name"] == "busy")
+        assert busy["type"] == "sampled"
+        assert all(0 <= i < len(frames) for s in busy["samples"] for i in s)
+        assert sum(busy["weights"]) == pytest.approx(busy["endValue"])
+        assert any(f["name"] == "busy_loop_for_profiler" for f in frames)
+
+
+class TestProfilerControl:
+    def test_flag_starts_sampler_and_close_writes(self, tmp_path):
+        control = ProfilerControl("unit", interval=0.002, folder=tmp_path)
+        control.start()
+        assert _wait_for(lambda: control.sampler.samples >= 5)
+        paths = control.close()
+        assert [p.suffix for p in paths] == [".collapsed", ".json"]
+        assert control.close() == []
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="needs SIGUSR2")
+    def test_sigusr2_toggles(self, tmp_path):
+        previous = signal.getsignal(signal.SIGUSR2)
+        control = ProfilerControl("unit", interval=0.002, folder=tmp_path)
+        try:
+            assert control.install_signal()
+            os.kill(os.getpid(), signal.SIGUSR2)
+            assert _wait_for(lambda: control.sampler is not None and control.sampler.samples >= 5)
+            os.kill(os.getpid(), signal.SIGUSR2)
+            assert _wait_for(lambda: len(control.written) == 2)
+            assert control.sampler is None
+        finally:
+            signal.signal(signal.SIGUSR2, previous)
+
+    def test_poll_cprofile(self, tmp_path):
+        control = ProfilerControl("unit", folder=tmp_path)
+        calls = []
+        poll = control.wrap_poll(lambda: calls.append(sum(range(1000))) or len(calls), polls=2)
+        assert [poll(), poll(), poll()] == [1, 2, 3]
+        dumps = sorted(tmp_path.glob("unit_poll_*.pstats"))
+        assert len(dumps) == 2
+        assert pstats.Stats(str(dumps[0])).total_calls > 0
+
+    def test_setup_wraps_target(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler, "profiles_dir", lambda: tmp_path)
+        monkeypatch.setattr(ProfilerControl, "install_signal", lambda self, signum=None: False)
+
+        class Daemon:
+            def tick(self):
+                return "ticked"
+
+        daemon = Daemon()
+        args = argparse.Namespace(profile=False, profile_interval=10.0, profile_polls=1)
+        control = profiler.setup("daemon", args, target=daemon, poll_method="tick")
+        assert daemon.tick() == "ticked"
+        assert control.sampler is None
+        assert len(list(tmp_path.glob("daemon_poll_*.pstats"))) == 1
+
+
+    def test_poll_profile_covers_pool_tasks(self, tmp_path, monkeypatch):
+        from src.orchestrator.task_pool import TaskPool
+
+        monkeypatch.setattr(profiler, "profiles_dir", lambda: tmp_path)
+        monkeypatch.setattr(ProfilerControl, "install_signal", lambda self, signum=None: False)
+
+        def pool_task_marker(task):
+            return sum(range(1000)) > 0
+
+        class Daemon:
+            pool = TaskPool(max_workers=4)
+
+            def poll_once(self):
+                return self.pool.run([{"filename": f"T{i}.md"} for i in range(3)],
+                                     pool_task_marker)
+
+        daemon = Daemon()
+        args = argparse.Namespace(profile=False, profile_interval=10.0, profile_polls=1)
+        profiler.setup("daemon", args, target=daemon)
+        assert daemon.poll_once() == 3
+        assert daemon.pool.inline is False
+        [dump] = tmp_path.glob("daemon_poll_*.pstats")
+        names = {func for _, _, func in pstats.Stats(str(dump)).stats}
+        assert "pool_task_marker" in names
+        daemon.pool.shutdown()
+
+
+def test_watcher_cli_profile(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    monkeypatch.setattr("src.watchers.base_watcher.get_project_root", lambda: tmp_path)
+    monkeypatch.setattr(ProfilerControl, "install_signal", lambda self, signum=None: False)
+    monkeypatch.setattr(sys, "argv", ["gmail_watcher", "--mock", "--dry-run", "--once",
+                                      "--profile", "--profile-polls", "1"])
+    try:
+        GmailWatcher.cli_main()
+    finally:
+        logger.stop_background_writer()  # cli_main started it for the process
+
+    names = sorted(p.name for p in (tmp_path / "Logs" / "profiles").iterdir())
+    assert any(n.startswith("gmail_watcher_poll_") and n.endswith(".pstats") for n in names)
+    assert any(n.endswith(".collapsed") for n in names)
+    assert any(n.endswith(".speedscope.json") for n in names)
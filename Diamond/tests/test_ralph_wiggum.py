@@ -10,10 +10,11 @@ from src.utils import frontmatter
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
-    """Create a temporary project structure."""
+def tmp_project(tmp_path, monkeypatch):
+    """Create a temporary project structure (logs and error files land there too)."""
     for folder in ["Needs_Action", "Pending_Approval", "Approved", "Done", "Errors", "Logs"]:
         (tmp_path / folder).mkdir()
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
     return tmp_path
 
 
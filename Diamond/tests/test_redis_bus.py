@@ -0,0 +1,127 @@
+"""Tests for the Redis Streams A2A bus, run against fakeredis."""
+
+import threading
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.a2a.message import A2AMessage, MessagePriority, MessageType  # noqa: E402
+from src.a2a.message_bus import create_message_bus  # noqa: E402
+from src.a2a.redis_bus import RedisStreamsBus, _decode, _encode  # noqa: E402
+from tests import test_message_bus  # noqa: E402
+
+
+def _msg(recipient="agent-b", sender="agent-a", priority=MessagePriority.NORMAL, **payload):
+    return A2AMessage(sender, recipient, MessageType.TASK_DELEGATION,
+                      payload or {"test": True}, priority=priority)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _bus(server, **kwargs):
+    return RedisStreamsBus(client=fakeredis.FakeRedis(server=server), **kwargs)
+
+
+class TestMessageBusBehaviour(test_message_bus.TestMockMessageBus):
+    """The memory bus's behaviour tests, with RedisStreamsBus in its place."""
+
+    @pytest.fixture(autouse=True)
+    def redis_backend(self, server, monkeypatch):
+        monkeypatch.setattr(test_message_bus, "MockMessageBus",
+                            lambda max_queue_size=1000: _bus(server, max_queue_size=max_queue_size))
+
+    def test_stats(self):
+        bus = test_message_bus.MockMessageBus()
+        bus.publish(_msg())
+        stats = bus.get_stats()
+        assert stats["total_published"] == 1
+        assert stats["backend"] == "redis"
+
+    def test_depth_counters_track_consume_and_expiry(self):
+        bus = test_message_bus.MockMessageBus()
+        expired = _msg(priority=MessagePriority.URGENT)
+        expired.timestamp = time.time() - 7200
+        bus.publish(expired)
+        for _ in range(3):
+            bus.publish(_msg())
+        bus.publish(_msg(recipient="agent-c"))
+        assert bus.peek("agent-b") == 3
+
+        assert len(bus.consume("agent-b", max_messages=2)) == 2
+        bus.clear("agent-c")
+        stats = bus.get_stats()
+        assert stats["total_queued"] == 1 and stats["total_consumed"] == 2
+        # Consumed but unacked messages stay in flight
+        assert stats["queues"]["agent-b"] == {"depth": 1, "in_flight": 2, "expired": 1}
+
+
+class TestRedisStreamsBus:
+    def test_compact_encoding_round_trip(self):
+        msg = _msg(priority=MessagePriority.HIGH, n=1)
+        raw = _encode(msg)
+        assert " " not in raw and '"sender_id"' not in raw
+        assert _decode(raw).to_dict() == msg.to_dict()
+
+    def test_ack_removes_entries(self, server):
+        bus = _bus(server)
+        msg = _msg()
+        bus.publish(msg)
+        bus.consume("agent-b")
+        assert bus.ack("agent-b", [msg.message_id]) == 1
+        assert bus.get_stats()["queues"]["agent-b"] == {"depth": 0, "in_flight": 0, "expired": 0}
+
+    def test_competing_consumers_and_reclaim(self, server):
+        crashed = _bus(server, consumer="host-1", claim_idle=0.05)
+        survivor = _bus(server, consumer="host-2", claim_idle=0.05)
+        for n in range(4):
+            crashed.publish(_msg(n=n))
+        assert [m.payload["n"] for m in crashed.consume("agent-b", max_messages=2)] == [0, 1]
+        own = survivor.consume("agent-b", max_messages=2)
+        assert [m.payload["n"] for m in own] == [2, 3]
+        survivor.ack("agent-b", [m.message_id for m in own])
+
+        time.sleep(0.1)                       # host-1 never acks
+        survivor._next_claim.clear()
+        reclaimed = survivor.consume("agent-b")
+        assert sorted(m.payload["n"] for m in reclaimed) == [0, 1]
+        assert survivor.get_stats()["total_reclaimed"] == 2
+        assert survivor.ack("agent-b", [m.message_id for m in reclaimed]) == 2
+
+    def test_nack_redelivers(self, server):
+        bus = _bus(server)
+        msg = _msg()
+        bus.publish(msg)
+        bus.consume("agent-b")
+        assert bus.nack("agent-b", [msg.message_id]) == 1
+        assert [m.message_id for m in bus.consume("agent-b")] == [msg.message_id]
+
+    def test_publish_many_is_pipelined(self, server):
+        bus = _bus(server, max_queue_size=3)
+        batch = [_msg(n=n) for n in range(5)] + [_msg(recipient="agent-c")]
+        assert bus.publish_many(batch) == 4    # agent-b is full after three
+        assert bus.peek("agent-b") == 3 and bus.peek("agent-c") == 1
+
+    def test_blocking_consume_wakes_on_publish(self, server):
+        bus = _bus(server)
+        publisher = _bus(server)
+        timer = threading.Timer(0.05, lambda: publisher.publish(_msg()))
+        timer.start()
+        start = time.monotonic()
+        assert len(bus.consume("agent-b", timeout=5)) == 1
+        assert time.monotonic() - start < 0.9     # woken by the XADD, not the 1s poll
+        timer.join()
+        assert bus.consume("agent-b", timeout=0.05) == []
+
+    def test_config_selects_redis(self, monkeypatch):
+        monkeypatch.setattr("src.config.agent_config.AgentConfig._load_config",
+                            staticmethod(lambda *a, **k: {"a2a": {
+                                "backend": "redis", "redis": {"url": "redis://example:6379/1",
+                                                              "prefix": "swarm"}}}))
+        bus = create_message_bus()
+        assert isinstance(bus, RedisStreamsBus)
+        assert bus._prefix == "swarm"
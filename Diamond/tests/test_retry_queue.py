@@ -0,0 +1,137 @@
+"""Tests for the delayed retry queue and its orchestrator wiring."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.errors.error_handler import ErrorHandler
+from src.errors.retry_queue import RetryQueue, get_retry_queue
+from src.orchestrator.orchestrator import Orchestrator
+from src.utils import frontmatter
+from src.utils.retry import backoff_delay
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Needs_Action", "In_Progress", "Done", "Logs", "Pending_Approval",
+                   "Approved", "Errors"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+class TestBackoff:
+    def test_exponential_and_capped(self):
+        assert [backoff_delay(n, 10, 2) for n in (1, 2, 3)] == [10, 20, 40]
+        assert backoff_delay(10, 10, 2, max_delay=60) == 60
+
+    def test_jitter_only_shortens(self):
+        delays = [backoff_delay(3, 10, 2, jitter=0.5) for _ in range(200)]
+        assert all(20 <= d <= 40 for d in delays)
+        assert len({round(d, 6) for d in delays}) > 1
+
+
+class TestRetryQueue:
+    def test_pops_in_due_order(self, tmp_path):
+        queue = RetryQueue(tmp_path / "q.json")
+        now = time.time()
+        queue.schedule("b.md", attempt=1, delay=20)
+        queue.schedule("a.md", attempt=1, delay=10)
+        queue.schedule("c.md", attempt=1, delay=100)
+        assert queue.next_due() == pytest.approx(now + 10, abs=1)
+        assert queue.pop_due(now + 5) == []
+        assert [e.task_name for e in queue.pop_due(now + 30)] == ["a.md", "b.md"]
+        assert len(queue) == 1
+
+    def test_reschedule_replaces_entry(self, tmp_path):
+        queue = RetryQueue(tmp_path / "q.json")
+        queue.schedule("a.md", attempt=1, delay=0)
+        queue.schedule("a.md", attempt=2, delay=60)
+        assert queue.pop_due() == []
+        assert queue.is_waiting("a.md")
+        assert queue.get("a.md").attempt == 2
+        assert queue.remove("a.md") and queue.next_due() is None
+
+    def test_persisted_across_instances(self, tmp_path):
+        path = tmp_path / "q.json"
+        RetryQueue(path).schedule("a.md", attempt=2, original_file="/x/a.md", delay=-1)
+        assert json.loads(path.read_text())["entries"][0]["task_name"] == "a.md"
+
+        [entry] = RetryQueue(path).pop_due()
+        assert (entry.attempt, entry.original_file) == (2, "/x/a.md")
+        assert RetryQueue(path).entries() == []
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "q.json"
+        path.write_text("{not json")
+        assert len(RetryQueue(path)) == 0
+
+
+class TestErrorHandler:
+    def test_schedules_and_lists_pending(self, project):
+        handler = ErrorHandler(max_retries=3)
+        task = project / "Needs_Action" / "EMAIL_1.md"
+        error_file = handler.handle_error(RuntimeError("cli down"), "EMAIL_1.md", task)
+
+        entry = handler.retry_queue.get("EMAIL_1.md")
+        assert entry.attempt == 1 and entry.due > time.time()
+        assert handler.get_pending_retries() == [error_file]
+        meta, _ = frontmatter.read_file(error_file)
+        assert meta["status"] == "pending_retry" and "retry_at" in meta
+
+    def test_exhausted_and_reset_leave_queue(self, project):
+        handler = ErrorHandler(max_retries=2)
+        task = project / "Needs_Action" / "EMAIL_2.md"
+        handler.handle_error(RuntimeError("x"), "EMAIL_2.md", task)
+        handler.handle_error(RuntimeError("x"), "EMAIL_2.md", task)
+        assert handler.retry_queue.get("EMAIL_2.md") is None
+
+        handler.reset_retries("EMAIL_2.md")
+        handler.handle_error(RuntimeError("x"), "EMAIL_2.md", task)
+        handler.reset_retries("EMAIL_2.md")
+        assert handler.get_pending_retries() == []
+
+    def test_attempts_survive_restart(self, project):
+        task = project / "Needs_Action" / "EMAIL_3.md"
+        get_retry_queue(project).schedule("EMAIL_3.md", attempt=2, original_file=task, delay=-1)
+        handler = ErrorHandler(max_retries=3, retry_queue=RetryQueue(project / ".retry_queue.json"))
+        assert [e.task_name for e in handler.take_due_retries()] == ["EMAIL_3.md"]
+        handler.handle_error(RuntimeError("x"), "EMAIL_3.md", task)
+        assert not handler.can_retry("EMAIL_3.md")
+
+
+class TestOrchestrator:
+    def test_failed_task_waits_then_retries(self, project):
+        (project / "Needs_Action" / "EMAIL_flaky.md").write_text("---\ntype: email\n---\nHi")
+        (project / "Needs_Action" / "EMAIL_ok.md").write_text("---\ntype: email\n---\nHi")
+        orch = Orchestrator(dry_run=False, ralph_enabled=False)
+        calls = []
+
+        def claude(cmd, root, skill, context):
+            calls.append(skill)
+            if "EMAIL_flaky" in context and skill == "create_plan" and calls.count("fail") == 0:
+                calls.append("fail")
+                raise RuntimeError("Claude CLI error: overloaded")
+            return "ok"
+
+        with patch.object(Orchestrator, "_invoke_claude_raw", side_effect=claude):
+            start = time.time()
+            assert orch.poll_once() == 1
+            assert time.time() - start < 1.0        # no backoff sleep in the worker
+            assert (project / "Done" / "EMAIL_ok.md").exists()
+            assert orch.error_handler.retry_queue.is_waiting("EMAIL_flaky.md")
+
+            assert orch.poll_once() == 0             # still backing off
+
+            orch.error_handler.retry_queue.schedule("EMAIL_flaky.md", attempt=1, delay=-1)
+            assert orch.poll_once() == 1
+        assert (project / "Done" / "EMAIL_flaky.md").exists()
+        assert len(orch.error_handler.retry_queue) == 0
+
+    def test_due_retry_of_moved_file_is_dropped(self, project):
+        orch = Orchestrator(dry_run=True, ralph_enabled=False)
+        orch.error_handler.retry_queue.schedule("EMAIL_gone.md", attempt=1, delay=-1)
+        assert orch._scan_needs_action() == []
+        assert len(orch.error_handler.retry_queue) == 0
@@ -1,6 +1,7 @@
 """Tests for the unified Social MCP server."""
 
 import json
+import time
 import pytest
 import os
 
@@ -116,6 +117,36 @@ class TestSocialMCPProtocol:
         assert "instagram" in data
         assert "twitter" in data
 
+    def test_get_social_summary_sections_run_concurrently(self, monkeypatch):
+        from src.mcp_social import social_server
+
+        def slow(limit):
+            time.sleep(0.2)
+            return [{"id": "x"}]
+
+        for platform, sections in social_server.SUMMARY_SECTIONS.items():
+            adapter = social_server._get_adapter(platform)
+            for method in sections.values():
+                monkeypatch.setattr(adapter, method, slow)
+
+        start = time.perf_counter()
+        summary = social_server._handle_get_social_summary({"platform": "all"})
+        assert time.perf_counter() - start < 0.6
+        assert summary["twitter"]["dms"] == [{"id": "x"}]
+
+    def test_get_social_summary_section_timeout(self, monkeypatch):
+        from src.mcp_social import social_server
+
+        adapter = social_server._get_adapter("facebook")
+        monkeypatch.setattr(adapter, "get_notifications", lambda limit: time.sleep(2))
+        start = time.perf_counter()
+        summary = social_server._handle_get_social_summary(
+            {"platform": "facebook", "timeout": 0.05}
+        )
+        assert time.perf_counter() - start < 0.5   # the hung section is not joined
+        assert "error" in summary["facebook"]["notifications"]
+        assert isinstance(summary["facebook"]["feed"], list)
+
     def test_unknown_tool(self):
         request = {
             "jsonrpc": "2.0",
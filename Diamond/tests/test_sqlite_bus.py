@@ -0,0 +1,151 @@
+"""Tests for the durable SQLite A2A bus and backend selection."""
+
+import threading
+import time
+
+import pytest
+
+from src.a2a.message import A2AMessage, MessagePriority, MessageType
+from src.a2a.message_bus import MockMessageBus, create_message_bus
+from src.a2a.sqlite_bus import SQLiteMessageBus
+
+
+def _msg(recipient="agent-b", sender="agent-a", priority=MessagePriority.NORMAL, **payload):
+    return A2AMessage(sender, recipient, MessageType.TASK_DELEGATION,
+                      payload or {"test": True}, priority=priority)
+
+
+@pytest.fixture
+def bus(tmp_path):
+    bus = SQLiteMessageBus(tmp_path / "bus.db")
+    yield bus
+    bus.close()
+
+
+class TestSQLiteMessageBus:
+    def test_priority_then_fifo(self, bus):
+        bus.publish(_msg(n=1))
+        bus.publish(_msg(priority=MessagePriority.URGENT, n=2))
+        bus.publish(_msg(n=3))
+        assert [m.payload["n"] for m in bus.consume("agent-b")] == [2, 1, 3]
+
+    def test_ack_deletes_and_lease_hides(self, bus):
+        msg = _msg()
+        bus.publish(msg)
+        [got] = bus.consume("agent-b")
+        assert got.message_id == msg.message_id and got.payload == msg.payload
+        assert bus.consume("agent-b") == [] and bus.peek("agent-b") == 0
+        assert bus.get_stats()["queues"]["agent-b"] == {"depth": 1, "in_flight": 1, "expired": 0}
+        assert bus.ack("agent-b", [msg.message_id]) == 1
+        assert bus.get_stats()["total_queued"] == 0
+
+    def test_unacked_message_is_redelivered(self, tmp_path):
+        bus = SQLiteMessageBus(tmp_path / "bus.db", ack_timeout=0.05)
+        bus.publish(_msg())
+        assert len(bus.consume("agent-b")) == 1
+        time.sleep(0.1)
+        assert len(bus.consume("agent-b")) == 1
+        assert bus.get_stats()["total_redelivered"] == 1
+        bus.close()
+
+    def test_nack_returns_message(self, bus):
+        msg = _msg()
+        bus.publish(msg)
+        bus.consume("agent-b")
+        assert bus.nack("agent-b", [msg.message_id]) == 1
+        assert [m.message_id for m in bus.consume("agent-b")] == [msg.message_id]
+
+    def test_survives_restart(self, tmp_path):
+        path = tmp_path / "bus.db"
+        first = SQLiteMessageBus(path)
+        first.publish(_msg(n=1))
+        first.publish(_msg(n=2))
+        first.close()
+
+        second = SQLiteMessageBus(path)
+        assert second.peek("agent-b") == 2
+        assert [m.payload["n"] for m in second.consume("agent-b")] == [1, 2]
+        second.close()
+
+    def test_queue_full_and_expired(self, tmp_path):
+        bus = SQLiteMessageBus(tmp_path / "bus.db", max_queue_size=1)
+        assert bus.publish(_msg()) is True
+        assert bus.publish(_msg()) is False
+        stale = _msg(recipient="agent-c")
+        stale.ttl = 0
+        stale.timestamp -= 10
+        assert bus.publish(stale) is True
+        assert bus.consume("agent-c") == []
+        assert bus.get_stats()["total_expired"] == 1
+        bus.close()
+
+    def test_broadcast_reaches_known_agents(self, bus):
+        for agent in ("agent-a", "agent-c", "agent-d"):
+            bus.consume(agent)
+        bus.publish(_msg(recipient="all"))
+        assert bus.peek("agent-a") == 0
+        assert bus.peek("agent-c") == 1 and bus.peek("agent-d") == 1
+
+    def test_concurrent_publishes_share_commits(self, bus):
+        threads = [threading.Thread(target=bus.publish, args=(_msg(recipient=f"agent-{i}"),))
+                   for i in range(8)]
+        with bus._batch_cond:                 # all publishers reach the group commit
+            for t in threads:
+                t.start()
+            time.sleep(0.1)
+            bus._lock.acquire()               # ...and the first leader stalls on the database
+        time.sleep(0.1)
+        bus._lock.release()
+        for t in threads:
+            t.join()
+        stats = bus.get_stats()
+        assert stats["total_queued"] == 8
+        assert stats["commits"] == 2 and stats["avg_batch"] == 4
+
+    def test_publish_order_kept_per_publisher(self, bus):
+        def publisher(i):
+            for n in range(50):
+                bus.publish(_msg(recipient=f"agent-{i}", n=n))
+
+        threads = [threading.Thread(target=publisher, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert [m.payload["n"] for m in bus.consume("agent-3", max_messages=50)] == list(range(50))
+
+    def test_blocking_consume_wakes_on_publish(self, bus):
+        timer = threading.Timer(0.05, lambda: bus.publish(_msg()))
+        timer.start()
+        start = time.monotonic()
+        assert len(bus.consume("agent-b", timeout=5)) == 1
+        assert time.monotonic() - start < 0.9     # woken by the publish, not the 1s poll
+        timer.join()
+
+    def test_subscribe_callback(self, bus):
+        received = []
+        bus.subscribe("agent-b", received.append)
+        bus.publish(_msg())
+        assert bus.flush_subscribers(timeout=5)
+        assert len(received) == 1
+
+
+class TestBackendSelection:
+    def _config(self, monkeypatch, a2a):
+        monkeypatch.setattr("src.config.agent_config.AgentConfig._load_config",
+                            staticmethod(lambda *a, **k: {"a2a": a2a}))
+
+    def test_sqlite_backend(self, tmp_path, monkeypatch):
+        self._config(monkeypatch, {"backend": "sqlite", "max_queue_size": 5,
+                                   "sqlite": {"path": "q.db", "ack_timeout": 10}})
+        bus = create_message_bus(tmp_path)
+        assert isinstance(bus, SQLiteMessageBus)
+        assert bus.db_path == tmp_path / "q.db"
+        assert bus.get_stats()["max_queue_size"] == 5
+        bus.close()
+
+    def test_memory_and_unknown_backends(self, tmp_path, monkeypatch):
+        self._config(monkeypatch, {"backend": "memory"})
+        assert isinstance(create_message_bus(tmp_path), MockMessageBus)
+        self._config(monkeypatch, {"backend": "rabbitmq"})
+        assert isinstance(create_message_bus(tmp_path), MockMessageBus)
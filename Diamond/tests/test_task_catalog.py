@@ -0,0 +1,100 @@
+"""Tests for the SQLite task catalog."""
+
+import pytest
+
+from src.claim.claim_manager import ClaimManager
+from src.utils import file_ops, frontmatter
+from src.utils.task_catalog import CATALOG_FILENAME, TaskCatalog, get_catalog
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Needs_Action", "Done", "Errors", "Pending_Approval"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+def _task(project, folder, name, **meta):
+    path = project / folder / name
+    frontmatter.write_file(path, meta, "# Task\n")
+    return path
+
+
+class TestTaskCatalog:
+    def test_wal_database_under_project_root(self, project):
+        catalog = get_catalog()
+        assert catalog.db_path == project / CATALOG_FILENAME
+        mode = catalog._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_write_file_records_metadata(self, project):
+        _task(project, "Done", "EMAIL_a.md", type="email", priority="high",
+              status="done", created="2026-10-15 09:00:00")
+        [row] = get_catalog().find("Done")
+        assert row["path"] == "Done/EMAIL_a.md"
+        assert (row["prefix"], row["type"], row["priority"], row["status"]) == \
+            ("EMAIL", "email", "high", "done")
+        assert row["created"] == "2026-10-15 09:00:00"
+        assert row["moved_at"] is not None
+
+    def test_counts_and_filters(self, project):
+        _task(project, "Done", "EMAIL_a.md", created="2026-10-15 09:00:00")
+        _task(project, "Done", "EMAIL_b.md", created="2026-10-01 09:00:00")
+        _task(project, "Done", "ODOO_c.md", created="2026-10-16 09:00:00")
+        _task(project, "Errors", "ERROR_x.md", status="failed")
+        catalog = get_catalog()
+        assert catalog.count("Done") == 3
+        assert catalog.count("Done", prefix="EMAIL") == 2
+        assert catalog.count("Done", created_since="2026-10-10") == 2
+        assert catalog.count_by_prefix("Done") == {"EMAIL": 2, "ODOO": 1}
+        assert [r["name"] for r in catalog.find("Done", created_before="2026-10-10")] == \
+            ["EMAIL_b.md"]
+        assert [r["name"] for r in catalog.find("Errors", status="failed")] == ["ERROR_x.md"]
+
+    def test_safe_move_and_claim_update_folder(self, project):
+        task = file_ops.create_task_file("Needs_Action", "EMAIL", "hello", {"priority": "low"}, "b")
+        catalog = get_catalog()
+
+        claimed = ClaimManager("local-01").claim(task)
+        assert catalog.count("Needs_Action") == 0
+        [row] = catalog.find("In_Progress/local-01")
+        assert row["priority"] == "low"
+
+        done = file_ops.safe_move(claimed, "Done")
+        assert catalog.count("In_Progress/local-01") == 0
+        assert [r["name"] for r in catalog.find("Done")] == [done.name]
+
+    def test_unhooked_changes_are_reconciled(self, project):
+        catalog = get_catalog()
+        assert catalog.count("Done") == 0
+        # Written behind the catalog's back (by hand, git sync, ...)
+        (project / "Done" / "EMAIL_manual.md").write_text("---\nstatus: done\n---\n\nbody\n")
+        assert catalog.count("Done", prefix="EMAIL") == 1
+        (project / "Done" / "EMAIL_manual.md").unlink()
+        assert catalog.count("Done") == 0
+
+    def test_unchanged_folder_is_not_reparsed(self, project):
+        _task(project, "Done", "EMAIL_a.md", status="done")
+        catalog = get_catalog()
+        catalog.count("Done")
+        parsed = catalog.parsed
+        for _ in range(5):
+            catalog.count("Done")
+        assert catalog.parsed == parsed
+
+    def test_ignores_files_outside_task_folders(self, project):
+        frontmatter.write_file(project / "Briefings" / "brief.md", {"type": "x"}, "b")
+        frontmatter.write_file(project / "Done" / "notes.txt", {"type": "x"}, "b")
+        assert get_catalog().get_stats()["rows"] == 0
+
+    def test_rebuild_from_disk(self, project):
+        _task(project, "Done", "EMAIL_a.md", status="done")
+        _task(project, "Needs_Action", "ODOO_b.md", priority="high")
+        (project / "In_Progress" / "cloud-01").mkdir(parents=True)
+        _task(project, "In_Progress/cloud-01", "EMAIL_c.md")
+
+        fresh = TaskCatalog(project, db_path=project / "rebuilt.db")
+        assert fresh.rebuild() == 3
+        assert fresh.count("In_Progress/cloud-01") == 1
+        assert fresh.find("Needs_Action")[0]["priority"] == "high"
@@ -0,0 +1,145 @@
+"""Tests for the orchestrator task pool."""
+
+import threading
+import time
+
+import pytest
+
+from src.orchestrator.task_pool import TaskPool
+from src.orchestrator.swarm_orchestrator import SwarmOrchestrator
+from src.utils import frontmatter
+
+
+def _task(name, task_type="email"):
+    return {"filename": name, "task_type": task_type}
+
+
+class TestTaskPool:
+    def test_runs_all_tasks(self):
+        pool = TaskPool(max_workers=3)
+        seen = []
+        processed = pool.run([_task(f"t{i}") for i in range(5)],
+                             lambda t: seen.append(t["filename"]) or True)
+        pool.shutdown()
+        assert processed == 5
+        assert sorted(seen) == [f"t{i}" for i in range(5)]
+
+    def test_handler_false_not_counted(self):
+        pool = TaskPool(max_workers=2)
+        processed = pool.run([_task("a"), _task("b")], lambda t: t["filename"] == "a")
+        pool.shutdown()
+        assert processed == 1
+
+    def test_handler_exception_does_not_stop_batch(self):
+        pool = TaskPool(max_workers=2)
+
+        def handler(task):
+            if task["filename"] == "bad":
+                raise RuntimeError("boom")
+            return True
+
+        processed = pool.run([_task("bad"), _task("good")], handler)
+        pool.shutdown()
+        assert processed == 1
+
+    def test_runs_concurrently(self):
+        pool = TaskPool(max_workers=4)
+        start = time.time()
+        pool.run([_task(f"t{i}") for i in range(4)],
+                 lambda t: time.sleep(0.2) or True)
+        pool.shutdown()
+        assert time.time() - start < 0.6
+
+    def test_global_limit(self):
+        pool = TaskPool(max_workers=2)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def handler(task):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return True
+
+        pool.run([_task(f"t{i}") for i in range(6)], handler)
+        pool.shutdown()
+        assert peak == 2
+
+    def test_type_limit(self):
+        pool = TaskPool(max_workers=4, type_limits={"odoo": 1})
+        lock = threading.Lock()
+        active_odoo = peak_odoo = 0
+
+        def handler(task):
+            nonlocal active_odoo, peak_odoo
+            if task["task_type"] == "odoo":
+                with lock:
+                    active_odoo += 1
+                    peak_odoo = max(peak_odoo, active_odoo)
+            time.sleep(0.05)
+            if task["task_type"] == "odoo":
+                with lock:
+                    active_odoo -= 1
+            return True
+
+        tasks = [_task(f"o{i}", "odoo") for i in range(3)] + [_task("e1")]
+        assert pool.run(tasks, handler) == 4
+        pool.shutdown()
+        assert peak_odoo == 1
+
+    def test_priority_order_with_single_worker(self):
+        pool = TaskPool(max_workers=1)
+        order = []
+        pool.run([_task("high"), _task("medium"), _task("low")],
+                 lambda t: order.append(t["filename"]) or True)
+        pool.shutdown()
+        assert order == ["high", "medium", "low"]
+
+    def test_stop_lets_in_flight_finish(self):
+        pool = TaskPool(max_workers=1)
+        running = True
+        finished = []
+
+        def handler(task):
+            nonlocal running
+            running = False  # simulate SIGTERM while first task is in flight
+            time.sleep(0.05)
+            finished.append(task["filename"])
+            return True
+
+        processed = pool.run([_task("a"), _task("b")], handler,
+                             keep_running=lambda: running)
+        pool.shutdown()
+        assert processed == 1
+        assert finished == ["a"]
+
+
+@pytest.fixture
+def tmp_project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Needs_Action", "In_Progress", "Done", "Logs",
+                   "Pending_Approval", "Errors"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+class TestOrchestratorPool:
+    def test_pool_limits_from_arguments(self, tmp_project):
+        orch = SwarmOrchestrator(dry_run=True, max_workers=2, type_limits={"odoo": 1})
+        assert orch.pool.max_workers == 2
+        assert orch.pool.type_limits == {"odoo": 1}
+
+    def test_processing_set_cleared_after_poll(self, tmp_project):
+        for i in range(3):
+            frontmatter.write_file(
+                tmp_project / "Needs_Action" / f"EMAIL_{i:03d}.md",
+                {"type": "email", "priority": "medium"}, "Hello",
+            )
+        orch = SwarmOrchestrator(dry_run=True, max_workers=3)
+        assert orch.poll_once() == 3
+        assert orch._processing == set()
+        assert len(list((tmp_project / "Done").glob("*.md"))) == 3
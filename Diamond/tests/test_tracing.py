@@ -0,0 +1,148 @@
+"""Tests for per-phase span tracing."""
+
+import json
+import sys
+
+import pytest
+
+from src.a2a.message import A2AMessage, MessageType
+from src.orchestrator.orchestrator import Orchestrator
+from src.orchestrator.swarm_orchestrator import SwarmOrchestrator
+from src.utils import frontmatter, logger, tracing
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.file_ops.get_project_root", lambda: tmp_path)
+    for folder in ["Needs_Action", "In_Progress", "Done", "Logs", "Pending_Approval",
+                   "Approved", "Errors"]:
+        (tmp_path / folder).mkdir()
+    return tmp_path
+
+
+def _spans(project):
+    logger.flush_logs()
+    return tracing.load_spans(root=project)
+
+
+def _task(project, name, **meta):
+    meta.setdefault("priority", "medium")
+    frontmatter.write_file(project / "Needs_Action" / name, meta, "Please handle this.")
+
+
+class TestSpans:
+    def test_span_without_trace_is_noop(self, project):
+        with tracing.span("orphan") as span:
+            assert span is None
+        assert _spans(project) == []
+
+    def test_nesting_and_export(self, project):
+        with tracing.trace("task", file="EMAIL_1.md") as root:
+            with tracing.span("plan") as plan:
+                with tracing.span("claude:create_plan"):
+                    pass
+            assert tracing.current_trace_id() == root.trace_id
+        assert tracing.current_trace_id() is None
+
+        spans = {s["name"]: s for s in _spans(project)}
+        assert set(spans) == {"task", "plan", "claude:create_plan"}
+        assert {s["trace_id"] for s in spans.values()} == {root.trace_id}
+        assert spans["task"]["parent_id"] is None
+        assert spans["plan"]["parent_id"] == spans["task"]["span_id"]
+        assert spans["claude:create_plan"]["parent_id"] == plan.span_id
+        assert spans["task"]["attrs"] == {"file": "EMAIL_1.md"}
+
+    def test_error_status(self, project):
+        with pytest.raises(RuntimeError):
+            with tracing.trace("task"):
+                raise RuntimeError("boom")
+        [span] = _spans(project)
+        assert span["status"] == "error"
+        assert "boom" in span["attrs"]["error"]
+
+    def test_disabled_in_config(self, project, monkeypatch):
+        monkeypatch.setattr(tracing, "_enabled", False)
+        with tracing.trace("task"):
+            pass
+        assert _spans(project) == []
+
+
+class TestPropagation:
+    def test_audit_log_carries_trace_id(self, project):
+        with tracing.trace("task") as root:
+            logger.audit_log("step")
+        logger.audit_log("outside")
+        [path] = (project / "Logs").glob("*_actions.jsonl")
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert records[0]["trace_id"] == root.trace_id
+        assert "trace_id" not in records[1]
+
+    def test_message_correlation_id(self, project):
+        with tracing.trace("task") as root:
+            msg = A2AMessage("a", "b", MessageType.TASK_DELEGATION, {})
+            reply = A2AMessage("b", "a", MessageType.TASK_RESULT, {}, correlation_id="req-1")
+        assert msg.correlation_id == root.trace_id
+        assert reply.correlation_id == "req-1"
+        assert A2AMessage("a", "b", MessageType.TASK_DELEGATION, {}).correlation_id is None
+
+        with tracing.trace("handle", trace_id=msg.correlation_id) as handler:
+            pass
+        assert handler.trace_id == root.trace_id
+
+
+class TestPipeline:
+    def test_orchestrator_phases_share_one_trace(self, project):
+        _task(project, "EMAIL_trace.md", type="email")
+        Orchestrator(dry_run=True, ralph_enabled=False).poll_once()
+
+        spans = _spans(project)
+        assert len({s["trace_id"] for s in spans}) == 1
+        names = [s["name"] for s in spans]
+        for phase in ["classify", "task", "plan", "claude:create_plan", "execute", "move",
+                      "dashboard", "claude:update_dashboard"]:
+            assert phase in names
+        by_id = {s["span_id"]: s for s in spans}
+        move = next(s for s in spans if s["name"] == "move")
+        assert by_id[move["parent_id"]]["name"] == "task"
+
+    def test_swarm_delegation_phases(self, project):
+        _task(project, "EMAIL_swarm.md", type="email")
+        SwarmOrchestrator(dry_run=True, ralph_enabled=False).poll_once()
+        names = {s["name"] for s in _spans(project)}
+        assert {"classify", "task", "security_scan", "execute", "move"} <= names
+
+
+class TestReport:
+    def _trace(self, trace_id, total_ms, phases):
+        spans = [{"trace_id": trace_id, "span_id": f"{trace_id}-root", "parent_id": None,
+                  "name": "task", "start": 100.0, "duration_ms": total_ms, "status": "ok",
+                  "attrs": {"file": f"{trace_id}.md"}}]
+        start = 100.0
+        for i, (name, ms) in enumerate(phases):
+            spans.append({"trace_id": trace_id, "span_id": f"{trace_id}-{i}",
+                          "parent_id": f"{trace_id}-root", "name": name, "start": start,
+                          "duration_ms": ms, "status": "ok"})
+            start += ms / 1000
+        return spans
+
+    def test_slowest_and_phase_totals(self):
+        spans = (self._trace("fast", 100, [("plan", 60), ("move", 10)])
+                 + self._trace("slow", 900, [("plan", 800), ("move", 50)]))
+        [(trace_id, duration, trace_spans)] = tracing.slowest_traces(spans, limit=1)
+        assert trace_id == "slow" and duration == pytest.approx(900)
+        assert list(tracing.phase_totals(spans))[:2] == ["task", "plan"]
+        assert tracing.phase_totals(spans)["plan"]["count"] == 2
+
+        lines = tracing.format_flame(trace_spans, width=10)
+        assert lines[0].split()[0] == "task"
+        assert lines[1].startswith("    plan") and lines[1].endswith("█" * 9)
+
+    def test_cli(self, project, monkeypatch, capsys):
+        with tracing.trace("task", file="EMAIL_cli.md"):
+            with tracing.span("plan"):
+                pass
+        logger.flush_logs()
+        monkeypatch.setattr(sys, "argv", ["tracing", "slowest", "--limit", "1"])
+        tracing.main()
+        out = capsys.readouterr().out
+        assert "EMAIL_cli.md" in out and "plan" in out